@@ -1,25 +1,49 @@
 from .exceptions import AuthenticationError
+from .models.frame_utils import validate_output
 from .stock import Stock
+from .streaming import Stream, TradeUpdatesStream
 from .trading import Trading
 
 
 class PyAlpacaAPI:
-    def __init__(self, api_key: str, api_secret: str, api_paper: bool = True) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        api_paper: bool = True,
+        output: str = "pandas",
+        stream_feed: str = "iex",
+    ) -> None:
         if not api_key or not api_secret:
             raise AuthenticationError()
+        validate_output(output)
         self._initialize_components(
-            api_key=api_key, api_secret=api_secret, api_paper=api_paper
+            api_key=api_key,
+            api_secret=api_secret,
+            api_paper=api_paper,
+            output=output,
+            stream_feed=stream_feed,
         )
 
     def _initialize_components(
-        self, api_key: str, api_secret: str, api_paper: bool = True
+        self,
+        api_key: str,
+        api_secret: str,
+        api_paper: bool = True,
+        output: str = "pandas",
+        stream_feed: str = "iex",
     ):
         self.trading = Trading(
-            api_key=api_key, api_secret=api_secret, api_paper=api_paper
+            api_key=api_key, api_secret=api_secret, api_paper=api_paper, output=output
         )
         self.stock = Stock(
             api_key=api_key,
             api_secret=api_secret,
             api_paper=api_paper,
             market=self.trading.market,
+            output=output,
+        )
+        self.stream = Stream(api_key=api_key, api_secret=api_secret, feed=stream_feed)
+        self.trade_updates = TradeUpdatesStream(
+            api_key=api_key, api_secret=api_secret, api_paper=api_paper
         )
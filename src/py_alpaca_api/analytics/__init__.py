@@ -0,0 +1,65 @@
+"""Analytics module for py-alpaca-api.
+
+This module provides vectorized tools for working with market data locally.
+"""
+
+from .asof import join_trades_quotes
+from .bar_builder import BarBuilder, build_bars
+from .conditions import (
+    DEFAULT_EXCLUDED_CONDITIONS,
+    QUOTE_CONDITION_FLAGS,
+    TRADE_CONDITION_FLAGS,
+    condition_flags,
+    decode_exchanges,
+    decode_ticks,
+    excluded_conditions,
+    explode_conditions,
+)
+from .indicators import (
+    ATR,
+    EMA,
+    RSI,
+    SMA,
+    BollingerBands,
+    Indicator,
+    VWAPBands,
+    ZScore,
+    atr,
+    bollinger_bands,
+    ema,
+    rsi,
+    sma,
+    vwap_bands,
+    zscore,
+)
+from .resample import resample_bars
+
+__all__ = [
+    "ATR",
+    "DEFAULT_EXCLUDED_CONDITIONS",
+    "EMA",
+    "QUOTE_CONDITION_FLAGS",
+    "RSI",
+    "SMA",
+    "TRADE_CONDITION_FLAGS",
+    "BarBuilder",
+    "BollingerBands",
+    "Indicator",
+    "VWAPBands",
+    "ZScore",
+    "atr",
+    "bollinger_bands",
+    "build_bars",
+    "condition_flags",
+    "decode_exchanges",
+    "decode_ticks",
+    "ema",
+    "excluded_conditions",
+    "explode_conditions",
+    "join_trades_quotes",
+    "resample_bars",
+    "rsi",
+    "sma",
+    "vwap_bands",
+    "zscore",
+]
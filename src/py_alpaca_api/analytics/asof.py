@@ -0,0 +1,161 @@
+"""Vectorized as-of join of trades against the prevailing quotes."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.models.trade_model import TradeBatch, TradeModel, trades_to_frame
+
+QUOTE_COLUMNS = ["bid_price", "bid_size", "ask_price", "ask_size"]
+
+
+def join_trades_quotes(
+    trades: pd.DataFrame | TradeBatch | Sequence[TradeModel],
+    quotes: pd.DataFrame | Mapping[str, pd.DataFrame],
+    tolerance: str | pd.Timedelta | None = None,
+    allow_exact_matches: bool = True,
+) -> pd.DataFrame:
+    """Attach the prevailing quote to every trade.
+
+    Trades and quotes are each sorted once by symbol and time, so every symbol is
+    a contiguous slice of both, and each trade is matched to the last quote at or
+    before its timestamp with a binary search (`np.searchsorted`). The join is
+    O(n log n + n log m) and never loops over ticks in Python.
+
+    Args:
+        trades: Trades as returned by `Trades.get_all_trades`, a `TradeBatch` or a
+            DataFrame with `timestamp` and `price` columns (and `symbol` for
+            several symbols).
+        quotes: Quotes as returned by `Quotes.get_historical_quotes`: a DataFrame
+            indexed by timestamp for one symbol, or a dict mapping symbols to such
+            DataFrames. A DataFrame with `timestamp` and `symbol` columns also works.
+        tolerance: Optional maximum age of the matched quote, e.g. "1s". Older
+            quotes are treated as missing.
+        allow_exact_matches: Whether a quote with the same timestamp as the trade
+            counts as prevailing. Defaults to True.
+
+    Returns:
+        pd.DataFrame: The trades in their original order with `quote_timestamp`,
+        `bid_price`, `bid_size`, `ask_price`, `ask_size`, `mid`, `spread`,
+        `effective_spread` (2 x |price - mid|) and `effective_spread_bps` columns.
+        Trades without a prevailing quote get NaN values.
+
+    Raises:
+        ValueError: If a required column is missing.
+    """
+    trades_df = trades_to_frame(trades)
+    quotes_df = _quotes_frame(quotes)
+
+    for frame, name in ((trades_df, "trades"), (quotes_df, "quotes")):
+        if "timestamp" not in frame.columns:
+            raise ValueError(f"The {name} have no timestamp column")
+    if "price" not in trades_df.columns:
+        raise ValueError("The trades have no price column")
+    missing_quotes = set(QUOTE_COLUMNS) - set(quotes_df.columns)
+    if missing_quotes:
+        raise ValueError(f"The quotes are missing: {', '.join(sorted(missing_quotes))}")
+
+    trade_ts = _epoch_ns(trades_df["timestamp"])
+    quote_ts = _epoch_ns(quotes_df["timestamp"])
+
+    # Symbols become integer codes; without symbols everything is one group
+    if "symbol" in trades_df.columns and "symbol" in quotes_df.columns:
+        codes, _ = pd.factorize(
+            np.concatenate(
+                [
+                    trades_df["symbol"].astype(str).to_numpy(),
+                    quotes_df["symbol"].astype(str).to_numpy(),
+                ]
+            )
+        )
+        trade_symbols = codes[: len(trades_df)]
+        quote_symbols = codes[len(trades_df) :]
+    else:
+        trade_symbols = np.zeros(len(trades_df), dtype=np.int64)
+        quote_symbols = np.zeros(len(quotes_df), dtype=np.int64)
+
+    # Sort quotes by symbol then time, so each symbol is a contiguous segment
+    order = np.lexsort((quote_ts, quote_symbols))
+    quote_ts = quote_ts[order]
+    quote_symbols = quote_symbols[order]
+    boundaries = np.flatnonzero(quote_symbols[1:] != quote_symbols[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(quote_ts)]))
+
+    # Sort trades the same way, so each symbol's trades are a contiguous slice too
+    trade_order = np.lexsort((trade_ts, trade_symbols))
+    sorted_trade_symbols = trade_symbols[trade_order]
+    segment_symbols = quote_symbols[starts] if len(quote_ts) else starts
+    trade_starts = np.searchsorted(sorted_trade_symbols, segment_symbols, side="left")
+    trade_ends = np.searchsorted(sorted_trade_symbols, segment_symbols, side="right")
+
+    side: Literal["left", "right"] = "right" if allow_exact_matches else "left"
+    match = np.full(len(trades_df), -1, dtype=np.int64)
+    for start, end, trade_start, trade_end in zip(
+        starts, ends, trade_starts, trade_ends, strict=True
+    ):
+        if start == end or trade_start == trade_end:
+            continue
+        in_symbol = trade_order[trade_start:trade_end]
+        pos = np.searchsorted(quote_ts[start:end], trade_ts[in_symbol], side=side) - 1
+        found = pos >= 0
+        match[in_symbol[found]] = start + pos[found]
+
+    if tolerance is not None:
+        max_age = pd.Timedelta(tolerance).value
+        stale = match >= 0
+        stale[stale] = trade_ts[stale] - quote_ts[match[stale]] > max_age
+        match[stale] = -1
+
+    matched = match >= 0
+    quote_rows = order[match[matched]]
+
+    result = trades_df.copy()
+    quote_times = np.full(len(result), np.datetime64("NaT"), dtype="datetime64[ns]")
+    quote_times[matched] = quote_ts[match[matched]].astype("datetime64[ns]")
+    result["quote_timestamp"] = pd.to_datetime(quote_times).tz_localize("UTC")
+    for column in QUOTE_COLUMNS:
+        values = np.full(len(result), np.nan)
+        values[matched] = quotes_df[column].to_numpy(dtype=float)[quote_rows]
+        result[column] = values
+
+    price = result["price"].to_numpy(dtype=float)
+    mid = (result["bid_price"].to_numpy() + result["ask_price"].to_numpy()) / 2
+    result["mid"] = mid
+    result["spread"] = result["ask_price"] - result["bid_price"]
+    result["effective_spread"] = 2 * np.abs(price - mid)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result["effective_spread_bps"] = result["effective_spread"] / mid * 10_000
+
+    return result
+
+
+def _quotes_frame(quotes: Any) -> pd.DataFrame:
+    """Normalize the supported quote containers to a long DataFrame."""
+    if isinstance(quotes, pd.DataFrame):
+        return _with_timestamp_column(quotes)
+    frames = [
+        _with_timestamp_column(df).assign(symbol=symbol)
+        for symbol, df in quotes.items()
+        if len(df)
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["timestamp", "symbol", *QUOTE_COLUMNS])
+    return pd.concat(frames, ignore_index=True)
+
+
+def _with_timestamp_column(df: pd.DataFrame) -> pd.DataFrame:
+    """Move a timestamp index into a regular column."""
+    if "timestamp" not in df.columns and df.index.name == "timestamp":
+        return df.reset_index()
+    return df.reset_index(drop=True)
+
+
+def _epoch_ns(values: pd.Series) -> np.ndarray:
+    """Convert timestamps (strings, naive UTC or timezone-aware) to int64 epoch ns."""
+    parsed = pd.to_datetime(values, utc=True, format="ISO8601")
+    return parsed.dt.tz_localize(None).to_numpy(dtype="datetime64[ns]").view("int64")
@@ -0,0 +1,260 @@
+"""Vectorized time, tick, volume and dollar bars built from raw trades."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.analytics.conditions import (
+    DEFAULT_EXCLUDED_CONDITIONS,
+    has_condition,
+)
+from py_alpaca_api.analytics.resample import BAR_COLUMNS
+from py_alpaca_api.models.trade_model import TradeBatch, TradeModel, trades_to_frame
+
+BAR_KINDS = ("time", "tick", "volume", "dollar")
+
+
+def build_bars(
+    trades: pd.DataFrame | TradeBatch | Sequence[TradeModel],
+    kind: str = "time",
+    threshold: str | float = "1min",
+    exclude_conditions: Iterable[str] | None = DEFAULT_EXCLUDED_CONDITIONS,
+) -> pd.DataFrame:
+    """Build bars from raw trades.
+
+    Trades are sorted by symbol and time and assigned to bars with cumulative
+    sums and integer division, then aggregated with `ufunc.reduceat`, so no
+    Python loop runs per trade. Bars never span two symbols.
+
+    Trades carrying an excluded condition still count towards volume, trade count
+    and the bar boundaries, but do not set the open, high, low, close or vwap,
+    matching how the consolidated tape treats them.
+
+    Args:
+        trades: Trades as returned by `Trades.get_all_trades`, a `TradeBatch` or a
+            DataFrame with `timestamp`, `price` and `size` columns (plus optional
+            `symbol` and `conditions`).
+        kind: "time", "tick", "volume" or "dollar". Defaults to "time".
+        threshold: The bar size: a pandas frequency such as "1min" for time bars,
+            or the number of trades, shares or dollars per bar for the others.
+        exclude_conditions: Condition codes that do not update OHLC. Defaults to
+            `DEFAULT_EXCLUDED_CONDITIONS`; see `excluded_conditions` to derive them
+            from `Metadata`. Pass None to use every trade.
+
+    Returns:
+        pd.DataFrame: One row per bar with the columns symbol, date, open, high,
+        low, close, volume, trade_count and vwap. `date` is the bucket start for
+        time bars and the first trade time otherwise, in naive UTC.
+
+    Raises:
+        ValueError: If the kind or threshold is invalid or a column is missing.
+    """
+    return _build(trades_to_frame(trades), kind, threshold, exclude_conditions)[0]
+
+
+class BarBuilder:
+    """Incrementally builds bars from chunks of trades, such as stream messages.
+
+    The last, possibly unfinished bar of each symbol is held back until a later
+    trade starts a new bar. For tick, volume and dollar bars the running count
+    or sum at the start of that bar is kept too, so bars are identical to a
+    single `build_bars` call over all the trades.
+    """
+
+    def __init__(
+        self,
+        kind: str = "time",
+        threshold: str | float = "1min",
+        exclude_conditions: Iterable[str] | None = DEFAULT_EXCLUDED_CONDITIONS,
+    ) -> None:
+        """Initialize the BarBuilder.
+
+        Args:
+            kind: "time", "tick", "volume" or "dollar". Defaults to "time".
+            threshold: The bar size, as for `build_bars`.
+            exclude_conditions: Condition codes that do not update OHLC.
+        """
+        _validate(kind, threshold)
+        self.kind = kind
+        self.threshold = threshold
+        self.exclude_conditions = (
+            None if exclude_conditions is None else frozenset(exclude_conditions)
+        )
+        self._pending: pd.DataFrame | None = None
+        # Running count or sum within its bar at the first pending trade, by symbol
+        self._offsets: dict[str, float] = {}
+
+    def update(
+        self, trades: pd.DataFrame | TradeBatch | Sequence[TradeModel]
+    ) -> pd.DataFrame:
+        """Add trades and return the bars they completed.
+
+        Args:
+            trades: New trades, in any container accepted by `build_bars`.
+
+        Returns:
+            pd.DataFrame: The completed bars, possibly empty.
+        """
+        frame = trades_to_frame(trades)
+        if self._pending is not None:
+            frame = pd.concat([self._pending, frame], ignore_index=True)
+        if frame.empty:
+            return pd.DataFrame(columns=BAR_COLUMNS)
+
+        bars, ids, ordered, carry = _build(
+            frame, self.kind, self.threshold, self.exclude_conditions, self._offsets
+        )
+        symbols = bars["symbol"].to_numpy()
+        last_of_symbol = np.r_[symbols[1:] != symbols[:-1], True]
+        pending = np.isin(ids, np.flatnonzero(last_of_symbol))
+        first_pending = pending & np.r_[True, ~pending[:-1] | (ids[1:] != ids[:-1])]
+        self._pending = ordered[pending]
+        self._offsets = dict(
+            zip(
+                ordered["symbol"].astype(str).to_numpy()[first_pending],
+                carry[first_pending].tolist(),
+                strict=True,
+            )
+        )
+        return bars[~last_of_symbol].reset_index(drop=True)
+
+    def flush(self) -> pd.DataFrame:
+        """Return the unfinished bars and reset the builder.
+
+        Returns:
+            pd.DataFrame: The bars still held back, possibly empty.
+        """
+        pending, self._pending = self._pending, None
+        offsets, self._offsets = self._offsets, {}
+        if pending is None or pending.empty:
+            return pd.DataFrame(columns=BAR_COLUMNS)
+        return _build(
+            pending, self.kind, self.threshold, self.exclude_conditions, offsets
+        )[0]
+
+
+def _validate(kind: str, threshold: str | float) -> None:
+    """Validate a bar kind and threshold."""
+    if kind not in BAR_KINDS:
+        raise ValueError(f"Invalid kind. Must be one of: {', '.join(BAR_KINDS)}")
+    if kind == "time":
+        if pd.Timedelta(threshold).value <= 0:
+            raise ValueError("The time bar threshold must be positive")
+    elif isinstance(threshold, str) or threshold <= 0:
+        raise ValueError(f"The {kind} bar threshold must be a positive number")
+
+
+def _build(
+    frame: pd.DataFrame,
+    kind: str,
+    threshold: str | float,
+    exclude_conditions: Iterable[str] | None,
+    offsets: dict[str, float] | None = None,
+) -> tuple[pd.DataFrame, np.ndarray, pd.DataFrame, np.ndarray]:
+    """Build bars and return them with the bar id of each sorted trade.
+
+    Args:
+        frame: The trades, with `timestamp`, `price` and `size` columns.
+        kind: "time", "tick", "volume" or "dollar".
+        threshold: The bar size, as for `build_bars`.
+        exclude_conditions: Condition codes that do not update OHLC.
+        offsets: For tick, volume and dollar bars, the running count or sum within
+            its bar that each symbol's first trade starts at. Defaults to 0.
+
+    Returns:
+        The bars, the bar id of each trade, the trades sorted by symbol and time,
+        and the running count or sum within its bar before each trade (0 for
+        time bars).
+    """
+    _validate(kind, threshold)
+    missing = {"timestamp", "price", "size"} - set(frame.columns)
+    if missing:
+        raise ValueError(f"The trades are missing: {', '.join(sorted(missing))}")
+    if "symbol" not in frame.columns:
+        frame = frame.assign(symbol="")
+
+    ts = (
+        pd.to_datetime(frame["timestamp"], utc=True, format="ISO8601")
+        .dt.tz_localize(None)
+        .to_numpy(dtype="datetime64[ns]")
+        .view("int64")
+    )
+    codes, names = pd.factorize(frame["symbol"].astype(str), sort=True)
+    order = np.lexsort((ts, codes))
+    frame = frame.iloc[order].reset_index(drop=True)
+    ts = ts[order]
+    codes = codes[order]
+    price = frame["price"].to_numpy(dtype=float)
+    size = frame["size"].to_numpy(dtype=float)
+    n = len(frame)
+
+    # Index of the first trade of each row's symbol
+    new_symbol = np.r_[True, codes[1:] != codes[:-1]] if n else np.zeros(0, bool)
+    symbol_start = np.maximum.accumulate(np.where(new_symbol, np.arange(n), 0))
+
+    if kind == "time":
+        width = pd.Timedelta(threshold).value
+        key = ts // width
+        carry = np.zeros(n)
+    else:
+        amounts = {"tick": np.ones(n), "volume": size, "dollar": price * size}
+        amount = amounts[kind]
+        total = np.cumsum(amount)
+        before = total - amount - (total - amount)[symbol_start]
+        if offsets:
+            starting = np.array([offsets.get(str(name), 0.0) for name in names])
+            before = before + starting[codes]
+        key = np.floor(before / float(threshold)).astype(np.int64)
+        carry = before - key * float(threshold)
+
+    new_bar = new_symbol | np.r_[True, key[1:] != key[:-1]] if n else new_symbol
+    ids = np.cumsum(new_bar) - 1
+    starts = np.flatnonzero(new_bar)
+    n_bars = len(starts)
+
+    volume = np.add.reduceat(size, starts) if n else np.zeros(0)
+    trade_count = np.diff(np.r_[starts, n])
+    if kind == "time":
+        date = (key[starts] * width).astype("datetime64[ns]")
+    else:
+        date = ts[starts].astype("datetime64[ns]")
+
+    # OHLC and vwap only come from trades whose conditions update them
+    if exclude_conditions is not None and "conditions" in frame.columns:
+        eligible = ~has_condition(frame["conditions"].tolist(), exclude_conditions)
+    else:
+        eligible = np.ones(n, dtype=bool)
+
+    open_, high, low, close, vwap = (np.full(n_bars, np.nan) for _ in range(5))
+    e_ids, e_price, e_size = ids[eligible], price[eligible], size[eligible]
+    if len(e_ids):
+        e_starts = np.flatnonzero(np.r_[True, e_ids[1:] != e_ids[:-1]])
+        e_ends = np.r_[e_starts[1:], len(e_ids)] - 1
+        bar = e_ids[e_starts]
+        open_[bar] = e_price[e_starts]
+        close[bar] = e_price[e_ends]
+        high[bar] = np.maximum.reduceat(e_price, e_starts)
+        low[bar] = np.minimum.reduceat(e_price, e_starts)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwap[bar] = np.add.reduceat(e_price * e_size, e_starts) / np.add.reduceat(
+                e_size, e_starts
+            )
+
+    bars = pd.DataFrame(
+        {
+            "symbol": np.asarray(names, dtype=object)[codes[starts]],
+            "date": date,
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume.astype(np.int64),
+            "trade_count": trade_count.astype(np.int64),
+            "vwap": vwap,
+        },
+        columns=BAR_COLUMNS,
+    )
+    return bars, ids, frame, carry
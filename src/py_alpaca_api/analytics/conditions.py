@@ -0,0 +1,239 @@
+"""Vectorized decoding of trade and quote condition and exchange codes."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.models.trade_model import TradeBatch, TradeModel, trades_to_frame
+
+if TYPE_CHECKING:
+    from py_alpaca_api.stock.metadata import Metadata
+
+# CTA/UTP sale conditions whose trades do not update the open, high, low or
+# close of consolidated bars (their volume still counts); all codes are one
+# character long.
+DEFAULT_EXCLUDED_CONDITIONS: frozenset[str] = frozenset("BCGHIMNPQRTUVWZ479")
+
+# Keywords identifying the above conditions in `Metadata.get_condition_codes` names
+EXCLUDED_CONDITION_KEYWORDS: tuple[str, ...] = (
+    "average price",
+    "cash",
+    "bunched sold",
+    "price variation",
+    "odd lot",
+    "official close",
+    "official open",
+    "next day",
+    "prior reference",
+    "seller",
+    "form t",
+    "extended trading hours",
+    "sold out of sequence",
+    "contingent",
+    "derivatively priced",
+    "corrected consolidated close",
+)
+
+# Trade flag columns and the condition codes that set them
+TRADE_CONDITION_FLAGS: dict[str, frozenset[str]] = {
+    "is_odd_lot": frozenset("I"),
+    "is_extended_hours": frozenset("TU"),
+    "is_average_price": frozenset("BW"),
+    "is_contingent": frozenset("V7"),
+    "is_derivatively_priced": frozenset("4"),
+    "is_intermarket_sweep": frozenset("F"),
+    "is_official_open_close": frozenset("QM6O"),
+    "updates_last": DEFAULT_EXCLUDED_CONDITIONS,
+}
+
+# Quote flag columns and the condition codes that set them
+QUOTE_CONDITION_FLAGS: dict[str, frozenset[str]] = {
+    "is_regular": frozenset("R"),
+    "is_closed": frozenset("L"),
+}
+
+EXCHANGE_COLUMNS: tuple[str, ...] = ("exchange", "ask_exchange", "bid_exchange")
+
+
+def excluded_conditions(
+    metadata: Metadata | None = None, tapes: Sequence[str] = ("A", "B", "C")
+) -> frozenset[str]:
+    """Returns the trade condition codes that do not update OHLC.
+
+    Without `metadata` the built-in CTA/UTP set is returned. With it, the current
+    condition names of each tape are fetched with `Metadata.get_condition_codes`
+    (cached by the client) and matched against `EXCLUDED_CONDITION_KEYWORDS`.
+
+    Args:
+        metadata: Optional Metadata client used to look up the condition names.
+        tapes: The tapes whose conditions are looked up. Defaults to all tapes.
+
+    Returns:
+        frozenset[str]: The excluded condition codes.
+    """
+    if metadata is None:
+        return DEFAULT_EXCLUDED_CONDITIONS
+
+    codes: set[str] = set()
+    for tape in tapes:
+        for code, name in metadata.get_condition_codes(
+            ticktype="trade", tape=tape
+        ).items():
+            if any(keyword in name.lower() for keyword in EXCLUDED_CONDITION_KEYWORDS):
+                codes.add(code)
+    return frozenset(codes)
+
+
+def has_condition(conditions: Sequence, codes: Iterable[str]) -> np.ndarray:
+    """Flags trades carrying any of the given condition codes.
+
+    Condition lists are factorized first, so each distinct combination is only
+    checked once no matter how many trades share it.
+
+    Args:
+        conditions: One condition list (or comma-separated string, or None) per trade.
+        codes: The condition codes to look for.
+
+    Returns:
+        np.ndarray: A boolean array with one flag per trade.
+    """
+    return condition_flags(conditions, {"flag": codes})["flag"]
+
+
+def condition_flags(
+    conditions: Sequence,
+    flags: Mapping[str, Iterable[str]] | None = None,
+    excluded: Iterable[str] | None = None,
+) -> dict[str, np.ndarray]:
+    """Computes boolean flag columns from per-tick condition lists.
+
+    The condition lists are factorized once into their distinct combinations,
+    every flag is evaluated per combination, and the results are broadcast back
+    with the factorized labels.
+
+    Args:
+        conditions: One condition list (or comma-separated string, or None) per tick.
+        flags: Maps each flag name to the condition codes that set it. Names
+            starting with "updates_" are set when none of their codes is present.
+            Defaults to `TRADE_CONDITION_FLAGS`.
+        excluded: Optional codes of the "updates_last" flag, e.g. from
+            `excluded_conditions(metadata)`. Defaults to the codes in `flags`.
+
+    Returns:
+        dict[str, np.ndarray]: One boolean array per flag.
+    """
+    if flags is None:
+        flags = TRADE_CONDITION_FLAGS
+    if excluded is not None and "updates_last" in flags:
+        flags = {**flags, "updates_last": excluded}
+    keys = [_condition_key(value) for value in conditions]
+    if not keys:
+        return {name: np.zeros(0, dtype=bool) for name in flags}
+
+    labels, uniques = pd.factorize(pd.Series(keys, dtype=object))
+    result = {}
+    for name, codes in flags.items():
+        lookup = frozenset(codes)
+        per_combo = np.array(
+            [not lookup.isdisjoint(combo) for combo in uniques], dtype=bool
+        )
+        if name.startswith("updates_"):
+            per_combo = ~per_combo
+        result[name] = per_combo[labels]
+    return result
+
+
+def explode_conditions(frame: pd.DataFrame) -> pd.DataFrame:
+    """Returns one row per tick and condition code, for grouping by condition.
+
+    Args:
+        frame: A trades or quotes DataFrame with a `conditions` column.
+
+    Returns:
+        pd.DataFrame: The exploded frame with a categorical `condition` column
+        in place of `conditions`; ticks without conditions get a missing value.
+    """
+    exploded = frame.assign(
+        condition=[list(_condition_key(value)) for value in frame["conditions"]]
+    ).explode("condition")
+    exploded["condition"] = exploded["condition"].astype("category")
+    return exploded.drop(columns="conditions")
+
+
+def decode_exchanges(codes: Sequence, exchanges: Mapping[str, str]) -> np.ndarray:
+    """Maps exchange codes to exchange names across a whole column.
+
+    Args:
+        codes: One exchange code per tick.
+        exchanges: Exchange codes mapped to names, e.g. from
+            `Metadata.get_exchange_codes`.
+
+    Returns:
+        np.ndarray: The exchange names, or None for unknown codes.
+    """
+    labels, uniques = pd.factorize(pd.Series(codes, dtype=object))
+    names = np.array([exchanges.get(code) for code in uniques] + [None], dtype=object)
+    return names[labels]  # Missing codes have label -1, the trailing None
+
+
+def decode_ticks(
+    ticks: pd.DataFrame | TradeBatch | Sequence[TradeModel],
+    flags: Mapping[str, Iterable[str]] | None = None,
+    exchanges: Mapping[str, str] | None = None,
+    metadata: Metadata | None = None,
+    excluded: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """Adds condition flag and exchange name columns to trades or quotes.
+
+    Args:
+        ticks: Trades as returned by `Trades.get_all_trades`, a `TradeBatch`, or a
+            trades or quotes DataFrame.
+        flags: The flag columns to add, as for `condition_flags`. Defaults to
+            `TRADE_CONDITION_FLAGS`; use `QUOTE_CONDITION_FLAGS` for quotes.
+        exchanges: Exchange codes mapped to names. Looked up with
+            `metadata.get_exchange_codes()` (cached by the client) when not given.
+        metadata: Optional Metadata client used for the exchange names and the
+            excluded conditions.
+        excluded: The codes of the "updates_last" flag. Defaults to
+            `excluded_conditions(metadata)` when a Metadata client is given.
+
+    Returns:
+        pd.DataFrame: A copy of the ticks with one boolean column per flag and an
+        `<column>_name` column for each exchange column, when names are available.
+    """
+    frame = trades_to_frame(ticks).copy()
+    if "conditions" in frame.columns:
+        if (
+            excluded is None
+            and metadata is not None
+            and "updates_last" in (flags or TRADE_CONDITION_FLAGS)
+        ):
+            excluded = excluded_conditions(metadata)
+        for name, values in condition_flags(
+            frame["conditions"], flags, excluded
+        ).items():
+            frame[name] = values
+
+    if exchanges is None and metadata is not None:
+        exchanges = metadata.get_exchange_codes()
+    if exchanges is not None:
+        for column in EXCHANGE_COLUMNS:
+            if column in frame.columns:
+                frame[f"{column}_name"] = decode_exchanges(frame[column], exchanges)
+    return frame
+
+
+def _condition_key(value: object) -> tuple[str, ...]:
+    """Normalize a condition list, string or missing value to a hashable tuple."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ()
+    if isinstance(value, bytes):
+        value = value.decode()
+    if isinstance(value, str):
+        # Joined with commas by `compact_quotes`, or concatenated by the tick store
+        return tuple(code for code in value if code not in ", ")
+    return tuple(value)  # type: ignore[arg-type]
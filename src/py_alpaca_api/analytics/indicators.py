@@ -0,0 +1,605 @@
+"""Technical indicators vectorized across symbols, with incremental updates."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.models.bar_panel_model import BarPanel
+
+Outputs = dict[str, np.ndarray]
+
+
+class Indicator(ABC):
+    """Base of the indicators.
+
+    An indicator takes the bars of many symbols at once: a long frame as returned
+    by `History.get_stock_data` (one row per symbol and bar), a panel frame as
+    returned by `History.get_stock_panel` ((field, symbol) columns) or a
+    `BarPanel`. The bars are laid out as one (bar, symbol) array per field, so
+    every symbol is computed by the same NumPy operations.
+
+    State is kept per symbol: calling `update()` again with only the bars appended
+    since gives the values a full recomputation would. Missing values (NaN) are
+    gaps, which give NaN and do not advance the indicator, so windows span each
+    symbol's own bars like a per-symbol groupby.
+
+    Constructors raise `ValidationError` for windows below 1.
+    """
+
+    INPUTS: ClassVar[tuple[str, ...]] = ("close",)
+    OUTPUTS: ClassVar[tuple[str, ...]] = ("value",)
+
+    def __init__(self) -> None:
+        self.symbols: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._state: dict[str, np.ndarray] = {}
+        self._fills: dict[str, float] = {}
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """The name of the indicator's long-frame result, e.g. "sma_20"."""
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        """The bar fields the indicator reads."""
+        return self.INPUTS
+
+    def update(self, data: Any) -> Any:
+        """Computes the indicator for new bars and advances its state.
+
+        Args:
+            data: A long frame, a panel frame or a BarPanel holding the bars
+                since the last update (all bars on the first call). Symbols not
+                seen before start with an empty history.
+
+        Returns:
+            The values for `data`, shaped like it: a Series aligned to the rows of
+            a long frame, a date-by-symbol DataFrame for a panel frame, or an array
+            for a BarPanel. Indicators with several outputs (bands) return a
+            DataFrame with one column per output for a long frame, (field, symbol)
+            columns for a panel frame, and a dict of arrays for a BarPanel.
+
+        Raises:
+            ValidationError: If the data is not bars, or lacks an input field.
+        """
+        symbols, values, rebuild = _unpack(data, self.inputs)
+        columns = self._columns(symbols)
+        rows = len(next(iter(values.values())))
+
+        if rows == 0:
+            outputs = {name: np.empty((0, len(columns))) for name in self.OUTPUTS}
+            return rebuild(outputs, self)
+
+        if len(columns) == len(self.symbols) and np.array_equal(
+            columns, np.arange(len(columns))
+        ):
+            full = values
+        else:
+            full = {}
+            for field, array in values.items():
+                full[field] = np.full((rows, len(self.symbols)), np.nan)
+                full[field][:, columns] = array
+
+        outputs = self._update(full)
+        return rebuild({name: out[:, columns] for name, out in outputs.items()}, self)
+
+    def reset(self) -> None:
+        """Forgets every symbol and its state."""
+        self.symbols = []
+        self._positions = {}
+        for key, array in self._state.items():
+            self._state[key] = array[..., :0]
+
+    @abstractmethod
+    def _update(self, values: Outputs) -> Outputs:
+        """Computes the outputs of (bar, symbol) arrays covering every known symbol."""
+
+    ############################################
+    # State
+    ############################################
+    def _register(self, key: str, fill: float, rows: int | None = None) -> None:
+        """Declares a per-symbol state array, optionally with `rows` rows."""
+        shape = (0,) if rows is None else (rows, 0)
+        self._state[key] = np.full(shape, fill)
+        self._fills[key] = fill
+
+    def _columns(self, symbols: list[str]) -> np.ndarray:
+        """Returns the state columns of symbols, adding columns for new ones."""
+        for symbol in symbols:
+            if symbol not in self._positions:
+                self._positions[symbol] = len(self.symbols)
+                self.symbols.append(symbol)
+
+        count = len(self.symbols)
+        for key, array in self._state.items():
+            missing = count - array.shape[-1]
+            if missing:
+                padding = np.full((*array.shape[:-1], missing), self._fills[key])
+                self._state[key] = np.concatenate([array, padding], axis=-1)
+        return np.array([self._positions[s] for s in symbols], dtype=np.intp)
+
+    def _windows(
+        self, values: Outputs, window: int
+    ) -> tuple[Outputs, Callable[[np.ndarray], np.ndarray]]:
+        """Returns the trailing windows of each symbol's own bars.
+
+        The valid bars of each symbol are moved to the top of its column and
+        appended to the last `window - 1` valid bars kept from earlier updates.
+
+        Args:
+            values: (bar, symbol) arrays of the fields, each with a buffer
+                registered as "buffer_<field>".
+            window: The window length.
+
+        Returns:
+            The (bar, symbol, window) views of each field, in compacted order, and
+            a function putting compacted (bar, symbol) results back in bar order,
+            with NaN at gaps.
+        """
+        valid = np.all([~np.isnan(v) for v in values.values()], axis=0)
+        order = np.argsort(~valid, axis=0, kind="stable")
+        dense_valid = np.take_along_axis(valid, order, axis=0)
+        tail = valid.sum(axis=0) + np.arange(window - 1)[:, None]
+
+        windows = {}
+        for field, array in values.items():
+            dense = np.take_along_axis(array, order, axis=0)
+            dense[~dense_valid] = np.nan
+            extended = np.concatenate([self._state[f"buffer_{field}"], dense])
+            self._state[f"buffer_{field}"] = np.take_along_axis(extended, tail, axis=0)
+            windows[field] = sliding_window_view(extended, window, axis=0)
+
+        def scatter(result: np.ndarray) -> np.ndarray:
+            out = np.empty_like(result)
+            np.put_along_axis(out, order, result, axis=0)
+            out[~valid] = np.nan
+            return out
+
+        return windows, scatter
+
+    def _wilder(
+        self, key: str, value: np.ndarray, valid: np.ndarray, window: int
+    ) -> np.ndarray:
+        """Advances a Wilder moving average by one bar per symbol.
+
+        The average starts as the mean of the first `window` values and then
+        moves by 1/window of each new value's difference.
+
+        Returns:
+            The averages, NaN for symbols without a value or a full first window.
+        """
+        count = self._state[f"{key}_count"] + valid
+        seeding = valid & (count <= window)
+        total = np.where(
+            seeding, self._state[f"{key}_total"] + value, self._state[f"{key}_total"]
+        )
+        average = np.where(
+            seeding & (count == window), total / window, self._state[f"{key}_average"]
+        )
+        average = np.where(
+            valid & (count > window), (average * (window - 1) + value) / window, average
+        )
+        self._state[f"{key}_count"] = count
+        self._state[f"{key}_total"] = total
+        self._state[f"{key}_average"] = average
+        return np.where(valid & (count >= window), average, np.nan)
+
+    def _register_wilder(self, key: str) -> None:
+        self._register(f"{key}_count", 0)
+        self._register(f"{key}_total", 0.0)
+        self._register(f"{key}_average", np.nan)
+
+
+def _validate_window(window: int, name: str = "window") -> None:
+    if window < 1:
+        raise ValidationError(f"{name} must be at least 1")
+
+
+############################################
+# Indicators
+############################################
+class SMA(Indicator):
+    """Simple moving average of a field over the last `window` bars."""
+
+    def __init__(self, window: int = 20, field: str = "close") -> None:
+        _validate_window(window)
+        super().__init__()
+        self.window = window
+        self.field = field
+        self._register(f"buffer_{field}", np.nan, window - 1)
+
+    @property
+    def name(self) -> str:
+        return f"sma_{self.window}"
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return (self.field,)
+
+    def _update(self, values: Outputs) -> Outputs:
+        windows, scatter = self._windows(values, self.window)
+        return {"value": scatter(windows[self.field].mean(axis=-1))}
+
+
+class EMA(Indicator):
+    """Exponential moving average of a field, with alpha = 2 / (span + 1).
+
+    The average starts at each symbol's first value, like pandas'
+    `ewm(span=span, adjust=False)`.
+    """
+
+    def __init__(self, span: int = 20, field: str = "close") -> None:
+        _validate_window(span, "span")
+        super().__init__()
+        self.span = span
+        self.field = field
+        self._register("average", np.nan)
+
+    @property
+    def name(self) -> str:
+        return f"ema_{self.span}"
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return (self.field,)
+
+    def _update(self, values: Outputs) -> Outputs:
+        prices = values[self.field]
+        alpha = 2 / (self.span + 1)
+        average = self._state["average"]
+        out = np.full(prices.shape, np.nan)
+        for i, price in enumerate(prices):
+            valid = ~np.isnan(price)
+            step = np.where(
+                np.isnan(average), price, average + alpha * (price - average)
+            )
+            average = np.where(valid, step, average)
+            out[i, valid] = average[valid]
+        self._state["average"] = average
+        return {"value": out}
+
+
+class RSI(Indicator):
+    """Relative strength index of a field, with Wilder's smoothing.
+
+    The first value comes after `window` changes. A window without losses gives
+    100, and one without gains or losses 50.
+    """
+
+    def __init__(self, window: int = 14, field: str = "close") -> None:
+        _validate_window(window)
+        super().__init__()
+        self.window = window
+        self.field = field
+        self._register("previous", np.nan)
+        self._register_wilder("gain")
+        self._register_wilder("loss")
+
+    @property
+    def name(self) -> str:
+        return f"rsi_{self.window}"
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return (self.field,)
+
+    def _update(self, values: Outputs) -> Outputs:
+        prices = values[self.field]
+        out = np.full(prices.shape, np.nan)
+        for i, price in enumerate(prices):
+            previous = self._state["previous"]
+            valid = ~np.isnan(price)
+            change = np.where(valid & ~np.isnan(previous), price - previous, np.nan)
+            changed = ~np.isnan(change)
+            gain = self._wilder("gain", np.maximum(change, 0), changed, self.window)
+            loss = self._wilder("loss", np.maximum(-change, 0), changed, self.window)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rsi = 100 - 100 / (1 + gain / loss)
+            rsi = np.where(loss == 0, np.where(gain == 0, 50.0, 100.0), rsi)
+            out[i] = np.where(np.isnan(gain), np.nan, rsi)
+            self._state["previous"] = np.where(valid, price, previous)
+        return {"value": out}
+
+
+class ATR(Indicator):
+    """Average true range, with Wilder's smoothing.
+
+    The true range of a symbol's first bar is its high minus its low, so the first
+    value comes with the `window`-th bar.
+    """
+
+    INPUTS: ClassVar[tuple[str, ...]] = ("high", "low", "close")
+
+    def __init__(self, window: int = 14) -> None:
+        _validate_window(window)
+        super().__init__()
+        self.window = window
+        self._register("previous", np.nan)
+        self._register_wilder("range")
+
+    @property
+    def name(self) -> str:
+        return f"atr_{self.window}"
+
+    def _update(self, values: Outputs) -> Outputs:
+        highs, lows, closes = values["high"], values["low"], values["close"]
+        out = np.full(closes.shape, np.nan)
+        for i in range(len(closes)):
+            high, low, close = highs[i], lows[i], closes[i]
+            previous = self._state["previous"]
+            valid = ~(np.isnan(high) | np.isnan(low) | np.isnan(close))
+            true_range = np.where(
+                np.isnan(previous),
+                high - low,
+                np.maximum(
+                    high - low,
+                    np.maximum(np.abs(high - previous), np.abs(low - previous)),
+                ),
+            )
+            out[i] = self._wilder("range", true_range, valid, self.window)
+            self._state["previous"] = np.where(valid, close, previous)
+        return {"value": out}
+
+
+class BollingerBands(Indicator):
+    """Moving average of a field with bands `num_std` standard deviations away."""
+
+    OUTPUTS: ClassVar[tuple[str, ...]] = ("middle", "upper", "lower")
+
+    def __init__(
+        self,
+        window: int = 20,
+        num_std: float = 2.0,
+        field: str = "close",
+        ddof: int = 0,
+    ) -> None:
+        _validate_window(window)
+        super().__init__()
+        self.window = window
+        self.num_std = num_std
+        self.field = field
+        self.ddof = ddof
+        self._register(f"buffer_{field}", np.nan, window - 1)
+
+    @property
+    def name(self) -> str:
+        return f"bollinger_{self.window}"
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return (self.field,)
+
+    def _update(self, values: Outputs) -> Outputs:
+        windows, scatter = self._windows(values, self.window)
+        prices = windows[self.field]
+        middle = prices.mean(axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            width = self.num_std * prices.std(axis=-1, ddof=self.ddof)
+        return {
+            "middle": scatter(middle),
+            "upper": scatter(middle + width),
+            "lower": scatter(middle - width),
+        }
+
+
+class VWAPBands(Indicator):
+    """Rolling volume-weighted average price with standard deviation bands.
+
+    Each bar contributes its typical price, (high + low + close) / 3, weighted by
+    its volume; the bands are `num_std` volume-weighted standard deviations away.
+    Windows without volume give NaN.
+    """
+
+    INPUTS: ClassVar[tuple[str, ...]] = ("high", "low", "close", "volume")
+    OUTPUTS: ClassVar[tuple[str, ...]] = ("vwap", "upper", "lower")
+
+    def __init__(self, window: int = 20, num_std: float = 2.0) -> None:
+        _validate_window(window)
+        super().__init__()
+        self.window = window
+        self.num_std = num_std
+        self._register("buffer_typical", np.nan, window - 1)
+        self._register("buffer_volume", np.nan, window - 1)
+
+    @property
+    def name(self) -> str:
+        return f"vwap_bands_{self.window}"
+
+    def _update(self, values: Outputs) -> Outputs:
+        typical = (values["high"] + values["low"] + values["close"]) / 3
+        windows, scatter = self._windows(
+            {"typical": typical, "volume": values["volume"]}, self.window
+        )
+        prices, volumes = windows["typical"], windows["volume"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            total = volumes.sum(axis=-1)
+            vwap = (prices * volumes).sum(axis=-1) / total
+            variance = (volumes * (prices - vwap[..., None]) ** 2).sum(axis=-1) / total
+        width = self.num_std * np.sqrt(variance)
+        return {
+            "vwap": scatter(vwap),
+            "upper": scatter(vwap + width),
+            "lower": scatter(vwap - width),
+        }
+
+
+class ZScore(Indicator):
+    """Distance of a field from its moving average, in moving standard deviations.
+
+    Windows without variation give NaN.
+    """
+
+    def __init__(self, window: int = 20, field: str = "close", ddof: int = 0) -> None:
+        _validate_window(window)
+        super().__init__()
+        self.window = window
+        self.field = field
+        self.ddof = ddof
+        self._register(f"buffer_{field}", np.nan, window - 1)
+
+    @property
+    def name(self) -> str:
+        return f"zscore_{self.window}"
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return (self.field,)
+
+    def _update(self, values: Outputs) -> Outputs:
+        windows, scatter = self._windows(values, self.window)
+        prices = windows[self.field]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std = prices.std(axis=-1, ddof=self.ddof)
+            zscore = (prices[..., -1] - prices.mean(axis=-1)) / std
+        return {"value": scatter(np.where(std > 0, zscore, np.nan))}
+
+
+############################################
+# One-shot functions
+############################################
+def sma(data: Any, window: int = 20, field: str = "close") -> Any:
+    """Computes the simple moving average of bars; see `SMA` and `Indicator.update`."""
+    return SMA(window, field).update(data)
+
+
+def ema(data: Any, span: int = 20, field: str = "close") -> Any:
+    """Computes the exponential moving average of bars; see `EMA` and `Indicator.update`."""
+    return EMA(span, field).update(data)
+
+
+def rsi(data: Any, window: int = 14, field: str = "close") -> Any:
+    """Computes the relative strength index of bars; see `RSI` and `Indicator.update`."""
+    return RSI(window, field).update(data)
+
+
+def atr(data: Any, window: int = 14) -> Any:
+    """Computes the average true range of bars; see `ATR` and `Indicator.update`."""
+    return ATR(window).update(data)
+
+
+def bollinger_bands(
+    data: Any, window: int = 20, num_std: float = 2.0, field: str = "close"
+) -> Any:
+    """Computes Bollinger bands of bars; see `BollingerBands` and `Indicator.update`."""
+    return BollingerBands(window, num_std, field).update(data)
+
+
+def vwap_bands(data: Any, window: int = 20, num_std: float = 2.0) -> Any:
+    """Computes rolling VWAP bands of bars; see `VWAPBands` and `Indicator.update`."""
+    return VWAPBands(window, num_std).update(data)
+
+
+def zscore(data: Any, window: int = 20, field: str = "close") -> Any:
+    """Computes the rolling z-score of bars; see `ZScore` and `Indicator.update`."""
+    return ZScore(window, field).update(data)
+
+
+############################################
+# Layouts
+############################################
+Rebuild = Callable[[Outputs, Indicator], Any]
+
+
+def _unpack(data: Any, fields: tuple[str, ...]) -> tuple[list[str], Outputs, Rebuild]:
+    """Lays out bars as one (bar, symbol) array per field.
+
+    Returns:
+        The symbols, the arrays, and a function shaping outputs like `data`.
+
+    Raises:
+        ValidationError: If the data is not bars, or lacks a field.
+    """
+    if isinstance(data, BarPanel):
+        _check_fields(fields, data.fields)
+        values = {field: np.asarray(data[field], dtype=float) for field in fields}
+        return list(data.symbols), values, _array_result
+
+    if isinstance(data, pd.DataFrame) and isinstance(data.columns, pd.MultiIndex):
+        _check_fields(fields, data.columns.get_level_values(0))
+        symbols = list(data.columns.get_level_values(-1).unique())
+        values = {
+            field: data[field].reindex(columns=symbols).to_numpy(dtype=float)
+            for field in fields
+        }
+        return (
+            symbols,
+            values,
+            lambda outputs, indicator: _panel_result(
+                outputs, indicator, data.index, symbols
+            ),
+        )
+
+    if isinstance(data, pd.DataFrame) and "symbol" in data.columns:
+        _check_fields(fields, data.columns)
+        return _unpack_long(data, fields)
+
+    raise ValidationError(
+        "Expected a long frame with a symbol column, a panel frame with "
+        "(field, symbol) columns, or a BarPanel"
+    )
+
+
+def _unpack_long(
+    data: pd.DataFrame, fields: tuple[str, ...]
+) -> tuple[list[str], Outputs, Rebuild]:
+    """Lays out a long frame with row k of each column holding a symbol's k-th bar."""
+    codes, uniques = pd.factorize(data["symbol"])
+    keys = (data["date"].to_numpy(), codes) if "date" in data.columns else (codes,)
+    order = np.lexsort(keys)
+    sorted_codes = codes[order]
+    counts = np.bincount(codes, minlength=len(uniques))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    positions = np.arange(len(order)) - starts[sorted_codes]
+    rows = int(np.max(counts, initial=0))
+
+    values = {}
+    for field in fields:
+        grid = np.full((rows, len(uniques)), np.nan)
+        grid[positions, sorted_codes] = data[field].to_numpy(dtype=float)[order]
+        values[field] = grid
+
+    def rebuild(outputs: Outputs, indicator: Indicator) -> Any:
+        columns = {}
+        for name, out in outputs.items():
+            flat = np.empty(len(order))
+            flat[order] = out[positions, sorted_codes]
+            columns[name] = flat
+        if len(indicator.OUTPUTS) == 1:
+            return pd.Series(columns["value"], index=data.index, name=indicator.name)
+        return pd.DataFrame(
+            {f"{indicator.name}_{name}": flat for name, flat in columns.items()},
+            index=data.index,
+        )
+
+    return [str(symbol) for symbol in uniques], values, rebuild
+
+
+def _array_result(outputs: Outputs, indicator: Indicator) -> Any:
+    return outputs["value"] if len(indicator.OUTPUTS) == 1 else outputs
+
+
+def _panel_result(
+    outputs: Outputs, indicator: Indicator, index: pd.Index, symbols: list[str]
+) -> pd.DataFrame:
+    if len(indicator.OUTPUTS) == 1:
+        return pd.DataFrame(
+            outputs["value"], index=index, columns=pd.Index(symbols, name="symbol")
+        )
+    columns = pd.MultiIndex.from_product(
+        [list(outputs), symbols], names=["field", "symbol"]
+    )
+    return pd.DataFrame(np.hstack(list(outputs.values())), index=index, columns=columns)
+
+
+def _check_fields(fields: tuple[str, ...], available: Any) -> None:
+    missing = [field for field in fields if field not in set(available)]
+    if missing:
+        raise ValidationError(f"Missing bar fields: {', '.join(missing)}")
@@ -0,0 +1,186 @@
+"""Local resampling of OHLCV bars into higher timeframes."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+MARKET_TZ = "America/New_York"
+
+# Intraday timeframes expressed in minutes; keys match History.TIMEFRAME_MAPPING
+INTRADAY_MINUTES: dict[str, int] = {
+    "1m": 1,
+    "5m": 5,
+    "15m": 15,
+    "30m": 30,
+    "1h": 60,
+    "4h": 240,
+}
+CALENDAR_TIMEFRAMES = ("1d", "1w", "1M")
+
+BAR_COLUMNS = [
+    "symbol",
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "trade_count",
+    "vwap",
+]
+
+
+def resample_bars(
+    bars: pd.DataFrame,
+    timeframe: str,
+    calendar: pd.DataFrame | None = None,
+    origin: str = "clock",
+) -> pd.DataFrame:
+    """Resample a base bar series into a higher timeframe.
+
+    The input is a long frame as returned by `History.get_stock_data` (one row per
+    symbol and bar, `date` in naive UTC). Bars are bucketed in market time, so no
+    bucket ever spans two trading days, and aggregated with first open, max high,
+    min low, last close, summed volume and trade count and a volume-weighted vwap.
+
+    Args:
+        bars: The base bars to resample. The base timeframe must divide the target.
+        timeframe: The target timeframe ("5m", "15m", "30m", "1h", "4h", "1d", "1w" or "1M").
+        calendar: Optional market calendar as returned by `Market.calendar`. When
+            given, base bars outside each session's open/close are dropped and days
+            that are not trading days are ignored.
+        origin: Where intraday buckets are anchored. "clock" aligns buckets to the
+            wall clock like the Alpaca API does, "session" anchors them at each
+            session's open (requires `calendar`). Defaults to "clock".
+
+    Returns:
+        pd.DataFrame: The resampled bars with the same columns as the input.
+
+    Raises:
+        ValueError: If the timeframe or origin is invalid.
+    """
+    if timeframe not in INTRADAY_MINUTES and timeframe not in CALENDAR_TIMEFRAMES:
+        raise ValueError(
+            f"Invalid timeframe. Must be one of: {', '.join([*INTRADAY_MINUTES, *CALENDAR_TIMEFRAMES])}"
+        )
+    if origin not in ("clock", "session"):
+        raise ValueError('Invalid origin. Must be "clock" or "session"')
+    if origin == "session" and calendar is None:
+        raise ValueError('A market calendar is required for origin="session"')
+
+    if bars.empty:
+        return bars.copy()
+
+    df = bars
+    if not df.groupby("symbol", sort=False)["date"].is_monotonic_increasing.all():
+        df = df.sort_values(["symbol", "date"], kind="stable")
+
+    # Wall-clock market time of every base bar
+    dates = pd.DatetimeIndex(df["date"])
+    if dates.tz is None:
+        dates = dates.tz_localize("UTC")
+    wall = dates.tz_convert(MARKET_TZ).tz_localize(None)
+    day = wall.normalize()
+
+    keep = np.ones(len(df), dtype=bool)
+    session_open = None
+    if calendar is not None:
+        sessions = calendar.set_index(pd.DatetimeIndex(calendar["date"]).normalize())
+        position = sessions.index.get_indexer(day)
+        keep = position >= 0
+        opens = _session_times(sessions, "open")
+        closes = _session_times(sessions, "close")
+        safe = np.where(keep, position, 0)
+        session_open = day + opens[safe]
+        session_close = day + closes[safe]
+        if timeframe in INTRADAY_MINUTES:
+            keep &= (wall >= session_open) & (wall < session_close)
+        # Daily and longer bars keep every bar of a trading day
+
+    bucket = _bucket_start(wall, day, timeframe, session_open, origin)
+
+    frame = pd.DataFrame(
+        {
+            "symbol": df["symbol"].to_numpy()[keep],
+            "bucket": bucket[keep],
+            "open": df["open"].to_numpy()[keep],
+            "high": df["high"].to_numpy()[keep],
+            "low": df["low"].to_numpy()[keep],
+            "close": df["close"].to_numpy()[keep],
+            "volume": df["volume"].to_numpy()[keep],
+            "trade_count": df["trade_count"].to_numpy()[keep],
+            "pv": (df["vwap"].to_numpy() * df["volume"].to_numpy())[keep],
+        }
+    )
+
+    grouped = frame.groupby(["symbol", "bucket"], sort=True)
+    result = grouped.agg(
+        open=("open", "first"),
+        high=("high", "max"),
+        low=("low", "min"),
+        close=("close", "last"),
+        volume=("volume", "sum"),
+        trade_count=("trade_count", "sum"),
+        pv=("pv", "sum"),
+    ).reset_index()
+
+    volume = result["volume"].to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vwap = np.where(volume > 0, result["pv"].to_numpy() / volume, np.nan)
+    result["vwap"] = np.where(np.isnan(vwap), result["close"].to_numpy(), vwap)
+
+    # Bucket starts are market wall-clock times; return naive UTC like the API
+    result["date"] = (
+        pd.DatetimeIndex(result["bucket"])
+        .tz_localize(MARKET_TZ, ambiguous=False, nonexistent="shift_forward")
+        .tz_convert("UTC")
+        .tz_localize(None)
+    )
+
+    return result[BAR_COLUMNS].astype(bars.dtypes[BAR_COLUMNS].to_dict())
+
+
+def _session_times(sessions: pd.DataFrame, column: str) -> pd.TimedeltaIndex:
+    """Converts a calendar time-of-day column into offsets from midnight.
+
+    Args:
+        sessions: Market calendar indexed by session date.
+        column: The "open" or "close" column.
+
+    Returns:
+        pd.TimedeltaIndex: The offset of each session time from midnight.
+    """
+    return pd.TimedeltaIndex(pd.to_timedelta(sessions[column].astype(str).to_numpy()))
+
+
+def _bucket_start(
+    wall: pd.DatetimeIndex,
+    day: pd.DatetimeIndex,
+    timeframe: str,
+    session_open: pd.DatetimeIndex | None,
+    origin: str,
+) -> pd.DatetimeIndex:
+    """Computes the wall-clock start of the bucket each bar falls into.
+
+    Args:
+        wall: Naive market-time timestamps of the base bars.
+        day: The trading day of each base bar.
+        timeframe: The target timeframe.
+        session_open: Session open of each bar's day, if a calendar was given.
+        origin: "clock" or "session" bucket anchoring.
+
+    Returns:
+        pd.DatetimeIndex: The bucket start of every base bar.
+    """
+    if timeframe in INTRADAY_MINUTES:
+        width = pd.Timedelta(minutes=INTRADAY_MINUTES[timeframe])
+        anchor = (
+            session_open if origin == "session" and session_open is not None else day
+        )
+        return anchor + ((wall - anchor) // width) * width
+    if timeframe == "1d":
+        return day
+    if timeframe == "1w":
+        return day - pd.to_timedelta(day.dayofweek, unit="D")
+    return day - pd.to_timedelta(day.day - 1, unit="D")
@@ -0,0 +1,182 @@
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.models.frame_utils import parse_timestamps
+
+MARKET_TZ = "America/New_York"
+
+# API bar keys mapped to column names and kinds
+BAR_FIELDS: dict[str, tuple[str, str]] = {
+    "t": ("date", "datetime"),
+    "o": ("open", "float"),
+    "h": ("high", "float"),
+    "l": ("low", "float"),
+    "c": ("close", "float"),
+    "v": ("volume", "int"),
+    "n": ("trade_count", "int"),
+    "vw": ("vwap", "float"),
+}
+
+# The bar values held by a panel, as API keys mapped to field names
+PANEL_FIELDS: dict[str, str] = {
+    key: name for key, (name, _) in BAR_FIELDS.items() if key != "t"
+}
+
+
+@dataclass
+class BarPanel:
+    """Wide, date-by-symbol bar data.
+
+    Every field is a 2D float64 array of shape (len(index), len(symbols)), aligned on
+    one shared, sorted timestamp index. Dates where a symbol has no bar hold NaN.
+    """
+
+    index: pd.DatetimeIndex
+    symbols: list[str]
+    fields: dict[str, np.ndarray]
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.fields[field]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.index), len(self.symbols)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Convert the panel to a DataFrame with (field, symbol) MultiIndex columns.
+
+        Returns:
+            A DataFrame indexed by date, with one column per field and symbol.
+        """
+        columns = pd.MultiIndex.from_product(
+            [list(self.fields), self.symbols], names=["field", "symbol"]
+        )
+        values = np.hstack(list(self.fields.values())) if self.fields else None
+        return pd.DataFrame(values, index=self.index, columns=columns)
+
+
+############################################
+# Data Class Bar Panel Conversion Functions
+############################################
+def session_index(calendar: pd.DataFrame, anchor: str = "date") -> pd.DatetimeIndex:
+    """Build a shared panel index from the trading calendar.
+
+    Args:
+        calendar: The calendar as returned by `Market.calendar`, with `date` and
+            `open` columns.
+        anchor: "date" for the session dates (naive midnight), or "open" for the
+            session opens (naive UTC). Defaults to "date".
+
+    Returns:
+        A sorted DatetimeIndex named "date" with one entry per session.
+
+    Raises:
+        ValidationError: If the anchor is invalid.
+    """
+    if anchor not in ("date", "open"):
+        raise ValidationError('Invalid anchor. Must be "date" or "open"')
+    dates = pd.DatetimeIndex(pd.to_datetime(calendar["date"])).normalize()
+    if anchor == "open":
+        opens = dates + pd.to_timedelta(calendar["open"].astype(str).to_numpy())
+        dates = opens.tz_localize(MARKET_TZ).tz_convert("UTC").tz_localize(None)
+    return pd.DatetimeIndex(dates, name="date").sort_values()
+
+
+def bar_panel_from_dict(
+    symbols_data: Mapping[str, Sequence[dict]],
+    symbols: list[str] | None = None,
+    index: pd.DatetimeIndex | None = None,
+    match: str = "auto",
+) -> BarPanel:
+    """Create a BarPanel directly from per-symbol bar lists.
+
+    Each symbol's bars are scattered into preallocated arrays by binary search on
+    the shared index, so no long frame is concatenated or sorted.
+
+    Args:
+        symbols_data: A dictionary mapping symbols to their raw API bars.
+        symbols: Optional column order. Defaults to the order of `symbols_data`.
+            Symbols without bars get an all-NaN column.
+        index: Optional shared index, e.g. from `session_index`. Bars not on the
+            index are dropped. Defaults to the sorted union of all bar timestamps.
+        match: How bars are placed on a given index: "timestamp" matches the bar
+            timestamps exactly (naive UTC), "session" matches daily bars by their
+            New York session date. Defaults to "auto", which matches by session
+            when the index holds dates only, like `session_index(calendar)`.
+
+    Returns:
+        An instance of `BarPanel` built from `symbols_data`.
+
+    Raises:
+        ValidationError: If `match` is invalid, or if an index is given and none
+            of the bars fall on it.
+    """
+    if match not in ("auto", "timestamp", "session"):
+        raise ValidationError('Invalid match. Must be "auto", "timestamp" or "session"')
+
+    symbols = list(symbols_data) if symbols is None else symbols
+    timestamps = {
+        symbol: parse_timestamps([bar["t"] for bar in symbols_data.get(symbol) or []])
+        for symbol in symbols
+    }
+
+    if index is None:
+        all_timestamps = [ts for ts in timestamps.values() if len(ts)]
+        index_values = (
+            np.unique(np.concatenate(all_timestamps))
+            if all_timestamps
+            else np.array([], dtype="datetime64[ns]")
+        )
+        index = pd.DatetimeIndex(index_values, name="date")
+        by_session = False
+    else:
+        is_dates = bool((index == index.normalize()).all())
+        by_session = match == "session" or (match == "auto" and is_dates)
+        index_values = (
+            _session_dates(index.to_numpy(dtype="datetime64[ns]"))
+            if by_session and not is_dates
+            else index.to_numpy(dtype="datetime64[ns]")
+        )
+        if by_session:
+            timestamps = {
+                symbol: _session_dates(ts) for symbol, ts in timestamps.items()
+            }
+
+    fields = {
+        name: np.full((len(index), len(symbols)), np.nan)
+        for name in PANEL_FIELDS.values()
+    }
+
+    total = placed = 0
+    for column, symbol in enumerate(symbols):
+        bars = symbols_data.get(symbol) or []
+        if not bars:
+            continue
+        ts = timestamps[symbol]
+        positions = np.searchsorted(index_values, ts)
+        on_index = positions < len(index_values)
+        on_index[on_index] = index_values[positions[on_index]] == ts[on_index]
+        rows = positions[on_index]
+        total += len(ts)
+        placed += int(on_index.sum())
+        for key, name in PANEL_FIELDS.items():
+            values = np.array([bar.get(key, np.nan) for bar in bars], dtype=float)
+            fields[name][rows, column] = values[on_index]
+
+    if total and not placed:
+        raise ValidationError(
+            f"None of the {total} bars fall on the given index; "
+            'use match="session" to align daily bars by session date'
+        )
+
+    return BarPanel(index=index, symbols=list(symbols), fields=fields)
+
+
+def _session_dates(timestamps: np.ndarray) -> np.ndarray:
+    """Return the New York session dates (naive midnight) of naive UTC timestamps."""
+    wall = pd.DatetimeIndex(timestamps).tz_localize("UTC").tz_convert(MARKET_TZ)
+    return wall.tz_localize(None).normalize().to_numpy(dtype="datetime64[ns]")
@@ -0,0 +1,321 @@
+from collections.abc import Sequence
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.exceptions import ValidationError
+
+OutputFormat = Literal["pandas", "polars", "arrow", "numpy"]
+OUTPUT_FORMATS: tuple[str, ...] = ("pandas", "polars", "arrow", "numpy")
+
+
+def validate_output(output: str) -> None:
+    """Validates an output format name.
+
+    Args:
+        output (str): The output format to validate.
+
+    Raises:
+        ValidationError: If the output format is not supported.
+    """
+    if output not in OUTPUT_FORMATS:
+        raise ValidationError(
+            f"Invalid output. Must be one of: {', '.join(OUTPUT_FORMATS)}"
+        )
+
+
+def _import_polars():
+    """Imports polars, which is an optional dependency.
+
+    Returns:
+        The polars module.
+
+    Raises:
+        ImportError: If polars is not installed.
+    """
+    try:
+        import polars as pl  # noqa: PLC0415
+    except ImportError as e:
+        raise ImportError(
+            'output="polars" requires polars. Install it with: pip install "py-alpaca-api[polars]"'
+        ) from e
+    return pl
+
+
+def import_pyarrow():
+    """Imports pyarrow, which is an optional dependency.
+
+    Returns:
+        The pyarrow module.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+    except ImportError as e:
+        raise ImportError(
+            'output="arrow" requires pyarrow. Install it with: pip install "py-alpaca-api[arrow]"'
+        ) from e
+    return pa
+
+
+############################################
+# Column Decoding Functions
+############################################
+def parse_timestamps(values: Sequence[str | None]) -> np.ndarray:
+    """Parses RFC-3339 timestamps into naive UTC datetime64 values.
+
+    Args:
+        values (Sequence[str | None]): The timestamps as returned by the API.
+
+    Returns:
+        np.ndarray: An array of datetime64[ns] values.
+    """
+    if not len(values):
+        return np.array([], dtype="datetime64[ns]")
+    parsed = pd.to_datetime(list(values), utc=True, format="ISO8601")
+    return parsed.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+
+
+def format_timestamp(value: np.datetime64) -> str:
+    """Formats a naive UTC timestamp as RFC-3339 without trailing zero digits.
+
+    Args:
+        value (np.datetime64): The timestamp, as parsed by `parse_timestamps`.
+
+    Returns:
+        str: The timestamp, e.g. "2024-01-02T14:30:00.5Z".
+    """
+    text = np.datetime_as_string(value, unit="ns")
+    seconds, _, fraction = text.partition(".")
+    fraction = fraction.rstrip("0")
+    return f"{seconds}.{fraction}Z" if fraction else f"{seconds}Z"
+
+
+def columns_from_records(
+    records: Sequence[dict],
+    fields: dict[str, tuple[str, str]],
+) -> dict[str, np.ndarray]:
+    """Decodes a list of API records into one NumPy array per column.
+
+    Args:
+        records (Sequence[dict]): The raw API records.
+        fields (dict[str, tuple[str, str]]): Maps each API key to a tuple of the
+            output column name and its kind: "datetime", "float", "int", "str"
+            or "object".
+
+    Returns:
+        dict[str, np.ndarray]: The decoded columns, in the order of `fields`.
+    """
+    columns: dict[str, np.ndarray] = {}
+    for key, (name, kind) in fields.items():
+        values = [record.get(key) for record in records]
+        if kind == "datetime":
+            columns[name] = parse_timestamps(values)
+        elif kind == "float":
+            columns[name] = np.array(
+                [np.nan if v is None else v for v in values], dtype="float64"
+            )
+        elif kind == "int":
+            columns[name] = np.array([v or 0 for v in values], dtype="int64")
+        elif kind == "str":
+            columns[name] = np.array([v or "" for v in values], dtype=object)
+        else:
+            columns[name] = np.empty(len(values), dtype=object)
+            columns[name][:] = values
+    return columns
+
+
+############################################
+# Frame Building Functions
+############################################
+def build_frame(columns: dict[str, np.ndarray], output: str) -> Any:
+    """Builds the requested output format directly from decoded columns.
+
+    Args:
+        columns (dict[str, np.ndarray]): Column arrays of equal length.
+        output (str): One of "pandas", "polars", "arrow" or "numpy".
+
+    Returns:
+        A pandas DataFrame, polars DataFrame, pyarrow Table or a dict of NumPy
+        arrays, depending on `output`.
+
+    Raises:
+        ValidationError: If the output format is not supported.
+        ImportError: If the optional library for the output format is missing.
+    """
+    validate_output(output)
+    if output == "numpy":
+        return columns
+    if output == "polars":
+        pl = _import_polars()
+        return pl.DataFrame(
+            {
+                name: list(values) if values.dtype == object else values
+                for name, values in columns.items()
+            }
+        )
+    if output == "arrow":
+        pa = import_pyarrow()
+        return pa.table(
+            {
+                name: pa.array(list(values) if values.dtype == object else values)
+                for name, values in columns.items()
+            }
+        )
+    return pd.DataFrame(columns)
+
+
+def convert_frame(df: pd.DataFrame, output: str) -> Any:
+    """Converts a pandas DataFrame to the requested output format.
+
+    A named or DatetimeIndex is kept as a regular column for formats without an
+    index, and timezone-aware timestamps are converted to naive UTC.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to convert.
+        output (str): One of "pandas", "polars", "arrow" or "numpy".
+
+    Returns:
+        The DataFrame in the requested format.
+
+    Raises:
+        ValidationError: If the output format is not supported.
+        ImportError: If the optional library for the output format is missing.
+    """
+    validate_output(output)
+    if output == "pandas":
+        return df
+    if df.index.name is not None or isinstance(df.index, pd.DatetimeIndex):
+        df = df.reset_index()
+    columns = {}
+    for name in df.columns:
+        series = df[name]
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+        columns[str(name)] = series.to_numpy()
+    return build_frame(columns, output)
+
+
+############################################
+# Compact Dtype Functions
+############################################
+# Largest absolute error accepted when storing a float column as float32
+FLOAT32_TOLERANCE = 1e-4
+
+BAR_CATEGORIES: tuple[str, ...] = ("symbol",)
+QUOTE_CATEGORIES: tuple[str, ...] = (
+    "symbol",
+    "ask_exchange",
+    "bid_exchange",
+    "tape",
+    "conditions",
+)
+
+
+def downcast_float(values: np.ndarray) -> np.ndarray:
+    """Converts a float64 array to float32 if no value moves by more than the tolerance.
+
+    Args:
+        values (np.ndarray): The float array to downcast.
+
+    Returns:
+        np.ndarray: The float32 array, or the original array if precision would be lost.
+    """
+    if values.dtype != np.float64:
+        return values
+    compact = values.astype(np.float32)
+    if np.allclose(compact, values, rtol=0, atol=FLOAT32_TOLERANCE, equal_nan=True):
+        return compact
+    return values
+
+
+def downcast_int(values: np.ndarray) -> np.ndarray:
+    """Converts an int64 array to int32 if every value fits.
+
+    Args:
+        values (np.ndarray): The integer array to downcast.
+
+    Returns:
+        np.ndarray: The int32 array, or the original array if a value is out of range.
+    """
+    if values.dtype != np.int64:
+        return values
+    info = np.iinfo(np.int32)
+    if not len(values) or (values.min() >= info.min and values.max() <= info.max):
+        return values.astype(np.int32)
+    return values
+
+
+def compact_columns(columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Downcasts the numeric columns of a column dictionary.
+
+    Args:
+        columns (dict[str, np.ndarray]): Decoded column arrays.
+
+    Returns:
+        dict[str, np.ndarray]: The columns with float32 and int32 arrays where possible.
+    """
+    return {
+        name: downcast_int(downcast_float(values)) for name, values in columns.items()
+    }
+
+
+def _compact_frame(df: pd.DataFrame, categories: Sequence[str]) -> pd.DataFrame:
+    """Downcasts numeric columns and turns repeated strings into categoricals.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to compact.
+        categories (Sequence[str]): The columns to store as categoricals.
+
+    Returns:
+        pd.DataFrame: A compacted copy of the DataFrame.
+    """
+    df = df.copy()
+    for name in df.columns:
+        series = df[name]
+        if name in categories:
+            df[name] = series.astype("category")
+        elif series.dtype in (np.float64, np.int64):
+            df[name] = downcast_int(downcast_float(series.to_numpy()))
+    return df
+
+
+def compact_bars(df: pd.DataFrame) -> pd.DataFrame:
+    """Compacts a bars DataFrame as returned by `History.get_stock_data`.
+
+    The symbol becomes a categorical, prices become float32 where they round-trip
+    within `FLOAT32_TOLERANCE`, and volume and trade counts become int32 where
+    they fit.
+
+    Args:
+        df (pd.DataFrame): The bars DataFrame.
+
+    Returns:
+        pd.DataFrame: A compacted copy of the DataFrame.
+    """
+    return _compact_frame(df, BAR_CATEGORIES)
+
+
+def compact_quotes(df: pd.DataFrame) -> pd.DataFrame:
+    """Compacts a quotes DataFrame as returned by `Quotes.get_historical_quotes`.
+
+    Exchanges and tape become categoricals, condition lists are joined into
+    comma-separated categoricals, prices become float32 where they round-trip
+    within `FLOAT32_TOLERANCE`, and sizes become int32 where they fit.
+
+    Args:
+        df (pd.DataFrame): The quotes DataFrame.
+
+    Returns:
+        pd.DataFrame: A compacted copy of the DataFrame.
+    """
+    if "conditions" in df.columns:
+        df = df.assign(
+            conditions=[
+                ",".join(c) if isinstance(c, list) else c for c in df["conditions"]
+            ]
+        )
+    return _compact_frame(df, QUOTE_CATEGORIES)
@@ -1,6 +1,28 @@
-from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+from dataclasses import asdict, dataclass
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.models.frame_utils import (
+    build_frame,
+    columns_from_records,
+    format_timestamp,
+    import_pyarrow,
+)
+
+# API trade keys mapped to column names and kinds
+TRADE_FIELDS: dict[str, tuple[str, str]] = {
+    "t": ("timestamp", "datetime"),
+    "x": ("exchange", "str"),
+    "p": ("price", "float"),
+    "s": ("size", "int"),
+    "c": ("conditions", "object"),
+    "i": ("id", "int"),
+    "z": ("tape", "str"),
+}
+
 
 @dataclass
 class TradeModel:
@@ -75,3 +97,149 @@ def extract_trades_data(data: dict[str, Any]) -> dict[str, Any]:
         return {"trades": [data["trade"]], "symbol": data.get("symbol", "")}
     # Direct trade data
     return {"trades": [data], "symbol": data.get("symbol", "")}
+
+
+@dataclass(eq=False)
+class TradeBatch:
+    """Columnar trades for a symbol, with one NumPy array per field.
+
+    Rows are only turned into `TradeModel` objects when they are accessed by
+    index or iteration, so large batches never hold one Python object per tick.
+    Batches compare by identity, since array fields have no single truth value.
+    """
+
+    symbol: str
+    timestamp: np.ndarray  # datetime64[ns], naive UTC
+    exchange: np.ndarray
+    price: np.ndarray
+    size: np.ndarray
+    conditions: np.ndarray  # object array of condition lists
+    id: np.ndarray
+    tape: np.ndarray
+    next_page_token: str | None = None
+
+    @classmethod
+    def from_columns(
+        cls,
+        symbol: str,
+        columns: dict[str, np.ndarray],
+        next_page_token: str | None = None,
+    ) -> "TradeBatch":
+        """Creates a batch from column arrays keyed by column name."""
+        return cls(
+            symbol=symbol,
+            timestamp=columns["timestamp"],
+            exchange=columns["exchange"],
+            price=columns["price"],
+            size=columns["size"],
+            conditions=columns["conditions"],
+            id=columns["id"],
+            tape=columns["tape"],
+            next_page_token=next_page_token,
+        )
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def __getitem__(self, key: int | slice) -> Any:
+        """Returns a `TradeModel` for an integer index, or a `TradeBatch` for a slice."""
+        if isinstance(key, slice):
+            return TradeBatch.from_columns(
+                self.symbol,
+                {name: values[key] for name, values in self.columns().items()},
+            )
+        return TradeModel(
+            timestamp=format_timestamp(self.timestamp[key]),
+            symbol=self.symbol,
+            exchange=str(self.exchange[key]),
+            price=float(self.price[key]),
+            size=int(self.size[key]),
+            conditions=self.conditions[key],
+            id=int(self.id[key]),
+            tape=str(self.tape[key]),
+        )
+
+    def __iter__(self) -> Iterator[TradeModel]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Returns the field arrays keyed by column name."""
+        return {name: getattr(self, name) for name, _ in TRADE_FIELDS.values()}
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Returns the trades as a pandas DataFrame with a symbol column."""
+        return build_frame(self._symbol_columns(), "pandas")
+
+    def to_arrow(self) -> Any:
+        """Returns the trades as a pyarrow Table with a symbol column.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        import_pyarrow()
+        return build_frame(self._symbol_columns(), "arrow")
+
+    def _symbol_columns(self) -> dict[str, np.ndarray]:
+        columns = {"symbol": np.full(len(self), self.symbol, dtype=object)}
+        columns.update(self.columns())
+        return columns
+
+
+def trade_batch_from_dicts(
+    trades: Sequence[dict[str, Any]],
+    symbol: str,
+    next_page_token: str | None = None,
+) -> TradeBatch:
+    """Create a TradeBatch from raw API trade dictionaries.
+
+    Args:
+        trades: The raw trades from the API response
+        symbol: The symbol the trades belong to
+        next_page_token: Pagination token of the response
+
+    Returns:
+        TradeBatch instance
+    """
+    return TradeBatch.from_columns(
+        symbol, columns_from_records(trades, TRADE_FIELDS), next_page_token
+    )
+
+
+def concat_trade_batches(batches: Sequence[TradeBatch], symbol: str) -> TradeBatch:
+    """Concatenate trade batches of one symbol into a single batch.
+
+    Args:
+        batches: The batches to concatenate, in order
+        symbol: The symbol the trades belong to
+
+    Returns:
+        TradeBatch instance
+    """
+    if not batches:
+        return trade_batch_from_dicts([], symbol)
+    return TradeBatch.from_columns(
+        symbol,
+        {
+            name: np.concatenate([batch.columns()[name] for batch in batches])
+            for name, _ in TRADE_FIELDS.values()
+        },
+    )
+
+
+def trades_to_frame(
+    trades: pd.DataFrame | TradeBatch | Sequence[TradeModel],
+) -> pd.DataFrame:
+    """Normalize the supported trade containers to a DataFrame.
+
+    Args:
+        trades: A list of TradeModel objects, a TradeBatch or a DataFrame
+
+    Returns:
+        DataFrame with one row per trade
+    """
+    if isinstance(trades, TradeBatch):
+        return trades.to_pandas()
+    if isinstance(trades, pd.DataFrame):
+        return trades.reset_index(drop=True)
+    return pd.DataFrame([asdict(trade) for trade in trades])
@@ -7,6 +7,7 @@ from py_alpaca_api.stock.metadata import Metadata
 from py_alpaca_api.stock.predictor import Predictor
 from py_alpaca_api.stock.quotes import Quotes
 from py_alpaca_api.stock.screener import Screener
+from py_alpaca_api.stock.snapshot_poller import SnapshotPoller
 from py_alpaca_api.stock.snapshots import Snapshots
 from py_alpaca_api.stock.trades import Trades
 from py_alpaca_api.trading.market import Market
@@ -14,7 +15,12 @@ from py_alpaca_api.trading.market import Market
 
 class Stock:
     def __init__(
-        self, api_key: str, api_secret: str, api_paper: bool, market: Market
+        self,
+        api_key: str,
+        api_secret: str,
+        api_paper: bool,
+        market: Market,
+        output: str = "pandas",
     ) -> None:
         headers = {
             "accept": "application/json",
@@ -28,7 +34,11 @@ class Stock:
         )
         data_url = "https://data.alpaca.markets/v2"
         self._initialize_components(
-            headers=headers, base_url=base_url, data_url=data_url, market=market
+            headers=headers,
+            base_url=base_url,
+            data_url=data_url,
+            market=market,
+            output=output,
         )
 
     def _initialize_components(
@@ -37,17 +47,62 @@ class Stock:
         base_url: str,
         data_url: str,
         market: Market,
+        output: str = "pandas",
     ):
-        self.assets = Assets(headers=headers, base_url=base_url)
-        self.auctions = Auctions(headers=headers)
-        self.history = History(headers=headers, data_url=data_url, asset=self.assets)
+        self.assets = Assets(headers=headers, base_url=base_url, output=output)
+        self.auctions = Auctions(headers=headers, output=output)
+        self.history = History(
+            headers=headers,
+            data_url=data_url,
+            asset=self.assets,
+            market=market,
+            output=output,
+        )
         self.logos = Logos(headers=headers)
-        self.quotes = Quotes(headers=headers)
+        self.quotes = Quotes(headers=headers, output=output)
+        self.snapshots = Snapshots(headers=headers, output=output)
         self.screener = Screener(
-            data_url=data_url, headers=headers, market=market, asset=self.assets
+            data_url=data_url,
+            headers=headers,
+            market=market,
+            asset=self.assets,
+            snapshots=self.snapshots,
         )
         self.predictor = Predictor(history=self.history, screener=self.screener)
         self.latest_quote = LatestQuote(headers=headers)
         self.metadata = Metadata(headers=headers)
-        self.snapshots = Snapshots(headers=headers)
         self.trades = Trades(headers=headers)
+        self.market = market
+
+    def snapshot_poller(
+        self,
+        symbols: list[str],
+        fields: tuple[str, ...] | None = None,
+        feed: str = "iex",
+        open_interval: float = 1.0,
+        closed_interval: float = 60.0,
+    ) -> SnapshotPoller:
+        """Creates a poller that emits snapshot changes for the given symbols.
+
+        The poll interval follows the market clock of this client.
+
+        Args:
+            symbols: The symbols to poll.
+            fields: The snapshot frame columns to track. Defaults to
+                `SnapshotPoller.DEFAULT_FIELDS`.
+            feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
+            open_interval: Seconds between polls while the market is open.
+            closed_interval: Maximum seconds between polls while it is closed.
+
+        Returns:
+            SnapshotPoller: The poller; call `start()` or `run()` to begin polling.
+        """
+        return SnapshotPoller(
+            self.snapshots,
+            symbols,
+            market=self.market,
+            fields=fields,
+            feed=feed,
+            open_interval=open_interval,
+            closed_interval=closed_interval,
+        )
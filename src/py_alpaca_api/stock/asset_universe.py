@@ -0,0 +1,315 @@
+"""A cached, indexed copy of the asset list."""
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, ClassVar
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.exceptions import APIRequestError
+from py_alpaca_api.http.requests import Requests
+
+logger = logging.getLogger(__name__)
+
+
+class AssetUniverse:
+    """The whole asset list, loaded once and indexed for lookups and filters.
+
+    The list is pulled with a single request and kept for `ttl` seconds. When
+    the server sent an ETag, a refresh revalidates it and keeps the current list
+    on "304 Not Modified". With `cache_path`, the list is also saved to disk and
+    reused by later processes while it is fresh.
+
+    Symbols and ids are indexed in dicts, and the status, class, exchange and
+    boolean attributes are precomputed NumPy arrays, so filters such as
+    "active, tradable, fractionable, not OTC" are one vectorized mask.
+    """
+
+    FLAGS: ClassVar[tuple[str, ...]] = (
+        "tradable",
+        "marginable",
+        "shortable",
+        "easy_to_borrow",
+        "fractionable",
+    )
+
+    # Column types of `frame()`
+    DTYPES: ClassVar[dict[str, str]] = {
+        "id": "string",
+        "class": "string",
+        "exchange": "string",
+        "symbol": "string",
+        "name": "string",
+        "status": "string",
+        "tradable": "bool",
+        "marginable": "bool",
+        "shortable": "bool",
+        "easy_to_borrow": "bool",
+        "fractionable": "bool",
+        "maintenance_margin_requirement": "float",
+    }
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        ttl: float = 3600.0,
+        cache_path: str | Path | None = None,
+        asset_class: str = "us_equity",
+    ) -> None:
+        """Initializes the universe without loading it.
+
+        Args:
+            base_url: The trading API URL.
+            headers: The API request headers.
+            ttl: Seconds before the list is refreshed. Defaults to one hour.
+            cache_path: Optional JSON file the list is saved to and loaded from.
+            asset_class: The asset class listed. Defaults to "us_equity".
+        """
+        self.base_url = base_url
+        self.headers = headers
+        self.ttl = ttl
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.asset_class = asset_class
+
+        self._lock = threading.RLock()
+        self._loaded_at: float | None = None
+        self._etag: str | None = None
+        self._records: list[dict] = []
+        self._by_symbol: dict[str, dict] = {}
+        self._by_id: dict[str, dict] = {}
+        self._columns: dict[str, np.ndarray] = {}
+        self._frame: pd.DataFrame | None = None
+
+    ############################################
+    # Loading
+    ############################################
+    def load(self, refresh: bool = False) -> "AssetUniverse":
+        """Loads the list unless the loaded copy is still fresh.
+
+        Args:
+            refresh: Whether to refresh even if the copy has not expired.
+
+        Returns:
+            AssetUniverse: The universe, for chaining.
+
+        Raises:
+            APIRequestError: If the request fails.
+        """
+        with self._lock:
+            if not refresh and self._is_fresh():
+                return self
+            if not refresh and self._loaded_at is None and self._read_cache():
+                return self
+            self._fetch()
+            return self
+
+    @property
+    def loaded_at(self) -> float | None:
+        """When the list was fetched, in UNIX seconds; None before loading."""
+        return self._loaded_at
+
+    def _is_fresh(self) -> bool:
+        return self._loaded_at is not None and time.time() - self._loaded_at < self.ttl
+
+    def _fetch(self) -> None:
+        """Fetches the list, revalidating with the ETag when there is one."""
+        url = f"{self.base_url}/assets"
+        params: dict[str, str | bool | float | int] = {"asset_class": self.asset_class}
+
+        if self._etag is not None and self._records:
+            response = Requests().request(
+                "GET",
+                url,
+                headers={**self.headers, "If-None-Match": self._etag},
+                params=params,
+                raw_response=True,
+            )
+            if response.status_code == 304:
+                self._loaded_at = time.time()
+                self._write_cache()
+                return
+            if response.status_code != 200:
+                raise APIRequestError(
+                    status_code=response.status_code, message=response.text
+                )
+        else:
+            response = Requests().request(
+                "GET", url, headers=self.headers, params=params
+            )
+
+        etag = response.headers.get("ETag")
+        self._set(
+            json.loads(response.text),
+            time.time(),
+            etag if isinstance(etag, str) else None,
+        )
+        self._write_cache()
+
+    def _read_cache(self) -> bool:
+        """Loads the list from disk if the file is fresh; returns whether it was."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return False
+        try:
+            cached = json.loads(self.cache_path.read_text())
+            loaded_at = float(cached["loaded_at"])
+            records = cached["assets"]
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring unreadable asset cache {self.cache_path}")
+            return False
+        if time.time() - loaded_at >= self.ttl:
+            return False
+        self._set(records, loaded_at, cached.get("etag"))
+        return True
+
+    def _write_cache(self) -> None:
+        """Saves the list to disk, if a cache path is set."""
+        if self.cache_path is None:
+            return
+        payload = {
+            "loaded_at": self._loaded_at,
+            "etag": self._etag,
+            "assets": self._records,
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+            temporary.write_text(json.dumps(payload))
+            temporary.replace(self.cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to write asset cache {self.cache_path}: {e!s}")
+
+    def _set(self, records: list[dict], loaded_at: float, etag: str | None) -> None:
+        """Replaces the list and rebuilds the indexes."""
+        self._records = records
+        self._loaded_at = loaded_at
+        self._etag = etag
+        self._by_symbol = {record["symbol"]: record for record in records}
+        self._by_id = {record["id"]: record for record in records if "id" in record}
+        self._columns = {
+            "symbol": np.array([r["symbol"] for r in records], dtype=object),
+            "status": np.array([r.get("status", "") for r in records], dtype=object),
+            "class": np.array([r.get("class", "") for r in records], dtype=object),
+            "exchange": np.array(
+                [r.get("exchange", "") for r in records], dtype=object
+            ),
+        }
+        for flag in self.FLAGS:
+            self._columns[flag] = np.array(
+                [bool(r.get(flag)) for r in records], dtype=bool
+            )
+        self._frame = None
+
+    ############################################
+    # Lookups
+    ############################################
+    def get(self, symbol: str, load: bool = True) -> dict | None:
+        """Returns the raw asset of a symbol, or None if it is not listed.
+
+        Args:
+            symbol: The symbol.
+            load: Whether to load the list first. If False, only a list already
+                in memory is used, so no request is made. Defaults to True.
+
+        Returns:
+            dict | None: The raw asset, or None if it is not listed or not loaded.
+        """
+        if load:
+            self.load()
+        return self._by_symbol.get(symbol.upper())
+
+    def get_by_id(self, asset_id: str) -> dict | None:
+        """Returns the raw asset with an id, or None if it is not listed."""
+        self.load()
+        return self._by_id.get(asset_id)
+
+    @property
+    def index(self) -> dict[str, dict]:
+        """The raw assets keyed by symbol; do not modify it."""
+        self.load()
+        return self._by_symbol
+
+    def __contains__(self, symbol: object) -> bool:
+        return isinstance(symbol, str) and self.get(symbol) is not None
+
+    def __len__(self) -> int:
+        self.load()
+        return len(self._records)
+
+    def missing(self, symbols: Iterable[str]) -> list[str]:
+        """Returns the symbols that are not listed.
+
+        Args:
+            symbols: The symbols to check.
+
+        Returns:
+            list[str]: The unlisted symbols, in the given order.
+        """
+        self.load()
+        return [s for s in symbols if s.upper() not in self._by_symbol]
+
+    ############################################
+    # Filters
+    ############################################
+    def mask(
+        self,
+        status: str | None = "active",
+        exchanges: Iterable[str] | None = None,
+        excluded_exchanges: Iterable[str] | None = None,
+        **flags: bool,
+    ) -> np.ndarray:
+        """Returns which assets match the filters, as a boolean array.
+
+        Args:
+            status: The required status; None for any. Defaults to "active".
+            exchanges: Optional exchanges to keep, e.g. ["NASDAQ", "NYSE"].
+            excluded_exchanges: Optional exchanges to drop, e.g. ["OTC"].
+            **flags: Required values of `FLAGS`, e.g. tradable=True, shortable=False.
+
+        Returns:
+            np.ndarray: One value per asset, in list order.
+
+        Raises:
+            ValueError: If a flag is unknown.
+        """
+        with self._lock:
+            self.load()
+            columns = self._columns
+            result = np.ones(len(self._records), dtype=bool)
+            if status is not None:
+                result &= columns["status"] == status
+            if exchanges is not None:
+                result &= np.isin(columns["exchange"], list(exchanges))
+            if excluded_exchanges is not None:
+                result &= ~np.isin(columns["exchange"], list(excluded_exchanges))
+            for flag, value in flags.items():
+                if flag not in self.FLAGS:
+                    raise ValueError(f"Unknown asset flag: {flag}")
+                result &= columns[flag] == value
+            return result
+
+    def symbols(self, **filters: Any) -> list[str]:
+        """Returns the symbols of the assets matching `mask(**filters)`."""
+        # The mask and the selection hold one lock, so a refresh cannot fall between
+        with self._lock:
+            mask = self.mask(**filters)
+            return self._columns["symbol"][mask].tolist()
+
+    def frame(self, **filters: Any) -> pd.DataFrame:
+        """Returns the assets matching `mask(**filters)` as a typed DataFrame.
+
+        The full DataFrame is built once per load, so each call only selects rows.
+        """
+        with self._lock:
+            mask = self.mask(**filters)
+            if self._frame is None:
+                frame = pd.DataFrame(self._records)
+                self._frame = frame.astype(
+                    {k: v for k, v in self.DTYPES.items() if k in frame.columns}
+                )
+            return self._frame.loc[mask].reset_index(drop=True)
@@ -1,16 +1,31 @@
 import json
-
-import pandas as pd
+from pathlib import Path
+from typing import Any
 
 from py_alpaca_api.exceptions import APIRequestError
 from py_alpaca_api.http.requests import Requests
 from py_alpaca_api.models.asset_model import AssetModel, asset_class_from_dict
+from py_alpaca_api.models.frame_utils import convert_frame, validate_output
+from py_alpaca_api.stock.asset_universe import AssetUniverse
 
 
 class Assets:
-    def __init__(self, base_url: str, headers: dict[str, str]) -> None:
+    SYMBOL_INDEX_TTL = 3600  # Seconds before the asset universe is refreshed
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        output: str = "pandas",
+        cache_path: str | Path | None = None,
+    ) -> None:
+        validate_output(output)
         self.base_url = base_url
         self.headers = headers
+        self.output = output
+        self.universe = AssetUniverse(
+            base_url, headers, ttl=self.SYMBOL_INDEX_TTL, cache_path=cache_path
+        )
 
     ############################################
     # Get Asset
@@ -18,6 +33,10 @@ class Assets:
     def get(self, symbol: str) -> AssetModel:
         """Retrieves an AssetModel for the specified symbol.
 
+        Symbols are answered from the asset universe when it is already loaded;
+        otherwise, and for symbols it does not list, the asset is requested
+        individually, so a single lookup never downloads the whole asset list.
+
         Args:
             symbol (str): The symbol of the asset to retrieve.
 
@@ -27,6 +46,10 @@ class Assets:
         Raises:
             Exception: If the asset is not a US Equity (stock).
         """
+        cached = self.universe.get(symbol, load=False)
+        if cached is not None and cached.get("class") == "us_equity":
+            return asset_class_from_dict(dict(cached))
+
         url = f"{self.base_url}/assets/{symbol}"
         http_response = Requests().request("GET", url, headers=self.headers)
 
@@ -51,10 +74,12 @@ class Assets:
         status: str = "active",
         exchange: str = "",
         excluded_exchanges: list[str] | None = None,
-    ) -> pd.DataFrame:
+        output: str | None = None,
+    ) -> Any:
         """Retrieves a DataFrame of all active, fractionable, and tradable assets.
 
-        Excluding those from the OTC exchange.
+        Excluding those from the OTC exchange. The assets are selected from the
+        cached asset universe with precomputed masks, without a request.
 
         Args:
             status (str, optional): The status of the assets to retrieve.
@@ -64,46 +89,77 @@ class Assets:
                 all exchanges.
             excluded_exchanges (List[str], optional): A list of exchanges to
                 exclude from the results. Defaults to ["OTC"].
+            output (str, optional): The output format: "pandas", "polars", "arrow"
+                or "numpy". Defaults to the client's output format.
 
         Returns:
-            pd.DataFrame: A DataFrame containing the retrieved assets.
+            pd.DataFrame: A DataFrame containing the retrieved assets, or the
+                equivalent in the requested output format.
         """
+        output = output or self.output
+        validate_output(output)
         if excluded_exchanges is None:
             excluded_exchanges = ["OTC"]
-        url = f"{self.base_url}/assets"
-
-        params: dict[str, str | bool | float | int] = {
-            "status": status,
-            "asset_class": "us_equity",
-            "exchange": exchange,
-        }
-        response = json.loads(
-            Requests().request("GET", url, headers=self.headers, params=params).text
+        result_df = self.universe.frame(
+            status=status,
+            exchanges=[exchange] if exchange else None,
+            excluded_exchanges=excluded_exchanges,
+            fractionable=True,
+            tradable=True,
         )
-        assets_df = pd.DataFrame(response)
-
-        filtered_df = assets_df[
-            (assets_df["status"] == "active")
-            & assets_df["fractionable"]
-            & assets_df["tradable"]
-            & ~assets_df["exchange"].isin(excluded_exchanges)
-        ].reset_index(drop=True)
-
-        assert isinstance(filtered_df, pd.DataFrame)
-        result_df = filtered_df.astype(
-            {
-                "id": "string",
-                "class": "string",
-                "exchange": "string",
-                "symbol": "string",
-                "name": "string",
-                "status": "string",
-                "tradable": "bool",
-                "marginable": "bool",
-                "shortable": "bool",
-                "easy_to_borrow": "bool",
-                "fractionable": "bool",
-                "maintenance_margin_requirement": "float",
-            }
+        return convert_frame(result_df, output)
+
+    ############################################
+    # Get Symbols
+    ############################################
+    def get_symbols(
+        self,
+        status: str = "active",
+        exchange: str = "",
+        excluded_exchanges: list[str] | None = None,
+    ) -> list[str]:
+        """Retrieves the symbols of all active, fractionable, and tradable assets.
+
+        The symbols are selected like `get_all`, from the cached asset universe,
+        without building a DataFrame.
+
+        Args:
+            status (str, optional): The status of the assets to retrieve.
+                Defaults to "active".
+            exchange (str, optional): The exchange to filter the assets by.
+                Defaults to an empty string, which retrieves assets from
+                all exchanges.
+            excluded_exchanges (List[str], optional): A list of exchanges to
+                exclude from the results. Defaults to ["OTC"].
+
+        Returns:
+            list[str]: The matching symbols, in asset list order.
+        """
+        if excluded_exchanges is None:
+            excluded_exchanges = ["OTC"]
+        return self.universe.symbols(
+            status=status,
+            exchanges=[exchange] if exchange else None,
+            excluded_exchanges=excluded_exchanges,
+            fractionable=True,
+            tradable=True,
         )
-        return result_df
+
+    ############################################
+    # Get Symbol Index
+    ############################################
+    def get_symbol_index(self, refresh: bool = False) -> dict[str, dict]:
+        """Retrieves a cached index of all US equity assets keyed by symbol.
+
+        The index is the cached asset universe, pulled with a single request and
+        kept for `SYMBOL_INDEX_TTL` seconds, so validating many symbols costs no
+        further requests.
+
+        Args:
+            refresh (bool, optional): Whether to force a new pull even if the
+                cached index has not expired. Defaults to False.
+
+        Returns:
+            dict[str, dict]: A dictionary mapping symbols to their raw asset data.
+        """
+        return self.universe.load(refresh=refresh).index
@@ -3,23 +3,28 @@
 import json
 from collections import defaultdict
 from datetime import datetime
+from typing import Any
 
 import pandas as pd
 
 from py_alpaca_api.exceptions import ValidationError
 from py_alpaca_api.http.requests import Requests
+from py_alpaca_api.models.frame_utils import convert_frame, validate_output
 
 
 class Auctions:
     """Handles historical auction data retrieval from Alpaca API."""
 
-    def __init__(self, headers: dict[str, str]) -> None:
+    def __init__(self, headers: dict[str, str], output: str = "pandas") -> None:
         """Initialize the Auctions class.
 
         Args:
             headers: Dictionary containing authentication headers.
+            output: The default output format: "pandas", "polars", "arrow" or "numpy".
         """
+        validate_output(output)
         self.headers = headers
+        self.output = output
         self.base_url = "https://data.alpaca.markets/v2/stocks"
 
     def get_auctions(
@@ -32,7 +37,8 @@ class Auctions:
         feed: str = "iex",
         page_token: str | None = None,
         sort: str = "asc",
-    ) -> pd.DataFrame | dict[str, pd.DataFrame]:
+        output: str | None = None,
+    ) -> Any:
         """Get historical auction data for one or more symbols.
 
         Retrieves auction prices (opening and closing auctions) between specified dates.
@@ -47,6 +53,8 @@ class Auctions:
             feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
             page_token: Pagination token from previous request.
             sort: Sort order for results ("asc" or "desc"). Defaults to "asc".
+            output: Output format ("pandas", "polars", "arrow" or "numpy").
+                Defaults to the client's output format.
 
         Returns:
             For single symbol: pd.DataFrame with auction data.
@@ -56,8 +64,11 @@ class Auctions:
             ValidationError: If parameters are invalid.
             Exception: If the API request fails or returns no data.
         """
+        output = output or self.output
+
         # Validate parameters
         self._validate_parameters(symbols, start, end, limit, feed, sort)
+        validate_output(output)
 
         # Normalize symbols to list
         is_single = isinstance(symbols, str)
@@ -98,7 +109,10 @@ class Auctions:
         )
 
         # Convert to DataFrames
-        result = self._convert_to_dataframes(all_auctions)
+        result = {
+            symbol: convert_frame(df, output)
+            for symbol, df in self._convert_to_dataframes(all_auctions).items()
+        }
 
         # Return single DataFrame for single symbol, dict for multiple
         if is_single and symbols_list[0] in result:
@@ -111,7 +125,8 @@ class Auctions:
         start: str,
         end: str,
         feed: str = "iex",
-    ) -> pd.DataFrame | dict[str, pd.DataFrame]:
+        output: str | None = None,
+    ) -> Any:
         """Get daily auction summary for one or more symbols.
 
         Retrieves opening and closing auction prices aggregated by day.
@@ -121,27 +136,38 @@ class Auctions:
             start: Start date in YYYY-MM-DD format.
             end: End date in YYYY-MM-DD format.
             feed: The data feed to use. Defaults to "iex".
+            output: Output format ("pandas", "polars", "arrow" or "numpy").
+                Defaults to the client's output format.
 
         Returns:
             DataFrame or dict of DataFrames with daily auction summaries.
         """
+        output = output or self.output
+        validate_output(output)
+
         # Get all auction data
-        auctions_data = self.get_auctions(symbols, start, end, feed=feed)
+        auctions_data = self.get_auctions(
+            symbols, start, end, feed=feed, output="pandas"
+        )
 
         # Process based on single or multiple symbols
         is_single = isinstance(symbols, str)
         if is_single:
             # auctions_data is a DataFrame for single symbol
             if isinstance(auctions_data, pd.DataFrame):
-                return self._aggregate_daily_auctions(auctions_data)
-            return pd.DataFrame()  # Return empty if no data
+                return convert_frame(
+                    self._aggregate_daily_auctions(auctions_data), output
+                )
+            return convert_frame(pd.DataFrame(), output)  # Return empty if no data
 
         # auctions_data is a dict for multiple symbols
         result = {}
         if isinstance(auctions_data, dict):
             for symbol, df in auctions_data.items():
                 if isinstance(df, pd.DataFrame):
-                    result[symbol] = self._aggregate_daily_auctions(df)
+                    result[symbol] = convert_frame(
+                        self._aggregate_daily_auctions(df), output
+                    )
         return result
 
     def _validate_parameters(
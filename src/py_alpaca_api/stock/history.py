@@ -1,28 +1,85 @@
 import json
+import logging
 from collections import defaultdict
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, ClassVar
 
+import numpy as np
 import pandas as pd
 
+from py_alpaca_api.analytics.resample import resample_bars
 from py_alpaca_api.http.requests import Requests
 from py_alpaca_api.models.asset_model import AssetModel
+from py_alpaca_api.models.bar_panel_model import (
+    BAR_FIELDS,
+    BarPanel,
+    bar_panel_from_dict,
+    session_index,
+)
+from py_alpaca_api.models.frame_utils import (
+    build_frame,
+    columns_from_records,
+    compact_bars,
+    compact_columns,
+    convert_frame,
+    validate_output,
+)
 from py_alpaca_api.stock.assets import Assets
+from py_alpaca_api.storage.export import (
+    arrow_schema,
+    export_pages,
+    validate_export_format,
+)
+from py_alpaca_api.trading.market import Market
+
+logger = logging.getLogger(__name__)
 
 
 class History:
     BATCH_SIZE = 200  # Alpaca API limit for multi-symbol requests
 
-    def __init__(self, data_url: str, headers: dict[str, str], asset: Assets) -> None:
+    TIMEFRAME_MAPPING: ClassVar[dict[str, str]] = {
+        "1m": "1Min",
+        "5m": "5Min",
+        "15m": "15Min",
+        "30m": "30Min",
+        "1h": "1Hour",
+        "4h": "4Hour",
+        "1d": "1Day",
+        "1w": "1Week",
+        "1M": "1Month",
+    }
+
+    # API bar keys mapped to output column names and kinds
+    BAR_FIELDS: ClassVar[dict[str, tuple[str, str]]] = BAR_FIELDS
+
+    def __init__(
+        self,
+        data_url: str,
+        headers: dict[str, str],
+        asset: Assets,
+        market: Market | None = None,
+        output: str = "pandas",
+    ) -> None:
         """Initializes an instance of the History class.
 
         Args:
             data_url: A string representing the URL of the data.
             headers: A dictionary containing the headers to be included in the request.
             asset: An instance of the Asset class representing the asset.
+            market: An optional instance of the Market class, used for session
+                boundaries when resampling bars locally.
+            output: The default output format of data methods: "pandas", "polars",
+                "arrow" or "numpy". Defaults to "pandas".
         """
+        validate_output(output)
         self.data_url = data_url
         self.headers = headers
         self.asset = asset
+        self.market = market
+        self.output = output
 
     ###########################################
     # /////// Check if Asset is Stock \\\\\\\ #
@@ -30,6 +87,8 @@ class History:
     def check_if_stock(self, symbol: str) -> AssetModel:
         """Check if the asset corresponding to the symbol is a stock.
 
+        Listed symbols are answered from the cached asset universe of `Assets`.
+
         Args:
             symbol (str): The symbol of the asset to be checked.
 
@@ -49,6 +108,32 @@ class History:
 
         return asset
 
+    def check_if_stocks(self, symbols: list[str]) -> None:
+        """Check that every symbol in a list is a stock.
+
+        A single symbol is checked with `check_if_stock`. Larger lists are validated
+        against the cached asset index from `Assets.get_symbol_index`, which costs
+        one request for the whole universe and none once it is cached.
+
+        Args:
+            symbols (list[str]): The symbols of the assets to be checked.
+
+        Raises:
+            ValueError: If any of the assets is not found or is not a stock.
+        """
+        if len(symbols) == 1:
+            self.check_if_stock(symbols[0])
+            return
+
+        index = self.asset.get_symbol_index()
+        invalid = [
+            symbol
+            for symbol in symbols
+            if index.get(symbol.upper(), {}).get("class") != "us_equity"
+        ]
+        if invalid:
+            raise ValueError(f"Not found or not a stock: {', '.join(invalid)}")
+
     ###########################################
     # ////// Get Stock Historical Data \\\\\\ #
     ###########################################
@@ -63,7 +148,10 @@ class History:
         limit: int = 1000,
         sort: str = "asc",
         adjustment: str = "raw",
-    ) -> pd.DataFrame:
+        validate: bool = True,
+        output: str | None = None,
+        compact: bool = False,
+    ) -> Any:
         """Retrieves historical stock data for one or more symbols within a specified date range and timeframe.
 
         Args:
@@ -76,13 +164,22 @@ class History:
             limit: The number of data points to fetch per symbol. Default is 1000.
             sort: The sort order for the data. Default is "asc".
             adjustment: The adjustment for historical data. Default is "raw".
+            validate: Whether to check that the symbols are stocks first. Default is True.
+            output: The output format: "pandas", "polars", "arrow" or "numpy".
+                Defaults to the client's output format.
+            compact: Whether to use compact dtypes (categorical symbols, float32
+                prices and int32 counts where they fit). Default is False.
 
         Returns:
-            A pandas DataFrame containing the historical stock data for the given symbol(s) and time range.
+            A DataFrame (or Arrow table, or dict of NumPy arrays, depending on `output`)
+            containing the historical stock data for the given symbol(s) and time range.
 
         Raises:
             ValueError: If the given timeframe is not one of the allowed values.
         """
+        output = output or self.output
+        validate_output(output)
+
         # Handle single symbol or list of symbols
         is_single = isinstance(symbol, str)
         if is_single:
@@ -95,12 +192,29 @@ class History:
             single_symbol = ""  # Won't be used in multi-symbol case
 
         # Validate symbols are stocks
-        for sym in symbols_list:
-            self.check_if_stock(sym)
+        if validate:
+            self.check_if_stocks(symbols_list)
+
+        # Other formats are built natively from the decoded bar columns
+        if output != "pandas":
+            symbols_data = self._fetch_symbols_data(
+                symbols_list,
+                is_single,
+                start,
+                end,
+                timeframe,
+                feed,
+                currency,
+                limit,
+                sort,
+                adjustment,
+            )
+            columns = self._bars_to_columns(symbols_data)
+            return build_frame(compact_columns(columns) if compact else columns, output)
 
         # If more than BATCH_SIZE symbols, need to batch the requests
         if not is_single and len(symbols_list) > self.BATCH_SIZE:
-            return self._get_batched_stock_data(
+            batched_df = self._get_batched_stock_data(
                 symbols_list,
                 start,
                 end,
@@ -111,32 +225,487 @@ class History:
                 sort,
                 adjustment,
             )
+            return compact_bars(batched_df) if compact else batched_df
 
-        # Determine if using single or multi-symbol endpoint
+        url, params = self._build_bars_request(
+            symbols_list,
+            is_single,
+            start,
+            end,
+            timeframe,
+            feed,
+            currency,
+            limit,
+            sort,
+            adjustment,
+        )
+
+        symbol_data = self.get_historical_data(symbols_list, url, params, is_single)
+
+        # Process data based on single or multi-symbol
         if is_single:
-            url = f"{self.data_url}/stocks/{single_symbol}/bars"
+            df = self.preprocess_data(symbol_data[single_symbol], single_symbol)
         else:
-            url = f"{self.data_url}/stocks/bars"
+            df = self.preprocess_multi_data(symbol_data)
+        return compact_bars(df) if compact else df
+
+    ###########################################
+    # ////// Get Stock Historical Panel \\\\\\ #
+    ###########################################
+    def get_stock_panel(
+        self,
+        symbols: list[str],
+        start: str,
+        end: str,
+        timeframe: str = "1d",
+        feed: str = "sip",
+        currency: str = "USD",
+        limit: int = 10000,
+        adjustment: str = "raw",
+        validate: bool = True,
+        index: pd.DatetimeIndex | None = None,
+        use_calendar: bool = True,
+        as_frame: bool = True,
+    ) -> pd.DataFrame | BarPanel:
+        """Retrieves historical stock data for several symbols in wide, date-by-symbol form.
+
+        The panel is assembled directly from the per-symbol bar lists, without building
+        and sorting a long frame first. For daily bars, when a market is available and
+        `use_calendar` is True, the panel is indexed by the trading sessions of the
+        market calendar, so every session gets a row even if no symbol traded.
+
+        Args:
+            symbols: The stock symbols to fetch data for.
+            start: The start date for historical data in the format "YYYY-MM-DD".
+            end: The end date for historical data in the format "YYYY-MM-DD".
+            timeframe: The timeframe for the historical data. Default is "1d".
+            feed: The data feed source. Default is "sip".
+            currency: The currency for historical data. Default is "USD".
+            limit: The number of data points to fetch per page. Default is 10000.
+            adjustment: The adjustment for historical data. Default is "raw".
+            validate: Whether to check that the symbols are stocks first. Default is True.
+            index: Optional shared index, e.g. from `session_index`. A date-only index
+                matches daily bars by session date; any other index matches bar
+                timestamps (naive UTC). Defaults to the calendar sessions or the
+                union of all bar timestamps.
+            use_calendar: Whether to index daily bars by the market calendar
+                sessions when no index is given. Default is True.
+            as_frame: If True, return a DataFrame with (field, symbol) MultiIndex
+                columns. If False, return a BarPanel of 2D NumPy arrays. Default is True.
+
+        Returns:
+            A pandas DataFrame or BarPanel indexed by date with one column per symbol.
+
+        Raises:
+            ValueError: If the given timeframe is not one of the allowed values.
+            ValidationError: If an index is given and none of the bars fall on it.
+        """
+        if validate:
+            self.check_if_stocks(symbols)
+
+        if (
+            index is None
+            and use_calendar
+            and timeframe == "1d"
+            and self.market is not None
+        ):
+            index = session_index(
+                self.market.calendar(
+                    start_date=start[:10], end_date=end[:10], output="pandas"
+                )
+            )
+
+        symbols_data = self._fetch_symbols_data(
+            symbols,
+            False,
+            start,
+            end,
+            timeframe,
+            feed,
+            currency,
+            limit,
+            "asc",
+            adjustment,
+        )
+
+        panel = bar_panel_from_dict(symbols_data, symbols=symbols, index=index)
+        return panel.to_frame() if as_frame else panel
+
+    ###########################################
+    # ////// Iterate Stock Historical Data \\\\\\ #
+    ###########################################
+    def iter_stock_data(
+        self,
+        symbol: str | list[str],
+        start: str,
+        end: str,
+        timeframe: str = "1d",
+        feed: str = "sip",
+        currency: str = "USD",
+        limit: int = 1000,
+        sort: str = "asc",
+        adjustment: str = "raw",
+        validate: bool = True,
+        output: str | None = None,
+        compact: bool = False,
+    ) -> Iterator[Any]:
+        """Yields historical stock data one page at a time as it is downloaded.
+
+        Unlike `get_stock_data`, nothing is accumulated between pages, so memory use
+        is bounded by a single page and processing can start before the download
+        finishes. Symbol lists larger than `BATCH_SIZE` are fetched batch by batch.
+
+        Args:
+            symbol: The stock symbol(s) to fetch data for. Can be a single symbol string or list of symbols.
+            start: The start date for historical data in the format "YYYY-MM-DD".
+            end: The end date for historical data in the format "YYYY-MM-DD".
+            timeframe: The timeframe for the historical data. Default is "1d".
+            feed: The data feed source. Default is "sip".
+            currency: The currency for historical data. Default is "USD".
+            limit: The number of data points to fetch per page. Default is 1000.
+            sort: The sort order for the data. Default is "asc".
+            adjustment: The adjustment for historical data. Default is "raw".
+            validate: Whether to check that the symbols are stocks first. Default is True.
+            output: The output format: "pandas", "polars", "arrow" or "numpy".
+                Defaults to the client's output format.
+            compact: Whether to use compact dtypes. Default is False.
+
+        Yields:
+            A frame with the same columns as `get_stock_data` for each page
+            returned by the API. Multi-symbol pages may contain several symbols.
+
+        Raises:
+            ValueError: If the given timeframe is not one of the allowed values.
+        """
+        output = output or self.output
+        validate_output(output)
+
+        is_single = isinstance(symbol, str)
+        symbols_list: list[str] = [symbol] if isinstance(symbol, str) else symbol
+
+        if validate:
+            self.check_if_stocks(symbols_list)
+
+        batches = [
+            symbols_list[i : i + self.BATCH_SIZE]
+            for i in range(0, len(symbols_list), self.BATCH_SIZE)
+        ]
+        for batch in batches:
+            url, params = self._build_bars_request(
+                batch,
+                is_single,
+                start,
+                end,
+                timeframe,
+                feed,
+                currency,
+                limit,
+                sort,
+                adjustment,
+            )
+            for page in self._iter_bar_pages(batch, url, params, is_single):
+                if output != "pandas":
+                    columns = self._bars_to_columns(page)
+                    yield build_frame(
+                        compact_columns(columns) if compact else columns, output
+                    )
+                    continue
+                if is_single:
+                    df = self.preprocess_data(page[batch[0]], batch[0])
+                else:
+                    df = self.preprocess_multi_data(page)
+                yield compact_bars(df) if compact else df
+
+    ###########################################
+    # ////////// Export Stock Data \\\\\\\\\\ #
+    ###########################################
+    def export_to(
+        self,
+        path: str | Path,
+        symbol: str | list[str],
+        start: str,
+        end: str,
+        timeframe: str = "1d",
+        feed: str = "sip",
+        currency: str = "USD",
+        limit: int = 10000,
+        sort: str = "asc",
+        adjustment: str = "raw",
+        validate: bool = True,
+        format: str = "parquet",
+    ) -> int:
+        """Streams historical stock data into a Parquet or Feather file.
+
+        Each downloaded page is decoded straight into Arrow columns and written as
+        its own row group (Parquet) or record batch (Feather), so memory use is
+        bounded by a single page.
+
+        Args:
+            path: The file to write.
+            symbol: The stock symbol(s) to fetch data for. Can be a single symbol string or list of symbols.
+            start: The start date for historical data in the format "YYYY-MM-DD".
+            end: The end date for historical data in the format "YYYY-MM-DD".
+            timeframe: The timeframe for the historical data. Default is "1d".
+            feed: The data feed source. Default is "sip".
+            currency: The currency for historical data. Default is "USD".
+            limit: The number of data points to fetch per page. Default is 10000.
+            sort: The sort order for the data. Default is "asc".
+            adjustment: The adjustment for historical data. Default is "raw".
+            validate: Whether to check that the symbols are stocks first. Default is True.
+            format: The file format: "parquet" or "feather". Default is "parquet".
+
+        Returns:
+            The number of bars written.
+
+        Raises:
+            ValueError: If the given timeframe is not one of the allowed values.
+            ValidationError: If the file format is not supported.
+            ImportError: If pyarrow is not installed.
+        """
+        validate_export_format(format)
+        is_single = isinstance(symbol, str)
+        symbols_list: list[str] = [symbol] if isinstance(symbol, str) else symbol
+
+        if validate:
+            self.check_if_stocks(symbols_list)
+
+        def pages() -> Iterator[dict[str, np.ndarray]]:
+            for i in range(0, len(symbols_list), self.BATCH_SIZE):
+                batch = symbols_list[i : i + self.BATCH_SIZE]
+                url, params = self._build_bars_request(
+                    batch,
+                    is_single,
+                    start,
+                    end,
+                    timeframe,
+                    feed,
+                    currency,
+                    limit,
+                    sort,
+                    adjustment,
+                )
+                for page in self._iter_bar_pages(batch, url, params, is_single):
+                    yield self._bars_to_columns(page)
+
+        return export_pages(path, pages(), arrow_schema(self.BAR_FIELDS), format)
+
+    ###########################################
+    # ///// Get Multiple Timeframes \\\\\ #
+    ###########################################
+    def get_stock_data_timeframes(
+        self,
+        symbol: str | list[str],
+        start: str,
+        end: str,
+        timeframes: list[str],
+        base_timeframe: str = "1m",
+        feed: str = "sip",
+        currency: str = "USD",
+        limit: int = 10000,
+        adjustment: str = "raw",
+        use_calendar: bool = True,
+        output: str | None = None,
+    ) -> dict[str, Any]:
+        """Retrieves several timeframes from a single download of a base timeframe.
+
+        The base series is downloaded once and every requested timeframe is built
+        from it locally with `resample_bars`, instead of one `/stocks/bars` download
+        per timeframe. When a market is available and `use_calendar` is True, the
+        market calendar is used so buckets respect session boundaries; base bars
+        outside the regular session are then excluded from intraday buckets.
+
+        Args:
+            symbol: The stock symbol(s) to fetch data for.
+            start: The start date for historical data in the format "YYYY-MM-DD".
+            end: The end date for historical data in the format "YYYY-MM-DD".
+            timeframes: The timeframes to build, e.g. ["5m", "15m", "1h", "1d"].
+            base_timeframe: The timeframe to download. Default is "1m".
+            feed: The data feed source. Default is "sip".
+            currency: The currency for historical data. Default is "USD".
+            limit: The number of data points to fetch per page. Default is 10000.
+            adjustment: The adjustment for historical data. Default is "raw".
+            use_calendar: Whether to apply the market calendar sessions. Default is True.
+            output: The output format: "pandas", "polars", "arrow" or "numpy".
+                Defaults to the client's output format.
+
+        Returns:
+            A dictionary mapping each requested timeframe to its DataFrame. The base
+            timeframe, if requested, is returned as downloaded.
+
+        Raises:
+            ValueError: If a timeframe is invalid or finer than the base timeframe.
+        """
+        output = output or self.output
+        validate_output(output)
+
+        ordered = list(self.TIMEFRAME_MAPPING)
+        for timeframe in [base_timeframe, *timeframes]:
+            if timeframe not in self.TIMEFRAME_MAPPING:
+                raise ValueError(
+                    'Invalid timeframe. Must be "1m", "5m", "15m", "30m", "1h", "4h", "1d", "1w", or "1M"'
+                )
+            if ordered.index(timeframe) < ordered.index(base_timeframe):
+                raise ValueError(
+                    f"Timeframe {timeframe} is finer than the base timeframe {base_timeframe}"
+                )
+
+        base = self.get_stock_data(
+            symbol,
+            start,
+            end,
+            timeframe=base_timeframe,
+            feed=feed,
+            currency=currency,
+            limit=limit,
+            adjustment=adjustment,
+            output="pandas",
+        )
+
+        calendar = None
+        if use_calendar and self.market is not None:
+            calendar = self.market.calendar(
+                start_date=start[:10], end_date=end[:10], output="pandas"
+            )
 
-        timeframe_mapping: dict = {
-            "1m": "1Min",
-            "5m": "5Min",
-            "15m": "15Min",
-            "30m": "30Min",
-            "1h": "1Hour",
-            "4h": "4Hour",
-            "1d": "1Day",
-            "1w": "1Week",
-            "1M": "1Month",
+        return {
+            timeframe: convert_frame(
+                base
+                if timeframe == base_timeframe
+                else resample_bars(base, timeframe, calendar=calendar),
+                output,
+            )
+            for timeframe in timeframes
         }
 
-        if timeframe not in timeframe_mapping:
+    def _fetch_symbols_data(
+        self,
+        symbols: list[str],
+        is_single: bool,
+        start: str,
+        end: str,
+        timeframe: str,
+        feed: str,
+        currency: str,
+        limit: int,
+        sort: str,
+        adjustment: str,
+    ) -> dict[str, list[defaultdict]]:
+        """Fetches the raw bars of all symbols, batching large symbol lists concurrently.
+
+        Args:
+            symbols: List of symbols to fetch data for.
+            is_single: Whether to use the single-symbol endpoint.
+            start: The start date for historical data.
+            end: The end date for historical data.
+            timeframe: The timeframe for the historical data.
+            feed: The data feed source.
+            currency: The currency for historical data.
+            limit: The number of data points to fetch per page.
+            sort: The sort order for the data.
+            adjustment: The adjustment for historical data.
+
+        Returns:
+            dict[str, list[defaultdict]]: A dictionary mapping symbols to their bars.
+        """
+        batches = [
+            symbols[i : i + self.BATCH_SIZE]
+            for i in range(0, len(symbols), self.BATCH_SIZE)
+        ]
+        batch_requests = [
+            (
+                batch,
+                *self._build_bars_request(
+                    batch,
+                    is_single,
+                    start,
+                    end,
+                    timeframe,
+                    feed,
+                    currency,
+                    limit,
+                    sort,
+                    adjustment,
+                ),
+            )
+            for batch in batches
+        ]
+
+        symbols_data: dict[str, list[defaultdict]] = {}
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(self.get_historical_data, batch, url, params, is_single)
+                for batch, url, params in batch_requests
+            ]
+            for future in as_completed(futures):
+                symbols_data.update(future.result())
+
+        return symbols_data
+
+    def _bars_to_columns(
+        self, symbols_data: dict[str, list[defaultdict]]
+    ) -> dict[str, np.ndarray]:
+        """Decodes raw bars into columns ordered by symbol, like `preprocess_multi_data`.
+
+        Args:
+            symbols_data: A dictionary mapping symbols to their bar data.
+
+        Returns:
+            dict[str, np.ndarray]: The symbol column followed by the bar columns.
+        """
+        symbols = sorted(symbol for symbol, bars in symbols_data.items() if bars)
+        records = [bar for symbol in symbols for bar in symbols_data[symbol]]
+        counts = [len(symbols_data[symbol]) for symbol in symbols]
+
+        columns = {"symbol": np.repeat(np.array(symbols, dtype=object), counts)}
+        columns.update(columns_from_records(records, self.BAR_FIELDS))
+        return columns
+
+    def _build_bars_request(
+        self,
+        symbols: list[str],
+        is_single: bool,
+        start: str,
+        end: str,
+        timeframe: str,
+        feed: str,
+        currency: str,
+        limit: int,
+        sort: str,
+        adjustment: str,
+    ) -> tuple[str, dict]:
+        """Builds the URL and query parameters for a bars request.
+
+        Args:
+            symbols: List of symbols to fetch data for.
+            is_single: Whether to use the single-symbol endpoint.
+            start: The start date for historical data.
+            end: The end date for historical data.
+            timeframe: The timeframe for the historical data.
+            feed: The data feed source.
+            currency: The currency for historical data.
+            limit: The number of data points to fetch per page.
+            sort: The sort order for the data.
+            adjustment: The adjustment for historical data.
+
+        Returns:
+            A tuple of the request URL and the query parameters.
+
+        Raises:
+            ValueError: If the given timeframe is not one of the allowed values.
+        """
+        # Determine if using single or multi-symbol endpoint
+        if is_single:
+            url = f"{self.data_url}/stocks/{symbols[0]}/bars"
+        else:
+            url = f"{self.data_url}/stocks/bars"
+
+        if timeframe not in self.TIMEFRAME_MAPPING:
             raise ValueError(
                 'Invalid timeframe. Must be "1m", "5m", "15m", "30m", "1h", "4h", "1d", "1w", or "1M"'
             )
 
         params: dict = {
-            "timeframe": timeframe_mapping[timeframe],
+            "timeframe": self.TIMEFRAME_MAPPING[timeframe],
             "start": start,
             "end": end,
             "currency": currency,
@@ -148,14 +717,9 @@ class History:
 
         # Add symbols parameter for multi-symbol request
         if not is_single:
-            params["symbols"] = ",".join(symbols_list)
+            params["symbols"] = ",".join(symbols)
 
-        symbol_data = self.get_historical_data(symbols_list, url, params, is_single)
-
-        # Process data based on single or multi-symbol
-        if is_single:
-            return self.preprocess_data(symbol_data[single_symbol], single_symbol)
-        return self.preprocess_multi_data(symbol_data)
+        return url, params
 
     def _get_batched_stock_data(
         self,
@@ -184,6 +748,9 @@ class History:
 
         Returns:
             A pandas DataFrame containing the historical stock data for all symbols.
+
+        Raises:
+            Exception: If any batch fails, so partial data is never returned.
         """
         # Split symbols into batches
         batches = [
@@ -194,9 +761,8 @@ class History:
         # Use ThreadPoolExecutor for concurrent batch requests
         all_dfs = []
         with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = []
-            for batch in batches:
-                future = executor.submit(
+            futures = {
+                executor.submit(
                     self.get_stock_data,
                     batch,
                     start,
@@ -207,17 +773,25 @@ class History:
                     limit,
                     sort,
                     adjustment,
-                )
-                futures.append(future)
+                    False,  # Already validated by the caller
+                    "pandas",
+                ): batch
+                for batch in batches
+            }
 
             for future in as_completed(futures):
                 try:
                     df = future.result()
-                    if not df.empty:
-                        all_dfs.append(df)
-                except Exception as e:
-                    # Log error but continue with other batches
-                    print(f"Error fetching batch: {e}")
+                except Exception:
+                    # A missing batch would silently leave out its symbols
+                    batch = futures[future]
+                    logger.warning(
+                        f"Failed to fetch bars for {len(batch)} symbols "
+                        f"({batch[0]}..{batch[-1]})"
+                    )
+                    raise
+                if not df.empty:
+                    all_dfs.append(df)
 
         if all_dfs:
             return pd.concat(all_dfs, ignore_index=True).sort_values(["symbol", "date"])
@@ -313,8 +887,32 @@ class History:
         Returns:
             dict[str, list[defaultdict]]: A dictionary mapping symbols to their historical data.
         """
-        page_token: str | None = None
         symbols_data = defaultdict(list)
+        for page in self._iter_bar_pages(symbols, url, params, is_single):
+            for symbol, symbol_bars in page.items():
+                symbols_data[symbol].extend(symbol_bars)
+
+        return symbols_data
+
+    def _iter_bar_pages(
+        self, symbols: list[str], url: str, params: dict, is_single: bool
+    ) -> Iterator[dict[str, list[defaultdict]]]:
+        """Yields the bars of each response page as it arrives.
+
+        Args:
+            symbols: List of symbols being requested.
+            url: The URL to send the request to.
+            params: Additional parameters to include in the request.
+            is_single: Whether this is a single-symbol request.
+
+        Yields:
+            dict[str, list[defaultdict]]: A dictionary mapping symbols to the bars of one page.
+
+        Raises:
+            Exception: If the first page contains no bars.
+        """
+        page_token: str | None = None
+        first_page = True
 
         while True:
             if page_token is not None:
@@ -328,27 +926,28 @@ class History:
 
             # Handle single vs multi-symbol response format
             if is_single:
-                if not response.get("bars"):
+                bars = response.get("bars")
+                if not bars and first_page:
                     raise Exception(
                         f"No historical data found for {symbols[0]}, with the given parameters."
                     )
-                symbols_data[symbols[0]].extend(response.get("bars", []))
+                page = {symbols[0]: bars or []}
             else:
                 # Multi-symbol response has bars nested under symbol keys
-                bars = response.get("bars", {})
-                if not bars:
+                page = response.get("bars") or {}
+                if not page and first_page:
                     raise Exception(
                         f"No historical data found for symbols: {', '.join(symbols)}, with the given parameters."
                     )
-                for symbol, symbol_bars in bars.items():
-                    symbols_data[symbol].extend(symbol_bars)
+
+            first_page = False
+            if any(page.values()):
+                yield page
 
             page_token = response.get("next_page_token")
             if not page_token:
                 break
 
-        return symbols_data
-
     ###########################################
     # ///////// Get Latest Bars \\\\\\\\\ #
     ###########################################
@@ -357,6 +956,7 @@ class History:
         symbols: str | list[str],
         feed: str = "iex",
         currency: str = "USD",
+        validate: bool = True,
     ) -> pd.DataFrame | dict[str, pd.DataFrame]:
         """Get the latest bars for one or more symbols.
 
@@ -367,6 +967,7 @@ class History:
                 or list of strings for multiple symbols.
             feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
             currency: The currency for the returned prices. Defaults to "USD".
+            validate: Whether to check that the symbols are stocks first. Defaults to True.
 
         Returns:
             For single symbol: pd.DataFrame with the latest bar data.
@@ -376,47 +977,13 @@ class History:
             ValueError: If feed is invalid or symbols is empty.
             Exception: If the API request fails or returns no data.
         """
-        # Validate feed
-        valid_feeds = ["iex", "sip", "otc"]
-        if feed not in valid_feeds:
-            raise ValueError(f"Invalid feed. Must be one of: {', '.join(valid_feeds)}")
-
-        # Normalize symbols to list
         is_single = isinstance(symbols, str)
-        symbols_list: list[str]
-        if is_single:
-            assert isinstance(symbols, str)  # Type narrowing for mypy
-            symbols_list = [symbols.upper()]
-        else:
-            assert isinstance(symbols, list)  # Type narrowing for mypy
-            symbols_list = [s.upper() for s in symbols]
-
-        if not symbols_list:
-            raise ValueError("At least one symbol is required")
-
-        # Check if all symbols are valid stocks
-        for symbol in symbols_list:
-            self.check_if_stock(symbol)
+        symbols_list = [symbols] if isinstance(symbols, str) else symbols
+        symbols_list = [s.upper() for s in symbols_list]
 
-        # Build URL
-        url = f"{self.data_url}/stocks/bars/latest"
-
-        # Build parameters
-        params: dict = {
-            "symbols": ",".join(symbols_list),
-            "feed": feed,
-            "currency": currency,
-        }
-
-        # Make request
-        response = json.loads(
-            Requests()
-            .request(method="GET", url=url, headers=self.headers, params=params)
-            .text
+        bars_data = self.get_latest_bars_raw(
+            symbols_list, feed=feed, currency=currency, validate=validate
         )
-
-        # Process response
-        bars_data = response.get("bars", {})
         if not bars_data:
             raise Exception(
                 f"No latest bar data found for symbols: {', '.join(symbols_list)}"
@@ -452,3 +1019,60 @@ class History:
         if is_single and symbols_list[0] in result:
             return result[symbols_list[0]]
         return result
+
+    def get_latest_bars_raw(
+        self,
+        symbols: list[str],
+        feed: str = "iex",
+        currency: str = "USD",
+        validate: bool = True,
+    ) -> dict[str, dict]:
+        """Get the latest bars for several symbols as the API's raw bar dicts.
+
+        Unlike `get_latest_bars`, no DataFrames are built, which suits frequent
+        polling of many symbols.
+
+        Args:
+            symbols: Symbols to get latest bars for.
+            feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
+            currency: The currency for the returned prices. Defaults to "USD".
+            validate: Whether to check that the symbols are stocks first. Defaults to True.
+
+        Returns:
+            dict[str, dict]: The latest bar of each symbol with data, with API keys
+            ("t", "o", "h", ...). Symbols without a bar are left out.
+
+        Raises:
+            ValueError: If feed is invalid or symbols is empty.
+            Exception: If the API request fails.
+        """
+        # Validate feed
+        valid_feeds = ["iex", "sip", "otc"]
+        if feed not in valid_feeds:
+            raise ValueError(f"Invalid feed. Must be one of: {', '.join(valid_feeds)}")
+
+        symbols_list = [s.upper() for s in symbols]
+        if not symbols_list:
+            raise ValueError("At least one symbol is required")
+
+        # Check if all symbols are valid stocks
+        if validate:
+            self.check_if_stocks(symbols_list)
+
+        # Build URL
+        url = f"{self.data_url}/stocks/bars/latest"
+
+        # Build parameters
+        params: dict = {
+            "symbols": ",".join(symbols_list),
+            "feed": feed,
+            "currency": currency,
+        }
+
+        # Make request
+        response = json.loads(
+            Requests()
+            .request(method="GET", url=url, headers=self.headers, params=params)
+            .text
+        )
+        return {symbol: bar for symbol, bar in response.get("bars", {}).items() if bar}
@@ -43,6 +43,7 @@ class Predictor:
             start=start,
             end=end,
             timeframe=timeframe,
+            output="pandas",
         )
         stock_df.rename(columns={"date": "ds", "vwap": "y"}, inplace=True)
 
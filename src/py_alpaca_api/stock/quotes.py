@@ -2,24 +2,61 @@
 
 import json
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import datetime
+from pathlib import Path
+from typing import Any, ClassVar
 
+import numpy as np
 import pandas as pd
 
 from py_alpaca_api.exceptions import ValidationError
 from py_alpaca_api.http.requests import Requests
+from py_alpaca_api.models.frame_utils import (
+    build_frame,
+    columns_from_records,
+    compact_columns,
+    compact_quotes,
+    validate_output,
+)
+from py_alpaca_api.storage.export import (
+    arrow_schema,
+    export_pages,
+    validate_export_format,
+)
+from py_alpaca_api.storage.tick_store import (
+    TickStore,
+    records_from_dicts,
+    records_to_frame,
+)
 
 
 class Quotes:
     """Handles historical quote data retrieval from Alpaca API."""
 
-    def __init__(self, headers: dict[str, str]) -> None:
+    # API quote keys mapped to output column names and kinds
+    QUOTE_FIELDS: ClassVar[dict[str, tuple[str, str]]] = {
+        "t": ("timestamp", "datetime"),
+        "ax": ("ask_exchange", "str"),
+        "ap": ("ask_price", "float"),
+        "as": ("ask_size", "int"),
+        "bx": ("bid_exchange", "str"),
+        "bp": ("bid_price", "float"),
+        "bs": ("bid_size", "int"),
+        "c": ("conditions", "object"),
+        "z": ("tape", "str"),
+    }
+
+    def __init__(self, headers: dict[str, str], output: str = "pandas") -> None:
         """Initialize the Quotes class.
 
         Args:
             headers: Dictionary containing authentication headers.
+            output: The default output format: "pandas", "polars", "arrow" or "numpy".
         """
+        validate_output(output)
         self.headers = headers
+        self.output = output
         self.base_url = "https://data.alpaca.markets/v2/stocks"
 
     def get_historical_quotes(
@@ -32,7 +69,9 @@ class Quotes:
         feed: str = "iex",
         page_token: str | None = None,
         sort: str = "asc",
-    ) -> pd.DataFrame | dict[str, pd.DataFrame]:
+        output: str | None = None,
+        compact: bool = False,
+    ) -> Any:
         """Get historical quote data for one or more symbols.
 
         Retrieves historical quote (bid/ask) data between specified dates.
@@ -47,18 +86,260 @@ class Quotes:
             feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
             page_token: Pagination token from previous request.
             sort: Sort order for results ("asc" or "desc"). Defaults to "asc".
+            output: Output format ("pandas", "polars", "arrow" or "numpy").
+                Defaults to the client's output format.
+            compact: Use compact dtypes (categorical exchanges, tape and conditions,
+                float32 prices and int32 sizes where they fit). Defaults to False.
 
         Returns:
             For single symbol: pd.DataFrame with quote data.
             For multiple symbols: dict mapping symbols to DataFrames with quote data.
+            Other output formats replace the DataFrames with polars DataFrames,
+            Arrow tables or dicts of NumPy arrays.
 
         Raises:
             ValidationError: If parameters are invalid.
             Exception: If the API request fails or returns no data.
         """
+        output = output or self.output
+
         # Validate parameters
         self._validate_parameters(symbols, start, end, limit, feed, sort)
+        validate_output(output)
+
+        url, params, symbols_list, is_single = self._build_quotes_request(
+            symbols, start, end, limit, asof, feed, page_token, sort
+        )
+
+        # Fetch all data with pagination
+        all_quotes = self._fetch_paginated_quotes(url, params, symbols_list, is_single)
+
+        # Convert to DataFrames
+        result = self._convert_quotes(all_quotes, output, compact)
+
+        # Return single DataFrame for single symbol, dict for multiple
+        if is_single and symbols_list[0] in result:
+            return result[symbols_list[0]]
+        return result
+
+    def iter_historical_quotes(
+        self,
+        symbols: str | list[str],
+        start: str,
+        end: str,
+        limit: int = 10000,
+        asof: str | None = None,
+        feed: str = "iex",
+        sort: str = "asc",
+        output: str | None = None,
+        compact: bool = False,
+    ) -> Iterator[Any]:
+        """Yield historical quote data one page at a time.
+
+        Each page is converted and yielded as soon as it arrives, so quote ranges
+        larger than memory can be processed while the download is in progress.
 
+        Args:
+            symbols: Symbol(s) to get quote data for. Can be a string for single symbol
+                or list of strings for multiple symbols.
+            start: Start date/time in ISO 8601 format (e.g., "2021-01-01" or "2021-01-01T00:00:00Z").
+            end: End date/time in ISO 8601 format.
+            limit: Maximum number of quotes to return per page. Defaults to 10000.
+            asof: As-of date for corporate actions adjustments in YYYY-MM-DD format.
+            feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
+            sort: Sort order for results ("asc" or "desc"). Defaults to "asc".
+            output: Output format ("pandas", "polars", "arrow" or "numpy").
+                Defaults to the client's output format.
+            compact: Use compact dtypes. Defaults to False.
+
+        Yields:
+            For single symbol: pd.DataFrame with the quotes of one page.
+            For multiple symbols: dict mapping symbols to DataFrames for one page.
+
+        Raises:
+            ValidationError: If parameters are invalid.
+            Exception: If the API request fails or returns no data.
+        """
+        output = output or self.output
+        self._validate_parameters(symbols, start, end, limit, feed, sort)
+        validate_output(output)
+
+        url, params, symbols_list, is_single = self._build_quotes_request(
+            symbols, start, end, limit, asof, feed, None, sort
+        )
+
+        for page in self._iter_quote_pages(url, params, symbols_list, is_single):
+            result = self._convert_quotes(page, output, compact)
+            if is_single:
+                yield result[symbols_list[0]]
+            else:
+                yield result
+
+    def export_to(
+        self,
+        path: str | Path,
+        symbols: str | list[str],
+        start: str,
+        end: str,
+        limit: int = 10000,
+        asof: str | None = None,
+        feed: str = "iex",
+        sort: str = "asc",
+        format: str = "parquet",
+    ) -> int:
+        """Stream historical quote data into a Parquet or Feather file.
+
+        Each page is decoded straight into Arrow columns and written as its own
+        row group (Parquet) or record batch (Feather) as it arrives, so memory
+        use is bounded by a single page.
+
+        Args:
+            path: The file to write.
+            symbols: Symbol(s) to get quote data for. Can be a string for single symbol
+                or list of strings for multiple symbols.
+            start: Start date/time in ISO 8601 format (e.g., "2021-01-01" or "2021-01-01T00:00:00Z").
+            end: End date/time in ISO 8601 format.
+            limit: Maximum number of quotes to return per page. Defaults to 10000.
+            asof: As-of date for corporate actions adjustments in YYYY-MM-DD format.
+            feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
+            sort: Sort order for results ("asc" or "desc"). Defaults to "asc".
+            format: File format ("parquet" or "feather"). Defaults to "parquet".
+
+        Returns:
+            The number of quotes written.
+
+        Raises:
+            ValidationError: If parameters or the file format are invalid.
+            ImportError: If pyarrow is not installed.
+            Exception: If the API request fails or returns no data.
+        """
+        validate_export_format(format)
+        self._validate_parameters(symbols, start, end, limit, feed, sort)
+
+        url, params, symbols_list, is_single = self._build_quotes_request(
+            symbols, start, end, limit, asof, feed, None, sort
+        )
+
+        pages = (
+            self._quotes_to_columns(page)
+            for page in self._iter_quote_pages(url, params, symbols_list, is_single)
+        )
+        return export_pages(path, pages, arrow_schema(self.QUOTE_FIELDS), format)
+
+    def fill_store(
+        self,
+        store: TickStore,
+        symbols: str | list[str],
+        start: str,
+        end: str,
+        limit: int = 10000,
+        asof: str | None = None,
+        feed: str = "iex",
+    ) -> int:
+        """Download historical quotes into a local tick store page by page.
+
+        Quotes already stored for the range are skipped, so interrupted fills can
+        simply be restarted.
+
+        Args:
+            store: The TickStore to append to.
+            symbols: Symbol(s) to get quote data for. Can be a string for single symbol
+                or list of strings for multiple symbols.
+            start: Start date/time in ISO 8601 format (e.g., "2021-01-01" or "2021-01-01T00:00:00Z").
+            end: End date/time in ISO 8601 format.
+            limit: Maximum number of quotes to return per page. Defaults to 10000.
+            asof: As-of date for corporate actions adjustments in YYYY-MM-DD format.
+            feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
+
+        Returns:
+            The number of quotes written.
+
+        Raises:
+            ValidationError: If parameters or the file format are invalid.
+            ImportError: If pyarrow is not installed.
+            Exception: If the API request fails or returns no data.
+        """
+        self._validate_parameters(symbols, start, end, limit, feed, "asc")
+
+        url, params, symbols_list, is_single = self._build_quotes_request(
+            symbols, start, end, limit, asof, feed, None, "asc"
+        )
+
+        written = 0
+        for page in self._iter_quote_pages(url, params, symbols_list, is_single):
+            for symbol, quotes in page.items():
+                written += store.append(
+                    "quotes", symbol, records_from_dicts(quotes, "quotes")
+                )
+        return written
+
+    def read_store(
+        self,
+        store: TickStore,
+        symbol: str,
+        start: str,
+        end: str,
+        as_frame: bool = True,
+    ) -> pd.DataFrame | np.ndarray:
+        """Read quotes filled with `fill_store` back from a local tick store.
+
+        Args:
+            store: The TickStore to read from.
+            symbol: The stock symbol.
+            start: Inclusive start time in ISO 8601 format.
+            end: Exclusive end time in ISO 8601 format.
+            as_frame: Whether to decode the records into a DataFrame. Defaults to True.
+
+        Returns:
+            A DataFrame with one row per quote, or the raw records (a memory-mapped
+            view when the range lies within one day).
+        """
+        records = store.read("quotes", symbol, start, end)
+        return records_to_frame(records) if as_frame else records
+
+    def _quotes_to_columns(self, page: dict[str, list[dict]]) -> dict[str, np.ndarray]:
+        """Decode one page of quotes into columns with a leading symbol column.
+
+        Args:
+            page: Dictionary mapping symbols to the quote dictionaries of one page.
+
+        Returns:
+            Dictionary of column arrays ordered by symbol.
+        """
+        symbols = sorted(page)
+        records = [quote for symbol in symbols for quote in page[symbol]]
+        counts = [len(page[symbol]) for symbol in symbols]
+
+        columns = {"symbol": np.repeat(np.array(symbols, dtype=object), counts)}
+        columns.update(columns_from_records(records, self.QUOTE_FIELDS))
+        return columns
+
+    def _build_quotes_request(
+        self,
+        symbols: str | list[str],
+        start: str,
+        end: str,
+        limit: int,
+        asof: str | None,
+        feed: str,
+        page_token: str | None,
+        sort: str,
+    ) -> tuple[str, dict[str, str | int], list[str], bool]:
+        """Build the endpoint URL and query parameters for a quotes request.
+
+        Args:
+            symbols: Symbol(s) to get quote data for.
+            start: Start date/time in ISO 8601 format.
+            end: End date/time in ISO 8601 format.
+            limit: Maximum number of quotes to return per page.
+            asof: As-of date for corporate actions adjustments.
+            feed: The data feed to use.
+            page_token: Pagination token from previous request.
+            sort: Sort order for results.
+
+        Returns:
+            Tuple of URL, parameters, normalized symbol list and single-symbol flag.
+        """
         # Normalize symbols to list
         is_single = isinstance(symbols, str)
         symbols_list: list[str]
@@ -92,16 +373,7 @@ class Quotes:
         if not is_single:
             params["symbols"] = ",".join(symbols_list)
 
-        # Fetch all data with pagination
-        all_quotes = self._fetch_paginated_quotes(url, params, symbols_list, is_single)
-
-        # Convert to DataFrames
-        result = self._convert_to_dataframes(all_quotes)
-
-        # Return single DataFrame for single symbol, dict for multiple
-        if is_single and symbols_list[0] in result:
-            return result[symbols_list[0]]
-        return result
+        return url, params, symbols_list, is_single
 
     def _validate_parameters(
         self,
@@ -172,7 +444,36 @@ class Quotes:
             Exception: If the API request fails or returns no data.
         """
         all_quotes = defaultdict(list)
+
+        for page in self._iter_quote_pages(url, params, symbols_list, is_single):
+            for symbol, symbol_quotes in page.items():
+                all_quotes[symbol].extend(symbol_quotes)
+
+        return all_quotes
+
+    def _iter_quote_pages(
+        self,
+        url: str,
+        params: dict,
+        symbols_list: list[str],
+        is_single: bool,
+    ) -> Iterator[dict[str, list[dict]]]:
+        """Yield the quotes of each response page as it arrives.
+
+        Args:
+            url: API endpoint URL.
+            params: Request parameters.
+            symbols_list: List of symbols being requested.
+            is_single: Whether this is a single-symbol request.
+
+        Yields:
+            Dictionary mapping symbols to the quote dictionaries of one page.
+
+        Raises:
+            Exception: If the API request fails or returns no data.
+        """
         page_token = params.get("page_token")
+        found_quotes = False
 
         while True:
             if page_token:
@@ -185,15 +486,21 @@ class Quotes:
             )
 
             # Handle single vs multi-symbol response format
+            page: dict[str, list[dict]] = {}
             if is_single:
                 quotes_data = response.get("quotes", [])
                 if quotes_data:
-                    all_quotes[symbols_list[0]].extend(quotes_data)
+                    page[symbols_list[0]] = quotes_data
             else:
                 # Multi-symbol response has quotes nested under symbol keys
                 quotes_data = response.get("quotes", {})
                 for symbol, symbol_quotes in quotes_data.items():
-                    all_quotes[symbol].extend(symbol_quotes)
+                    if symbol_quotes:
+                        page[symbol] = symbol_quotes
+
+            if page:
+                found_quotes = True
+                yield page
 
             # Check for next page
             page_token = response.get("next_page_token")
@@ -203,12 +510,47 @@ class Quotes:
             # Remove page_token from params if it was there
             params.pop("page_token", None)
 
-        if not all_quotes:
+        if not found_quotes:
             raise Exception(
                 f"No quote data found for symbols: {', '.join(symbols_list)}"
             )
 
-        return all_quotes
+    def _convert_quotes(
+        self, quotes_data: dict[str, list[dict]], output: str, compact: bool = False
+    ) -> dict[str, Any]:
+        """Convert quote data to the requested output format.
+
+        Non-pandas formats are built directly from the decoded columns, with the
+        timestamp as a regular column since they have no index.
+
+        Args:
+            quotes_data: Dictionary mapping symbols to lists of quote dictionaries.
+            output: Output format ("pandas", "polars", "arrow" or "numpy").
+            compact: Whether to use compact dtypes.
+
+        Returns:
+            Dictionary mapping symbols to quote data in the requested format.
+        """
+        if output == "pandas":
+            result_df = self._convert_to_dataframes(quotes_data)
+            if compact:
+                return {symbol: compact_quotes(df) for symbol, df in result_df.items()}
+            return result_df
+
+        result = {}
+        for symbol, quotes in quotes_data.items():
+            if quotes:
+                columns = columns_from_records(quotes, self.QUOTE_FIELDS)
+                columns["spread"] = columns["ask_price"] - columns["bid_price"]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    columns["spread_pct"] = np.round(
+                        columns["spread"] / columns["bid_price"] * 100, 4
+                    )
+                result[symbol] = build_frame(
+                    compact_columns(columns) if compact else columns, output
+                )
+
+        return result
 
     def _convert_to_dataframes(
         self, quotes_data: dict[str, list[dict]]
@@ -0,0 +1,361 @@
+"""Declarative stock screens evaluated as one vectorized mask."""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.exceptions import ValidationError
+
+Columns = Mapping[str, np.ndarray]
+
+
+def _pct(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Returns numerator / denominator in percent, NaN where undefined."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = numerator / denominator * 100
+    return np.where(np.isfinite(result), result, np.nan)
+
+
+@dataclass(frozen=True)
+class Condition:
+    """One condition of a screen.
+
+    Attributes:
+        column: The column or indicator compared.
+        op: One of ">", ">=", "<", "<=", "==", "!=" or "between".
+        value: The threshold, or a (low, high) pair for "between", inclusive.
+        transform: "value" to compare the column itself, "rank" to compare its
+            rank across the universe (1 is the largest, or the smallest when
+            `ascending`), or "percentile" to compare its 0-100 percentile.
+        ascending: Whether rank 1 is the smallest value.
+    """
+
+    column: str
+    op: str
+    value: float | tuple[float, float]
+    transform: str = "value"
+    ascending: bool = False
+
+
+class ScreenSpec:
+    """A declarative screen: conditions, a sort column and a result size.
+
+    Conditions are combined with AND into one boolean mask over the columns of
+    a universe (a DataFrame or a dict of NumPy arrays, one row per symbol), with
+    no intermediate copies. Ranks and percentiles are computed across the whole
+    universe. Only the `top_k` best rows are sorted, after a partial sort.
+
+    Besides the universe's columns, conditions and the sort may use indicators
+    derived from them: the built-in `INDICATORS` (given the columns they need)
+    or any registered with `derive()`.
+
+    Example:
+        >>> spec = (
+        ...     ScreenSpec(sort_by="change", top_k=20)
+        ...     .where("price", ">", 5)
+        ...     .percentile("dollar_volume", ">=", 80)
+        ...     .between("gap_pct", 1, 10)
+        ... )
+        >>> gainers = screener.screen(spec, mode="snapshots")
+    """
+
+    OPERATORS: ClassVar[dict[str, Callable[..., np.ndarray]]] = {
+        ">": np.greater,
+        ">=": np.greater_equal,
+        "<": np.less,
+        "<=": np.less_equal,
+        "==": np.equal,
+        "!=": np.not_equal,
+    }
+
+    # Indicators computed from universe columns; snapshot universes provide them all
+    INDICATORS: ClassVar[dict[str, Callable[[Columns], np.ndarray]]] = {
+        "dollar_volume": lambda c: c["price"] * c["volume"],
+        "spread_pct": lambda c: _pct(
+            c["ask_price"] - c["bid_price"], (c["ask_price"] + c["bid_price"]) / 2
+        ),
+        "gap_pct": lambda c: _pct(
+            c["daily_open"] - c["prev_daily_close"], c["prev_daily_close"]
+        ),
+        "range_pct": lambda c: _pct(c["daily_high"] - c["daily_low"], c["daily_low"]),
+        "vwap_distance_pct": lambda c: _pct(
+            c["price"] - c["daily_vwap"], c["daily_vwap"]
+        ),
+    }
+
+    def __init__(
+        self,
+        sort_by: str = "change",
+        ascending: bool = False,
+        top_k: int | None = None,
+    ) -> None:
+        """Initializes a screen without conditions.
+
+        Args:
+            sort_by: The column or indicator the result is sorted by.
+            ascending: Whether the smallest values come first. Defaults to False.
+            top_k: The maximum number of rows returned; all by default.
+
+        Raises:
+            ValidationError: If top_k is not positive.
+        """
+        if top_k is not None and top_k < 1:
+            raise ValidationError("top_k must be at least 1.")
+        self.sort_by = sort_by
+        self.ascending = ascending
+        self.top_k = top_k
+        self.conditions: list[Condition | Callable[[Any], Any]] = []
+        self.indicators: dict[str, Callable[[Columns], np.ndarray]] = {}
+
+    ############################################
+    # Building
+    ############################################
+    def where(
+        self, column: str, op: str, value: float | tuple[float, float]
+    ) -> "ScreenSpec":
+        """Adds a threshold on a column or indicator.
+
+        Args:
+            column: The column or indicator.
+            op: One of ">", ">=", "<", "<=", "==", "!=" or "between".
+            value: The threshold, or a (low, high) pair for "between".
+
+        Returns:
+            ScreenSpec: The spec, for chaining.
+        """
+        return self._add(Condition(column, op, value))
+
+    def between(self, column: str, low: float, high: float) -> "ScreenSpec":
+        """Adds an inclusive range on a column or indicator."""
+        return self._add(Condition(column, "between", (low, high)))
+
+    def rank(
+        self, column: str, op: str, value: float, ascending: bool = False
+    ) -> "ScreenSpec":
+        """Adds a condition on the rank of a column across the universe.
+
+        Args:
+            column: The column or indicator.
+            op: The comparison, e.g. "<=" with 50 for the 50 largest values.
+            value: The rank threshold; rank 1 is the largest value.
+            ascending: Whether rank 1 is the smallest value instead.
+
+        Returns:
+            ScreenSpec: The spec, for chaining.
+        """
+        return self._add(Condition(column, op, value, "rank", ascending))
+
+    def percentile(self, column: str, op: str, value: float) -> "ScreenSpec":
+        """Adds a condition on the 0-100 percentile of a column across the universe.
+
+        Args:
+            column: The column or indicator.
+            op: The comparison, e.g. ">=" with 90 for the top decile.
+            value: The percentile threshold.
+
+        Returns:
+            ScreenSpec: The spec, for chaining.
+        """
+        return self._add(Condition(column, op, value, "percentile"))
+
+    def where_fn(self, func: Callable[[Any], Any]) -> "ScreenSpec":
+        """Adds a custom condition.
+
+        Args:
+            func: Called with the universe; returns a boolean array or Series
+                with one value per row.
+
+        Returns:
+            ScreenSpec: The spec, for chaining.
+        """
+        self.conditions.append(func)
+        return self
+
+    def derive(self, name: str, func: Callable[[Columns], np.ndarray]) -> "ScreenSpec":
+        """Registers an indicator computed from the universe's columns.
+
+        Args:
+            name: The name used in conditions and `sort_by`.
+            func: Called with a mapping of column names to arrays (which also
+                resolves other indicators); returns one value per row.
+
+        Returns:
+            ScreenSpec: The spec, for chaining.
+        """
+        self.indicators[name] = func
+        return self
+
+    def _add(self, condition: Condition) -> "ScreenSpec":
+        """Validates and appends a condition."""
+        if condition.op not in self.OPERATORS and condition.op != "between":
+            raise ValidationError(
+                f"Invalid operator. Must be one of: {', '.join(self.OPERATORS)}, between"
+            )
+        if condition.op == "between" and not (
+            isinstance(condition.value, tuple) and len(condition.value) == 2
+        ):
+            raise ValidationError("between requires a (low, high) pair.")
+        self.conditions.append(condition)
+        return self
+
+    ############################################
+    # Evaluation
+    ############################################
+    def compile(self) -> Callable[[Any], np.ndarray]:
+        """Compiles the conditions into one function returning the combined mask.
+
+        Returns:
+            Callable: Takes a universe and returns a boolean array with one value
+            per row. Rows with missing (NaN) values fail their conditions.
+        """
+        evaluate = self._compile()
+
+        def mask(universe: Any) -> np.ndarray:
+            return evaluate(universe)[0]
+
+        return mask
+
+    def _compile(
+        self,
+    ) -> Callable[[Any], tuple[np.ndarray, "_ColumnResolver"]]:
+        """Snapshots the spec into a function returning the mask and its columns.
+
+        `compile()` and `select()` both evaluate through this, so the conditions
+        are applied the same way whether or not the rows are then ranked.
+        """
+        conditions = list(self.conditions)
+        indicators = {**self.INDICATORS, **self.indicators}
+
+        def evaluate(universe: Any) -> tuple[np.ndarray, _ColumnResolver]:
+            columns = _ColumnResolver(universe, indicators)
+            return self._combine(conditions, universe, columns), columns
+
+        return evaluate
+
+    def mask(self, universe: Any) -> np.ndarray:
+        """Returns the combined boolean mask of the conditions over a universe."""
+        return self.compile()(universe)
+
+    def apply(self, universe: Any) -> Any:
+        """Screens a universe.
+
+        Args:
+            universe: A DataFrame or a dict of NumPy arrays, one row per symbol.
+
+        Returns:
+            The rows passing every condition, best first by `sort_by`, at most
+            `top_k` of them, in the type of the universe (a DataFrame with a
+            fresh index, or a dict of arrays).
+
+        Raises:
+            ValidationError: If a column or indicator is missing.
+        """
+        indices = self.select(universe)
+        if isinstance(universe, pd.DataFrame):
+            return universe.iloc[indices].reset_index(drop=True)
+        return {name: np.asarray(values)[indices] for name, values in universe.items()}
+
+    def select(self, universe: Any) -> np.ndarray:
+        """Returns the row positions of the result of `apply()`, best first.
+
+        Args:
+            universe: A DataFrame or a dict of NumPy arrays, one row per symbol.
+
+        Returns:
+            np.ndarray: The positions of the selected rows.
+        """
+        mask, columns = self._compile()(universe)
+        indices = np.flatnonzero(mask)
+        key = np.asarray(columns[self.sort_by][indices], dtype=float)
+        if not self.ascending:
+            key = -key
+        key[np.isnan(key)] = np.inf  # Missing values sort last
+
+        if self.top_k is not None and self.top_k < len(indices):
+            # Partial sort: only the best top_k rows are sorted below
+            best = np.argpartition(key, self.top_k - 1)[: self.top_k]
+            indices, key = indices[best], key[best]
+        return indices[np.argsort(key, kind="stable")]
+
+    def _combine(
+        self,
+        conditions: list[Condition | Callable[[Any], Any]],
+        universe: Any,
+        columns: "_ColumnResolver",
+    ) -> np.ndarray:
+        """ANDs the conditions into one mask, reusing resolved columns."""
+        result = np.ones(len(columns), dtype=bool)
+        for condition in conditions:
+            if isinstance(condition, Condition):
+                result &= self._evaluate(condition, columns)
+            else:
+                result &= np.asarray(condition(universe), dtype=bool)
+        return result
+
+    def _evaluate(self, condition: Condition, columns: "_ColumnResolver") -> np.ndarray:
+        """Evaluates one condition to a boolean array."""
+        values = np.asarray(columns[condition.column], dtype=float)
+        if condition.transform == "rank":
+            values = _ranks(values, condition.ascending)
+        elif condition.transform == "percentile":
+            values = _percentiles(values)
+
+        if condition.op == "between":
+            low, high = condition.value  # type: ignore[misc]
+            return (values >= low) & (values <= high)
+        return self.OPERATORS[condition.op](values, condition.value)
+
+
+class _ColumnResolver(Mapping[str, np.ndarray]):
+    """Resolves universe columns and indicators to arrays, computing each once."""
+
+    def __init__(
+        self,
+        universe: Any,
+        indicators: dict[str, Callable[[Columns], np.ndarray]],
+    ) -> None:
+        self._universe = universe
+        self._indicators = indicators
+        self._cache: dict[str, np.ndarray] = {}
+        self._length = (
+            len(universe)
+            if isinstance(universe, pd.DataFrame)
+            else len(next(iter(universe.values()), ()))
+        )
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in self._cache:
+            if name in self._universe:
+                self._cache[name] = np.asarray(self._universe[name])
+            elif name in self._indicators:
+                self._cache[name] = np.asarray(self._indicators[name](self))
+            else:
+                raise ValidationError(f"Unknown screen column or indicator: {name}")
+        return self._cache[name]
+
+    def __iter__(self):
+        return iter(self._universe)
+
+    def __len__(self) -> int:
+        return self._length
+
+
+def _ranks(values: np.ndarray, ascending: bool) -> np.ndarray:
+    """Ranks values from 1, ties sharing the best rank; missing values rank last."""
+    ranks = pd.Series(values).rank(method="min", ascending=ascending).to_numpy()
+    return np.where(np.isnan(ranks), np.inf, ranks)
+
+
+def _percentiles(values: np.ndarray) -> np.ndarray:
+    """Returns the 0-100 percentile of each value among the non-missing values.
+
+    The smallest value is at 0 and the largest at 100; ties share their average.
+    """
+    ranks = pd.Series(values).rank(method="average").to_numpy()
+    count = int((~np.isnan(values)).sum())
+    if count < 2:
+        return np.where(np.isnan(values), np.nan, 100.0)
+    return (ranks - 1) / (count - 1) * 100
@@ -1,22 +1,51 @@
 import json
-from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 import pendulum
 
+from py_alpaca_api.exceptions import ValidationError
 from py_alpaca_api.http.requests import Requests
+from py_alpaca_api.models.frame_utils import columns_from_records
 from py_alpaca_api.stock.assets import Assets
+from py_alpaca_api.stock.screen_spec import ScreenSpec
+from py_alpaca_api.stock.snapshots import Snapshots
 from py_alpaca_api.trading.market import Market
 
 
 class Screener:
+    BATCH_SIZE = 200  # Alpaca API limit for multi-symbol requests
+    MAX_WORKERS = 5
+
+    # Sources of the change column; see universe
+    MODES: ClassVar[tuple[str, ...]] = ("bars", "snapshots", "intraday")
+
+    # Columns returned by filter_stocks, gainers and losers
+    COLUMNS: ClassVar[tuple[str, ...]] = (
+        "symbol",
+        "change",
+        "price",
+        "volume",
+        "trades",
+    )
+
+    # Columns computed from the latest bar of each symbol
+    PERCENTAGE_FIELDS: ClassVar[dict[str, tuple[str, str]]] = {
+        "c": ("price", "float"),
+        "v": ("volume", "int"),
+        "n": ("trades", "int"),
+    }
+
     def __init__(
         self,
         data_url: str,
         headers: dict[str, str],
         asset: Assets,
         market: Market,
+        snapshots: Snapshots | None = None,
     ) -> None:
         """Initialize Screener class3.
 
@@ -30,6 +59,8 @@ class Screener:
 
         asset: Asset                 object required
 
+        snapshots: Snapshots         object required by the snapshot modes
+
         Raises:
         _______
         ValueError: If data URL is not provided
@@ -42,6 +73,7 @@ class Screener:
         self.headers = headers
         self.asset = asset
         self.market = market
+        self.snapshots = snapshots
 
         self.yesterday = ""
         self.day_before_yesterday = ""
@@ -57,6 +89,7 @@ class Screener:
         trade_count_greater_than: int,
         total_returned: int,
         ascending_order: bool,
+        mode: str = "bars",
     ) -> pd.DataFrame:
         """Filter stocks based on given parameters.
 
@@ -68,34 +101,73 @@ class Screener:
             trade_count_greater_than: The minimum trade count threshold for the stocks.
             total_returned: The number of stocks to return.
             ascending_order: A boolean value indicating whether to sort the stocks in ascending order by change value.
+            mode: "bars", "snapshots" or "intraday"; see `universe`. Defaults to "bars".
 
         Returns:
             A pandas DataFrame containing the filtered stocks.
+
+        Raises:
+            ValidationError: If the mode is invalid, or a snapshot mode is used without a Snapshots client.
         """
-        self.set_dates()
-        df = self._get_percentages(start=self.day_before_yesterday, end=self.yesterday)
+        spec = (
+            ScreenSpec(
+                sort_by="change", ascending=ascending_order, top_k=total_returned
+            )
+            .where("price", ">", price_greater_than)
+            .where_fn(change_condition)
+            .where("volume", ">", volume_greater_than)
+            .where("trades", ">", trade_count_greater_than)
+        )
+        return self.screen(spec, mode=mode)[list(self.COLUMNS)]
 
-        # Apply filters step by step, ensuring DataFrame type is preserved
-        price_filter = df["price"] > price_greater_than
-        df = df.loc[price_filter].copy()
+    ##################################################
+    # ////////////////// Screen \\\\\\\\\\\ #
+    ##################################################
+    def screen(self, spec: ScreenSpec, mode: str = "bars") -> pd.DataFrame:
+        """Screens the asset universe with a declarative spec.
 
-        # Apply the change condition (returns a boolean Series)
-        change_filter = change_condition(df)
-        df = df.loc[change_filter].copy()
+        The spec's conditions are evaluated as one boolean mask over the universe,
+        and only its `top_k` rows are sorted.
 
-        volume_filter = df["volume"] > volume_greater_than
-        df = df.loc[volume_filter].copy()
+        Args:
+            spec: The screen to apply.
+            mode: The universe to screen: "bars", "snapshots" or "intraday"; see `universe`.
 
-        trades_filter = df["trades"] > trade_count_greater_than
-        df = df.loc[trades_filter].copy()
+        Returns:
+            pd.DataFrame: The matching rows of the universe, best first.
 
-        # Ensure df is a DataFrame before sorting
-        assert isinstance(df, pd.DataFrame)
-        return (
-            df.sort_values(by="change", ascending=ascending_order)
-            .reset_index(drop=True)
-            .head(total_returned)
-        )
+        Raises:
+            ValidationError: If the mode is invalid, or the spec uses a column the universe lacks.
+        """
+        return spec.apply(self.universe(mode))
+
+    def universe(self, mode: str = "bars") -> pd.DataFrame:
+        """Retrieves one row per tradable asset for screening.
+
+        Args:
+            mode: "bars" for the change between the last two completed sessions, "snapshots" for the
+                latest trade against the previous close, or "intraday" for the latest trade against
+                today's open. The snapshot modes need one snapshot request per 200 symbols, follow
+                the market during trading hours, and add every snapshot column
+                (`bid_price`, `daily_high`, `prev_daily_close`, ...). Defaults to "bars".
+
+        Returns:
+            pd.DataFrame: The symbol, change, price, volume and trades columns of each asset,
+            sorted by symbol.
+
+        Raises:
+            ValidationError: If the mode is invalid, or a snapshot mode is used without a Snapshots client.
+        """
+        if mode not in self.MODES:
+            raise ValidationError(
+                f"Invalid mode. Must be one of: {', '.join(self.MODES)}"
+            )
+        if mode == "bars":
+            self.set_dates()
+            return self._get_percentages(
+                start=self.day_before_yesterday, end=self.yesterday
+            )
+        return self._get_snapshot_percentages(intraday=mode == "intraday")
 
     ##################################################
     # //////////////// Get Losers \\\\\\\\\\\\\\\\\\ #
@@ -107,6 +179,7 @@ class Screener:
         volume_greater_than: int = 20000,
         trade_count_greater_than: int = 2000,
         total_losers_returned: int = 100,
+        mode: str = "bars",
     ) -> pd.DataFrame:
         """Returns a filtered DataFrame of stocks that meet the specified conditions for losers.
 
@@ -118,6 +191,7 @@ class Screener:
             trade_count_greater_than (int): The minimum trade count threshold for stocks to be considered losers.
              Default is 2000.
             total_losers_returned (int): The maximum number of losers to be returned. Default is 100.
+            mode (str): "bars", "snapshots" or "intraday"; see `universe`. Default is "bars".
 
         Returns:
             pd.DataFrame: A filtered DataFrame containing stocks that meet the specified conditions for losers.
@@ -129,6 +203,7 @@ class Screener:
             trade_count_greater_than,
             total_losers_returned,
             ascending_order=True,
+            mode=mode,
         )
 
     ##################################################
@@ -141,6 +216,7 @@ class Screener:
         volume_greater_than: int = 20000,
         trade_count_greater_than: int = 2000,
         total_gainers_returned: int = 100,
+        mode: str = "bars",
     ) -> pd.DataFrame:
         """Args:
             price_greater_than (float): The minimum price threshold for the stocks to be included in the gainers list.
@@ -153,6 +229,7 @@ class Screener:
             trade_count_greater_than (int): The minimum trade count threshold for the stocks to be included in the
             gainers list. Default is 2000.
             total_gainers_returned (int): The maximum number of gainers to be returned. Default is 100.
+            mode (str): "bars", "snapshots" or "intraday"; see `universe`. Default is "bars".
 
         Returns:
             pd.DataFrame: A Pandas DataFrame containing the stocks that satisfy the criteria for being gainers.
@@ -165,11 +242,16 @@ class Screener:
             trade_count_greater_than,
             total_gainers_returned,
             ascending_order=False,
+            mode=mode,
         )
 
     ##################################################
     # /////////// Calculate Percentages \\\\\\\\\\\\ #
     ##################################################
+    def _symbols(self) -> list[str]:
+        """Returns the active, fractionable and tradable non-OTC symbols from the asset universe."""
+        return self.asset.get_symbols()
+
     def _get_percentages(
         self,
         start: str,
@@ -178,6 +260,10 @@ class Screener:
     ) -> pd.DataFrame:
         """Retrieves stock data for a set of symbols and calculates the percentage change, price, volume, and trade count for each symbol.
 
+        Symbols are requested in batches of `BATCH_SIZE`, up to `MAX_WORKERS` at
+        a time, and the columns are computed for all symbols at once from their
+        last two bars.
+
         Args:
             start (str): The start date for the data retrieval, in the format "YYYY-MM-DD".
             end (str): The end date for the data retrieval, in the format "YYYY-MM-DD".
@@ -186,10 +272,109 @@ class Screener:
         Returns:
             pd.DataFrame: A Pandas DataFrame containing the calculated data for each symbol, including the symbol, percentage change, price, volume, and trade count.
         """
+        symbols = self._symbols()
+        batches = [
+            symbols[i : i + self.BATCH_SIZE]
+            for i in range(0, len(symbols), self.BATCH_SIZE)
+        ]
+
+        last_bars: dict[str, list[dict]] = {}
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self._fetch_last_bars, batch, start, end, timeframe)
+                for batch in batches
+            ]
+            for future in as_completed(futures):
+                last_bars.update(future.result())
+
+        symbols = sorted(symbol for symbol, bars in last_bars.items() if len(bars) > 1)
+        previous = columns_from_records(
+            [last_bars[symbol][-2] for symbol in symbols], {"c": ("close", "float")}
+        )["close"]
+        latest = columns_from_records(
+            [last_bars[symbol][-1] for symbol in symbols], self.PERCENTAGE_FIELDS
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = np.round((latest["price"] - previous) / previous * 100, 2)
+        valid = np.isfinite(change)
+
+        return pd.DataFrame(
+            {
+                "symbol": np.array(symbols, dtype=object)[valid],
+                "change": change[valid],
+                "price": latest["price"][valid],
+                "volume": latest["volume"][valid],
+                "trades": latest["trades"][valid],
+            }
+        )
+
+    def _get_snapshot_percentages(self, intraday: bool = False) -> pd.DataFrame:
+        """Calculates the percentage change, price, volume, and trade count of each symbol from snapshots.
+
+        Args:
+            intraday (bool, optional): Whether to measure the change from today's open
+                instead of from the previous close. Defaults to False.
+
+        Returns:
+            pd.DataFrame: The same columns as `_get_percentages`, with the latest trade as
+            price and the volume and trade count of the current daily bar, followed by
+            the other snapshot columns.
+
+        Raises:
+            ValidationError: If the screener has no Snapshots client.
+        """
+        if self.snapshots is None:
+            raise ValidationError("Snapshot modes require a Snapshots client.")
+
+        symbols = self._symbols()
+        columns = self.snapshots.get_snapshots_frame(
+            symbols, feed="sip", output="numpy"
+        )
+
+        price = np.where(
+            np.isnan(columns["trade_price"]),
+            columns["daily_close"],
+            columns["trade_price"],
+        )
+        base = columns["daily_open"] if intraday else columns["prev_daily_close"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = np.round((price - base) / base * 100, 2)
+        valid = np.isfinite(change)
+
+        return pd.DataFrame(
+            {
+                "symbol": columns["symbol"][valid],
+                "change": change[valid],
+                "price": price[valid],
+                "volume": columns["daily_volume"][valid],
+                "trades": columns["daily_trade_count"][valid],
+                **{
+                    name: values[valid]
+                    for name, values in columns.items()
+                    if name != "symbol"
+                },
+            }
+        )
+
+    def _fetch_last_bars(
+        self, symbols: list[str], start: str, end: str, timeframe: str
+    ) -> dict[str, list[dict]]:
+        """Pages through the bars of one batch of symbols, keeping the last two of each.
+
+        Args:
+            symbols (list[str]): At most `BATCH_SIZE` symbols.
+            start (str): The start date for the data retrieval.
+            end (str): The end date for the data retrieval.
+            timeframe (str): The timeframe for the data retrieval.
+
+        Returns:
+            dict[str, list[dict]]: Up to two raw bars per symbol, oldest first.
+        """
         url = f"{self.data_url}/stocks/bars"
 
         params: dict[str, str | bool | float | int] = {
-            "symbols": ",".join(self.asset.get_all()["symbol"].tolist()),
+            "symbols": ",".join(symbols),
             "limit": 10000,
             "timeframe": timeframe,
             "start": start,
@@ -201,7 +386,7 @@ class Screener:
         }
 
         page_token = None
-        symbols_data = defaultdict(list)
+        last_bars: dict[str, list[dict]] = {}
 
         while True:
             params["page_token"] = page_token or ""
@@ -211,37 +396,15 @@ class Screener:
                 .text
             )
 
-            for symbol in response["bars"]:
-                symbols_data[symbol].extend(response.get("bars", [])[symbol])
+            for symbol, bars in (response.get("bars") or {}).items():
+                last_bars[symbol] = (last_bars.get(symbol, []) + bars[-2:])[-2:]
 
             page_token = response.get("next_page_token", "")
 
             if not page_token:
                 break
 
-        sceener_df = pd.DataFrame()
-        for symbol in symbols_data.items():
-            try:
-                if len(symbol[1]) > 1:
-                    sym = symbol[0]
-                    last_day = symbol[1][-1]
-                    prev_day = symbol[1][-2]
-
-                    sym_data = {
-                        "symbol": sym,
-                        "change": round(
-                            ((last_day["c"] - prev_day["c"]) / prev_day["c"]) * 100, 2
-                        ),
-                        "price": last_day["c"],
-                        "volume": last_day["v"],
-                        "trades": last_day["n"],
-                    }
-                    sceener_df = pd.concat([sceener_df, pd.DataFrame([sym_data])])
-            except (TypeError, KeyError, IndexError):
-                pass
-
-        sceener_df.reset_index(drop=True, inplace=True)
-        return sceener_df
+        return last_bars
 
     ##################################################
     # ///////////////// Set Dates \\\\\\\\\\\\\\\\\\ #
@@ -261,6 +424,7 @@ class Screener:
             self.market.calendar(
                 start_date=today.subtract(days=7).format("YYYY-MM-DD"),
                 end_date=today.subtract(days=1).format("YYYY-MM-DD"),
+                output="pandas",
             )
             .tail(2)
             .reset_index(drop=True)
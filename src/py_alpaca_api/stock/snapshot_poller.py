@@ -0,0 +1,278 @@
+"""Polling of snapshots that only reports what changed between polls."""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.stock.snapshots import Snapshots
+from py_alpaca_api.trading.market import Market
+
+logger = logging.getLogger(__name__)
+
+SnapshotChanges = dict[str, dict[str, Any]]
+
+
+class SnapshotPoller:
+    """Polls snapshots for a set of symbols and emits only the changed fields.
+
+    The last state is kept as one array per field, aligned with the sorted
+    symbols, and each poll is diffed against it column by column. Changes are
+    delivered to subscribers as `{symbol: {field: new_value}}`, either through a
+    callback or a `queue.Queue`.
+
+    When a Market client is given, the interval follows the market clock: every
+    `open_interval` seconds during market hours, otherwise every
+    `closed_interval` seconds or at the next open, whichever comes first.
+    """
+
+    # Snapshot frame columns tracked by default
+    DEFAULT_FIELDS: ClassVar[tuple[str, ...]] = (
+        "trade_timestamp",
+        "trade_price",
+        "trade_size",
+        "bid_price",
+        "bid_size",
+        "ask_price",
+        "ask_size",
+        "minute_close",
+        "minute_volume",
+        "daily_high",
+        "daily_low",
+        "daily_volume",
+    )
+
+    def __init__(
+        self,
+        snapshots: Snapshots,
+        symbols: list[str],
+        market: Market | None = None,
+        fields: tuple[str, ...] | None = None,
+        feed: str = "iex",
+        open_interval: float = 1.0,
+        closed_interval: float = 60.0,
+        clock_ttl: float = 300.0,
+    ) -> None:
+        """Initializes the poller.
+
+        Args:
+            snapshots: The Snapshots client used to poll.
+            symbols: The symbols to poll.
+            market: Optional Market client used to adapt the interval to market hours.
+            fields: The snapshot frame columns to track. Defaults to `DEFAULT_FIELDS`.
+            feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
+            open_interval: Seconds between polls while the market is open.
+            closed_interval: Maximum seconds between polls while it is closed.
+            clock_ttl: Seconds before the market clock is fetched again.
+
+        Raises:
+            ValidationError: If no symbols are given or the intervals are not positive.
+        """
+        if not symbols:
+            raise ValidationError("Symbols are required.")
+        if open_interval <= 0 or closed_interval <= 0:
+            raise ValidationError("Poll intervals must be positive.")
+
+        self.snapshots = snapshots
+        self.market = market
+        self.symbols = np.array(sorted({s.upper().strip() for s in symbols}))
+        self.fields = fields or self.DEFAULT_FIELDS
+        self.feed = feed
+        self.open_interval = open_interval
+        self.closed_interval = closed_interval
+        self.clock_ttl = clock_ttl
+
+        self._state: dict[str, np.ndarray] = {}
+        self._seen = np.zeros(len(self.symbols), dtype=bool)
+        self._callbacks: list[Callable[[SnapshotChanges], None]] = []
+        self._queues: list[queue.Queue] = []
+        self._clock: tuple[float, bool, float] | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    ############################################
+    # Subscriptions
+    ############################################
+    def subscribe(
+        self, callback: Callable[[SnapshotChanges], None] | None = None
+    ) -> queue.Queue | None:
+        """Registers a subscriber for changes.
+
+        Args:
+            callback: Called with the changes of each poll that changed anything.
+                When omitted, a queue receiving the changes is created instead.
+
+        Returns:
+            queue.Queue | None: The new queue, or None when a callback was given.
+        """
+        if callback is not None:
+            self._callbacks.append(callback)
+            return None
+        changes: queue.Queue = queue.Queue()
+        self._queues.append(changes)
+        return changes
+
+    def unsubscribe(self, subscriber: Callable | queue.Queue) -> None:
+        """Removes a callback or queue returned by `subscribe`.
+
+        Args:
+            subscriber: The callback or queue to remove.
+        """
+        if isinstance(subscriber, queue.Queue):
+            self._queues.remove(subscriber)
+        else:
+            self._callbacks.remove(subscriber)
+
+    ############################################
+    # Polling
+    ############################################
+    def poll(self) -> SnapshotChanges:
+        """Polls once and notifies subscribers of the changed fields.
+
+        The first response of a symbol reports every tracked field, including the
+        missing ones (NaN, NaT or None); later polls report the changed fields.
+
+        Returns:
+            SnapshotChanges: The changed fields by symbol; empty if nothing changed.
+        """
+        columns = self.snapshots.get_snapshots_frame(
+            list(self.symbols), feed=self.feed, output="numpy"
+        )
+        # Rows of symbols missing from the response keep their previous state
+        rows = np.searchsorted(self.symbols, columns["symbol"])
+        first = ~self._seen[rows]
+        changed_rows = np.zeros(len(self.symbols), dtype=bool)
+        changed: dict[str, np.ndarray] = {}
+
+        for field in self.fields:
+            new = columns[field]
+            if field not in self._state:
+                self._state[field] = self._empty_state(new.dtype)
+            old = self._state[field][rows]
+            mask = ((old != new) & ~(pd.isna(old) & pd.isna(new))) | first
+            self._state[field][rows[mask]] = new[mask]
+            changed[field] = np.zeros(len(self.symbols), dtype=bool)
+            changed[field][rows[mask]] = True
+            changed_rows |= changed[field]
+        self._seen[rows] = True
+
+        changes: SnapshotChanges = {}
+        for row in np.flatnonzero(changed_rows):
+            changes[str(self.symbols[row])] = {
+                field: self._state[field][row]
+                for field in self.fields
+                if changed[field][row]
+            }
+
+        if changes:
+            self._notify(changes)
+        return changes
+
+    def interval(self) -> float:
+        """Returns the seconds until the next poll, based on the market clock.
+
+        The clock is fetched again after `clock_ttl` seconds, or as soon as the
+        market has passed its next open or close.
+
+        Returns:
+            float: `open_interval` while the market is open; otherwise the time
+            until the next open, capped at `closed_interval`.
+        """
+        if self.market is None:
+            return self.open_interval
+
+        now = time.monotonic()
+        if self._clock is None or now - self._clock[0] >= self.clock_ttl:
+            self._clock = self._read_clock(now)
+        fetched_at, is_open, until_change = self._clock
+        remaining = until_change - (now - fetched_at)
+        if remaining <= 0:
+            self._clock = self._read_clock(now)
+            fetched_at, is_open, remaining = self._clock
+
+        if is_open:
+            return self.open_interval
+        return min(self.closed_interval, max(remaining, self.open_interval))
+
+    def run(self, max_polls: int | None = None) -> None:
+        """Polls in the calling thread until `stop` is called.
+
+        Failed polls are logged and retried at the next interval.
+
+        Args:
+            max_polls: Optional number of polls after which to return.
+        """
+        self._stop.clear()
+        polls = 0
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Snapshot poll failed")
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                break
+            self._stop.wait(self.interval())
+
+    def start(self) -> None:
+        """Starts polling in a background daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run, name="SnapshotPoller", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stops polling and waits for the background thread to finish.
+
+        Args:
+            timeout: Optional number of seconds to wait for the thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def state(self) -> pd.DataFrame:
+        """pd.DataFrame: The last known value of every tracked field by symbol."""
+        return pd.DataFrame(self._state, index=pd.Index(self.symbols, name="symbol"))
+
+    def _read_clock(self, now: float) -> tuple[float, bool, float]:
+        """Fetches the clock as (fetched at, is open, seconds to next open/close)."""
+        assert self.market is not None  # Type guard for mypy
+        clock = self.market.clock()
+        change = clock.next_close if clock.is_open else clock.next_open
+        # Both times are New York wall-clock strings from the clock model
+        seconds = (
+            pd.Timestamp(str(change)) - pd.Timestamp(str(clock.market_time))
+        ).total_seconds()
+        return now, clock.is_open, seconds
+
+    def _empty_state(self, dtype: np.dtype) -> np.ndarray:
+        """Returns a state column that differs from any polled value."""
+        if dtype.kind == "M":
+            return np.full(len(self.symbols), np.datetime64("NaT"), dtype=dtype)
+        if dtype.kind == "f":
+            return np.full(len(self.symbols), np.nan, dtype=dtype)
+        if dtype.kind == "i":
+            return np.full(len(self.symbols), -1, dtype=dtype)  # Sizes are never -1
+        return np.full(len(self.symbols), None, dtype=object)
+
+    def _notify(self, changes: SnapshotChanges) -> None:
+        """Delivers changes to every subscriber."""
+        for callback in list(self._callbacks):
+            try:
+                callback(changes)
+            except Exception:
+                logger.exception("Snapshot subscriber failed")
+        for subscriber in list(self._queues):
+            subscriber.put(changes)
@@ -1,18 +1,67 @@
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, ClassVar
+
+import numpy as np
 
 from py_alpaca_api.exceptions import APIRequestError, ValidationError
 from py_alpaca_api.http.requests import Requests
+from py_alpaca_api.models.frame_utils import (
+    build_frame,
+    columns_from_records,
+    validate_output,
+)
 from py_alpaca_api.models.snapshot_model import SnapshotModel, snapshot_class_from_dict
 
 
+def _bar_fields(prefix: str) -> dict[str, tuple[str, str]]:
+    """Returns the column map of a snapshot bar section."""
+    return {
+        "t": (f"{prefix}_timestamp", "datetime"),
+        "o": (f"{prefix}_open", "float"),
+        "h": (f"{prefix}_high", "float"),
+        "l": (f"{prefix}_low", "float"),
+        "c": (f"{prefix}_close", "float"),
+        "v": (f"{prefix}_volume", "int"),
+        "n": (f"{prefix}_trade_count", "int"),
+        "vw": (f"{prefix}_vwap", "float"),
+    }
+
+
 class Snapshots:
-    def __init__(self, headers: dict[str, str]) -> None:
+    BATCH_SIZE = 200  # Alpaca API limit for multi-symbol requests
+    MAX_WORKERS = 5
+
+    # Snapshot sections mapped to their API keys, column names and kinds
+    SNAPSHOT_FIELDS: ClassVar[dict[str, dict[str, tuple[str, str]]]] = {
+        "latestTrade": {
+            "t": ("trade_timestamp", "datetime"),
+            "p": ("trade_price", "float"),
+            "s": ("trade_size", "int"),
+            "x": ("trade_exchange", "str"),
+        },
+        "latestQuote": {
+            "t": ("quote_timestamp", "datetime"),
+            "bp": ("bid_price", "float"),
+            "bs": ("bid_size", "int"),
+            "ap": ("ask_price", "float"),
+            "as": ("ask_size", "int"),
+        },
+        "minuteBar": _bar_fields("minute"),
+        "dailyBar": _bar_fields("daily"),
+        "prevDailyBar": _bar_fields("prev_daily"),
+    }
+
+    def __init__(self, headers: dict[str, str], output: str = "pandas") -> None:
         """Initialize the Snapshots class.
 
         Args:
             headers: Dictionary containing authentication headers.
+            output: The default output format: "pandas", "polars", "arrow" or "numpy".
         """
+        validate_output(output)
         self.headers = headers
+        self.output = output
         self.base_url = "https://data.alpaca.markets/v2/stocks"
 
     def get_snapshot(
@@ -76,7 +125,8 @@ class Snapshots:
         """Get snapshots for multiple stock symbols.
 
         The snapshot includes the latest trade, latest quote, minute bar,
-        daily bar, and previous daily bar data for each symbol.
+        daily bar, and previous daily bar data for each symbol. Lists longer
+        than `BATCH_SIZE` are split into batches fetched concurrently.
 
         Args:
             symbols: A list of stock symbols or comma-separated string of symbols.
@@ -90,6 +140,70 @@ class Snapshots:
             ValidationError: If symbols are invalid or feed is invalid.
             APIRequestError: If the API request fails.
         """
+        symbols_list = self._validate_symbols(symbols, feed)
+        response = self._get_raw_snapshots(symbols_list, feed)
+
+        snapshots = {}
+        for symbol, data in response.items():
+            data["symbol"] = symbol
+            snapshots[symbol] = snapshot_class_from_dict(data)
+
+        if len(symbols_list) == 1:
+            return list(snapshots.values())
+
+        return snapshots
+
+    def get_snapshots_frame(
+        self,
+        symbols: list[str] | str,
+        feed: str = "iex",
+        output: str | None = None,
+    ) -> Any:
+        """Get snapshots for many symbols as one row per symbol.
+
+        The columns are decoded straight from the API responses, without creating
+        a SnapshotModel per symbol, which keeps full-universe scans cheap. Missing
+        sections (e.g. no daily bar yet) are NaN/NaT, with zero sizes and volumes.
+
+        Args:
+            symbols: A list of stock symbols or comma-separated string of symbols.
+            feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
+            output: Output format ("pandas", "polars", "arrow" or "numpy").
+                Defaults to the client's output format.
+
+        Returns:
+            The snapshots sorted by symbol, with `trade_*`, `bid_*`/`ask_*`,
+            `minute_*`, `daily_*` and `prev_daily_*` columns.
+
+        Raises:
+            ValidationError: If symbols, feed or output are invalid.
+            APIRequestError: If the API request fails.
+        """
+        output = output or self.output
+        validate_output(output)
+        symbols_list = self._validate_symbols(symbols, feed)
+        response = self._get_raw_snapshots(symbols_list, feed)
+
+        ordered = sorted(response)
+        columns: dict[str, np.ndarray] = {"symbol": np.array(ordered, dtype=object)}
+        for section, fields in self.SNAPSHOT_FIELDS.items():
+            records = [response[symbol].get(section) or {} for symbol in ordered]
+            columns.update(columns_from_records(records, fields))
+        return build_frame(columns, output)
+
+    def _validate_symbols(self, symbols: list[str] | str, feed: str) -> list[str]:
+        """Validate and normalize the symbols and feed of a snapshots request.
+
+        Args:
+            symbols: A list of stock symbols or comma-separated string of symbols.
+            feed: The data feed to use.
+
+        Returns:
+            The upper-cased symbols.
+
+        Raises:
+            ValidationError: If symbols are invalid or feed is invalid.
+        """
         if not symbols:
             raise ValidationError("Symbols are required.")
 
@@ -100,19 +214,68 @@ class Snapshots:
             )
 
         if isinstance(symbols, str):
-            symbols_str = symbols.upper().strip()
-            symbols_list = [s.strip() for s in symbols_str.split(",")]
+            symbols_list = [s.strip() for s in symbols.upper().split(",")]
         else:
             symbols_list = [s.upper().strip() for s in symbols]
-            symbols_str = ",".join(symbols_list)
+        symbols_list = [s for s in symbols_list if s]
 
-        if not symbols_str:
+        if not symbols_list:
             raise ValidationError("At least one symbol is required.")
+        return symbols_list
+
+    def _get_raw_snapshots(self, symbols: list[str], feed: str) -> dict[str, dict]:
+        """Fetch raw snapshots, batching and parallelizing large symbol lists.
+
+        Args:
+            symbols: List of stock symbols.
+            feed: The data feed to use.
+
+        Returns:
+            The snapshot data keyed by symbol.
+
+        Raises:
+            APIRequestError: If any request fails or no data is returned.
+        """
+        batches = [
+            symbols[i : i + self.BATCH_SIZE]
+            for i in range(0, len(symbols), self.BATCH_SIZE)
+        ]
 
+        if len(batches) == 1:
+            snapshots = self._fetch_snapshots(batches[0], feed)
+        else:
+            # Use ThreadPoolExecutor for concurrent batch requests; each request
+            # still retries with backoff on 429 responses
+            snapshots = {}
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(self._fetch_snapshots, batch, feed)
+                    for batch in batches
+                ]
+                for future in as_completed(futures):
+                    snapshots.update(future.result())
+
+        if not snapshots:
+            raise APIRequestError(message="No snapshot data returned")
+        return snapshots
+
+    def _fetch_snapshots(self, symbols: list[str], feed: str) -> dict[str, dict]:
+        """Fetch the snapshots of a single batch of symbols.
+
+        Args:
+            symbols: List of at most `BATCH_SIZE` stock symbols.
+            feed: The data feed to use.
+
+        Returns:
+            The snapshot data keyed by symbol.
+
+        Raises:
+            APIRequestError: If the API request fails.
+        """
         url = f"{self.base_url}/snapshots"
 
         params: dict[str, str | bool | float | int] = {
-            "symbols": symbols_str,
+            "symbols": ",".join(symbols),
             "feed": feed,
         }
 
@@ -125,17 +288,9 @@ class Snapshots:
         except Exception as e:
             raise APIRequestError(message=f"Failed to get snapshots: {e!s}") from e
 
-        if not response:
-            raise APIRequestError(message="No snapshot data returned")
-
         # The API returns symbols as top-level keys directly
-        snapshots = {}
-        for symbol, data in response.items():
-            if isinstance(data, dict):  # Ensure it's snapshot data
-                data["symbol"] = symbol
-                snapshots[symbol] = snapshot_class_from_dict(data)
-
-        if len(symbols_list) == 1:
-            return list(snapshots.values())
-
-        return snapshots
+        return {
+            symbol: data
+            for symbol, data in (response or {}).items()
+            if isinstance(data, dict)  # Ensure it's snapshot data
+        }
@@ -1,14 +1,34 @@
 import json
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Literal
+from pathlib import Path
+from typing import ClassVar, Literal
+
+import numpy as np
+import pandas as pd
 
 from py_alpaca_api.exceptions import APIRequestError, ValidationError
 from py_alpaca_api.http.requests import Requests
+from py_alpaca_api.models.frame_utils import columns_from_records
 from py_alpaca_api.models.trade_model import (
+    TRADE_FIELDS,
+    TradeBatch,
     TradeModel,
     TradesResponse,
+    concat_trade_batches,
+    trade_batch_from_dicts,
     trade_class_from_dict,
 )
+from py_alpaca_api.storage.export import (
+    arrow_schema,
+    export_pages,
+    validate_export_format,
+)
+from py_alpaca_api.storage.tick_store import (
+    TickStore,
+    records_from_dicts,
+    records_to_frame,
+)
 
 
 def _validate_datetime_format(start: str, end: str) -> None:
@@ -26,6 +46,8 @@ def _validate_datetime_format(start: str, end: str) -> None:
 
 
 class Trades:
+    TRADE_FIELDS: ClassVar[dict[str, tuple[str, str]]] = TRADE_FIELDS
+
     def __init__(self, headers: dict[str, str]) -> None:
         self.headers = headers
         self.base_url = "https://data.alpaca.markets/v2"
@@ -54,6 +76,49 @@ class Trades:
         Returns:
             TradesResponse with list of trades and pagination token
 
+        Raises:
+            ValidationError: If parameters are invalid
+            APIRequestError: If the API request fails
+        """
+        response = self._get_trades_page(
+            symbol, start, end, limit, feed, page_token, asof
+        )
+
+        # Parse trades
+        trades = []
+        for trade_data in response.get("trades", []) or []:
+            trades.append(trade_class_from_dict(trade_data, symbol))
+
+        return TradesResponse(
+            trades=trades,
+            symbol=response.get("symbol", symbol),
+            next_page_token=response.get("next_page_token"),
+        )
+
+    def _get_trades_page(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        limit: int,
+        feed: str | None,
+        page_token: str | None,
+        asof: str | None,
+    ) -> dict:
+        """Retrieve one raw page of historical trades for a symbol.
+
+        Args:
+            symbol: The stock symbol to retrieve trades for
+            start: Start time in RFC-3339 format
+            end: End time in RFC-3339 format
+            limit: Number of trades to return (1-10000)
+            feed: Data feed to use (iex, sip, otc)
+            page_token: Token for pagination
+            asof: As-of time for historical data in RFC-3339 format
+
+        Returns:
+            The decoded API response with the raw trades and pagination token
+
         Raises:
             ValidationError: If parameters are invalid
             APIRequestError: If the API request fails
@@ -101,18 +166,7 @@ class Trades:
                 f"Failed to retrieve trades: {http_response.text}",
             )
 
-        response = json.loads(http_response.text) if http_response.text else {}
-
-        # Parse trades
-        trades = []
-        for trade_data in response.get("trades", []) or []:
-            trades.append(trade_class_from_dict(trade_data, symbol))
-
-        return TradesResponse(
-            trades=trades,
-            symbol=response.get("symbol", symbol),
-            next_page_token=response.get("next_page_token"),
-        )
+        return json.loads(http_response.text) if http_response.text else {}
 
     def get_latest_trade(
         self,
@@ -357,25 +411,310 @@ class Trades:
             APIRequestError: If the API request fails
         """
         all_trades = []
+        for response in self.iter_trades(
+            symbol=symbol, start=start, end=end, feed=feed, asof=asof
+        ):
+            all_trades.extend(response.trades)
+
+        return all_trades
+
+    def iter_trades(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        limit: int = 10000,
+        feed: Literal["iex", "sip", "otc"] | None = None,
+        asof: str | None = None,
+    ) -> Iterator[TradesResponse]:
+        """Yield historical trades for a symbol one page at a time.
+
+        Pages are yielded as they arrive instead of being accumulated, so tick
+        ranges larger than memory can be processed during the download.
+
+        Args:
+            symbol: The stock symbol
+            start: Start time in RFC-3339 format
+            end: End time in RFC-3339 format
+            limit: Number of trades per page (1-10000, default 10000)
+            feed: Data feed to use
+            asof: As-of time for historical data
+
+        Yields:
+            TradesResponse for each page returned by the API
+
+        Raises:
+            ValidationError: If parameters are invalid
+            APIRequestError: If the API request fails
+        """
+        for response in self._iter_trade_pages(symbol, start, end, limit, feed, asof):
+            yield TradesResponse(
+                trades=[
+                    trade_class_from_dict(trade_data, symbol)
+                    for trade_data in response.get("trades", []) or []
+                ],
+                symbol=response.get("symbol", symbol),
+                next_page_token=response.get("next_page_token"),
+            )
+
+    def _iter_trade_pages(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        limit: int = 10000,
+        feed: str | None = None,
+        asof: str | None = None,
+    ) -> Iterator[dict]:
+        """Yield the raw API response of each trades page as it arrives.
+
+        Args:
+            symbol: The stock symbol
+            start: Start time in RFC-3339 format
+            end: End time in RFC-3339 format
+            limit: Number of trades per page (1-10000, default 10000)
+            feed: Data feed to use
+            asof: As-of time for historical data
+
+        Yields:
+            The decoded API response of each page
+
+        Raises:
+            ValidationError: If parameters are invalid
+            APIRequestError: If the API request fails
+        """
         page_token = None
 
         while True:
-            response = self.get_trades(
-                symbol=symbol,
-                start=start,
-                end=end,
-                limit=10000,  # Max limit for efficiency
-                feed=feed,
-                page_token=page_token,
-                asof=asof,
+            response = self._get_trades_page(
+                symbol, start, end, limit, feed, page_token, asof
             )
 
-            all_trades.extend(response.trades)
+            yield response
 
-            # Check if there are more pages
-            if response.next_page_token:
-                page_token = response.next_page_token
-            else:
+            page_token = response.get("next_page_token")
+            if not page_token:
                 break
 
-        return all_trades
+    def export_to(
+        self,
+        path: str | Path,
+        symbol: str,
+        start: str,
+        end: str,
+        limit: int = 10000,
+        feed: Literal["iex", "sip", "otc"] | None = None,
+        asof: str | None = None,
+        format: str = "parquet",
+    ) -> int:
+        """Stream historical trades for a symbol into a Parquet or Feather file.
+
+        Raw pages are decoded straight into Arrow columns without building
+        TradeModel objects, and each page is written as its own row group
+        (Parquet) or record batch (Feather), so memory use is bounded by a page.
+
+        Args:
+            path: The file to write
+            symbol: The stock symbol
+            start: Start time in RFC-3339 format
+            end: End time in RFC-3339 format
+            limit: Number of trades per page (1-10000, default 10000)
+            feed: Data feed to use
+            asof: As-of time for historical data
+            format: File format, "parquet" or "feather" (default "parquet")
+
+        Returns:
+            The number of trades written
+
+        Raises:
+            ValidationError: If parameters or the file format are invalid
+            ImportError: If pyarrow is not installed
+            APIRequestError: If the API request fails
+        """
+        validate_export_format(format)
+        pages = (
+            self._trades_to_columns(response.get("trades") or [], symbol)
+            for response in self._iter_trade_pages(
+                symbol, start, end, limit, feed, asof
+            )
+        )
+        return export_pages(path, pages, arrow_schema(self.TRADE_FIELDS), format)
+
+    def fill_store(
+        self,
+        store: TickStore,
+        symbol: str,
+        start: str,
+        end: str,
+        limit: int = 10000,
+        feed: Literal["iex", "sip", "otc"] | None = None,
+        asof: str | None = None,
+    ) -> int:
+        """Download historical trades into a local tick store page by page.
+
+        Trades already stored for the range are skipped, so interrupted fills can
+        simply be restarted.
+
+        Args:
+            store: The TickStore to append to
+            symbol: The stock symbol
+            start: Start time in RFC-3339 format
+            end: End time in RFC-3339 format
+            limit: Number of trades per page (1-10000, default 10000)
+            feed: Data feed to use
+            asof: As-of time for historical data
+
+        Returns:
+            The number of trades written
+
+        Raises:
+            ValidationError: If parameters are invalid
+            APIRequestError: If the API request fails
+        """
+        written = 0
+        for response in self._iter_trade_pages(symbol, start, end, limit, feed, asof):
+            written += store.append(
+                "trades", symbol, records_from_dicts(response.get("trades") or [])
+            )
+        return written
+
+    def read_store(
+        self,
+        store: TickStore,
+        symbol: str,
+        start: str,
+        end: str,
+        as_frame: bool = True,
+    ) -> pd.DataFrame | np.ndarray:
+        """Read trades filled with `fill_store` back from a local tick store.
+
+        Args:
+            store: The TickStore to read from
+            symbol: The stock symbol
+            start: Inclusive start time in RFC-3339 format
+            end: Exclusive end time in RFC-3339 format
+            as_frame: Whether to decode the records into a DataFrame (default True)
+
+        Returns:
+            A DataFrame with one row per trade, or the raw records (a memory-mapped
+            view when the range lies within one day)
+        """
+        records = store.read("trades", symbol, start, end)
+        return records_to_frame(records) if as_frame else records
+
+    def _trades_to_columns(
+        self, trades: list[dict], symbol: str
+    ) -> dict[str, np.ndarray]:
+        """Decode raw trades into columns with a leading symbol column.
+
+        Args:
+            trades: The raw trades of one page
+            symbol: The stock symbol
+
+        Returns:
+            Dictionary of column arrays
+        """
+        columns = {"symbol": np.full(len(trades), symbol, dtype=object)}
+        columns.update(columns_from_records(trades, self.TRADE_FIELDS))
+        return columns
+
+    def get_trades_columnar(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        limit: int = 1000,
+        feed: Literal["iex", "sip", "otc"] | None = None,
+        page_token: str | None = None,
+        asof: str | None = None,
+    ) -> TradeBatch:
+        """Retrieve one page of historical trades as a columnar TradeBatch.
+
+        Args:
+            symbol: The stock symbol to retrieve trades for
+            start: Start time in RFC-3339 format (YYYY-MM-DDTHH:MM:SSZ)
+            end: End time in RFC-3339 format (YYYY-MM-DDTHH:MM:SSZ)
+            limit: Number of trades to return (1-10000, default 1000)
+            feed: Data feed to use (iex, sip, otc)
+            page_token: Token for pagination
+            asof: As-of time for historical data in RFC-3339 format
+
+        Returns:
+            TradeBatch with the trades and pagination token
+
+        Raises:
+            ValidationError: If parameters are invalid
+            APIRequestError: If the API request fails
+        """
+        response = self._get_trades_page(
+            symbol, start, end, limit, feed, page_token, asof
+        )
+        return trade_batch_from_dicts(
+            response.get("trades") or [],
+            response.get("symbol", symbol),
+            response.get("next_page_token"),
+        )
+
+    def iter_trades_columnar(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        limit: int = 10000,
+        feed: Literal["iex", "sip", "otc"] | None = None,
+        asof: str | None = None,
+    ) -> Iterator[TradeBatch]:
+        """Yield historical trades for a symbol as one TradeBatch per page.
+
+        Args:
+            symbol: The stock symbol
+            start: Start time in RFC-3339 format
+            end: End time in RFC-3339 format
+            limit: Number of trades per page (1-10000, default 10000)
+            feed: Data feed to use
+            asof: As-of time for historical data
+
+        Yields:
+            TradeBatch for each page returned by the API
+
+        Raises:
+            ValidationError: If parameters are invalid
+            APIRequestError: If the API request fails
+        """
+        for response in self._iter_trade_pages(symbol, start, end, limit, feed, asof):
+            yield trade_batch_from_dicts(
+                response.get("trades") or [],
+                response.get("symbol", symbol),
+                response.get("next_page_token"),
+            )
+
+    def get_all_trades_columnar(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        feed: Literal["iex", "sip", "otc"] | None = None,
+        asof: str | None = None,
+    ) -> TradeBatch:
+        """Retrieve all trades for a symbol as a single columnar TradeBatch.
+
+        Args:
+            symbol: The stock symbol
+            start: Start time in RFC-3339 format
+            end: End time in RFC-3339 format
+            feed: Data feed to use
+            asof: As-of time for historical data
+
+        Returns:
+            TradeBatch with the trades of all pages
+
+        Raises:
+            ValidationError: If parameters are invalid
+            APIRequestError: If the API request fails
+        """
+        batches = list(
+            self.iter_trades_columnar(
+                symbol=symbol, start=start, end=end, feed=feed, asof=asof
+            )
+        )
+        return concat_trade_batches(batches, symbol)
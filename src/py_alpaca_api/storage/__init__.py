@@ -0,0 +1,22 @@
+"""Storage helpers for writing market data to files."""
+
+from .export import EXPORT_FORMATS, PageWriter, arrow_schema, export_pages
+from .tick_store import (
+    QUOTE_DTYPE,
+    TRADE_DTYPE,
+    TickStore,
+    records_from_dicts,
+    records_to_frame,
+)
+
+__all__ = [
+    "EXPORT_FORMATS",
+    "QUOTE_DTYPE",
+    "TRADE_DTYPE",
+    "PageWriter",
+    "TickStore",
+    "arrow_schema",
+    "export_pages",
+    "records_from_dicts",
+    "records_to_frame",
+]
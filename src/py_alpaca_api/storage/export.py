@@ -0,0 +1,141 @@
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.models.frame_utils import import_pyarrow
+
+EXPORT_FORMATS: tuple[str, ...] = ("parquet", "feather")
+
+
+def validate_export_format(format: str) -> None:
+    """Validates an export file format name and checks that pyarrow is installed.
+
+    Exports call this before any request, so a bad argument fails without
+    downloading anything.
+
+    Args:
+        format (str): The export format to validate.
+
+    Raises:
+        ValidationError: If the export format is not supported.
+        ImportError: If pyarrow is not installed.
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValidationError(
+            f"Invalid format. Must be one of: {', '.join(EXPORT_FORMATS)}"
+        )
+    import_pyarrow()
+
+
+def arrow_schema(fields: dict[str, tuple[str, str]], with_symbol: bool = True) -> Any:
+    """Builds a fixed Arrow schema from a field mapping.
+
+    Args:
+        fields (dict[str, tuple[str, str]]): Maps each API key to a tuple of the
+            column name and its kind, as used by `columns_from_records`.
+        with_symbol (bool, optional): Whether to start the schema with a symbol
+            column. Defaults to True.
+
+    Returns:
+        pyarrow.Schema: The schema of the exported file.
+    """
+    pa = import_pyarrow()
+    types = {
+        "datetime": pa.timestamp("ns"),
+        "float": pa.float64(),
+        "int": pa.int64(),
+        "str": pa.string(),
+        "object": pa.list_(pa.string()),
+    }
+    schema_fields = [pa.field("symbol", pa.string())] if with_symbol else []
+    schema_fields.extend(pa.field(name, types[kind]) for name, kind in fields.values())
+    return pa.schema(schema_fields)
+
+
+class PageWriter:
+    """Appends column pages to a Parquet or Feather (Arrow IPC) file.
+
+    Each page is written as its own Parquet row group or IPC record batch, so
+    memory use is bounded by a single page regardless of the file size.
+    """
+
+    def __init__(self, path: str | Path, schema: Any, format: str = "parquet"):
+        """Opens the file for writing.
+
+        Args:
+            path (str | Path): The file to write.
+            schema (pyarrow.Schema): The fixed schema of every page.
+            format (str, optional): "parquet" or "feather". Defaults to "parquet".
+
+        Raises:
+            ValidationError: If the export format is not supported.
+            ImportError: If pyarrow is not installed.
+        """
+        validate_export_format(format)
+        pa = import_pyarrow()
+        self._pa = pa
+        self.schema = schema
+        self.rows = 0
+        if format == "parquet":
+            import pyarrow.parquet as pq  # noqa: PLC0415
+
+            self._writer = pq.ParquetWriter(str(path), schema)
+        else:
+            self._writer = pa.ipc.new_file(str(path), schema)
+
+    def write(self, columns: dict[str, np.ndarray]) -> None:
+        """Writes one page of decoded columns.
+
+        Args:
+            columns (dict[str, np.ndarray]): Column arrays named as in the schema.
+        """
+        pa = self._pa
+        arrays = [
+            pa.array(
+                list(columns[field.name])
+                if columns[field.name].dtype == object
+                else columns[field.name],
+                type=field.type,
+            )
+            for field in self.schema
+        ]
+        batch = pa.record_batch(arrays, schema=self.schema)
+        if batch.num_rows:
+            self._writer.write(batch)
+            self.rows += batch.num_rows
+
+    def close(self) -> None:
+        """Finalizes the file."""
+        self._writer.close()
+
+    def __enter__(self) -> "PageWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def export_pages(
+    path: str | Path,
+    pages: Iterable[dict[str, np.ndarray]],
+    schema: Any,
+    format: str = "parquet",
+) -> int:
+    """Streams column pages into a Parquet or Feather file as they are produced.
+
+    Args:
+        path (str | Path): The file to write.
+        pages (Iterable[dict[str, np.ndarray]]): Decoded column pages.
+        schema (pyarrow.Schema): The fixed schema of every page.
+        format (str, optional): "parquet" or "feather". Defaults to "parquet".
+
+    Returns:
+        int: The number of rows written.
+    """
+    with PageWriter(path, schema, format) as writer:
+        for columns in pages:
+            writer.write(columns)
+    return writer.rows
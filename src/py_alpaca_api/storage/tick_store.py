@@ -0,0 +1,365 @@
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import IO
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.models.frame_utils import parse_timestamps
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Fixed-width records; timestamps are int64 nanoseconds since the epoch (UTC)
+TRADE_DTYPE = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("price", "<f8"),
+        ("size", "<i8"),
+        ("id", "<i8"),
+        ("exchange", "S1"),
+        ("tape", "S1"),
+        ("conditions", "S8"),
+    ]
+)
+QUOTE_DTYPE = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("bid_price", "<f8"),
+        ("bid_size", "<i8"),
+        ("ask_price", "<f8"),
+        ("ask_size", "<i8"),
+        ("bid_exchange", "S1"),
+        ("ask_exchange", "S1"),
+        ("tape", "S1"),
+        ("conditions", "S8"),
+    ]
+)
+RECORD_DTYPES: dict[str, np.dtype] = {"trades": TRADE_DTYPE, "quotes": QUOTE_DTYPE}
+
+# Fields identifying a stored record; quotes have no id, so they are compared whole
+DEDUP_FIELDS: dict[str, tuple[str, ...] | None] = {
+    "trades": ("timestamp", "id"),
+    "quotes": None,
+}
+
+# API keys of each record field; condition codes are stored concatenated
+TRADE_KEYS: dict[str, str] = {
+    "timestamp": "t",
+    "price": "p",
+    "size": "s",
+    "id": "i",
+    "exchange": "x",
+    "tape": "z",
+    "conditions": "c",
+}
+QUOTE_KEYS: dict[str, str] = {
+    "timestamp": "t",
+    "bid_price": "bp",
+    "bid_size": "bs",
+    "ask_price": "ap",
+    "ask_size": "as",
+    "bid_exchange": "bx",
+    "ask_exchange": "ax",
+    "tape": "z",
+    "conditions": "c",
+}
+
+NS_PER_DAY = 86_400 * 1_000_000_000
+
+
+############################################
+# Record Conversion Functions
+############################################
+def records_from_dicts(items: Sequence[dict], kind: str = "trades") -> np.ndarray:
+    """Converts raw API trades or quotes into fixed-width records.
+
+    Args:
+        items (Sequence[dict]): The raw API trades or quotes.
+        kind (str, optional): "trades" or "quotes". Defaults to "trades".
+
+    Returns:
+        np.ndarray: A structured array with the record dtype of `kind`.
+
+    Raises:
+        ValidationError: If the condition codes of a tick do not fit the record.
+    """
+    dtype = _record_dtype(kind)
+    keys = TRADE_KEYS if kind == "trades" else QUOTE_KEYS
+    records = np.zeros(len(items), dtype=dtype)
+    if not len(items):
+        return records
+
+    for name, key in keys.items():
+        values = [item.get(key) for item in items]
+        if name == "timestamp":
+            records[name] = parse_timestamps(values).view("int64")
+        elif name == "conditions":
+            codes = ["".join(v or []).encode() for v in values]
+            width = dtype[name].itemsize
+            if any(len(code) > width for code in codes):
+                raise ValidationError(
+                    f"Condition codes longer than {width} characters cannot be stored"
+                )
+            records[name] = codes
+        elif dtype[name].kind == "S":
+            records[name] = [(v or "").encode() for v in values]
+        else:
+            records[name] = [v or 0 for v in values]
+    return records
+
+
+def records_to_frame(records: np.ndarray) -> pd.DataFrame:
+    """Converts stored records into a DataFrame with decoded strings and timestamps.
+
+    Args:
+        records (np.ndarray): Records as returned by `TickStore.read`.
+
+    Returns:
+        pd.DataFrame: One row per record, with `timestamp` in naive UTC.
+    """
+    df = pd.DataFrame(
+        {
+            name: records[name].astype("U")
+            if records.dtype[name].kind == "S"
+            else records[name]
+            for name in records.dtype.names or ()
+        }
+    )
+    df["timestamp"] = df["timestamp"].to_numpy().astype("datetime64[ns]")
+    return df
+
+
+############################################
+# Tick Store
+############################################
+class TickStore:
+    """Append-only store of trades and quotes in memory-mapped files.
+
+    Records live in `root/<kind>/<SYMBOL>/<YYYY-MM-DD>.bin`, one file per symbol and
+    UTC day, as raw fixed-width records sorted by timestamp. The sorted timestamps
+    are the index: time ranges are found with a binary search and returned as
+    read-only `np.memmap` slices, without copying or deserializing.
+
+    Appends hold an exclusive `fcntl` lock on the file and only write whole
+    records, and readers only map whole records, so any number of processes can
+    read while one writes.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """Initializes the store.
+
+        Args:
+            root (str | Path): The directory of the store. It is created if missing.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, kind: str, symbol: str, day: str) -> Path:
+        """Returns the file of a symbol and UTC day.
+
+        Args:
+            kind (str): "trades" or "quotes".
+            symbol (str): The symbol.
+            day (str): The UTC day in the format "YYYY-MM-DD".
+
+        Returns:
+            Path: The path of the day file.
+        """
+        _record_dtype(kind)
+        return self.root / kind / symbol.upper() / f"{day}.bin"
+
+    def days(self, kind: str, symbol: str) -> list[str]:
+        """Lists the stored UTC days of a symbol.
+
+        Args:
+            kind (str): "trades" or "quotes".
+            symbol (str): The symbol.
+
+        Returns:
+            list[str]: The days in ascending order.
+        """
+        _record_dtype(kind)
+        directory = self.root / kind / symbol.upper()
+        if not directory.exists():
+            return []
+        return sorted(path.stem for path in directory.glob("*.bin"))
+
+    def append(self, kind: str, symbol: str, records: np.ndarray) -> int:
+        """Appends records, splitting them into day files.
+
+        Records already stored are skipped (trades with the same timestamp and id,
+        quotes identical in every field), so refilling a range is idempotent, and
+        ticks sharing a timestamp are all kept. Records older than the last one
+        stored for their day are merged in by atomically rewriting the day file.
+
+        Args:
+            kind (str): "trades" or "quotes".
+            symbol (str): The symbol.
+            records (np.ndarray): Records with the dtype of `kind`.
+
+        Returns:
+            int: The number of records written.
+
+        Raises:
+            ValidationError: If the kind or record dtype is invalid.
+        """
+        dtype = _record_dtype(kind)
+        if records.dtype != dtype:
+            raise ValidationError(f"Records must have the {kind} record dtype")
+        if not len(records):
+            return 0
+
+        records = records[np.argsort(records["timestamp"], kind="stable")]
+        _, first = np.unique(_record_keys(records, kind), return_index=True)
+        records = records[np.sort(first)]
+        day_numbers = records["timestamp"] // NS_PER_DAY
+        boundaries = np.flatnonzero(np.diff(day_numbers)) + 1
+        written = 0
+        for chunk in np.split(records, boundaries):
+            day = str(np.datetime64(int(chunk["timestamp"][0]), "ns").astype("M8[D]"))
+            written += self._append_day(self.path(kind, symbol, day), chunk, kind)
+        return written
+
+    def read_day(
+        self,
+        kind: str,
+        symbol: str,
+        day: str,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> np.ndarray:
+        """Returns the records of one day as a read-only memory-mapped view.
+
+        Args:
+            kind (str): "trades" or "quotes".
+            symbol (str): The symbol.
+            day (str): The UTC day in the format "YYYY-MM-DD".
+            start (str, optional): Inclusive start time in ISO 8601 format.
+            end (str, optional): Exclusive end time in ISO 8601 format.
+
+        Returns:
+            np.ndarray: A slice of the mapped file, empty if nothing is stored.
+        """
+        dtype = _record_dtype(kind)
+        path = self.path(kind, symbol, day)
+        count = path.stat().st_size // dtype.itemsize if path.exists() else 0
+        if not count:
+            return np.zeros(0, dtype=dtype)
+
+        records = np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+        timestamps = records["timestamp"]
+        lo = np.searchsorted(timestamps, _to_ns(start)) if start else 0
+        hi = np.searchsorted(timestamps, _to_ns(end)) if end else count
+        return records[lo:hi]
+
+    def read(self, kind: str, symbol: str, start: str, end: str) -> np.ndarray:
+        """Returns the records of a time range.
+
+        A range within a single day is a memory-mapped view; ranges spanning
+        several days are concatenated into a new array.
+
+        Args:
+            kind (str): "trades" or "quotes".
+            symbol (str): The symbol.
+            start (str): Inclusive start time in ISO 8601 format.
+            end (str): Exclusive end time in ISO 8601 format.
+
+        Returns:
+            np.ndarray: The records sorted by timestamp.
+        """
+        first, last = _to_ns(start) // NS_PER_DAY, (_to_ns(end) - 1) // NS_PER_DAY
+        views = [
+            self.read_day(kind, symbol, day, start, end)
+            for day in self.days(kind, symbol)
+            if first <= np.datetime64(day, "D").astype(np.int64) <= last
+        ]
+        views = [view for view in views if len(view)]
+        if len(views) == 1:
+            return views[0]
+        if not views:
+            return np.zeros(0, dtype=_record_dtype(kind))
+        return np.concatenate(views)
+
+    @staticmethod
+    def _append_day(path: Path, records: np.ndarray, kind: str) -> int:
+        """Writes the records of one day under an exclusive file lock."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            with path.open("ab") as file:
+                if fcntl is not None:
+                    fcntl.flock(file, fcntl.LOCK_EX)
+                try:
+                    # A merge by another writer may have replaced the locked file
+                    if os.fstat(file.fileno()).st_ino == path.stat().st_ino:
+                        return TickStore._write_day(path, file, records, kind)
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _write_day(path: Path, file: IO[bytes], records: np.ndarray, kind: str) -> int:
+        """Appends or merges the new records of one day into its locked file."""
+        dtype = records.dtype
+        size = os.fstat(file.fileno()).st_size
+        count = size // dtype.itemsize
+        if size != count * dtype.itemsize:
+            # Drop a partial record left by an interrupted writer
+            file.truncate(count * dtype.itemsize)
+
+        start = count
+        existing = np.zeros(0, dtype=dtype)
+        if count:
+            stored = np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+            start = int(np.searchsorted(stored["timestamp"], records["timestamp"][0]))
+            existing = np.array(stored[start:])
+            del stored
+            records = records[
+                ~np.isin(_record_keys(records, kind), _record_keys(existing, kind))
+            ]
+        if not len(records):
+            return 0
+
+        if not len(existing) or records["timestamp"][0] >= existing["timestamp"][-1]:
+            file.write(records.tobytes())
+            file.flush()
+            return len(records)
+
+        # A backfill: rewrite the day with the records merged in, then swap it in
+        merged = np.concatenate([existing, records])
+        merged = merged[np.argsort(merged["timestamp"], kind="stable")]
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with temporary.open("wb") as out:
+            out.write(np.fromfile(path, dtype=dtype, count=start).tobytes())
+            out.write(merged.tobytes())
+        temporary.replace(path)
+        return len(records)
+
+
+def _record_dtype(kind: str) -> np.dtype:
+    """Returns the record dtype of a kind."""
+    if kind not in RECORD_DTYPES:
+        raise ValidationError(
+            f"Invalid kind. Must be one of: {', '.join(RECORD_DTYPES)}"
+        )
+    return RECORD_DTYPES[kind]
+
+
+def _record_keys(records: np.ndarray, kind: str) -> np.ndarray:
+    """Returns the identifying fields of each record as one comparable value."""
+    fields = DEDUP_FIELDS[kind] or records.dtype.names or ()
+    keys = np.empty(
+        len(records), dtype=[(name, records.dtype[name]) for name in fields]
+    )
+    for name in fields:
+        keys[name] = records[name]
+    return keys.view(f"V{keys.dtype.itemsize}")
+
+
+def _to_ns(value: str) -> int:
+    """Converts an ISO 8601 time to int64 nanoseconds since the epoch (UTC)."""
+    return int(parse_timestamps([value]).view("int64")[0])
@@ -0,0 +1,26 @@
+"""Streaming module for py-alpaca-api.
+
+This module provides WebSocket clients for real-time market data and order
+updates.
+"""
+
+from .dispatcher import ChannelStats, Dispatcher
+from .live_screener import LiveScreener
+from .live_window import LiveWindow
+from .order_mirror import OrderMirror
+from .recorder import LogRecord, Recorder, Replayer
+from .stream import Stream
+from .trade_updates import TradeUpdatesStream
+
+__all__ = [
+    "ChannelStats",
+    "Dispatcher",
+    "LiveScreener",
+    "LiveWindow",
+    "LogRecord",
+    "OrderMirror",
+    "Recorder",
+    "Replayer",
+    "Stream",
+    "TradeUpdatesStream",
+]
@@ -0,0 +1,320 @@
+"""Connection management shared by the WebSocket clients."""
+
+import asyncio
+import concurrent.futures
+import inspect
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Coroutine
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from py_alpaca_api.exceptions import APIRequestError, AuthenticationError
+
+if TYPE_CHECKING:
+    from py_alpaca_api.streaming.dispatcher import Dispatcher
+
+logger = logging.getLogger(__name__)
+
+Callback = Callable[..., Any]  # Plain functions or coroutine functions
+
+
+def _import_websockets():
+    """Imports the websockets client, which is an optional dependency.
+
+    Returns:
+        The websockets module with its asyncio client loaded.
+
+    Raises:
+        ImportError: If websockets is not installed.
+    """
+    try:
+        import websockets  # noqa: PLC0415
+        import websockets.asyncio.client  # noqa: PLC0415
+    except ImportError as e:
+        raise ImportError(
+            'Streaming requires websockets. Install it with: pip install "py-alpaca-api[stream]"'
+        ) from e
+    return websockets
+
+
+async def call_handler(handler: Callback, *args: Any) -> None:
+    """Calls a sync or async handler, logging instead of raising its errors.
+
+    Args:
+        handler: A plain function or a coroutine function.
+        *args: The arguments of the handler.
+    """
+    try:
+        result = handler(*args)
+        if inspect.isawaitable(result):
+            await result
+    except Exception:
+        logger.exception(f"Stream handler {handler!r} failed")
+
+
+def _log_failure(
+    future: "asyncio.Future[Any] | concurrent.futures.Future[Any]",
+) -> None:
+    """Logs the exception of a scheduled coroutine, which nobody awaits."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Scheduled stream operation failed", exc_info=future.exception())
+
+
+class BaseStream(ABC):
+    """Base class of the WebSocket clients.
+
+    `run()` connects, authenticates, runs the `on_connect` callbacks and hands
+    every frame to `_handle_frame` until `stop()` is called. Dropped connections
+    are re-established with exponential backoff. Subclasses implement the
+    handshake and frame handling of their stream.
+
+    Without a `Dispatcher`, handlers run in the reader, so a slow handler delays
+    every following message; with one, they run from bounded queues.
+    """
+
+    # Handshake error codes worth reconnecting for
+    RETRYABLE_ERRORS: ClassVar[frozenset[int]] = frozenset()
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        url: str,
+        reconnect: bool = True,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        dispatcher: "Dispatcher | None" = None,
+    ) -> None:
+        """Initializes the stream without connecting.
+
+        Args:
+            api_key: The API key.
+            api_secret: The API secret.
+            url: The stream URL.
+            reconnect: Whether to reconnect when the connection drops.
+            backoff: Seconds before the first reconnect; doubled on each failure.
+            max_backoff: Maximum seconds between reconnects.
+            dispatcher: Optional dispatcher queuing messages for the handlers.
+
+        Raises:
+            AuthenticationError: If the API key or secret is missing.
+        """
+        if not api_key or not api_secret:
+            raise AuthenticationError()
+
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.url = url
+        self.reconnect = reconnect
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.dispatcher = dispatcher
+
+        self._connect_callbacks: list[Callback] = []
+        self._taps: list[Callable[[str, dict[str, Any]], Any]] = []
+        self._ws: Any = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopped = threading.Event()
+        self._tasks: set[asyncio.Future] = set()
+
+    def on_connect(self, callback: Callback) -> None:
+        """Registers a callback run after every connection and reconnection.
+
+        Callbacks run once the stream is authenticated and before any message is
+        dispatched, e.g. to resynchronize state missed while disconnected.
+
+        Args:
+            callback: A plain function or coroutine function without arguments.
+        """
+        self._connect_callbacks.append(callback)
+
+    def tap(self, callback: Callable[[str, dict[str, Any]], Any]) -> None:
+        """Registers a callback that sees every data message, e.g. to record them.
+
+        Taps run in the reader before the message is handed to its handler, with
+        the channel and the message, whether or not a handler is subscribed. They
+        must be fast; errors are logged.
+
+        Args:
+            callback: A plain function called with the channel and message.
+        """
+        self._taps.append(callback)
+
+    def untap(self, callback: Callable[[str, dict[str, Any]], Any]) -> None:
+        """Removes a callback registered with `tap`.
+
+        Args:
+            callback: The callback to remove.
+        """
+        self._taps.remove(callback)
+
+    async def inject(self, message: dict[str, Any]) -> None:
+        """Handles a message as if it had been received, e.g. to replay a log.
+
+        Args:
+            message: A decoded message of the stream.
+        """
+        await self._dispatch(message)
+
+    @property
+    def connected(self) -> bool:
+        """bool: Whether the stream is connected and authenticated."""
+        return self._ws is not None
+
+    ############################################
+    # Connection
+    ############################################
+    async def run(self) -> None:
+        """Streams until `stop()` is called, reconnecting when the connection drops.
+
+        Raises:
+            AuthenticationError: If the credentials are rejected.
+            APIRequestError: If the server rejects the connection, or it drops
+                while `reconnect` is False.
+            ImportError: If an optional streaming dependency is missing.
+        """
+        websockets = _import_websockets()
+        headers = self._connect_headers()
+
+        self._loop = asyncio.get_running_loop()
+        attempt = 0
+        try:
+            while not self._stopped.is_set():
+                try:
+                    async with websockets.asyncio.client.connect(
+                        self.url, additional_headers=headers, max_size=None
+                    ) as ws:
+                        await self._authenticate(ws)
+                        attempt = 0
+                        self._ws = ws
+                        await self._on_connected()
+                        for callback in list(self._connect_callbacks):
+                            await call_handler(callback)
+                        if not self._stopped.is_set():
+                            async for raw in ws:
+                                await self._handle_frame(raw)
+                except (websockets.exceptions.ConnectionClosed, OSError) as e:
+                    logger.warning(f"Stream connection lost: {e!s}")
+                except APIRequestError as e:
+                    if e.status_code not in self.RETRYABLE_ERRORS:
+                        raise
+                    logger.warning(e.message)
+                finally:
+                    self._ws = None
+
+                if self._stopped.is_set():
+                    break
+                if not self.reconnect:
+                    raise APIRequestError(message="Stream connection closed")
+                delay = min(self.max_backoff, self.backoff * 2**attempt)
+                attempt += 1
+                await asyncio.sleep(delay)
+        finally:
+            # The stop is consumed here rather than on entry, so a `stop()` issued
+            # while `run()` is starting up is not lost
+            self._stopped.clear()
+            self._loop = None
+            if self.dispatcher is not None:
+                await self.dispatcher.close()
+
+    def run_forever(self) -> None:
+        """Runs `run()` in a new event loop, blocking until the stream stops."""
+        asyncio.run(self.run())
+
+    def stop(self) -> None:
+        """Stops streaming and closes the connection. Safe to call from any thread.
+
+        A stop issued before `run()` starts, or while it is connecting, makes it
+        return as soon as it checks; the next `run()` streams again.
+        """
+        self._stopped.set()
+        if self._ws is not None:
+            self._schedule(self._ws.close())
+
+    ############################################
+    # Subclass Hooks
+    ############################################
+    def _connect_headers(self) -> dict[str, str]:
+        """Returns the extra HTTP headers of the connection request."""
+        return {}
+
+    @abstractmethod
+    async def _authenticate(self, ws: Any) -> None:
+        """Performs the handshake of the stream.
+
+        Raises:
+            AuthenticationError: If the credentials are rejected.
+            APIRequestError: If the server reports any other error.
+        """
+
+    async def _on_connected(self) -> None:  # noqa: B027
+        """Restores the stream's subscriptions after a (re)connection."""
+
+    @abstractmethod
+    async def _handle_frame(self, raw: str | bytes) -> None:
+        """Handles one received frame."""
+
+    @abstractmethod
+    async def _dispatch(self, message: dict[str, Any]) -> None:
+        """Hands one decoded message to its handlers."""
+
+    def _encode(self, message: dict[str, Any]) -> str | bytes:
+        """Encodes an outgoing message."""
+        return json.dumps(message)
+
+    def _run_taps(self, channel: str, message: dict[str, Any]) -> None:
+        """Calls every tap with a data message, logging their errors."""
+        for callback in self._taps:
+            try:
+                callback(channel, message)
+            except Exception:
+                logger.exception(f"Stream tap {callback!r} failed")
+
+    async def _deliver(
+        self, channel: str, handler: Callback, message: dict[str, Any]
+    ) -> None:
+        """Hands a message to a handler, through the dispatcher if there is one."""
+        if self.dispatcher is None:
+            await call_handler(handler, message)
+        else:
+            await self.dispatcher.put(channel, handler, message)
+
+    ############################################
+    # Sending
+    ############################################
+    async def _send(self, message: dict[str, Any]) -> None:
+        """Sends a message on the current connection, if any."""
+        if self._ws is not None:
+            await self._ws.send(self._encode(message))
+
+    def _send_threadsafe(self, message: dict[str, Any]) -> None:
+        """Sends a message if connected; otherwise it is restored on connect."""
+        if self._ws is not None:
+            self._schedule(self._send(message))
+
+    def _schedule(self, coroutine: Coroutine[Any, Any, Any]) -> None:
+        """Runs a coroutine on the stream's event loop from any thread.
+
+        Without a running loop (before `run()` or after it returned) the coroutine
+        is dropped. Callers only schedule work for a live connection; what they
+        would send is restored by `_on_connected` on the next connection, e.g.
+        the subscriptions.
+        """
+        loop = self._loop
+        if loop is None:
+            coroutine.close()
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            task = asyncio.ensure_future(coroutine)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(_log_failure)
+        else:
+            future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+            future.add_done_callback(_log_failure)
@@ -0,0 +1,259 @@
+"""Bounded, per-channel dispatch of stream messages to handlers."""
+
+import asyncio
+import dataclasses
+import logging
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.streaming.base import Callback, call_handler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ChannelStats:
+    """Counters of one channel.
+
+    Lags are in seconds from queuing until the handler returns, so they cover
+    both the wait in the queue and the handling itself.
+    """
+
+    received: int = 0
+    dispatched: int = 0
+    dropped: int = 0
+    conflated: int = 0
+    blocked: int = 0
+    depth: int = 0
+    max_depth: int = 0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+
+
+class _ChannelQueue:
+    """The pending messages of one channel."""
+
+    def __init__(self, policy: str, maxsize: int, stats: ChannelStats) -> None:
+        self.policy = policy
+        self.maxsize = maxsize
+        self.items: deque[tuple[Callback, dict[str, Any], float]] = deque()
+        self.latest: OrderedDict[tuple[Callback, Any], tuple] = OrderedDict()
+        self.changed = asyncio.Condition()
+        self.stats = stats
+        self.active = 0
+        self.workers: list[asyncio.Task] = []
+        self.pool: ThreadPoolExecutor | None = None
+
+    def __len__(self) -> int:
+        return len(self.latest) if self.policy == "conflate" else len(self.items)
+
+    def pop(self) -> tuple[Callback, dict[str, Any], float]:
+        if self.policy == "conflate":
+            return self.latest.popitem(last=False)[1]
+        return self.items.popleft()
+
+
+class Dispatcher:
+    """Decouples reading a stream from running its handlers.
+
+    Messages are put on a bounded queue per channel and handed to handlers by
+    worker tasks, so a slow handler never stalls the socket reader. When a
+    queue is full, its policy decides what happens:
+
+    - "block": the reader waits for room, pushing back on the connection.
+    - "drop_oldest": the oldest pending message is dropped.
+    - "conflate": only the latest pending message per handler and symbol is
+      kept, which suits quotes and bars where only the latest value matters.
+
+    Handlers run as coroutines on the event loop ("async"), or in a thread pool
+    per channel ("thread") for blocking or CPU-heavy plain functions, so a slow
+    handler on one channel never holds up another. With one worker per
+    channel (the default) messages are handled in order. `stats()` reports
+    throughput, drops, conflations, queue depth and lag per channel.
+    """
+
+    POLICIES: ClassVar[tuple[str, ...]] = ("block", "drop_oldest", "conflate")
+    EXECUTORS: ClassVar[tuple[str, ...]] = ("async", "thread")
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        policy: str = "block",
+        policies: dict[str, str] | None = None,
+        executor: str = "async",
+        workers: int = 1,
+    ) -> None:
+        """Initializes the dispatcher; workers start with the first message.
+
+        Args:
+            maxsize: The maximum number of pending messages per channel.
+            policy: The default policy: "block", "drop_oldest" or "conflate".
+            policies: Optional policies by channel, e.g. {"quotes": "conflate"}.
+            executor: Where handlers run: "async" or "thread". Defaults to "async".
+            workers: The number of workers per channel; more than one trades
+                message order for throughput.
+
+        Raises:
+            ValidationError: If an argument is invalid.
+        """
+        policies = policies or {}
+        for name in (policy, *policies.values()):
+            if name not in self.POLICIES:
+                raise ValidationError(
+                    f"Invalid policy. Must be one of: {', '.join(self.POLICIES)}"
+                )
+        if executor not in self.EXECUTORS:
+            raise ValidationError(
+                f"Invalid executor. Must be one of: {', '.join(self.EXECUTORS)}"
+            )
+        if maxsize < 1 or workers < 1:
+            raise ValidationError("maxsize and workers must be at least 1.")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.policies = policies
+        self.executor = executor
+        self.workers = workers
+
+        self._queues: dict[str, _ChannelQueue] = {}
+        self._stats: dict[str, ChannelStats] = {}
+
+    async def put(
+        self, channel: str, handler: Callback, message: dict[str, Any]
+    ) -> None:
+        """Queues a message for a handler, applying the channel's policy.
+
+        Args:
+            channel: The channel of the message, e.g. "trades".
+            handler: The handler to call with the message.
+            message: The message.
+        """
+        queue = self._queue(channel)
+        stats = queue.stats
+        async with queue.changed:
+            stats.received += 1
+            if queue.policy == "conflate":
+                key = (handler, message.get("S"))
+                if key in queue.latest:
+                    stats.conflated += 1
+                    # Keep the position and enqueue time of the pending message
+                    queue.latest[key] = (handler, message, queue.latest[key][2])
+                else:
+                    if len(queue) >= queue.maxsize:
+                        queue.latest.popitem(last=False)
+                        stats.dropped += 1
+                    queue.latest[key] = (handler, message, time.monotonic())
+            else:
+                if len(queue) >= queue.maxsize:
+                    if queue.policy == "drop_oldest":
+                        queue.items.popleft()
+                        stats.dropped += 1
+                    else:
+                        stats.blocked += 1
+                        await queue.changed.wait_for(lambda: len(queue) < queue.maxsize)
+                queue.items.append((handler, message, time.monotonic()))
+            stats.depth = len(queue)
+            stats.max_depth = max(stats.max_depth, stats.depth)
+            queue.changed.notify_all()
+
+    async def drain(self) -> None:
+        """Waits until every queued message has been handled."""
+        for queue in list(self._queues.values()):
+            async with queue.changed:
+                while len(queue) or queue.active:
+                    await queue.changed.wait()
+
+    async def close(self) -> None:
+        """Stops the workers; counters are kept.
+
+        Messages still pending are discarded and counted as dropped. Call
+        `drain()` first to handle them instead.
+        """
+        for queue in self._queues.values():
+            for worker in queue.workers:
+                worker.cancel()
+            await asyncio.gather(*queue.workers, return_exceptions=True)
+            discarded = len(queue)
+            if discarded:
+                logger.warning(f"Dropped {discarded} pending messages on close")
+            queue.stats.dropped += discarded
+            queue.stats.depth = 0
+            if queue.pool is not None:
+                queue.pool.shutdown(wait=False)
+        self._queues.clear()
+
+    def stats(self) -> dict[str, ChannelStats]:
+        """Returns a copy of the counters of each channel.
+
+        The counters only change on the event loop, so a call from the loop
+        gets a consistent snapshot; from another thread the values are
+        approximate and may mix counts from before and after a message.
+
+        Returns:
+            dict[str, ChannelStats]: Messages received, dispatched, dropped,
+            conflated and blocked on, the current and maximum queue depth, and
+            the last and maximum lag in seconds from queuing until the handler
+            returned.
+        """
+        return {
+            channel: dataclasses.replace(stats)
+            for channel, stats in self._stats.items()
+        }
+
+    def _queue(self, channel: str) -> _ChannelQueue:
+        """Returns the queue of a channel, starting its workers on first use."""
+        queue = self._queues.get(channel)
+        if queue is None:
+            queue = _ChannelQueue(
+                self.policies.get(channel, self.policy),
+                self.maxsize,
+                self._stats.setdefault(channel, ChannelStats()),
+            )
+            queue.workers = [
+                asyncio.ensure_future(self._work(queue)) for _ in range(self.workers)
+            ]
+            self._queues[channel] = queue
+        return queue
+
+    async def _work(self, queue: _ChannelQueue) -> None:
+        """Hands queued messages to their handlers until cancelled."""
+        stats = queue.stats
+        while True:
+            async with queue.changed:
+                await queue.changed.wait_for(lambda: len(queue) > 0)
+                handler, message, enqueued_at = queue.pop()
+                queue.active += 1
+                stats.depth = len(queue)
+                queue.changed.notify_all()
+
+            try:
+                if self.executor == "thread":
+                    await self._run_in_thread(queue, handler, message)
+                else:
+                    await call_handler(handler, message)
+            finally:
+                async with queue.changed:
+                    queue.active -= 1
+                    stats.dispatched += 1
+                    stats.last_lag = time.monotonic() - enqueued_at
+                    stats.max_lag = max(stats.max_lag, stats.last_lag)
+                    queue.changed.notify_all()
+
+    async def _run_in_thread(
+        self, queue: _ChannelQueue, handler: Callback, message: dict[str, Any]
+    ) -> None:
+        """Runs a plain handler in the channel's thread pool, logging its errors."""
+        if queue.pool is None:
+            queue.pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="StreamDispatcher"
+            )
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                queue.pool, handler, message
+            )
+        except Exception:
+            logger.exception(f"Stream handler {handler!r} failed")
@@ -0,0 +1,356 @@
+"""Top gainers and losers kept current from streamed trades and snapshot changes."""
+
+import heapq
+import threading
+from collections.abc import Iterable
+from typing import Any, ClassVar
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.analytics.conditions import DEFAULT_EXCLUDED_CONDITIONS
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.stock.snapshot_poller import SnapshotPoller
+from py_alpaca_api.stock.snapshots import Snapshots
+from py_alpaca_api.streaming.stream import Stream
+
+
+class LiveScreener:
+    """Incremental gainers/losers screen over per-symbol state arrays.
+
+    The state of each symbol (previous close, today's open, last price, running
+    volume and trade count) is loaded once from snapshots, then updated only by
+    what changes: streamed trades and daily bars, or the deltas of a
+    `SnapshotPoller`. Every update re-scores its symbol and pushes it onto a max
+    heap of gainers and a min heap of losers; superseded entries are skipped
+    lazily, so `gainers(k)` and `losers(k)` only look at the top of the heaps
+    instead of sorting the universe.
+
+    The change is measured from the previous close, or from today's open with
+    `basis="open"`. Symbols below the price, volume or trade count minimums are
+    left out of the rankings. Thread-safe.
+    """
+
+    BASES: ClassVar[tuple[str, ...]] = ("previous_close", "open")
+
+    # Snapshot columns the screener reads, e.g. for `SnapshotPoller(fields=...)`
+    SNAPSHOT_FIELDS: ClassVar[tuple[str, ...]] = (
+        "trade_price",
+        "daily_open",
+        "daily_close",
+        "daily_volume",
+        "daily_trade_count",
+        "prev_daily_close",
+    )
+
+    def __init__(
+        self,
+        basis: str = "previous_close",
+        min_price: float = 0.0,
+        min_volume: int = 0,
+        min_trades: int = 0,
+        excluded_conditions: Iterable[str] = DEFAULT_EXCLUDED_CONDITIONS,
+        capacity: int = 1024,
+    ) -> None:
+        """Initializes an empty screener.
+
+        Args:
+            basis: "previous_close" or "open". Defaults to "previous_close".
+            min_price: The minimum last price of ranked symbols.
+            min_volume: The minimum volume of ranked symbols.
+            min_trades: The minimum trade count of ranked symbols.
+            excluded_conditions: Trade conditions whose trades count towards
+                volume but do not update the last price (odd lots, out of
+                sequence, ...). Defaults to the CTA/UTP set.
+            capacity: The number of symbols preallocated; grown as needed.
+
+        Raises:
+            ValidationError: If the basis is invalid.
+        """
+        if basis not in self.BASES:
+            raise ValidationError(
+                f"Invalid basis. Must be one of: {', '.join(self.BASES)}"
+            )
+        self.basis = basis
+        self.min_price = min_price
+        self.min_volume = min_volume
+        self.min_trades = min_trades
+        self.excluded_conditions = frozenset(excluded_conditions)
+
+        self._rows: dict[str, int] = {}
+        self._symbols: list[str] = []
+        self._prev_close = np.full(capacity, np.nan)
+        self._open = np.full(capacity, np.nan)
+        self._price = np.full(capacity, np.nan)
+        self._volume = np.zeros(capacity, dtype=np.int64)
+        self._trades = np.zeros(capacity, dtype=np.int64)
+        self._versions = np.zeros(capacity, dtype=np.int64)
+
+        # Entries are (-change or change, version, row); an entry is current
+        # while its version matches the row's
+        self._gainers: list[tuple[float, int, int]] = []
+        self._losers: list[tuple[float, int, int]] = []
+        self._lock = threading.Lock()
+
+    ############################################
+    # Loading
+    ############################################
+    def load(self, universe: Any) -> None:
+        """Sets the state of many symbols at once from snapshot columns.
+
+        Args:
+            universe: A frame from `Snapshots.get_snapshots_frame` or
+                `Screener.universe("snapshots")`, as a DataFrame or dict of NumPy
+                arrays, with a `symbol` column and the `SNAPSHOT_FIELDS`.
+        """
+        columns = {name: np.asarray(universe[name]) for name in universe}
+        with self._lock:
+            rows = np.array(
+                [self._row(str(symbol)) for symbol in columns["symbol"]], dtype=np.int64
+            )
+            trade_price = columns["trade_price"].astype(float)
+            self._prev_close[rows] = columns["prev_daily_close"]
+            self._open[rows] = columns["daily_open"]
+            self._price[rows] = np.where(
+                np.isnan(trade_price), columns["daily_close"], trade_price
+            )
+            self._volume[rows] = columns["daily_volume"]
+            self._trades[rows] = columns["daily_trade_count"]
+            self._versions[rows] += 1
+            self._rebuild()
+
+    def load_snapshots(
+        self, snapshots: Snapshots, symbols: list[str], feed: str = "iex"
+    ) -> None:
+        """Loads the state of symbols from one batched snapshot pull.
+
+        Args:
+            snapshots: The Snapshots client.
+            symbols: The symbols to screen.
+            feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
+        """
+        self.load(snapshots.get_snapshots_frame(symbols, feed=feed, output="numpy"))
+
+    def attach(
+        self, source: Stream | SnapshotPoller, symbols: Iterable[str] = ("*",)
+    ) -> None:
+        """Keeps the screener current from a stream or snapshot poller.
+
+        Args:
+            source: A market data stream, whose trades and daily bars of
+                `symbols` are routed to the screener (replacing other handlers
+                of those channels and symbols), or a snapshot poller, whose
+                changes are applied. Pollers should track `SNAPSHOT_FIELDS`.
+            symbols: The stream symbols to subscribe. Defaults to all ("*").
+        """
+        if isinstance(source, SnapshotPoller):
+            source.subscribe(self.on_changes)
+        else:
+            symbols = list(symbols)
+            source.subscribe_trades(self.on_trade, *symbols)
+            source.subscribe("dailyBars", self.on_daily_bar, symbols)
+
+    ############################################
+    # Updates
+    ############################################
+    def on_trade(self, message: dict[str, Any]) -> None:
+        """Applies a streamed trade; usable as a `Stream` handler.
+
+        Args:
+            message: A trade message with "S", "p", "s" and optional "c".
+        """
+        if message.get("T", "t") != "t":
+            return  # Corrections and cancels are left to the next daily bar
+        with self._lock:
+            row = self._row(message["S"])
+            self._volume[row] += message.get("s", 0)
+            self._trades[row] += 1
+            if self.excluded_conditions.isdisjoint(message.get("c") or ()):
+                self._price[row] = message["p"]
+            self._score(row)
+
+    def on_daily_bar(self, message: dict[str, Any]) -> None:
+        """Applies a streamed daily bar, which resets volume and trade count.
+
+        Args:
+            message: A daily bar message with "S", "o", "c", "v" and "n".
+        """
+        with self._lock:
+            row = self._row(message["S"])
+            self._open[row] = message["o"]
+            self._volume[row] = message["v"]
+            self._trades[row] = message.get("n", self._trades[row])
+            if np.isnan(self._price[row]):
+                self._price[row] = message["c"]
+            self._score(row)
+
+    def on_changes(self, changes: dict[str, dict[str, Any]]) -> None:
+        """Applies the changes of a snapshot poll; usable as a poller callback.
+
+        Args:
+            changes: Changed snapshot fields by symbol.
+        """
+        with self._lock:
+            for symbol, fields in changes.items():
+                row = self._row(symbol)
+                if "prev_daily_close" in fields:
+                    self._prev_close[row] = fields["prev_daily_close"]
+                if "daily_open" in fields:
+                    self._open[row] = fields["daily_open"]
+                if "daily_volume" in fields:
+                    self._volume[row] = fields["daily_volume"]
+                if "daily_trade_count" in fields:
+                    self._trades[row] = fields["daily_trade_count"]
+                if not np.isnan(fields.get("trade_price", np.nan)):
+                    self._price[row] = fields["trade_price"]
+                elif "daily_close" in fields and np.isnan(self._price[row]):
+                    self._price[row] = fields["daily_close"]
+                self._score(row)
+
+    def _row(self, symbol: str) -> int:
+        """Returns the row of a symbol, adding it (and growing the arrays) if new."""
+        row = self._rows.get(symbol)
+        if row is not None:
+            return row
+        row = len(self._symbols)
+        if row == len(self._price):
+            for name in ("_prev_close", "_open", "_price"):
+                values = getattr(self, name)
+                setattr(
+                    self, name, np.concatenate([values, np.full_like(values, np.nan)])
+                )
+            for name in ("_volume", "_trades", "_versions"):
+                values = getattr(self, name)
+                setattr(self, name, np.concatenate([values, np.zeros_like(values)]))
+        self._rows[symbol] = row
+        self._symbols.append(symbol)
+        return row
+
+    def _changes(self, rows: np.ndarray | slice) -> np.ndarray:
+        """Returns the percent change of rows, NaN if unknown."""
+        base = (self._prev_close if self.basis == "previous_close" else self._open)[
+            rows
+        ]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = (self._price[rows] - base) / base * 100
+        return np.where(np.isfinite(change), change, np.nan)
+
+    def _ranked(self, rows: np.ndarray | slice) -> np.ndarray:
+        """Returns which rows pass the minimums and have a known change."""
+        return (
+            ~np.isnan(self._changes(rows))
+            & (self._price[rows] >= self.min_price)
+            & (self._volume[rows] >= self.min_volume)
+            & (self._trades[rows] >= self.min_trades)
+        )
+
+    def _score(self, row: int) -> None:
+        """Supersedes a symbol's heap entries with its current score."""
+        self._versions[row] += 1
+        base = float(
+            (self._prev_close if self.basis == "previous_close" else self._open)[row]
+        )
+        price = float(self._price[row])
+        if (
+            base  # Neither zero nor NaN
+            and not np.isnan(base)
+            and price >= self.min_price
+            and self._volume[row] >= self.min_volume
+            and self._trades[row] >= self.min_trades
+        ):
+            change = (price - base) / base * 100
+            version = int(self._versions[row])
+            heapq.heappush(self._gainers, (-change, version, row))
+            heapq.heappush(self._losers, (change, version, row))
+            # Bound the stale entries by rebuilding once they dominate the heaps
+            if len(self._gainers) > 4 * len(self._symbols) + 64:
+                self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Rebuilds both heaps from the current state, dropping stale entries."""
+        count = len(self._symbols)
+        rows = np.flatnonzero(self._ranked(slice(0, count)))
+        changes = self._changes(rows)
+        versions = self._versions[rows]
+        self._gainers = list(
+            zip((-changes).tolist(), versions.tolist(), rows.tolist(), strict=True)
+        )
+        self._losers = list(
+            zip(changes.tolist(), versions.tolist(), rows.tolist(), strict=True)
+        )
+        heapq.heapify(self._gainers)
+        heapq.heapify(self._losers)
+
+    ############################################
+    # Queries
+    ############################################
+    def gainers(self, k: int = 10) -> pd.DataFrame:
+        """Returns the k symbols with the largest change, best first.
+
+        Args:
+            k: The number of symbols. Defaults to 10.
+
+        Returns:
+            pd.DataFrame: The symbol, change, price, volume and trades columns.
+        """
+        return self._select(self._gainers, k)
+
+    def losers(self, k: int = 10) -> pd.DataFrame:
+        """Returns the k symbols with the smallest change, worst first.
+
+        Args:
+            k: The number of symbols. Defaults to 10.
+
+        Returns:
+            pd.DataFrame: The symbol, change, price, volume and trades columns.
+        """
+        return self._select(self._losers, k)
+
+    @property
+    def state(self) -> pd.DataFrame:
+        """pd.DataFrame: A copy of the state of every symbol, indexed by symbol."""
+        with self._lock:
+            count = len(self._symbols)
+            return pd.DataFrame(
+                {
+                    "prev_close": self._prev_close[:count],
+                    "open": self._open[:count],
+                    "price": self._price[:count],
+                    "volume": self._volume[:count],
+                    "trades": self._trades[:count],
+                    "change": self._changes(slice(0, count)),
+                },
+                index=pd.Index(self._symbols, name="symbol"),
+            )
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def _select(self, heap: list[tuple[float, int, int]], k: int) -> pd.DataFrame:
+        """Builds the result frame of the k best current entries of a heap.
+
+        The rows are picked and their values copied under one lock acquisition,
+        so updates cannot land between the two; the frame is built afterwards.
+        """
+        with self._lock:
+            rows = self._top(heap, k)
+            columns = {
+                "symbol": [self._symbols[row] for row in rows],
+                "change": np.round(self._changes(rows), 2),
+                "price": self._price[rows],
+                "volume": self._volume[rows],
+                "trades": self._trades[rows],
+            }
+        return pd.DataFrame(columns)
+
+    def _top(self, heap: list[tuple[float, int, int]], k: int) -> np.ndarray:
+        """Returns the rows of the k best current entries of a heap; needs the lock."""
+        best: list[tuple[float, int, int]] = []
+        while heap and len(best) < k:
+            entry = heapq.heappop(heap)
+            if entry[1] == self._versions[entry[2]]:
+                best.append(entry)
+        # Current entries go back; stale ones popped on the way are dropped
+        for entry in best:
+            heapq.heappush(heap, entry)
+        return np.array([row for _, _, row in best], dtype=np.int64)
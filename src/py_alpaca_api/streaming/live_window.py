@@ -0,0 +1,250 @@
+"""Rolling per-symbol windows of live bars, quotes or trades."""
+
+import threading
+from typing import Any, ClassVar
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.stock.history import History
+
+
+def _to_datetime64(value: Any) -> np.datetime64:
+    """Converts an RFC-3339 string or timestamp to naive UTC datetime64[ns]."""
+    if isinstance(value, str):
+        if value.endswith("Z"):
+            return np.datetime64(value[:-1], "ns")
+        value = pd.Timestamp(value)
+    if isinstance(value, pd.Timestamp) and value.tzinfo is not None:
+        value = value.tz_convert("UTC").tz_localize(None)
+    return np.datetime64(value, "ns")
+
+
+class LiveWindow:
+    """The last `size` bars, quotes or trades of each symbol in ring buffers.
+
+    Every field is a preallocated `(symbols, 2 * size)` array. Each value is
+    written twice, at `i` and `i + size`, so the latest `size` values of a symbol
+    are always contiguous: appends are O(1) and `view()` returns a read-only
+    slice of the buffer, oldest first, without copying.
+
+    Bars with the timestamp of the latest bar replace it, so updated bars from
+    the stream and repeated polls do not create duplicates.
+    """
+
+    # API keys of each kind mapped to field names; all values are stored as float64
+    KINDS: ClassVar[dict[str, dict[str, str]]] = {
+        "bars": {
+            "o": "open",
+            "h": "high",
+            "l": "low",
+            "c": "close",
+            "v": "volume",
+            "n": "trade_count",
+            "vw": "vwap",
+        },
+        "quotes": {
+            "bp": "bid_price",
+            "bs": "bid_size",
+            "ap": "ask_price",
+            "as": "ask_size",
+        },
+        "trades": {"p": "price", "s": "size"},
+    }
+
+    def __init__(self, size: int, kind: str = "bars", capacity: int = 64) -> None:
+        """Initializes empty windows.
+
+        Args:
+            size: The number of records kept per symbol.
+            kind: "bars", "quotes" or "trades". Defaults to "bars".
+            capacity: The number of symbols preallocated; grown as needed.
+
+        Raises:
+            ValidationError: If the size or kind is invalid.
+        """
+        if size < 1:
+            raise ValidationError("Size must be at least 1.")
+        if kind not in self.KINDS:
+            raise ValidationError(
+                f"Invalid kind. Must be one of: {', '.join(self.KINDS)}"
+            )
+
+        self.size = size
+        self.kind = kind
+        self.fields = ("timestamp", *self.KINDS[kind].values())
+        self._keys = {"timestamp": "t", **{v: k for k, v in self.KINDS[kind].items()}}
+
+        self._rows: dict[str, int] = {}
+        self._timestamps = np.full((capacity, 2 * size), np.datetime64("NaT", "ns"))
+        self._values = {
+            field: np.full((capacity, 2 * size), np.nan) for field in self.fields[1:]
+        }
+        self._positions = np.zeros(capacity, dtype=np.int64)
+        self._counts = np.zeros(capacity, dtype=np.int64)
+        self._lock = threading.Lock()
+
+    ############################################
+    # Appending
+    ############################################
+    def append(self, symbol: str, record: dict[str, Any]) -> None:
+        """Appends one record to the window of a symbol.
+
+        Args:
+            symbol: The symbol.
+            record: The record with API keys ("t", "o", "bp", ...) as sent by the
+                stream and REST API, or with field names.
+        """
+        timestamp = _to_datetime64(record.get("t", record.get("timestamp")))
+        with self._lock:
+            row = self._rows.get(symbol)
+            if row is None:
+                row = self._add_row(symbol)
+
+            pos, count = self._positions[row], self._counts[row]
+            if (
+                self.kind == "bars"
+                and count
+                and self._timestamps[row, pos + self.size - 1] == timestamp
+            ):
+                pos = (pos - 1) % self.size  # Replace the latest bar
+            else:
+                self._positions[row] = (pos + 1) % self.size
+                self._counts[row] = min(count + 1, self.size)
+
+            self._timestamps[row, pos] = self._timestamps[row, pos + self.size] = (
+                timestamp
+            )
+            for field, values in self._values.items():
+                value = record.get(self._keys[field], record.get(field))
+                values[row, pos] = values[row, pos + self.size] = (
+                    np.nan if value is None else value
+                )
+
+    def on_message(self, message: dict[str, Any]) -> None:
+        """Appends a stream message; usable as a `Stream` handler.
+
+        Args:
+            message: A bar, quote or trade message with its symbol under "S".
+        """
+        self.append(message["S"], message)
+
+    def poll_latest_bars(
+        self, history: History, symbols: list[str], feed: str = "iex"
+    ) -> None:
+        """Appends the latest bar of each symbol from `History.get_latest_bars_raw`.
+
+        The raw bar dicts of the response are appended directly, without building
+        a DataFrame per symbol.
+
+        Args:
+            history: The History client.
+            symbols: The symbols to poll.
+            feed: The data feed to use ("iex", "sip", or "otc"). Defaults to "iex".
+
+        Raises:
+            ValidationError: If the window does not hold bars.
+        """
+        if self.kind != "bars":
+            raise ValidationError("Only bar windows can poll latest bars.")
+        latest = history.get_latest_bars_raw(symbols, feed=feed, validate=False)
+        for symbol, bar in latest.items():
+            self.append(symbol, bar)
+
+    def _add_row(self, symbol: str) -> int:
+        """Assigns a row to a new symbol, doubling the buffers when full."""
+        row = len(self._rows)
+        if row == len(self._positions):
+            grow = len(self._positions)
+            self._timestamps = np.concatenate(
+                [self._timestamps, np.full_like(self._timestamps[:grow], "NaT")]
+            )
+            for field, values in self._values.items():
+                self._values[field] = np.concatenate(
+                    [values, np.full_like(values[:grow], np.nan)]
+                )
+            self._positions = np.concatenate([self._positions, np.zeros(grow, int)])
+            self._counts = np.concatenate([self._counts, np.zeros(grow, int)])
+        self._rows[symbol] = row
+        return row
+
+    ############################################
+    # Reading
+    ############################################
+    @property
+    def symbols(self) -> list[str]:
+        """list[str]: The symbols with at least one record."""
+        return list(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def count(self, symbol: str) -> int:
+        """Returns the number of records held for a symbol (at most `size`)."""
+        row = self._rows.get(symbol)
+        return 0 if row is None else int(self._counts[row])
+
+    def view(self, symbol: str, field: str) -> np.ndarray:
+        """Returns the window of one field as a zero-copy, read-only view.
+
+        Args:
+            symbol: The symbol.
+            field: One of `fields`, e.g. "close" or "timestamp".
+
+        Returns:
+            np.ndarray: Up to `size` values, oldest first. The view reflects later
+            appends until a new symbol grows the buffers, so copy it to keep a
+            snapshot.
+
+        Raises:
+            KeyError: If the symbol has no records.
+            ValidationError: If the field is invalid.
+        """
+        buffer = self._buffer(field)
+        row = self._rows[symbol]
+        end = int(self._positions[row]) + self.size
+        window = buffer[row, end - int(self._counts[row]) : end]
+        window.flags.writeable = False
+        return window
+
+    def last(self, symbol: str, field: str) -> Any:
+        """Returns the latest value of a field for a symbol."""
+        return self.view(symbol, field)[-1]
+
+    def frame(self, symbol: str) -> pd.DataFrame:
+        """Returns a copy of a symbol's window as a DataFrame indexed by timestamp."""
+        columns = {field: self.view(symbol, field) for field in self.fields}
+        return pd.DataFrame(columns).set_index("timestamp")
+
+    def matrix(self, field: str) -> np.ndarray:
+        """Returns one field of every symbol as a `(symbols, size)` array.
+
+        Rows follow `symbols` and are right-aligned, so the latest values share the
+        last column; windows that are not full are padded with NaN (NaT) on the
+        left. Gathered in one vectorized step, as a copy.
+
+        Args:
+            field: One of `fields`.
+
+        Returns:
+            np.ndarray: The windows of all symbols.
+        """
+        buffer = self._buffer(field)
+        rows = len(self._rows)
+        ends = self._positions[:rows] + self.size
+        columns = ends[:, None] - self.size + np.arange(self.size)
+        matrix = np.take_along_axis(buffer[:rows], columns, axis=1)
+        padding = np.arange(self.size) < (self.size - self._counts[:rows])[:, None]
+        matrix[padding] = np.datetime64("NaT") if field == "timestamp" else np.nan
+        return matrix
+
+    def _buffer(self, field: str) -> np.ndarray:
+        """Returns the buffer of a field."""
+        if field == "timestamp":
+            return self._timestamps
+        if field not in self._values:
+            raise ValidationError(
+                f"Invalid field. Must be one of: {', '.join(self.fields)}"
+            )
+        return self._values[field]
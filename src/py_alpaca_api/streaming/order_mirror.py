@@ -0,0 +1,305 @@
+"""In-memory mirror of the account's orders, kept current by trade updates."""
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from typing import Any, ClassVar
+
+import pendulum
+
+from py_alpaca_api.exceptions import OrderError
+from py_alpaca_api.models.order_model import OrderModel, order_class_from_dict
+from py_alpaca_api.streaming.trade_updates import TradeUpdatesStream
+from py_alpaca_api.trading.orders import Orders
+
+
+class OrderMirror:
+    """Local copy of orders indexed by id, client order id and symbol.
+
+    Attached to a `TradeUpdatesStream`, every event updates the mirror, so fills
+    are seen as soon as they are streamed instead of by polling. After each
+    (re)connection the mirror resynchronizes over REST: open orders on the first
+    connection, then only orders submitted since the previous sync (`after=`),
+    plus the locally open orders that closed while disconnected.
+
+    All methods are thread-safe; `wait_for_fill` blocks a thread and
+    `wait_for_fill_async` awaits in any event loop.
+    """
+
+    TERMINAL_STATUSES: ClassVar[frozenset[str]] = frozenset(
+        {"filled", "canceled", "expired", "replaced", "rejected", "done_for_day"}
+    )
+    PAGE_LIMIT = 500  # Alpaca API limit for listing orders
+
+    def __init__(
+        self,
+        orders: Orders,
+        stream: TradeUpdatesStream | None = None,
+        resync_margin: float = 5.0,
+    ) -> None:
+        """Initializes an empty mirror.
+
+        Args:
+            orders: The Orders client used to resynchronize.
+            stream: Optional trade updates stream to attach to.
+            resync_margin: Seconds subtracted from the previous sync time when
+                resynchronizing, to cover clock skew.
+        """
+        self.orders = orders
+        self.resync_margin = resync_margin
+
+        self._by_id: dict[str, OrderModel] = {}
+        self._id_by_client_id: dict[str, str] = {}
+        self._ids_by_symbol: defaultdict[str, set[str]] = defaultdict(set)
+        self._condition = threading.Condition()
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self._synced_at: str | None = None
+
+        if stream is not None:
+            self.attach(stream)
+
+    def attach(self, stream: TradeUpdatesStream) -> None:
+        """Keeps the mirror current from a trade updates stream.
+
+        Args:
+            stream: The stream to subscribe to; the mirror resynchronizes each
+                time it connects.
+        """
+        stream.subscribe(self.apply_event)
+        stream.on_connect(self._resync_async)
+
+    ############################################
+    # Updates
+    ############################################
+    def apply_event(self, event: dict[str, Any]) -> OrderModel | None:
+        """Applies a trade update event.
+
+        Args:
+            event: The `data` of a trade_updates message.
+
+        Returns:
+            OrderModel | None: The mirrored order, or None if the event has none.
+        """
+        if not event.get("order"):
+            return None
+        return self.update(order_class_from_dict(event["order"]))
+
+    def update(self, order: OrderModel) -> OrderModel:
+        """Stores an order unless the mirror already holds a newer version.
+
+        Args:
+            order: The order as received from the stream or REST.
+
+        Returns:
+            OrderModel: The mirrored version of the order.
+        """
+        with self._condition:
+            current = self._by_id.get(order.id)
+            if current is not None and not _is_newer(order, current):
+                return current
+            self._by_id[order.id] = order
+            if order.client_order_id:
+                self._id_by_client_id[order.client_order_id] = order.id
+            self._ids_by_symbol[order.symbol].add(order.id)
+            self._condition.notify_all()
+            waiters, self._waiters = self._waiters, []
+
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+        return order
+
+    def resync(self) -> int:
+        """Fetches the orders that may have changed since the last sync.
+
+        Returns:
+            int: The number of orders fetched.
+        """
+        started = pendulum.now("UTC")
+        if self._synced_at is None:
+            fetched = self.orders.get_all_orders(
+                status="open", limit=self.PAGE_LIMIT, direction="asc"
+            )
+        else:
+            fetched = self._fetch_since(self._synced_at)
+            fetched += self.orders.get_all_orders(
+                status="open", limit=self.PAGE_LIMIT, direction="asc"
+            )
+
+        for order in fetched:
+            self.update(order)
+
+        # Locally open orders missing from both lists closed while disconnected
+        if self._synced_at is not None:
+            returned = {order.id for order in fetched}
+            for order in self.open_orders:
+                if order.id not in returned:
+                    fetched.append(self.update(self.orders.get_by_id(order.id)))
+
+        self._synced_at = started.subtract(
+            seconds=self.resync_margin
+        ).to_iso8601_string()
+        return len(fetched)
+
+    async def _resync_async(self) -> None:
+        """Resynchronizes without blocking the stream's event loop."""
+        await asyncio.to_thread(self.resync)
+
+    def _fetch_since(self, after: str) -> list[OrderModel]:
+        """Fetches every order submitted after a time, page by page."""
+        fetched: list[OrderModel] = []
+        while True:
+            page = self.orders.get_all_orders(
+                status="all", limit=self.PAGE_LIMIT, after=after, direction="asc"
+            )
+            fetched.extend(page)
+            if len(page) < self.PAGE_LIMIT:
+                return fetched
+            # Order times are UTC with second precision
+            next_after = str(page[-1].submitted_at).replace(" ", "T") + "Z"
+            if next_after == after:
+                return fetched
+            after = next_after
+
+    ############################################
+    # Lookups
+    ############################################
+    def get(self, key: str) -> OrderModel | None:
+        """Returns an order by id or client order id.
+
+        Args:
+            key: The order id or client order id.
+
+        Returns:
+            OrderModel | None: The order, or None if it is not mirrored.
+        """
+        with self._condition:
+            return self._get(key)
+
+    def orders_for(self, symbol: str, open_only: bool = False) -> list[OrderModel]:
+        """Returns the mirrored orders of a symbol.
+
+        Args:
+            symbol: The symbol.
+            open_only: Whether to only return orders that are not final.
+
+        Returns:
+            list[OrderModel]: The orders, oldest submitted first.
+        """
+        with self._condition:
+            orders = [self._by_id[i] for i in self._ids_by_symbol.get(symbol, ())]
+        if open_only:
+            orders = [o for o in orders if o.status not in self.TERMINAL_STATUSES]
+        return sorted(orders, key=lambda o: (str(o.submitted_at), o.id))
+
+    @property
+    def open_orders(self) -> list[OrderModel]:
+        """list[OrderModel]: The mirrored orders that are not final."""
+        with self._condition:
+            return [
+                order
+                for order in self._by_id.values()
+                if order.status not in self.TERMINAL_STATUSES
+            ]
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    ############################################
+    # Waiting For Fills
+    ############################################
+    def wait_for_fill(self, key: str, timeout: float | None = None) -> OrderModel:
+        """Blocks until an order is filled.
+
+        Replaced orders are followed to their replacement.
+
+        Args:
+            key: The order id or client order id.
+            timeout: Optional maximum number of seconds to wait.
+
+        Returns:
+            OrderModel: The filled order.
+
+        Raises:
+            OrderError: If the order ends without being filled.
+            TimeoutError: If the timeout expires first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                order = self._filled(key)
+                if order is not None:
+                    return order
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"Order {key} was not filled within {timeout}s")
+                self._condition.wait(remaining)
+
+    async def wait_for_fill_async(
+        self, key: str, timeout: float | None = None
+    ) -> OrderModel:
+        """Waits in the running event loop until an order is filled.
+
+        Args:
+            key: The order id or client order id.
+            timeout: Optional maximum number of seconds to wait.
+
+        Returns:
+            OrderModel: The filled order.
+
+        Raises:
+            OrderError: If the order ends without being filled.
+            TimeoutError: If the timeout expires first.
+        """
+
+        async def wait() -> OrderModel:
+            loop = asyncio.get_running_loop()
+            while True:
+                event = asyncio.Event()
+                with self._condition:
+                    order = self._filled(key)
+                    if order is not None:
+                        return order
+                    self._waiters.append((loop, event))
+                await event.wait()
+
+        try:
+            return await asyncio.wait_for(wait(), timeout)
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(f"Order {key} was not filled within {timeout}s") from e
+
+    def _get(self, key: str) -> OrderModel | None:
+        """Looks up an order by id or client order id; the lock must be held."""
+        return self._by_id.get(self._id_by_client_id.get(key, key))
+
+    def _filled(self, key: str) -> OrderModel | None:
+        """Returns the filled order, or None while it may still fill.
+
+        Raises:
+            OrderError: If the order ended without being filled.
+        """
+        order = self._get(key)
+        seen: set[str] = set()
+        while order is not None and order.status == "replaced" and order.replaced_by:
+            if order.id in seen:
+                break
+            seen.add(order.id)
+            order = self._by_id.get(order.replaced_by)
+
+        if order is None or order.status not in self.TERMINAL_STATUSES:
+            return None
+        if order.status != "filled":
+            raise OrderError(f"Order {order.id} was {order.status} before filling")
+        return order
+
+
+def _is_newer(new: OrderModel, old: OrderModel) -> bool:
+    """Returns whether an order version supersedes the mirrored one."""
+    if new.updated_at != old.updated_at:
+        return str(new.updated_at) > str(old.updated_at)
+    # Within the same second, never move back from a final or more filled state
+    if old.status in OrderMirror.TERMINAL_STATUSES and (
+        new.status not in OrderMirror.TERMINAL_STATUSES
+    ):
+        return False
+    return float(new.filled_qty or 0) >= float(old.filled_qty or 0)
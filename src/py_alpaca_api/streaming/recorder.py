@@ -0,0 +1,300 @@
+"""Recording of stream messages to disk, and their replay at any speed."""
+
+import asyncio
+import gzip
+import json
+import logging
+import struct
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, ClassVar
+
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.stock.snapshot_poller import SnapshotPoller
+from py_alpaca_api.streaming.base import BaseStream, call_handler
+from py_alpaca_api.streaming.stream import _import_msgpack
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PYALPLOG"
+VERSION = 1
+# Receive time (UNIX seconds) and payload length of each record
+RECORD_HEADER = struct.Struct("<dI")
+
+
+@dataclass(frozen=True)
+class LogRecord:
+    """One recorded message."""
+
+    received_at: float
+    channel: str
+    message: Any
+
+
+def _default(value: Any) -> Any:
+    """Converts the numpy and pandas values of snapshot changes for encoding."""
+    if isinstance(value, np.datetime64):
+        return None if np.isnat(value) else pd.Timestamp(value).isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot record value of type {type(value).__name__}")
+
+
+def _open(path: Path, mode: str) -> IO[bytes]:
+    """Opens a log, gzip-compressed if its name ends with ".gz"."""
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)  # type: ignore[return-value]
+    return path.open(mode)
+
+
+def _read_header(file: IO[bytes], path: Path) -> str:
+    """Reads the header of a log and returns its codec."""
+    header = file.read(len(MAGIC) + 2)
+    if len(header) != len(MAGIC) + 2 or not header.startswith(MAGIC):
+        raise ValidationError(f"{path} is not a recorded stream log.")
+    version, codec = header[len(MAGIC)], header[len(MAGIC) + 1]
+    if version != VERSION or codec >= len(Recorder.CODECS):
+        raise ValidationError(f"Unsupported log version {version} in {path}.")
+    return Recorder.CODECS[codec]
+
+
+class Recorder:
+    """Appends stream messages and snapshot changes to a compact binary log.
+
+    Each record is the receive time, the channel and the message exactly as
+    handlers see it, encoded with JSON or msgpack. Logs whose name ends with
+    ".gz" are gzip-compressed. Appending to an existing log continues it.
+
+    Attach the recorder to a `Stream`, `TradeUpdatesStream` or `SnapshotPoller`,
+    or call `record()` directly. It is thread-safe and a context manager.
+    """
+
+    CODECS: ClassVar[tuple[str, ...]] = ("json", "msgpack")
+
+    def __init__(self, path: str | Path, codec: str = "json") -> None:
+        """Opens a log for appending.
+
+        Args:
+            path: The log file; ".gz" names are compressed.
+            codec: "json" or "msgpack" (requires msgpack). Defaults to "json".
+                An existing log keeps its codec.
+
+        Raises:
+            ValidationError: If the codec is invalid or differs from the log's.
+            ImportError: If msgpack is requested but not installed.
+        """
+        if codec not in self.CODECS:
+            raise ValidationError(
+                f"Invalid codec. Must be one of: {', '.join(self.CODECS)}"
+            )
+        self.path = Path(path)
+        if self.path.exists() and self.path.stat().st_size:
+            with _open(self.path, "rb") as file:
+                existing = _read_header(file, self.path)
+            if existing != codec:
+                raise ValidationError(f"{self.path} is recorded with {existing}.")
+            new = False
+        else:
+            new = True
+
+        self.codec = codec
+        if codec == "msgpack":
+            msgpack = _import_msgpack()
+            self._encode: Callable[[Any], bytes] = lambda record: msgpack.packb(
+                record, default=_default
+            )
+        else:
+            self._encode = lambda record: json.dumps(
+                record, default=_default, separators=(",", ":")
+            ).encode()
+
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = _open(self.path, "ab")
+        if new:
+            self._file.write(MAGIC + bytes([VERSION, self.CODECS.index(codec)]))
+
+    def attach(self, source: BaseStream | SnapshotPoller) -> None:
+        """Records everything a stream receives or a poller reports.
+
+        Args:
+            source: A stream, whose data messages are recorded under their
+                channel, or a snapshot poller, whose changes are recorded under
+                "snapshots".
+        """
+        if isinstance(source, SnapshotPoller):
+            source.subscribe(self._record_snapshots)
+        else:
+            source.tap(self.record)
+
+    def detach(self, source: BaseStream | SnapshotPoller) -> None:
+        """Stops recording a source attached with `attach`.
+
+        Args:
+            source: The stream or poller.
+        """
+        if isinstance(source, SnapshotPoller):
+            source.unsubscribe(self._record_snapshots)
+        else:
+            source.untap(self.record)
+
+    def record(
+        self, channel: str, message: Any, received_at: float | None = None
+    ) -> None:
+        """Appends one message to the log.
+
+        Args:
+            channel: The channel of the message, e.g. "trades" or "snapshots".
+            message: The message.
+            received_at: The receive time in UNIX seconds. Defaults to now.
+        """
+        if received_at is None:
+            received_at = time.time()
+        payload = self._encode([channel, message])
+        with self._lock:
+            self._file.write(RECORD_HEADER.pack(received_at, len(payload)))
+            self._file.write(payload)
+            self.count += 1
+
+    def _record_snapshots(self, changes: dict[str, dict[str, Any]]) -> None:
+        """Records the changes of one snapshot poll."""
+        self.record("snapshots", changes)
+
+    def flush(self) -> None:
+        """Writes buffered records to disk."""
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the log."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "Recorder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class Replayer:
+    """Feeds a recorded log back through the handler API.
+
+    Messages are replayed into a stream with `inject()`, so they reach the
+    stream's handlers (and dispatcher) exactly as live messages would, or to a
+    plain callback, e.g. a snapshot poller subscriber. The original gaps between
+    messages are kept at `speed=1`, divided by `speed` otherwise, and skipped
+    with `speed=None`. Replays into a stream with a dispatcher return once the
+    dispatcher has handled every message.
+    """
+
+    def __init__(self, path: str | Path, channels: list[str] | None = None) -> None:
+        """Opens a recorded log.
+
+        Args:
+            path: The log file.
+            channels: Optional channels to replay, e.g. ["trades"]; all by default.
+
+        Raises:
+            ValidationError: If the file is not a recorded log.
+        """
+        self.path = Path(path)
+        self.channels = set(channels) if channels else None
+        with _open(self.path, "rb") as file:
+            self.codec = _read_header(file, self.path)
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        """Yields the records of the log in order.
+
+        A truncated last record, e.g. after a crash while recording, is skipped.
+        """
+        decode = _import_msgpack().unpackb if self.codec == "msgpack" else json.loads
+
+        with _open(self.path, "rb") as file:
+            _read_header(file, self.path)
+            while header := file.read(RECORD_HEADER.size):
+                payload = None
+                if len(header) == RECORD_HEADER.size:
+                    received_at, length = RECORD_HEADER.unpack(header)
+                    payload = file.read(length)
+                if payload is None or len(payload) < length:
+                    logger.warning(f"Skipping truncated record at end of {self.path}")
+                    return
+                channel, message = decode(payload)
+                if self.channels is None or channel in self.channels:
+                    yield LogRecord(received_at, channel, message)
+
+    async def replay(
+        self,
+        target: BaseStream | Callable[[Any], Any],
+        speed: float | None = 1.0,
+    ) -> int:
+        """Replays the log into a stream or callback.
+
+        Args:
+            target: A stream whose handlers receive the messages, or a plain
+                function or coroutine function called with each message.
+            speed: The replay speed: 1 for the recorded rate, 10 for ten times
+                faster, or None for as fast as possible. Defaults to 1.
+
+        Returns:
+            int: The number of messages replayed.
+
+        Raises:
+            ValidationError: If the speed is not positive.
+        """
+        if speed is not None and speed <= 0:
+            raise ValidationError("Speed must be positive.")
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first: float | None = None
+        count = 0
+        for record in self:
+            if first is None:
+                first = record.received_at
+            if speed is not None:
+                delay = started + (record.received_at - first) / speed - loop.time()
+                await asyncio.sleep(max(delay, 0))
+            else:
+                await asyncio.sleep(0)  # Let handlers and dispatch workers run
+
+            if isinstance(target, BaseStream):
+                await target.inject(record.message)
+            else:
+                await call_handler(target, record.message)
+            count += 1
+
+        if isinstance(target, BaseStream) and target.dispatcher is not None:
+            await target.dispatcher.drain()
+        return count
+
+    def replay_sync(
+        self,
+        target: BaseStream | Callable[[Any], Any],
+        speed: float | None = 1.0,
+    ) -> int:
+        """Runs `replay()` in a new event loop, blocking until it ends.
+
+        Returns:
+            int: The number of messages replayed.
+        """
+
+        async def replay() -> int:
+            try:
+                return await self.replay(target, speed)
+            finally:
+                # Dispatch workers cannot outlive the event loop
+                if isinstance(target, BaseStream) and target.dispatcher is not None:
+                    await target.dispatcher.close()
+
+        return asyncio.run(replay())
@@ -0,0 +1,287 @@
+"""Real-time market data from the Alpaca v2 stock data stream."""
+
+import json
+import logging
+from collections.abc import Iterable
+from typing import Any, ClassVar
+
+import numpy as np
+
+from py_alpaca_api.exceptions import (
+    APIRequestError,
+    AuthenticationError,
+    ValidationError,
+)
+from py_alpaca_api.models.frame_utils import format_timestamp
+from py_alpaca_api.streaming.base import BaseStream, Callback
+from py_alpaca_api.streaming.dispatcher import Dispatcher
+
+logger = logging.getLogger(__name__)
+
+
+def _import_msgpack():
+    """Imports msgpack, which is an optional dependency.
+
+    Returns:
+        The msgpack module.
+
+    Raises:
+        ImportError: If msgpack is not installed.
+    """
+    try:
+        import msgpack  # noqa: PLC0415
+    except ImportError as e:
+        raise ImportError(
+            'use_msgpack=True requires msgpack. Install it with: pip install "py-alpaca-api[stream]"'
+        ) from e
+    return msgpack
+
+
+class Stream(BaseStream):
+    """Client for the v2 stock market data stream.
+
+    Handlers are registered per channel and symbol ("*" for all symbols) and
+    called with each message as a dict using the stream's short keys ("S", "t",
+    "p", ...), with "t" always an RFC-3339 string. Handlers may be plain
+    functions or coroutines.
+
+    `run()` connects, authenticates and subscribes, then dispatches messages
+    until `stop()` is called. Dropped connections are re-established with
+    exponential backoff and every active subscription is sent again.
+    """
+
+    BASE_URL = "wss://stream.data.alpaca.markets/v2"
+    FEEDS: ClassVar[tuple[str, ...]] = ("iex", "sip", "delayed_sip", "test")
+
+    # Subscription channels mapped to the message types they deliver; trade
+    # subscriptions also deliver corrections ("c") and cancel errors ("x")
+    CHANNELS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "trades": ("t", "c", "x"),
+        "quotes": ("q",),
+        "bars": ("b",),
+        "updatedBars": ("u",),
+        "dailyBars": ("d",),
+        "statuses": ("s",),
+        "lulds": ("l",),
+    }
+
+    # Handshake error codes worth reconnecting for (connection limit exceeded)
+    RETRYABLE_ERRORS: ClassVar[frozenset[int]] = frozenset({406})
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        feed: str = "iex",
+        url: str | None = None,
+        use_msgpack: bool = False,
+        reconnect: bool = True,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        dispatcher: Dispatcher | None = None,
+    ) -> None:
+        """Initializes the stream without connecting.
+
+        Args:
+            api_key: The API key.
+            api_secret: The API secret.
+            feed: The data feed: "iex", "sip", "delayed_sip" or "test". Defaults to "iex".
+            url: Optional stream URL, e.g. a local server in tests. Defaults to the
+                Alpaca URL of `feed`.
+            use_msgpack: Whether to exchange msgpack frames instead of JSON.
+            reconnect: Whether to reconnect when the connection drops.
+            backoff: Seconds before the first reconnect; doubled on each failure.
+            max_backoff: Maximum seconds between reconnects.
+            dispatcher: Optional dispatcher queuing messages for the handlers, so
+                slow handlers do not stall the connection.
+
+        Raises:
+            AuthenticationError: If the API key or secret is missing.
+            ValidationError: If the feed is invalid.
+        """
+        if feed not in self.FEEDS:
+            raise ValidationError(
+                f"Invalid feed. Must be one of: {', '.join(self.FEEDS)}"
+            )
+        super().__init__(
+            api_key,
+            api_secret,
+            url or f"{self.BASE_URL}/{feed}",
+            reconnect=reconnect,
+            backoff=backoff,
+            max_backoff=max_backoff,
+            dispatcher=dispatcher,
+        )
+        self.use_msgpack = use_msgpack
+
+        self._handlers: dict[str, dict[str, Callback]] = {
+            channel: {} for channel in self.CHANNELS
+        }
+        self._channels = {
+            message_type: channel
+            for channel, message_types in self.CHANNELS.items()
+            for message_type in message_types
+        }
+
+    ############################################
+    # Subscriptions
+    ############################################
+    def subscribe(
+        self, channel: str, handler: Callback, symbols: Iterable[str]
+    ) -> None:
+        """Subscribes a handler to a channel for the given symbols.
+
+        Can be called before `run()` or while streaming, from any thread.
+
+        Args:
+            channel: One of `CHANNELS`, e.g. "trades", "quotes" or "bars".
+            handler: Called with each message of the channel for these symbols.
+            symbols: The symbols, or "*" for all symbols.
+
+        Raises:
+            ValidationError: If the channel is invalid or no symbols are given.
+        """
+        symbols = self._validate(channel, symbols)
+        for symbol in symbols:
+            self._handlers[channel][symbol] = handler
+        self._send_threadsafe({"action": "subscribe", channel: symbols})
+
+    def unsubscribe(self, channel: str, symbols: Iterable[str]) -> None:
+        """Unsubscribes a channel for the given symbols.
+
+        Args:
+            channel: One of `CHANNELS`.
+            symbols: The symbols, or "*".
+
+        Raises:
+            ValidationError: If the channel is invalid or no symbols are given.
+        """
+        symbols = self._validate(channel, symbols)
+        for symbol in symbols:
+            self._handlers[channel].pop(symbol, None)
+        self._send_threadsafe({"action": "unsubscribe", channel: symbols})
+
+    def subscribe_trades(self, handler: Callback, *symbols: str) -> None:
+        """Subscribes a handler to trades, trade corrections and cancel errors."""
+        self.subscribe("trades", handler, symbols)
+
+    def subscribe_quotes(self, handler: Callback, *symbols: str) -> None:
+        """Subscribes a handler to quotes."""
+        self.subscribe("quotes", handler, symbols)
+
+    def subscribe_bars(self, handler: Callback, *symbols: str) -> None:
+        """Subscribes a handler to minute bars."""
+        self.subscribe("bars", handler, symbols)
+
+    @property
+    def subscriptions(self) -> dict[str, list[str]]:
+        """dict[str, list[str]]: The subscribed symbols of each non-empty channel."""
+        return {
+            channel: sorted(handlers)
+            for channel, handlers in self._handlers.items()
+            if handlers
+        }
+
+    ############################################
+    # Connection
+    ############################################
+    def _connect_headers(self) -> dict[str, str]:
+        """Requests msgpack frames when `use_msgpack` is set."""
+        if not self.use_msgpack:
+            return {}
+        _import_msgpack()
+        return {"Content-Type": "application/msgpack"}
+
+    async def _authenticate(self, ws: Any) -> None:
+        """Waits for the welcome message and authenticates.
+
+        Raises:
+            AuthenticationError: If the credentials are rejected.
+            APIRequestError: If the server reports any other error.
+        """
+        self._check_handshake(await ws.recv(), "connected")
+        await ws.send(
+            self._encode(
+                {"action": "auth", "key": self.api_key, "secret": self.api_secret}
+            )
+        )
+        self._check_handshake(await ws.recv(), "authenticated")
+
+    def _check_handshake(self, raw: str | bytes, expected: str) -> None:
+        """Validates a handshake reply."""
+        for message in self._decode(raw):
+            if message.get("T") == "success" and message.get("msg") == expected:
+                return
+            if message.get("T") == "error":
+                code, msg = message.get("code"), message.get("msg", "")
+                if code == 402:
+                    raise AuthenticationError(f"Stream authentication failed: {msg}")
+                raise APIRequestError(code, f"Stream error: {msg}")
+        raise APIRequestError(message=f"Unexpected stream message: {raw!r}")
+
+    async def _on_connected(self) -> None:
+        """Sends every active subscription again."""
+        if self.subscriptions:
+            await self._send({"action": "subscribe", **self.subscriptions})
+
+    async def _handle_frame(self, raw: str | bytes) -> None:
+        """Dispatches every message of a frame."""
+        for message in self._decode(raw):
+            await self._dispatch(message)
+
+    async def _dispatch(self, message: dict[str, Any]) -> None:
+        """Calls the handler of a data message; logs control messages."""
+        message_type = message.get("T")
+        channel = self._channels.get(str(message_type))
+        if channel is None:
+            if message_type == "error":
+                logger.error(
+                    f"Stream error {message.get('code')}: {message.get('msg', '')}"
+                )
+            elif message_type == "subscription":
+                logger.debug(f"Stream subscriptions: {message}")
+            return
+
+        self._run_taps(channel, message)
+        handlers = self._handlers[channel]
+        handler = handlers.get(message.get("S", "")) or handlers.get("*")
+        if handler is not None:
+            await self._deliver(channel, handler, message)
+
+    ############################################
+    # Frames
+    ############################################
+    def _encode(self, message: dict[str, Any]) -> str | bytes:
+        """Encodes an outgoing message as JSON or msgpack."""
+        if self.use_msgpack:
+            return _import_msgpack().packb(message)
+        return json.dumps(message)
+
+    def _decode(self, raw: str | bytes) -> list[dict[str, Any]]:
+        """Decodes a frame into its list of messages.
+
+        msgpack timestamps are converted to the RFC-3339 strings of JSON frames.
+        """
+        if isinstance(raw, str) or not self.use_msgpack:
+            messages = json.loads(raw)
+        else:
+            msgpack = _import_msgpack()
+            messages = msgpack.unpackb(raw)
+            for message in messages:
+                timestamp = message.get("t")
+                if isinstance(timestamp, msgpack.Timestamp):
+                    message["t"] = format_timestamp(
+                        np.datetime64(timestamp.to_unix_nano(), "ns")
+                    )
+        return messages if isinstance(messages, list) else [messages]
+
+    def _validate(self, channel: str, symbols: Iterable[str]) -> list[str]:
+        """Validates a channel and normalizes its symbols."""
+        if channel not in self.CHANNELS:
+            raise ValidationError(
+                f"Invalid channel. Must be one of: {', '.join(self.CHANNELS)}"
+            )
+        normalized = sorted({s.upper().strip() for s in symbols if s and s.strip()})
+        if not normalized:
+            raise ValidationError("At least one symbol is required.")
+        return normalized
@@ -0,0 +1,114 @@
+"""Order events from the Alpaca trade_updates stream."""
+
+import json
+from typing import Any
+
+from py_alpaca_api.exceptions import APIRequestError, AuthenticationError
+from py_alpaca_api.streaming.base import BaseStream, Callback
+from py_alpaca_api.streaming.dispatcher import Dispatcher
+
+
+class TradeUpdatesStream(BaseStream):
+    """Client for the `trade_updates` stream of the trading API.
+
+    Handlers are called with the `data` of every event: a dict with the
+    `event` ("new", "fill", "partial_fill", "canceled", ...), the raw `order`
+    dict and, for fills, `timestamp`, `price`, `qty` and `position_qty`.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        api_paper: bool = True,
+        url: str | None = None,
+        reconnect: bool = True,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        dispatcher: Dispatcher | None = None,
+    ) -> None:
+        """Initializes the stream without connecting.
+
+        Args:
+            api_key: The API key.
+            api_secret: The API secret.
+            api_paper: Whether to stream the paper account. Defaults to True.
+            url: Optional stream URL, e.g. a local server in tests.
+            reconnect: Whether to reconnect when the connection drops.
+            backoff: Seconds before the first reconnect; doubled on each failure.
+            max_backoff: Maximum seconds between reconnects.
+            dispatcher: Optional dispatcher queuing messages for the handlers, so
+                slow handlers do not stall the connection.
+
+        Raises:
+            AuthenticationError: If the API key or secret is missing.
+        """
+        default_url = (
+            "wss://paper-api.alpaca.markets/stream"
+            if api_paper
+            else "wss://api.alpaca.markets/stream"
+        )
+        super().__init__(
+            api_key,
+            api_secret,
+            url or default_url,
+            reconnect=reconnect,
+            backoff=backoff,
+            max_backoff=max_backoff,
+            dispatcher=dispatcher,
+        )
+        self._handlers: list[Callback] = []
+
+    def subscribe(self, handler: Callback) -> None:
+        """Registers a handler for every trade update.
+
+        Args:
+            handler: A plain function or coroutine function called with the event.
+        """
+        self._handlers.append(handler)
+
+    def unsubscribe(self, handler: Callback) -> None:
+        """Removes a handler registered with `subscribe`.
+
+        Args:
+            handler: The handler to remove.
+        """
+        self._handlers.remove(handler)
+
+    async def _authenticate(self, ws: Any) -> None:
+        """Authenticates and starts listening to trade updates.
+
+        Raises:
+            AuthenticationError: If the credentials are rejected.
+            APIRequestError: If the server does not confirm the subscription.
+        """
+        await ws.send(
+            self._encode(
+                {"action": "auth", "key": self.api_key, "secret": self.api_secret}
+            )
+        )
+        reply = json.loads(await ws.recv())
+        data = reply.get("data", {})
+        if reply.get("stream") != "authorization" or data.get("status") != "authorized":
+            raise AuthenticationError(
+                f"Stream authentication failed: {data.get('status', reply)}"
+            )
+
+        await ws.send(
+            self._encode({"action": "listen", "data": {"streams": ["trade_updates"]}})
+        )
+        reply = json.loads(await ws.recv())
+        if "trade_updates" not in reply.get("data", {}).get("streams", []):
+            raise APIRequestError(message=f"Unexpected stream message: {reply!r}")
+
+    async def _handle_frame(self, raw: str | bytes) -> None:
+        """Dispatches a received trade update."""
+        await self._dispatch(json.loads(raw))
+
+    async def _dispatch(self, message: dict[str, Any]) -> None:
+        """Calls every handler with a trade update."""
+        if message.get("stream") != "trade_updates":
+            return
+        self._run_taps("trade_updates", message)
+        for handler in list(self._handlers):
+            await self._deliver("trade_updates", handler, message["data"])
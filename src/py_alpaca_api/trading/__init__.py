@@ -9,7 +9,9 @@ from py_alpaca_api.trading.watchlists import Watchlist
 
 
 class Trading:
-    def __init__(self, api_key: str, api_secret: str, api_paper: bool) -> None:
+    def __init__(
+        self, api_key: str, api_secret: str, api_paper: bool, output: str = "pandas"
+    ) -> None:
         headers = {
             "accept": "application/json",
             "APCA-API-KEY-ID": api_key,
@@ -20,14 +22,16 @@ class Trading:
             if api_paper
             else "https://api.alpaca.markets/v2"
         )
-        self._initialize_components(headers=headers, base_url=base_url)
+        self._initialize_components(headers=headers, base_url=base_url, output=output)
 
-    def _initialize_components(self, headers: dict[str, str], base_url: str):
+    def _initialize_components(
+        self, headers: dict[str, str], base_url: str, output: str = "pandas"
+    ):
         self.account = Account(headers=headers, base_url=base_url)
         self.corporate_actions = CorporateActions(headers=headers, base_url=base_url)
-        self.market = Market(headers=headers, base_url=base_url)
+        self.market = Market(headers=headers, base_url=base_url, output=output)
         self.positions = Positions(
-            headers=headers, base_url=base_url, account=self.account
+            headers=headers, base_url=base_url, account=self.account, output=output
         )
         self.orders = Orders(headers=headers, base_url=base_url)
         self.watchlists = Watchlist(headers=headers, base_url=base_url)
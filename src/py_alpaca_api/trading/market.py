@@ -1,15 +1,21 @@
 import json
+from typing import Any
 
 import pandas as pd
 
 from py_alpaca_api.http.requests import Requests
 from py_alpaca_api.models.clock_model import ClockModel, clock_class_from_dict
+from py_alpaca_api.models.frame_utils import convert_frame, validate_output
 
 
 class Market:
-    def __init__(self, base_url: str, headers: dict[str, str]) -> None:
+    def __init__(
+        self, base_url: str, headers: dict[str, str], output: str = "pandas"
+    ) -> None:
+        validate_output(output)
         self.base_url = base_url
         self.headers = headers
+        self.output = output
 
     def clock(self) -> ClockModel:
         """Retrieves the current market clock.
@@ -25,16 +31,22 @@ class Market:
         del response["timestamp"]
         return clock_class_from_dict(response)
 
-    def calendar(self, start_date: str, end_date: str) -> pd.DataFrame:
+    def calendar(
+        self, start_date: str, end_date: str, output: str | None = None
+    ) -> Any:
         """Retrieves the market calendar for the specified date range.
 
         Args:
             start_date (str): The start date of the calendar range in the format "YYYY-MM-DD".
             end_date (str): The end date of the calendar range in the format "YYYY-MM-DD".
+            output (str, optional): The output format: "pandas", "polars", "arrow" or "numpy". Defaults to the client's output format.
 
         Returns:
             pd.DataFrame: A DataFrame containing the market calendar data, with columns for the date, settlement date, open time, and close time.
         """
+        output = output or self.output
+        validate_output(output)
+
         url = f"{self.base_url}/calendar"
         params: dict[str, str | bool | float | int] = {
             "start": start_date,
@@ -57,4 +69,4 @@ class Market:
         for col in time_cols:
             calendar_df[col] = pd.to_datetime(calendar_df[col], format="mixed").dt.time
 
-        return calendar_df
+        return convert_frame(calendar_df, output)
@@ -1,19 +1,27 @@
 import json
+from typing import Any
 
 import pandas as pd
 
 from py_alpaca_api.http.requests import Requests
+from py_alpaca_api.models.frame_utils import convert_frame, validate_output
 from py_alpaca_api.models.position_model import PositionModel, position_class_from_dict
 from py_alpaca_api.trading.account import Account
 
 
 class Positions:
     def __init__(
-        self, base_url: str, headers: dict[str, str], account: Account
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        account: Account,
+        output: str = "pandas",
     ) -> None:
+        validate_output(output)
         self.base_url = base_url
         self.headers = headers
         self.account = account
+        self.output = output
 
     ########################################################
     # \\\\\\\\\\\\\\\\ Close All Positions ////////////////#
@@ -103,7 +111,9 @@ class Positions:
             raise ValueError("Symbol is required.")
 
         try:
-            position = self.get_all().query(f"symbol == '{symbol}'").iloc[0]
+            position = (
+                self.get_all(output="pandas").query(f"symbol == '{symbol}'").iloc[0]
+            )
         except IndexError:
             raise ValueError(
                 f"Position for symbol '{symbol}' not found."
@@ -115,8 +125,11 @@ class Positions:
     # Get All Positions
     ############################################
     def get_all(
-        self, order_by: str = "profit_pct", order_asc: bool = False
-    ) -> pd.DataFrame:
+        self,
+        order_by: str = "profit_pct",
+        order_asc: bool = False,
+        output: str | None = None,
+    ) -> Any:
         """Retrieves all positions for the user's Alpaca account, including cash positions.
 
         The positions are returned as a pandas DataFrame, with the following columns:
@@ -141,7 +154,12 @@ class Positions:
         - asset_marginable: Whether the asset is marginable or not
 
         The positions are sorted based on the provided `order_by` parameter, in ascending or descending order based on the `order_asc` parameter.
+
+        The `output` parameter selects the returned format: "pandas", "polars", "arrow" or "numpy", defaulting to the client's output format.
         """
+        output = output or self.output
+        validate_output(output)
+
         sorting_list = [
             "profit_pct",
             "profit_dol",
@@ -180,9 +198,10 @@ class Positions:
 
         positions_df = self.modify_position_df(positions_df)
 
-        return positions_df.sort_values(by=order_by, ascending=order_asc).reset_index(
-            drop=True
-        )
+        positions_df = positions_df.sort_values(
+            by=order_by, ascending=order_asc
+        ).reset_index(drop=True)
+        return convert_frame(positions_df, output)
 
     ############################################
     # static Modify Positions DataFrame
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from py_alpaca_api.analytics import join_trades_quotes
+from py_alpaca_api.models.trade_model import TradeModel, trade_batch_from_dicts
+
+
+def _quotes(times: list[str], bids: list[float], asks: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "bid_price": bids,
+            "bid_size": [1] * len(bids),
+            "ask_price": asks,
+            "ask_size": [2] * len(asks),
+        },
+        index=pd.DatetimeIndex(pd.to_datetime(times, utc=True), name="timestamp"),
+    )
+
+
+def _trade(t: str, price: float, symbol: str = "AAPL") -> TradeModel:
+    return TradeModel(
+        timestamp=t,
+        symbol=symbol,
+        exchange="V",
+        price=price,
+        size=100,
+        conditions=["@"],
+        id=1,
+        tape="C",
+    )
+
+
+QUOTES = _quotes(
+    ["2024-01-02T14:30:00Z", "2024-01-02T14:30:02Z"],
+    [99.0, 100.0],
+    [101.0, 100.2],
+)
+
+
+class TestJoinTradesQuotes:
+    def test_matches_prevailing_quote(self):
+        trades = [
+            _trade("2024-01-02T14:29:59Z", 100.0),
+            _trade("2024-01-02T14:30:01Z", 100.5),
+            _trade("2024-01-02T14:30:02Z", 100.1),
+        ]
+        result = join_trades_quotes(trades, QUOTES)
+
+        assert np.isnan(result["bid_price"].iloc[0])
+        assert result["bid_price"].tolist()[1:] == [99.0, 100.0]
+        assert result["mid"].iloc[1] == pytest.approx(100.0)
+        assert result["effective_spread"].iloc[1] == pytest.approx(1.0)
+        assert result["effective_spread_bps"].iloc[1] == pytest.approx(100.0)
+        assert result["spread"].iloc[2] == pytest.approx(0.2)
+
+    def test_exact_matches_and_tolerance(self):
+        trades = [_trade("2024-01-02T14:30:02Z", 100.1)]
+
+        strict = join_trades_quotes(trades, QUOTES, allow_exact_matches=False)
+        assert strict["bid_price"].iloc[0] == 99.0
+
+        stale = join_trades_quotes(
+            trades, QUOTES, tolerance="1s", allow_exact_matches=False
+        )
+        assert np.isnan(stale["bid_price"].iloc[0])
+
+    def test_multiple_symbols_keep_trade_order(self):
+        quotes = {
+            "AAPL": QUOTES,
+            "MSFT": _quotes(["2024-01-02T14:30:00Z"], [400.0], [400.5]),
+        }
+        batch = trade_batch_from_dicts(
+            [
+                {"t": "2024-01-02T14:30:03Z", "p": 100.1, "s": 1, "i": 1},
+                {"t": "2024-01-02T14:30:01Z", "p": 100.5, "s": 1, "i": 2},
+            ],
+            "AAPL",
+        )
+        trades = pd.concat(
+            [
+                batch.to_pandas(),
+                pd.DataFrame(
+                    {
+                        "symbol": ["MSFT", "NVDA"],
+                        "timestamp": pd.to_datetime(
+                            ["2024-01-02T14:30:01", "2024-01-02T14:30:01"]
+                        ),
+                        "price": [400.25, 500.0],
+                    }
+                ),
+            ],
+            ignore_index=True,
+        )
+
+        result = join_trades_quotes(trades, quotes)
+
+        assert result["symbol"].tolist() == ["AAPL", "AAPL", "MSFT", "NVDA"]
+        assert result["bid_price"].tolist()[:3] == [100.0, 99.0, 400.0]
+        assert np.isnan(result["bid_price"].iloc[3])
+
+    def test_missing_quote_columns(self):
+        with pytest.raises(ValueError, match="missing"):
+            join_trades_quotes(
+                [_trade("2024-01-02T14:30:01Z", 100.0)], QUOTES.drop(columns="ask_size")
+            )
+
+    def test_many_interleaved_symbols_match_merge_asof(self):
+        rng = np.random.default_rng(0)
+        symbols = np.array([f"S{i}" for i in range(50)])
+        start = pd.Timestamp("2024-01-02T14:30:00Z")
+
+        def ticks(n):
+            return start + pd.to_timedelta(rng.integers(0, 60_000, n), unit="ms")
+
+        quotes = pd.DataFrame(
+            {
+                "symbol": rng.choice(symbols[:45], 2000),
+                "timestamp": ticks(2000),
+                "bid_price": rng.uniform(99, 100, 2000),
+                "bid_size": 1,
+                "ask_price": rng.uniform(100, 101, 2000),
+                "ask_size": 2,
+            }
+        )
+        trades = pd.DataFrame(
+            {
+                "symbol": rng.choice(symbols, 3000),
+                "timestamp": ticks(3000),
+                "price": rng.uniform(99, 101, 3000),
+            }
+        )
+
+        result = join_trades_quotes(trades, quotes)
+
+        expected = pd.merge_asof(
+            trades.reset_index().sort_values("timestamp"),
+            quotes.sort_values("timestamp", kind="stable"),
+            on="timestamp",
+            by="symbol",
+        ).set_index("index")
+        np.testing.assert_array_equal(
+            result["bid_price"].to_numpy(),
+            expected["bid_price"].reindex(trades.index).to_numpy(),
+        )
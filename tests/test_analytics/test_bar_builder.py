@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from py_alpaca_api.analytics import BarBuilder, build_bars, excluded_conditions
+from py_alpaca_api.analytics.conditions import has_condition
+
+
+def _trades(symbol: str = "AAPL") -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "timestamp": pd.to_datetime(
+                [
+                    "2024-01-02T14:30:01Z",
+                    "2024-01-02T14:30:20Z",
+                    "2024-01-02T14:30:40Z",
+                    "2024-01-02T14:31:05Z",
+                    "2024-01-02T14:31:30Z",
+                ]
+            ),
+            "price": [100.0, 101.0, 99.0, 102.0, 103.0],
+            "size": [100, 50, 300, 100, 50],
+            "conditions": [["@"], ["@", "I"], ["@"], None, ["@"]],
+        }
+    )
+
+
+class TestBuildBars:
+    def test_time_bars_skip_excluded_conditions_for_ohlc(self):
+        bars = build_bars(_trades(), "time", "1min")
+
+        assert len(bars) == 2
+        first = bars.iloc[0]
+        assert first["date"] == pd.Timestamp("2024-01-02 14:30:00")
+        assert (first["open"], first["high"], first["low"], first["close"]) == (
+            100.0,
+            100.0,
+            99.0,
+            99.0,
+        )
+        assert first["volume"] == 450  # The odd lot still counts towards volume
+        assert first["trade_count"] == 3
+        assert first["vwap"] == pytest.approx((100 * 100 + 99 * 300) / 400)
+
+    def test_time_bars_without_exclusions(self):
+        bars = build_bars(_trades(), "time", "1min", exclude_conditions=None)
+        assert bars["high"].iloc[0] == 101.0
+
+    def test_tick_volume_and_dollar_bars(self):
+        tick = build_bars(_trades(), "tick", 2)
+        assert tick["trade_count"].tolist() == [2, 2, 1]
+
+        volume = build_bars(_trades(), "volume", 150)
+        assert volume["volume"].tolist() == [150, 300, 150]
+
+        dollar = build_bars(_trades(), "dollar", 30_000)
+        assert dollar["trade_count"].tolist() == [3, 2]
+
+    def test_bars_never_span_symbols(self):
+        trades = pd.concat([_trades("MSFT"), _trades("AAPL")], ignore_index=True)
+        bars = build_bars(trades, "tick", 4)
+        assert bars["symbol"].tolist() == ["AAPL", "AAPL", "MSFT", "MSFT"]
+        assert bars["trade_count"].tolist() == [4, 1, 4, 1]
+
+    def test_invalid_kind(self):
+        with pytest.raises(ValueError, match="Invalid kind"):
+            build_bars(_trades(), "range", 1)
+
+
+class TestBarBuilder:
+    def test_incremental_matches_batch(self):
+        trades = _trades()
+        builder = BarBuilder("volume", 150)
+
+        chunks = [builder.update(trades.iloc[:2]), builder.update(trades.iloc[2:])]
+        chunks.append(builder.flush())
+        incremental = pd.concat(chunks, ignore_index=True)
+
+        pd.testing.assert_frame_equal(
+            incremental, build_bars(trades, "volume", 150), check_dtype=False
+        )
+
+    @pytest.mark.parametrize(
+        ("kind", "threshold"), [("tick", 4), ("volume", 100), ("dollar", 10_000)]
+    )
+    def test_split_feed_matches_single_call(self, kind, threshold):
+        timestamps = pd.date_range("2024-01-02 14:30", periods=10, freq="s")
+        trades = pd.concat(
+            [
+                pd.DataFrame(
+                    {
+                        "symbol": symbol,
+                        "timestamp": timestamps,
+                        "price": 100.0,
+                        "size": 60,
+                    }
+                )
+                for symbol in ("AAPL", "MSFT")
+            ]
+        ).sort_values("timestamp", kind="stable", ignore_index=True)
+        builder = BarBuilder(kind, threshold)
+
+        chunks = [builder.update(trades.iloc[:6]), builder.update(trades.iloc[6:])]
+        chunks.append(builder.flush())
+        incremental = pd.concat(chunks).sort_values(["symbol", "date"])
+
+        expected = build_bars(trades, kind, threshold)
+        if kind == "volume":
+            assert expected["volume"].tolist()[:6] == [120, 120, 60, 120, 120, 60]
+        pd.testing.assert_frame_equal(
+            incremental.reset_index(drop=True), expected, check_dtype=False
+        )
+
+
+class TestConditions:
+    def test_has_condition(self):
+        flags = has_condition([["@", "I"], ["@"], None, "@,W"], {"I", "W"})
+        np.testing.assert_array_equal(flags, [True, False, False, True])
+
+    def test_excluded_conditions_from_metadata(self, mocker):
+        metadata = mocker.Mock()
+        metadata.get_condition_codes.return_value = {
+            "@": "Regular Sale",
+            "I": "Odd Lot Trade",
+            "W": "Average Price Trade",
+        }
+        assert excluded_conditions(metadata, tapes=("A",)) == {"I", "W"}
+        metadata.get_condition_codes.assert_called_once_with(ticktype="trade", tape="A")
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.analytics import (
+    QUOTE_CONDITION_FLAGS,
+    condition_flags,
+    decode_exchanges,
+    decode_ticks,
+    explode_conditions,
+)
+from py_alpaca_api.models.trade_model import trade_batch_from_dicts
+
+EXCHANGES = {"V": "IEX", "Q": "NASDAQ OMX"}
+
+
+def _trades() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": "AAPL",
+            "price": [100.0, 101.0, 99.0, 102.0],
+            "exchange": ["V", "Q", "V", "Z"],
+            "conditions": [["@"], ["@", "I"], None, "@,T"],
+        }
+    )
+
+
+class TestConditionFlags:
+    def test_trade_flags(self):
+        flags = condition_flags(_trades()["conditions"])
+
+        np.testing.assert_array_equal(flags["is_odd_lot"], [False, True, False, False])
+        np.testing.assert_array_equal(
+            flags["is_extended_hours"], [False, False, False, True]
+        )
+        np.testing.assert_array_equal(flags["updates_last"], [True, False, True, False])
+
+    def test_sold_out_of_sequence_does_not_update_last(self):
+        flags = condition_flags(["@", "Z", "@,Z"])
+        np.testing.assert_array_equal(flags["updates_last"], [True, False, False])
+
+    def test_excluded_codes_override_updates_last(self):
+        flags = condition_flags(["@", "I", "X"], excluded={"X"})
+        np.testing.assert_array_equal(flags["updates_last"], [True, True, False])
+        np.testing.assert_array_equal(flags["is_odd_lot"], [False, True, False])
+
+    def test_custom_and_quote_flags(self):
+        flags = condition_flags(["R", "L", "RL"], QUOTE_CONDITION_FLAGS)
+        np.testing.assert_array_equal(flags["is_regular"], [True, False, True])
+        np.testing.assert_array_equal(flags["is_closed"], [False, True, True])
+
+    def test_empty(self):
+        assert len(condition_flags([])["is_odd_lot"]) == 0
+
+
+class TestDecoding:
+    def test_decode_exchanges(self):
+        names = decode_exchanges(["V", "Q", None, "Z"], EXCHANGES)
+        assert names.tolist() == ["IEX", "NASDAQ OMX", None, None]
+
+    def test_decode_ticks_frame(self):
+        frame = decode_ticks(_trades(), exchanges=EXCHANGES)
+
+        assert frame["is_odd_lot"].dtype == bool
+        assert frame["exchange_name"].iloc[:3].tolist() == ["IEX", "NASDAQ OMX", "IEX"]
+        assert pd.isna(frame["exchange_name"].iloc[3])
+        assert "is_odd_lot" not in _trades().columns
+
+    def test_decode_ticks_batch_with_metadata(self, mocker):
+        batch = trade_batch_from_dicts(
+            [
+                {"t": "2024-01-02T14:30:00Z", "x": "V", "p": 1.0, "s": 5, "c": ["I"]},
+                {"t": "2024-01-02T14:30:01Z", "x": "Q", "p": 1.0, "s": 500, "c": ["@"]},
+                {"t": "2024-01-02T14:30:02Z", "x": "Q", "p": 1.0, "s": 500, "c": ["X"]},
+            ],
+            "AAPL",
+        )
+        metadata = mocker.Mock()
+        metadata.get_exchange_codes.return_value = EXCHANGES
+        # X is not in the default set, but the metadata names it a cash sale
+        metadata.get_condition_codes.return_value = {
+            "@": "Regular Sale",
+            "I": "Odd Lot Trade",
+            "X": "Cash Sale",
+        }
+
+        frame = decode_ticks(batch, metadata=metadata)
+
+        assert frame["is_odd_lot"].tolist() == [True, False, False]
+        assert frame["updates_last"].tolist() == [False, True, False]
+        assert frame["exchange_name"].tolist() == ["IEX", "NASDAQ OMX", "NASDAQ OMX"]
+        metadata.get_exchange_codes.assert_called_once_with()
+
+    def test_explode_conditions(self):
+        exploded = explode_conditions(_trades())
+
+        assert exploded.index.tolist() == [0, 1, 1, 2, 3, 3]
+        assert exploded["condition"].dtype == "category"
+        assert exploded.groupby("condition", observed=True).size().to_dict() == {
+            "@": 3,
+            "I": 1,
+            "T": 1,
+        }
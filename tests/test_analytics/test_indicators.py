@@ -0,0 +1,253 @@
+"""Test cases for the vectorized technical indicators."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from py_alpaca_api.analytics.indicators import (
+    ATR,
+    EMA,
+    RSI,
+    SMA,
+    BollingerBands,
+    Indicator,
+    VWAPBands,
+    ZScore,
+    atr,
+    bollinger_bands,
+    ema,
+    rsi,
+    sma,
+    vwap_bands,
+    zscore,
+)
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.models.bar_panel_model import bar_panel_from_dict
+
+
+def _bars(symbol: str, periods: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, periods))
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "date": pd.date_range("2024-01-02", periods=periods, freq="D"),
+            "open": close + rng.normal(0, 0.5, periods),
+            "high": close + rng.uniform(0.5, 2, periods),
+            "low": close - rng.uniform(0.5, 2, periods),
+            "close": close,
+            "volume": rng.integers(100, 10000, periods),
+            "trade_count": rng.integers(10, 100, periods),
+            "vwap": close,
+        }
+    )
+
+
+@pytest.fixture
+def bars():
+    # Interleaved symbols of different lengths, as a long frame
+    frame = pd.concat([_bars("AAPL", 40, 1), _bars("MSFT", 25, 2)], ignore_index=True)
+    return frame.sample(frac=1, random_state=0)
+
+
+def _per_symbol(bars, func):
+    """Reference: applies a per-symbol function with a groupby loop."""
+    parts = [func(group.sort_values("date")) for _, group in bars.groupby("symbol")]
+    return pd.concat(parts).reindex(bars.index)
+
+
+def _reference_rsi(close: pd.Series, window: int) -> pd.Series:
+    change = close.diff().to_numpy()
+    out = np.full(len(close), np.nan)
+    gain = loss = 0.0
+    for i in range(1, len(close)):
+        up, down = max(change[i], 0), max(-change[i], 0)
+        if i < window:
+            gain, loss = gain + up, loss + down
+            continue
+        if i == window:
+            gain, loss = (gain + up) / window, (loss + down) / window
+        else:
+            gain = (gain * (window - 1) + up) / window
+            loss = (loss * (window - 1) + down) / window
+        out[i] = 100.0 if loss == 0 else 100 - 100 / (1 + gain / loss)
+    return pd.Series(out, index=close.index)
+
+
+def _reference_atr(group: pd.DataFrame, window: int) -> pd.Series:
+    previous = group["close"].shift()
+    true_range = np.maximum(
+        group["high"] - group["low"],
+        np.maximum((group["high"] - previous).abs(), (group["low"] - previous).abs()),
+    ).fillna(group["high"] - group["low"])
+    out = np.full(len(group), np.nan)
+    average = true_range.iloc[:window].mean()
+    out[window - 1] = average
+    for i in range(window, len(group)):
+        average = (average * (window - 1) + true_range.iloc[i]) / window
+        out[i] = average
+    return pd.Series(out, index=group.index)
+
+
+class TestLongFrames:
+    def test_sma_and_ema_match_per_symbol_pandas(self, bars):
+        expected_sma = _per_symbol(bars, lambda g: g["close"].rolling(10).mean())
+        expected_ema = _per_symbol(
+            bars, lambda g: g["close"].ewm(span=10, adjust=False).mean()
+        )
+
+        result = sma(bars, 10)
+
+        assert result.name == "sma_10"
+        pd.testing.assert_series_equal(result, expected_sma, check_names=False)
+        pd.testing.assert_series_equal(ema(bars, 10), expected_ema, check_names=False)
+
+    def test_bollinger_and_zscore_match_per_symbol_pandas(self, bars):
+        mean = _per_symbol(bars, lambda g: g["close"].rolling(20).mean())
+        std = _per_symbol(bars, lambda g: g["close"].rolling(20).std(ddof=0))
+
+        bands = bollinger_bands(bars, 20, num_std=2)
+
+        assert list(bands.columns) == [
+            "bollinger_20_middle",
+            "bollinger_20_upper",
+            "bollinger_20_lower",
+        ]
+        np.testing.assert_allclose(bands["bollinger_20_middle"], mean)
+        np.testing.assert_allclose(bands["bollinger_20_upper"], mean + 2 * std)
+        np.testing.assert_allclose(bands["bollinger_20_lower"], mean - 2 * std)
+        np.testing.assert_allclose(zscore(bars, 20), (bars["close"] - mean) / std)
+
+    def test_rsi_and_atr_match_wilder_references(self, bars):
+        expected_rsi = _per_symbol(bars, lambda g: _reference_rsi(g["close"], 14))
+        expected_atr = _per_symbol(bars, lambda g: _reference_atr(g, 14))
+
+        np.testing.assert_allclose(rsi(bars, 14), expected_rsi)
+        np.testing.assert_allclose(atr(bars, 14), expected_atr)
+
+    def test_vwap_bands_match_per_symbol_pandas(self, bars):
+        def reference(group):
+            typical = (group["high"] + group["low"] + group["close"]) / 3
+            volume = group["volume"]
+            vwap = (typical * volume).rolling(5).sum() / volume.rolling(5).sum()
+            second = (typical**2 * volume).rolling(5).sum() / volume.rolling(5).sum()
+            return pd.DataFrame(
+                {"vwap": vwap, "std": np.sqrt(second - vwap**2)}, index=group.index
+            )
+
+        expected = _per_symbol(bars, reference)
+
+        bands = vwap_bands(bars, 5, num_std=1.5)
+
+        np.testing.assert_allclose(bands["vwap_bands_5_vwap"], expected["vwap"])
+        np.testing.assert_allclose(
+            bands["vwap_bands_5_upper"], expected["vwap"] + 1.5 * expected["std"]
+        )
+
+    def test_rsi_without_losses_is_100(self):
+        bars = _bars("UP", 6, 0).assign(close=[1.0, 2, 3, 4, 5, 6])
+        assert rsi(bars, 3).tolist()[3:] == [100.0, 100.0, 100.0]
+
+
+class TestIncrementalUpdates:
+    @pytest.mark.parametrize(
+        "indicator",
+        [
+            lambda: SMA(10),
+            lambda: EMA(10),
+            lambda: RSI(14),
+            lambda: ATR(14),
+            lambda: BollingerBands(20),
+            lambda: VWAPBands(5),
+            lambda: ZScore(20),
+        ],
+    )
+    def test_appended_bars_match_full_recomputation(self, bars, indicator):
+        full = indicator().update(bars)
+
+        incremental = indicator()
+        cutoff = pd.Timestamp("2024-01-20")
+        head = bars[bars["date"] < cutoff]
+        # Later updates may bring new symbols and uneven numbers of bars
+        head = head[(head["symbol"] == "AAPL") | (head["date"] < "2024-01-10")]
+        tail = bars.drop(head.index)
+        result = pd.concat([incremental.update(head), incremental.update(tail)])
+
+        np.testing.assert_allclose(
+            pd.DataFrame(result).reindex(bars.index), pd.DataFrame(full)
+        )
+
+    def test_reset_forgets_state(self, bars):
+        indicator = SMA(3)
+        first = indicator.update(bars)
+        indicator.reset()
+        pd.testing.assert_series_equal(indicator.update(bars), first)
+
+
+class TestPanels:
+    def test_panel_frame_gaps_are_skipped(self):
+        frame = pd.DataFrame(
+            {
+                ("close", "AAPL"): [1.0, 2.0, np.nan, 3.0, 4.0],
+                ("close", "MSFT"): [10.0, 20.0, 30.0, 40.0, 50.0],
+            },
+            index=pd.date_range("2024-01-02", periods=5, name="date"),
+        )
+        frame.columns.names = ["field", "symbol"]
+
+        result = sma(frame, 2)
+
+        assert list(result.columns) == ["AAPL", "MSFT"]
+        np.testing.assert_array_equal(
+            result["AAPL"].to_numpy(), [np.nan, 1.5, np.nan, 2.5, 3.5]
+        )
+        np.testing.assert_array_equal(
+            result["MSFT"].to_numpy(), [np.nan, 15.0, 25.0, 35.0, 45.0]
+        )
+
+        bands = bollinger_bands(frame, 2)
+        assert list(bands.columns.get_level_values("field").unique()) == [
+            "middle",
+            "upper",
+            "lower",
+        ]
+        np.testing.assert_array_equal(bands["middle"], result)
+
+    def test_bar_panel_returns_arrays(self):
+        raw = {
+            "AAPL": [
+                {
+                    "t": f"2024-01-0{d}T05:00:00Z",
+                    "o": d,
+                    "h": d + 1,
+                    "l": d - 1,
+                    "c": d,
+                    "v": 100,
+                }
+                for d in range(2, 7)
+            ]
+        }
+        panel = bar_panel_from_dict(raw)
+
+        np.testing.assert_allclose(sma(panel, 3)[:, 0], [np.nan, np.nan, 3.0, 4.0, 5.0])
+        bands = vwap_bands(panel, 2)
+        assert set(bands) == {"vwap", "upper", "lower"}
+        assert bands["vwap"].shape == (5, 1)
+
+
+class TestValidation:
+    def test_invalid_window(self):
+        with pytest.raises(ValidationError, match="window must be at least 1"):
+            SMA(0)
+
+    def test_missing_field(self, bars):
+        with pytest.raises(ValidationError, match="Missing bar fields: high"):
+            atr(bars.drop(columns="high"))
+
+    def test_unsupported_data(self):
+        with pytest.raises(ValidationError, match="Expected a long frame"):
+            sma(pd.DataFrame({"close": [1.0]}))
+
+    def test_base_class_is_abstract(self):
+        with pytest.raises(TypeError, match="abstract"):
+            Indicator()  # type: ignore[abstract]
@@ -0,0 +1,174 @@
+"""Test cases for local bar resampling."""
+
+import datetime as dt
+import json
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from py_alpaca_api.analytics.resample import resample_bars
+from py_alpaca_api.stock.history import History
+
+
+def _minute_bars(symbol: str, start: str, periods: int, base: float = 100.0):
+    dates = pd.date_range(start, periods=periods, freq="1min")
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "date": dates,
+            "open": [base + i for i in range(periods)],
+            "high": [base + i + 0.5 for i in range(periods)],
+            "low": [base + i - 0.5 for i in range(periods)],
+            "close": [base + i + 0.25 for i in range(periods)],
+            "volume": [100 * (i + 1) for i in range(periods)],
+            "trade_count": [i + 1 for i in range(periods)],
+            "vwap": [base + i for i in range(periods)],
+        }
+    ).astype({"volume": "int", "trade_count": "int"})
+
+
+@pytest.fixture
+def calendar():
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+            "open": [dt.time(9, 30), dt.time(9, 30)],
+            "close": [dt.time(16, 0), dt.time(13, 0)],
+        }
+    )
+
+
+class TestResampleBars:
+    def test_five_minute_ohlc(self):
+        # 14:30 UTC is 09:30 New York time in January
+        bars = _minute_bars("AAPL", "2024-01-02 14:30", 10)
+
+        result = resample_bars(bars, "5m")
+
+        assert len(result) == 2
+        first = result.iloc[0]
+        assert first["date"] == pd.Timestamp("2024-01-02 14:30")
+        assert first["open"] == 100.0
+        assert first["high"] == 104.5
+        assert first["low"] == 99.5
+        assert first["close"] == 104.25
+        assert first["volume"] == 100 + 200 + 300 + 400 + 500
+        assert first["trade_count"] == 15
+        expected_vwap = sum((100 + i) * 100 * (i + 1) for i in range(5)) / 1500
+        assert first["vwap"] == pytest.approx(expected_vwap)
+        assert list(result.columns) == list(bars.columns)
+        assert result.dtypes.equals(bars.dtypes)
+
+    def test_clock_aligned_hour_buckets(self):
+        bars = _minute_bars("AAPL", "2024-01-02 14:30", 60)
+
+        result = resample_bars(bars, "1h")
+
+        # Buckets start on the hour, like the API's hourly bars
+        assert result["date"].tolist() == [
+            pd.Timestamp("2024-01-02 14:00"),
+            pd.Timestamp("2024-01-02 15:00"),
+        ]
+        assert result["volume"].sum() == bars["volume"].sum()
+
+    def test_session_origin_anchors_at_open(self, calendar):
+        bars = _minute_bars("AAPL", "2024-01-02 14:30", 60)
+
+        result = resample_bars(bars, "1h", calendar=calendar, origin="session")
+
+        assert len(result) == 1
+        assert result.iloc[0]["date"] == pd.Timestamp("2024-01-02 14:30")
+
+    def test_calendar_drops_bars_outside_session(self, calendar):
+        # 12:55-13:04 New York time on an early-close day
+        bars = _minute_bars("AAPL", "2024-01-03 17:55", 10)
+
+        result = resample_bars(bars, "15m", calendar=calendar)
+
+        assert len(result) == 1
+        assert result.iloc[0]["volume"] == sum(100 * (i + 1) for i in range(5))
+
+    def test_daily_bars_per_symbol_and_session(self, calendar):
+        bars = pd.concat(
+            [
+                _minute_bars("AAPL", "2024-01-02 14:30", 5),
+                _minute_bars("AAPL", "2024-01-03 14:30", 5, base=200.0),
+                _minute_bars("MSFT", "2024-01-02 14:30", 5, base=300.0),
+            ],
+            ignore_index=True,
+        )
+
+        result = resample_bars(bars, "1d", calendar=calendar)
+
+        assert result["symbol"].tolist() == ["AAPL", "AAPL", "MSFT"]
+        # Daily bars are stamped at midnight New York time, like the API
+        assert result["date"].tolist() == [
+            pd.Timestamp("2024-01-02 05:00"),
+            pd.Timestamp("2024-01-03 05:00"),
+            pd.Timestamp("2024-01-02 05:00"),
+        ]
+        assert result["open"].tolist() == [100.0, 200.0, 300.0]
+        assert result["close"].tolist() == [104.25, 204.25, 304.25]
+
+    def test_zero_volume_vwap_falls_back_to_close(self):
+        bars = _minute_bars("AAPL", "2024-01-02 14:30", 5)
+        bars["volume"] = 0
+
+        result = resample_bars(bars, "5m")
+
+        assert result.iloc[0]["vwap"] == result.iloc[0]["close"]
+
+    def test_invalid_arguments(self):
+        bars = _minute_bars("AAPL", "2024-01-02 14:30", 5)
+        with pytest.raises(ValueError, match="Invalid timeframe"):
+            resample_bars(bars, "2m")
+        with pytest.raises(ValueError, match="calendar is required"):
+            resample_bars(bars, "5m", origin="session")
+
+
+class TestGetStockDataTimeframes:
+    def test_downloads_base_once(self, mocker, calendar):
+        market = mocker.Mock()
+        market.calendar.return_value = calendar
+        history = History(
+            headers={"Authorization": "Bearer TEST"},
+            data_url="https://data.alpaca.markets/v2",
+            asset=mocker.Mock(),
+            market=market,
+        )
+        mocker.patch.object(history, "check_if_stock")
+        bars = [
+            {
+                "t": f"2024-01-02T14:{30 + i}:00Z",
+                "o": 100 + i,
+                "h": 101 + i,
+                "l": 99 + i,
+                "c": 100 + i,
+                "v": 100,
+                "n": 1,
+                "vw": 100 + i,
+            }
+            for i in range(10)
+        ]
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(text=json.dumps({"bars": bars}))
+
+        result = history.get_stock_data_timeframes(
+            "AAPL", "2024-01-02", "2024-01-03", timeframes=["1m", "5m", "1d"]
+        )
+
+        assert mock_request.call_count == 1
+        assert len(result["1m"]) == 10
+        assert len(result["5m"]) == 2
+        assert len(result["1d"]) == 1
+        assert result["1d"].iloc[0]["volume"] == 1000
+
+    def test_rejects_finer_timeframe(self, mocker):
+        history = History(
+            headers={}, data_url="https://data.alpaca.markets/v2", asset=mocker.Mock()
+        )
+        with pytest.raises(ValueError, match="finer than the base"):
+            history.get_stock_data_timeframes(
+                "AAPL", "2024-01-02", "2024-01-03", ["1m"], base_timeframe="5m"
+            )
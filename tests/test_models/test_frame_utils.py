@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from py_alpaca_api.models.frame_utils import (
+    compact_bars,
+    compact_quotes,
+    downcast_float,
+    downcast_int,
+    format_timestamp,
+)
+
+
+def test_downcast_float_keeps_precise_values():
+    values = np.array([185.75, 0.1234, np.nan])
+    result = downcast_float(values)
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, values, atol=1e-4)
+
+
+def test_downcast_float_rejects_lossy_values():
+    values = np.array([123456789.123])
+    assert downcast_float(values).dtype == np.float64
+
+
+def test_downcast_int_checks_range():
+    assert downcast_int(np.array([1, 2, 3])).dtype == np.int32
+    assert downcast_int(np.array([2**40])).dtype == np.int64
+
+
+def test_compact_bars():
+    df = pd.DataFrame(
+        {
+            "symbol": ["AAPL", "AAPL", "MSFT"],
+            "date": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-02"]),
+            "close": [185.75, 186.5, 400.25],
+            "volume": [1000, 2000, 3000],
+        }
+    )
+    result = compact_bars(df)
+
+    assert isinstance(result["symbol"].dtype, pd.CategoricalDtype)
+    assert result["close"].dtype == np.float32
+    assert result["volume"].dtype == np.int32
+    assert result["date"].dtype == df["date"].dtype
+    assert df["close"].dtype == np.float64  # Input is left untouched
+
+
+def test_compact_quotes_joins_conditions():
+    df = pd.DataFrame(
+        {
+            "ask_exchange": ["Q", "Q"],
+            "ask_price": [100.5, 100.25],
+            "ask_size": [2, 3],
+            "conditions": [["R"], ["R", "Y"]],
+            "tape": ["C", "C"],
+        }
+    )
+    result = compact_quotes(df)
+
+    assert result["conditions"].tolist() == ["R", "R,Y"]
+    for name in ("ask_exchange", "conditions", "tape"):
+        assert isinstance(result[name].dtype, pd.CategoricalDtype)
+    assert result["ask_size"].dtype == np.int32
+
+
+def test_format_timestamp_trims_fraction():
+    assert format_timestamp(np.datetime64("2024-01-02T14:30:00", "ns")) == (
+        "2024-01-02T14:30:00Z"
+    )
+    assert format_timestamp(np.datetime64("2024-01-02T14:30:00.123400", "ns")) == (
+        "2024-01-02T14:30:00.1234Z"
+    )
@@ -0,0 +1,173 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from py_alpaca_api.exceptions import APIRequestError
+from py_alpaca_api.stock.asset_universe import AssetUniverse
+
+
+def _asset(symbol: str, **overrides) -> dict:
+    asset = {
+        "id": f"id-{symbol}",
+        "class": "us_equity",
+        "exchange": "NASDAQ",
+        "symbol": symbol,
+        "name": symbol,
+        "status": "active",
+        "tradable": True,
+        "marginable": True,
+        "shortable": True,
+        "easy_to_borrow": True,
+        "fractionable": True,
+        "maintenance_margin_requirement": 30,
+    }
+    asset.update(overrides)
+    return asset
+
+
+ASSETS = [
+    _asset("AAPL"),
+    _asset("IBM", exchange="NYSE", shortable=False),
+    _asset("PINK", exchange="OTC"),
+    _asset("GONE", status="inactive", tradable=False),
+    _asset("WHOLE", fractionable=False),
+]
+
+
+def _response(payload=None, status_code=200, etag=None):
+    response = MagicMock(status_code=status_code, text=json.dumps(payload))
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+@pytest.fixture
+def request_mock(mocker):
+    return mocker.patch(
+        "py_alpaca_api.http.requests.Requests.request",
+        return_value=_response(ASSETS),
+    )
+
+
+class TestLookups:
+    def test_loads_once_and_indexes_symbols_and_ids(self, request_mock):
+        universe = AssetUniverse("https://api", headers={})
+
+        assert universe.get("aapl")["id"] == "id-AAPL"
+        assert universe.get_by_id("id-IBM")["symbol"] == "IBM"
+        assert universe.get("NOPE") is None
+        assert "IBM" in universe
+        assert len(universe) == 5
+        assert universe.missing(["AAPL", "NOPE", "msft"]) == ["NOPE", "msft"]
+        assert request_mock.call_count == 1
+        assert request_mock.call_args.kwargs["params"] == {"asset_class": "us_equity"}
+
+    def test_refreshes_after_ttl(self, request_mock, mocker):
+        clock = mocker.patch(
+            "py_alpaca_api.stock.asset_universe.time.time", return_value=1000.0
+        )
+        universe = AssetUniverse("https://api", headers={}, ttl=60)
+
+        universe.load()
+        clock.return_value = 1059.0
+        universe.load()
+        assert request_mock.call_count == 1
+
+        clock.return_value = 1060.0
+        universe.load()
+        assert request_mock.call_count == 2
+
+    def test_request_errors_propagate(self, mocker):
+        mocker.patch(
+            "py_alpaca_api.http.requests.Requests.request",
+            side_effect=APIRequestError(500, "Server Error"),
+        )
+        with pytest.raises(APIRequestError):
+            AssetUniverse("https://api", headers={}).get("AAPL")
+
+
+class TestFilters:
+    def test_mask_combines_status_exchanges_and_flags(self, request_mock):
+        universe = AssetUniverse("https://api", headers={})
+
+        assert universe.symbols() == ["AAPL", "IBM", "PINK", "WHOLE"]
+        assert universe.symbols(status=None, tradable=False) == ["GONE"]
+        assert universe.symbols(
+            excluded_exchanges=["OTC"], fractionable=True, tradable=True
+        ) == ["AAPL", "IBM"]
+        assert universe.symbols(exchanges=["NYSE"]) == ["IBM"]
+        assert universe.symbols(shortable=True, fractionable=True) == ["AAPL", "PINK"]
+
+    def test_unknown_flag_raises(self, request_mock):
+        with pytest.raises(ValueError, match="Unknown asset flag"):
+            AssetUniverse("https://api", headers={}).mask(listed=True)
+
+    def test_frame_is_typed_and_built_once(self, request_mock):
+        universe = AssetUniverse("https://api", headers={})
+
+        frame = universe.frame(exchanges=["NASDAQ", "OTC"], fractionable=True)
+
+        assert frame["symbol"].tolist() == ["AAPL", "PINK"]
+        assert frame.dtypes["symbol"] == "string"
+        assert frame.dtypes["maintenance_margin_requirement"] == "float"
+        cached = universe._frame
+        universe.frame(status=None)
+        assert universe._frame is cached
+
+
+class TestRevalidation:
+    def test_not_modified_keeps_the_list(self, mocker):
+        request = mocker.patch(
+            "py_alpaca_api.http.requests.Requests.request",
+            side_effect=[
+                _response(ASSETS, etag='"v1"'),
+                _response(status_code=304),
+                _response([_asset("NEW")], etag='"v2"'),
+            ],
+        )
+        universe = AssetUniverse("https://api", headers={"key": "k"})
+
+        universe.load()
+        universe.load(refresh=True)
+        assert len(universe) == 5
+        kwargs = request.call_args.kwargs
+        assert kwargs["headers"] == {"key": "k", "If-None-Match": '"v1"'}
+        assert kwargs["raw_response"] is True
+
+        universe.load(refresh=True)
+        assert universe.symbols() == ["NEW"]
+
+    def test_revalidation_errors_raise(self, mocker):
+        mocker.patch(
+            "py_alpaca_api.http.requests.Requests.request",
+            side_effect=[
+                _response(ASSETS, etag='"v1"'),
+                _response("Server Error", status_code=500),
+            ],
+        )
+        universe = AssetUniverse("https://api", headers={})
+        universe.load()
+
+        with pytest.raises(APIRequestError):
+            universe.load(refresh=True)
+
+
+class TestPersistence:
+    def test_fresh_cache_file_skips_the_request(self, request_mock, tmp_path):
+        path = tmp_path / "assets.json"
+        AssetUniverse("https://api", headers={}, cache_path=path).load()
+        assert request_mock.call_count == 1
+
+        universe = AssetUniverse("https://api", headers={}, cache_path=path)
+        assert universe.symbols(exchanges=["NYSE"]) == ["IBM"]
+        assert request_mock.call_count == 1
+
+    def test_stale_or_corrupt_cache_file_is_refetched(self, request_mock, tmp_path):
+        path = tmp_path / "assets.json"
+        path.write_text(json.dumps({"loaded_at": 0, "etag": None, "assets": []}))
+        assert len(AssetUniverse("https://api", headers={}, cache_path=path)) == 5
+
+        path.write_text("{not json")
+        assert len(AssetUniverse("https://api", headers={}, cache_path=path)) == 5
+        assert request_mock.call_count == 2
+        assert len(json.loads(path.read_text())["assets"]) == 5
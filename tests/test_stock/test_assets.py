@@ -64,49 +64,99 @@ def test_get_asset_attributes(alpaca):
     assert isinstance(asset.tradable, bool)
 
 
-def test_get_asset_successful(assets_obj):
+def _response(status_code, payload):
     mock_response = Mock()
-    mock_response.text = json.dumps(
-        {
-            "id": "asset_id",
-            "symbol": "AAPL",
-            "easy_to_borrow": True,
-            "fractionable": True,
-            "maintenance_margin_requirement": 0.25,
-            "marginable": True,
-            "name": "Apple Inc.",
-            "shortable": True,
-            "status": "active",
-            "tradable": True,
-            "class": "us_equity",
-            "exchange": "NASDAQ",
-        }
-    )
-    mock_response.status_code = 200
-    with patch.object(Requests, "request", return_value=mock_response):
+    mock_response.status_code = status_code
+    mock_response.text = payload if isinstance(payload, str) else json.dumps(payload)
+    return mock_response
+
+
+def test_get_asset_successful(assets_obj):
+    asset_data = {
+        "id": "asset_id",
+        "symbol": "AAPL",
+        "easy_to_borrow": True,
+        "fractionable": True,
+        "maintenance_margin_requirement": 0.25,
+        "marginable": True,
+        "name": "Apple Inc.",
+        "shortable": True,
+        "status": "active",
+        "tradable": True,
+        "class": "us_equity",
+        "exchange": "NASDAQ",
+    }
+    with patch.object(
+        Requests, "request", return_value=_response(200, asset_data)
+    ) as mock_req:
         asset = assets_obj.get("AAPL")
         assert isinstance(asset, AssetModel)
         assert asset.id == "asset_id"
         assert asset.symbol == "AAPL"
+        # A cold universe is not downloaded for a single lookup
+        assert mock_req.call_args.args[1].endswith("/assets/AAPL")
+
+    with patch.object(
+        Requests, "request", return_value=_response(200, [asset_data])
+    ) as mock_req:
+        assets_obj.get_symbol_index()
+        assert assets_obj.get("aapl").id == "asset_id"
+        # Once the universe is loaded, lookups are answered from it
+        assert mock_req.call_count == 1
 
 
 def test_get_asset_not_found(assets_obj):
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_response.text = "Not Found"
+    def request(method, url, **kwargs):
+        if url.endswith("/assets"):
+            return _response(200, [])
+        return _response(404, "Not Found")
+
     with (
-        patch.object(Requests, "request", return_value=mock_response),
+        patch.object(Requests, "request", side_effect=request),
         pytest.raises(APIRequestError),
     ):
         assets_obj.get("INVALID")
 
 
 def test_get_asset_server_error(assets_obj):
-    mock_response = Mock()
-    mock_response.status_code = 500
-    mock_response.text = "Internal Server Error"
+    def request(method, url, **kwargs):
+        if url.endswith("/assets"):
+            return _response(200, [])
+        return _response(500, "Internal Server Error")
+
     with (
-        patch.object(Requests, "request", return_value=mock_response),
+        patch.object(Requests, "request", side_effect=request),
         pytest.raises(APIRequestError),
     ):
         assets_obj.get("AAPL")
+
+
+def test_get_symbols(assets_obj):
+    listed = [
+        {"symbol": "AAPL", "class": "us_equity", "exchange": "NASDAQ"},
+        {"symbol": "PINK", "class": "us_equity", "exchange": "OTC"},
+    ]
+    for asset in listed:
+        asset.update(status="active", tradable=True, fractionable=True)
+    with patch.object(Requests, "request", return_value=_response(200, listed)):
+        assert assets_obj.get_symbols() == ["AAPL"]
+        assert assets_obj.get_symbols(excluded_exchanges=[]) == ["AAPL", "PINK"]
+
+
+def test_get_symbol_index_is_cached(assets_obj):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.text = json.dumps(
+        [
+            {"symbol": "AAPL", "class": "us_equity"},
+            {"symbol": "MSFT", "class": "us_equity"},
+        ]
+    )
+    with patch.object(Requests, "request", return_value=mock_response) as mock_req:
+        index = assets_obj.get_symbol_index()
+        assets_obj.get_symbol_index()
+        assert set(index) == {"AAPL", "MSFT"}
+        assert mock_req.call_count == 1
+
+        assets_obj.get_symbol_index(refresh=True)
+        assert mock_req.call_count == 2
@@ -64,7 +64,7 @@ class TestBatchOperations:
         mock_requests.return_value.request.return_value = mock_response
 
         # Mock the asset check
-        with patch.object(alpaca.stock.history, "check_if_stock", return_value=None):
+        with patch.object(alpaca.stock.history, "check_if_stocks", return_value=None):
             # Test multiple symbols
             symbols = ["AAPL", "GOOGL"]
             df = alpaca.stock.history.get_stock_data(
@@ -125,7 +125,7 @@ class TestBatchOperations:
 
         # Mock the batching method directly since it uses ThreadPoolExecutor
         with (
-            patch.object(alpaca.stock.history, "check_if_stock", return_value=None),
+            patch.object(alpaca.stock.history, "check_if_stocks", return_value=None),
             patch.object(alpaca.stock.history, "_get_batched_stock_data") as mock_batch,
         ):
             # Return a simple DataFrame for testing
@@ -297,7 +297,7 @@ class TestBatchOperations:
 
         # Should continue despite one batch failing
         with (
-            patch.object(alpaca.stock.history, "check_if_stock", return_value=None),
+            patch.object(alpaca.stock.history, "check_if_stocks", return_value=None),
             patch.object(alpaca.stock.history, "_get_batched_stock_data") as mock_batch,
         ):
             # Simulate partial failure - return DataFrame with some data
@@ -321,6 +321,29 @@ class TestBatchOperations:
             # Should return partial data
             assert not df.empty
 
+    def test_history_failed_batch_raises(self, alpaca, mock_requests):
+        """Test that a failed batch raises instead of returning partial data."""
+        symbols = [f"STOCK{i:03d}" for i in range(250)]
+        success_response = MagicMock()
+        success_response.text = """{
+            "bars": {
+                "STOCK000": [{"t": "2024-01-01T09:30:00Z", "o": 100, "h": 105, "l": 99, "c": 103, "v": 1000000, "n": 500, "vw": 102.5}]
+            }
+        }"""
+
+        def request(method, url, headers, params):
+            if "STOCK200" in params["symbols"]:
+                raise Exception("API Error")
+            return success_response
+
+        mock_requests.return_value.request.side_effect = request
+
+        with (
+            patch.object(alpaca.stock.history, "check_if_stocks", return_value=None),
+            pytest.raises(Exception, match="API Error"),
+        ):
+            alpaca.stock.history.get_stock_data(symbols, "2024-01-01", "2024-01-02")
+
     def test_quote_concurrent_batch_error_handling(self, alpaca, mock_quotes_requests):
         """Test error handling in concurrent batch requests for quotes."""
         # Create a list of 250 symbols
@@ -378,7 +401,7 @@ class TestBatchOperations:
         }"""
         mock_requests.return_value.request.return_value = mock_response
 
-        with patch.object(alpaca.stock.history, "check_if_stock", return_value=None):
+        with patch.object(alpaca.stock.history, "check_if_stocks", return_value=None):
             # Test DataFrame is properly sorted and indexed
             df = alpaca.stock.history.get_stock_data(
                 ["AAPL", "GOOGL"], "2024-01-01", "2024-01-02"
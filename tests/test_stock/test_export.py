@@ -0,0 +1,164 @@
+"""Test cases for streaming exports to Parquet and Feather files."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.stock.history import History
+from py_alpaca_api.stock.quotes import Quotes
+from py_alpaca_api.stock.trades import Trades
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _bar(t: str, close: float) -> dict:
+    return {
+        "t": t,
+        "o": close,
+        "h": close,
+        "l": close,
+        "c": close,
+        "v": 100,
+        "n": 1,
+        "vw": close,
+    }
+
+
+def _trade(i: int) -> dict:
+    return {
+        "t": f"2024-01-02T14:30:0{i}Z",
+        "x": "V",
+        "p": 100.0 + i,
+        "s": 10,
+        "c": ["@"],
+        "i": i,
+        "z": "C",
+    }
+
+
+@pytest.fixture
+def history():
+    return History(
+        data_url="https://data.alpaca.markets/v2",
+        headers={"Authorization": "Bearer TEST"},
+        asset=MagicMock(),
+    )
+
+
+class TestHistoryExport:
+    def test_parquet_row_group_per_page(self, history, mocker, tmp_path):
+        pages = [
+            {
+                "bars": {"AAPL": [_bar("2024-01-02T05:00:00Z", 100)]},
+                "next_page_token": "next",
+            },
+            {
+                "bars": {
+                    "AAPL": [_bar("2024-01-03T05:00:00Z", 101)],
+                    "MSFT": [_bar("2024-01-03T05:00:00Z", 300)],
+                },
+                "next_page_token": None,
+            },
+        ]
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.side_effect = [MagicMock(text=json.dumps(p)) for p in pages]
+
+        path = tmp_path / "bars.parquet"
+        rows = history.export_to(
+            path, ["AAPL", "MSFT"], "2024-01-01", "2024-01-05", validate=False
+        )
+
+        assert rows == 3
+        parquet = pq.ParquetFile(path)
+        assert parquet.metadata.num_row_groups == 2
+        table = parquet.read()
+        assert table.column("symbol").to_pylist() == ["AAPL", "AAPL", "MSFT"]
+        assert table.schema.field("date").type == pa.timestamp("ns")
+        assert table.schema.field("volume").type == pa.int64()
+
+    def test_invalid_format_fails_before_any_request(self, history, mocker, tmp_path):
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        exports = [
+            lambda: history.export_to(
+                tmp_path / "bars.csv", "AAPL", "2024-01-01", "2024-01-05", format="csv"
+            ),
+            lambda: Quotes(headers={}).export_to(
+                tmp_path / "quotes.csv",
+                "AAPL",
+                "2024-01-01",
+                "2024-01-05",
+                format="csv",
+            ),
+            lambda: Trades(headers={}).export_to(
+                tmp_path / "trades.csv",
+                "AAPL",
+                "2024-01-01",
+                "2024-01-05",
+                format="csv",
+            ),
+        ]
+
+        for export in exports:
+            with pytest.raises(ValidationError, match="Invalid format"):
+                export()
+
+        # The symbols are not validated and nothing is downloaded
+        assert not history.asset.mock_calls
+        mock_request.assert_not_called()
+
+
+class TestQuotesExport:
+    def test_feather(self, mocker, tmp_path):
+        response = {
+            "quotes": [
+                {
+                    "t": "2024-01-02T14:30:00Z",
+                    "ax": "Q",
+                    "ap": 100.5,
+                    "as": 2,
+                    "bx": "P",
+                    "bp": 100.0,
+                    "bs": 3,
+                    "c": ["R"],
+                    "z": "C",
+                }
+            ]
+        }
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(text=json.dumps(response))
+
+        path = tmp_path / "quotes.feather"
+        rows = Quotes(headers={}).export_to(
+            path, "AAPL", "2024-01-02", "2024-01-03", format="feather"
+        )
+
+        assert rows == 1
+        table = pa.ipc.open_file(path).read_all()
+        assert table.column("symbol").to_pylist() == ["AAPL"]
+        assert table.column("conditions").to_pylist() == [["R"]]
+
+
+class TestTradesExport:
+    def test_parquet_pages(self, mocker, tmp_path):
+        pages = [
+            {"trades": [_trade(1), _trade(2)], "next_page_token": "next"},
+            {"trades": [_trade(3)], "next_page_token": None},
+        ]
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.side_effect = [
+            MagicMock(status_code=200, text=json.dumps(p)) for p in pages
+        ]
+
+        path = tmp_path / "trades.parquet"
+        rows = Trades(headers={}).export_to(
+            path, "AAPL", "2024-01-02T14:00:00Z", "2024-01-02T15:00:00Z"
+        )
+
+        assert rows == 3
+        table = pq.read_table(path)
+        assert table.column("id").to_pylist() == [1, 2, 3]
+        assert table.column("price").to_pylist() == [101.0, 102.0, 103.0]
+        assert mock_request.call_args_list[1][1]["params"]["page_token"] == "next"
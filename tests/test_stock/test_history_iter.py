@@ -0,0 +1,140 @@
+"""Test cases for page-by-page iteration of historical data."""
+
+import json
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from py_alpaca_api.stock.history import History
+
+
+def _bar(t: str, close: float) -> dict:
+    return {
+        "t": t,
+        "o": close,
+        "h": close + 1,
+        "l": close - 1,
+        "c": close,
+        "v": 1000,
+        "n": 10,
+        "vw": close,
+    }
+
+
+class TestIterStockData:
+    """Test suite for History.iter_stock_data."""
+
+    @pytest.fixture
+    def history(self, mocker):
+        mock_asset = mocker.Mock()
+        mock_asset.get.return_value = mocker.Mock(asset_class="us_equity")
+        mock_asset.get_symbol_index.return_value = {
+            "AAPL": {"symbol": "AAPL", "class": "us_equity"},
+            "MSFT": {"symbol": "MSFT", "class": "us_equity"},
+        }
+        return History(
+            headers={"Authorization": "Bearer TEST"},
+            data_url="https://data.alpaca.markets/v2",
+            asset=mock_asset,
+        )
+
+    def test_single_symbol_yields_each_page(self, history, mocker):
+        pages = [
+            {"bars": [_bar("2024-01-02T05:00:00Z", 100)], "next_page_token": "p2"},
+            {"bars": [_bar("2024-01-03T05:00:00Z", 101)], "next_page_token": None},
+        ]
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.side_effect = [MagicMock(text=json.dumps(p)) for p in pages]
+
+        iterator = history.iter_stock_data("AAPL", "2024-01-01", "2024-01-05")
+        first = next(iterator)
+
+        # Only the first page has been requested so far
+        assert mock_request.call_count == 1
+        assert isinstance(first, pd.DataFrame)
+        assert first["close"].tolist() == [100.0]
+
+        rest = list(iterator)
+        assert len(rest) == 1
+        assert rest[0]["close"].tolist() == [101.0]
+        assert mock_request.call_args[1]["params"]["page_token"] == "p2"
+
+    def test_multi_symbol_pages(self, history, mocker):
+        pages = [
+            {
+                "bars": {
+                    "AAPL": [_bar("2024-01-02T05:00:00Z", 100)],
+                    "MSFT": [_bar("2024-01-02T05:00:00Z", 300)],
+                },
+                "next_page_token": "p2",
+            },
+            {
+                "bars": {"MSFT": [_bar("2024-01-03T05:00:00Z", 301)]},
+                "next_page_token": None,
+            },
+        ]
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.side_effect = [MagicMock(text=json.dumps(p)) for p in pages]
+
+        frames = list(
+            history.iter_stock_data(["AAPL", "MSFT"], "2024-01-01", "2024-01-05")
+        )
+
+        assert len(frames) == 2
+        assert set(frames[0]["symbol"]) == {"AAPL", "MSFT"}
+        assert frames[1]["symbol"].tolist() == ["MSFT"]
+
+    def test_no_data_raises(self, history, mocker):
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(text=json.dumps({"bars": None}))
+
+        with pytest.raises(Exception, match="No historical data found"):
+            list(history.iter_stock_data("AAPL", "2024-01-01", "2024-01-05"))
+
+    def test_invalid_timeframe(self, history):
+        with pytest.raises(ValueError, match="Invalid timeframe"):
+            list(
+                history.iter_stock_data(
+                    "AAPL", "2024-01-01", "2024-01-05", timeframe="2d"
+                )
+            )
+
+
+class TestCheckIfStocks:
+    """Test suite for batched symbol validation."""
+
+    @pytest.fixture
+    def history(self, mocker):
+        mock_asset = mocker.Mock()
+        mock_asset.get_symbol_index.return_value = {
+            f"SYM{i}": {"symbol": f"SYM{i}", "class": "us_equity"} for i in range(500)
+        }
+        return History(
+            headers={"Authorization": "Bearer TEST"},
+            data_url="https://data.alpaca.markets/v2",
+            asset=mock_asset,
+        )
+
+    def test_large_batch_uses_index_only(self, history):
+        history.check_if_stocks([f"SYM{i}" for i in range(500)])
+
+        history.asset.get_symbol_index.assert_called_once()
+        history.asset.get.assert_not_called()
+
+    def test_invalid_symbols_are_reported(self, history):
+        with pytest.raises(ValueError, match="Not found or not a stock: NOPE"):
+            history.check_if_stocks(["SYM1", "NOPE"])
+
+    def test_validate_false_skips_check(self, history, mocker):
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(
+            text=json.dumps({"bars": {"NOPE": [_bar("2024-01-02T05:00:00Z", 1)]}})
+        )
+
+        df = history.get_stock_data(
+            ["NOPE", "SYM1"], "2024-01-01", "2024-01-05", validate=False
+        )
+
+        assert df["symbol"].tolist() == ["NOPE"]
+        history.asset.get_symbol_index.assert_not_called()
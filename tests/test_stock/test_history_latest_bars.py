@@ -19,6 +19,10 @@ class TestLatestBars:
         mock_asset.get.return_value = mocker.Mock(
             tradable=True, asset_class="us_equity"
         )
+        mock_asset.get_symbol_index.return_value = {
+            "AAPL": {"symbol": "AAPL", "class": "us_equity"},
+            "MSFT": {"symbol": "MSFT", "class": "us_equity"},
+        }
 
         history = History(
             headers={"Authorization": "Bearer TEST"},
@@ -244,3 +248,17 @@ class TestLatestBars:
         original_columns = ["o", "h", "l", "c", "v", "n", "vw"]
         for col in original_columns:
             assert col not in result.columns
+
+    def test_get_latest_bars_raw(self, mock_history, mocker):
+        """Test getting the raw bar dicts without building DataFrames."""
+        bar = {"t": "2024-01-10T15:59:00Z", "o": 185.50, "c": 185.75, "v": 1000}
+        mock_response = {"bars": {"AAPL": bar, "MSFT": None}}
+
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(text=json.dumps(mock_response))
+
+        result = mock_history.get_latest_bars_raw(["aapl", "msft"], feed="sip")
+
+        assert result == {"AAPL": bar}
+        assert mock_request.call_args[1]["params"]["symbols"] == "AAPL,MSFT"
+        assert mock_request.call_args[1]["params"]["feed"] == "sip"
@@ -0,0 +1,167 @@
+"""Test cases for wide panel output of historical data."""
+
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.models.bar_panel_model import (
+    BarPanel,
+    bar_panel_from_dict,
+    session_index,
+)
+from py_alpaca_api.stock.history import History
+
+
+def _bar(t: str, close: float) -> dict:
+    return {
+        "t": t,
+        "o": close - 1,
+        "h": close + 1,
+        "l": close - 2,
+        "c": close,
+        "v": 1000,
+        "n": 10,
+        "vw": close,
+    }
+
+
+SYMBOLS_DATA = {
+    "MSFT": [_bar("2024-01-02T05:00:00Z", 300), _bar("2024-01-04T05:00:00Z", 302)],
+    "AAPL": [
+        _bar("2024-01-02T05:00:00Z", 100),
+        _bar("2024-01-03T05:00:00Z", 101),
+        _bar("2024-01-04T05:00:00Z", 102),
+    ],
+}
+
+
+def _calendar(dates: list[str]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(dates),
+            "open": pd.to_datetime(["09:30"] * len(dates)).time,
+            "close": pd.to_datetime(["16:00"] * len(dates)).time,
+        }
+    )
+
+
+class TestBarPanelFromDict:
+    def test_aligns_on_shared_index(self):
+        panel = bar_panel_from_dict(SYMBOLS_DATA, symbols=["AAPL", "MSFT", "NODATA"])
+
+        assert panel.shape == (3, 3)
+        assert list(panel.index) == list(
+            pd.to_datetime(["2024-01-02 05:00", "2024-01-03 05:00", "2024-01-04 05:00"])
+        )
+        np.testing.assert_array_equal(panel["close"][:, 0], [100.0, 101.0, 102.0])
+        np.testing.assert_array_equal(panel["close"][:, 1], [300.0, np.nan, 302.0])
+        assert np.isnan(panel["close"][:, 2]).all()
+
+    def test_explicit_index_drops_other_dates(self):
+        index = pd.DatetimeIndex(
+            pd.to_datetime(["2024-01-03 05:00", "2024-01-04 05:00"])
+        )
+
+        panel = bar_panel_from_dict(SYMBOLS_DATA, index=index)
+
+        assert panel.symbols == ["MSFT", "AAPL"]
+        np.testing.assert_array_equal(panel["close"][:, 0], [np.nan, 302.0])
+        np.testing.assert_array_equal(panel["close"][:, 1], [101.0, 102.0])
+
+    def test_calendar_dates_match_daily_bars_by_session(self):
+        calendar = _calendar(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"])
+        # Daily bars are stamped at midnight New York time: 05:00 UTC in winter
+        # and 04:00 UTC in summer
+        data = {
+            **SYMBOLS_DATA,
+            "SPY": [_bar("2024-01-05T05:00:00Z", 470), _bar("2024-07-01T04:00:00Z", 1)],
+        }
+
+        panel = bar_panel_from_dict(data, index=session_index(calendar))
+
+        assert list(panel.index) == list(calendar["date"])
+        np.testing.assert_array_equal(
+            panel["close"][:, 1], [100.0, 101.0, 102.0, np.nan]
+        )
+        np.testing.assert_array_equal(
+            panel["close"][:, 2], [np.nan, np.nan, np.nan, 470.0]
+        )
+
+    def test_session_opens_match_by_session_date(self):
+        calendar = _calendar(["2024-01-02", "2024-01-03"])
+        index = session_index(calendar, anchor="open")
+
+        assert list(index) == list(
+            pd.to_datetime(["2024-01-02 14:30", "2024-01-03 14:30"])
+        )
+        with pytest.raises(ValidationError, match="None of the 5 bars"):
+            bar_panel_from_dict(SYMBOLS_DATA, index=index)
+
+        panel = bar_panel_from_dict(SYMBOLS_DATA, index=index, match="session")
+        np.testing.assert_array_equal(panel["close"][:, 1], [100.0, 101.0])
+
+    def test_to_frame_multiindex_columns(self):
+        frame = bar_panel_from_dict(SYMBOLS_DATA, symbols=["AAPL", "MSFT"]).to_frame()
+
+        assert frame.columns.names == ["field", "symbol"]
+        assert frame[("close", "AAPL")].tolist() == [100.0, 101.0, 102.0]
+        assert frame["volume"].shape == (3, 2)
+
+
+class TestGetStockPanel:
+    @pytest.fixture
+    def history(self, mocker):
+        mock_asset = mocker.Mock()
+        mock_asset.get_symbol_index.return_value = {
+            "AAPL": {"symbol": "AAPL", "class": "us_equity"},
+            "MSFT": {"symbol": "MSFT", "class": "us_equity"},
+        }
+        return History(
+            headers={"Authorization": "Bearer TEST"},
+            data_url="https://data.alpaca.markets/v2",
+            asset=mock_asset,
+        )
+
+    def test_returns_frame_by_default(self, history, mocker):
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(text=json.dumps({"bars": SYMBOLS_DATA}))
+
+        frame = history.get_stock_panel(["AAPL", "MSFT"], "2024-01-01", "2024-01-05")
+
+        assert isinstance(frame, pd.DataFrame)
+        assert frame.shape == (3, 14)
+        assert frame[("close", "MSFT")].isna().sum() == 1
+
+    def test_returns_arrays(self, history, mocker):
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(text=json.dumps({"bars": SYMBOLS_DATA}))
+
+        panel = history.get_stock_panel(
+            ["AAPL", "MSFT"], "2024-01-01", "2024-01-05", as_frame=False
+        )
+
+        assert isinstance(panel, BarPanel)
+        assert panel.symbols == ["AAPL", "MSFT"]
+        assert panel["open"].shape == (3, 2)
+
+    def test_daily_panel_uses_calendar_sessions(self, history, mocker):
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(text=json.dumps({"bars": SYMBOLS_DATA}))
+        history.market = mocker.Mock()
+        history.market.calendar.return_value = _calendar(
+            ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"]
+        )
+
+        frame = history.get_stock_panel(["AAPL", "MSFT"], "2024-01-01", "2024-01-05")
+
+        history.market.calendar.assert_called_once_with(
+            start_date="2024-01-01", end_date="2024-01-05", output="pandas"
+        )
+        assert list(frame.index) == list(
+            pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"])
+        )
+        assert frame[("close", "AAPL")].tolist()[:3] == [100.0, 101.0, 102.0]
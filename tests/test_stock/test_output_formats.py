@@ -0,0 +1,171 @@
+"""Test cases for the pluggable output formats of data methods."""
+
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from py_alpaca_api import PyAlpacaAPI
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.models.frame_utils import convert_frame
+from py_alpaca_api.stock.history import History
+from py_alpaca_api.stock.quotes import Quotes
+
+
+def _bar(t: str, close: float) -> dict:
+    return {
+        "t": t,
+        "o": close - 1,
+        "h": close + 1,
+        "l": close - 2,
+        "c": close,
+        "v": 1000,
+        "n": 10,
+        "vw": close,
+    }
+
+
+BARS_RESPONSE = {
+    "bars": {
+        "MSFT": [_bar("2024-01-02T05:00:00Z", 300)],
+        "AAPL": [_bar("2024-01-02T05:00:00Z", 100), _bar("2024-01-03T05:00:00Z", 101)],
+    }
+}
+
+QUOTES_RESPONSE = {
+    "quotes": [
+        {
+            "t": "2024-01-02T14:30:00Z",
+            "ax": "Q",
+            "ap": 100.5,
+            "as": 2,
+            "bx": "P",
+            "bp": 100.0,
+            "bs": 3,
+            "c": ["R"],
+            "z": "C",
+        }
+    ]
+}
+
+
+@pytest.fixture
+def history(mocker):
+    mock_asset = mocker.Mock()
+    mock_asset.get_symbol_index.return_value = {
+        "AAPL": {"symbol": "AAPL", "class": "us_equity"},
+        "MSFT": {"symbol": "MSFT", "class": "us_equity"},
+    }
+    return History(
+        data_url="https://data.alpaca.markets/v2",
+        headers={"Authorization": "Bearer TEST"},
+        asset=mock_asset,
+    )
+
+
+@pytest.fixture
+def mock_bars(mocker):
+    mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+    mock_request.return_value = MagicMock(text=json.dumps(BARS_RESPONSE))
+    return mock_request
+
+
+class TestHistoryOutput:
+    def test_numpy_output_matches_pandas(self, history, mock_bars):
+        expected = history.get_stock_data(["AAPL", "MSFT"], "2024-01-01", "2024-01-05")
+        result = history.get_stock_data(
+            ["AAPL", "MSFT"], "2024-01-01", "2024-01-05", output="numpy"
+        )
+
+        assert list(result) == list(expected.columns)
+        assert result["symbol"].tolist() == ["AAPL", "AAPL", "MSFT"]
+        np.testing.assert_array_equal(result["close"], expected["close"].to_numpy())
+        np.testing.assert_array_equal(result["date"], expected["date"].to_numpy())
+        assert result["volume"].dtype == np.int64
+
+    def test_client_default_output(self, mock_bars):
+        history = History(
+            data_url="https://data.alpaca.markets/v2",
+            headers={"Authorization": "Bearer TEST"},
+            asset=MagicMock(),
+            output="numpy",
+        )
+        result = history.get_stock_data(
+            ["AAPL", "MSFT"], "2024-01-01", "2024-01-05", validate=False
+        )
+        assert isinstance(result, dict)
+
+    def test_polars_output(self, history, mock_bars):
+        pl = pytest.importorskip("polars")
+        result = history.get_stock_data(
+            ["AAPL", "MSFT"], "2024-01-01", "2024-01-05", output="polars"
+        )
+        assert isinstance(result, pl.DataFrame)
+        assert result.height == 3
+        assert result.schema["date"] == pl.Datetime("ns")
+
+    def test_arrow_output(self, history, mock_bars):
+        pa = pytest.importorskip("pyarrow")
+        result = history.get_stock_data(
+            ["AAPL", "MSFT"], "2024-01-01", "2024-01-05", output="arrow"
+        )
+        assert isinstance(result, pa.Table)
+        assert result.column("symbol").to_pylist() == ["AAPL", "AAPL", "MSFT"]
+
+    def test_invalid_output(self, history):
+        with pytest.raises(ValidationError, match="Invalid output"):
+            history.get_stock_data("AAPL", "2024-01-01", "2024-01-05", output="csv")
+
+
+class TestQuotesOutput:
+    def test_numpy_quotes(self, mocker):
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(text=json.dumps(QUOTES_RESPONSE))
+
+        result = Quotes(headers={}).get_historical_quotes(
+            "AAPL", "2024-01-02", "2024-01-03", output="numpy"
+        )
+
+        assert result["ask_price"][0] == 100.5
+        assert result["spread"][0] == pytest.approx(0.5)
+        assert result["spread_pct"][0] == pytest.approx(0.5)
+        assert result["conditions"][0] == ["R"]
+
+
+class TestConvertFrame:
+    def test_keeps_datetime_index_as_column(self):
+        df = pd.DataFrame(
+            {"price": [1.0, 2.0]},
+            index=pd.DatetimeIndex(
+                ["2024-01-02T14:30:00Z", "2024-01-02T14:31:00Z"], name="timestamp"
+            ),
+        )
+        result = convert_frame(df, "numpy")
+        assert list(result) == ["timestamp", "price"]
+        assert result["timestamp"].dtype.kind == "M"
+
+    def test_client_rejects_invalid_output(self):
+        with pytest.raises(ValidationError):
+            PyAlpacaAPI(api_key="key", api_secret="secret", output="excel")
+
+
+class TestCompact:
+    def test_compact_bars(self, history, mock_bars):
+        result = history.get_stock_data(
+            ["AAPL", "MSFT"], "2024-01-01", "2024-01-05", compact=True
+        )
+        assert isinstance(result["symbol"].dtype, pd.CategoricalDtype)
+        assert result["close"].dtype == np.float32
+        assert result["volume"].dtype == np.int32
+
+    def test_compact_numpy_quotes(self, mocker):
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(text=json.dumps(QUOTES_RESPONSE))
+
+        result = Quotes(headers={}).get_historical_quotes(
+            "AAPL", "2024-01-02", "2024-01-03", output="numpy", compact=True
+        )
+        assert result["ask_price"].dtype == np.float32
+        assert result["bid_size"].dtype == np.int32
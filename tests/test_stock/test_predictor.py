@@ -83,7 +83,11 @@ def test_retrieve_historical_stock_data_valid_symbol(mocker):
     assert list(result.columns) == ["ds", "y"]
     assert len(result) == 5
     mock_history.get_stock_data.assert_called_once_with(
-        symbol="AAPL", start="2020-01-01", end="2020-01-05", timeframe="1d"
+        symbol="AAPL",
+        start="2020-01-01",
+        end="2020-01-05",
+        timeframe="1d",
+        output="pandas",
     )
 
 
@@ -105,7 +109,11 @@ def test_handle_invalid_stock_symbols_gracefully(mocker):
 
     # Ensure the method was called with the invalid symbol
     mock_history.get_stock_data.assert_called_once_with(
-        symbol="INVALID", start="2020-01-01", end="2020-01-05", timeframe="1d"
+        symbol="INVALID",
+        start="2020-01-01",
+        end="2020-01-05",
+        timeframe="1d",
+        output="pandas",
     )
 
 
@@ -303,3 +303,35 @@ class TestQuotes:
         # Check that asof was passed
         call_args = mock_request.call_args
         assert call_args[1]["params"]["asof"] == "2024-01-09"
+
+    def test_iter_historical_quotes_yields_pages(self, quotes_instance, mocker):
+        """Test iterating historical quotes page by page."""
+        pages = [
+            {
+                "quotes": [
+                    {"t": "2024-01-10T09:30:00Z", "ap": 185.50, "bp": 185.45},
+                ],
+                "next_page_token": "page2",
+            },
+            {
+                "quotes": [
+                    {"t": "2024-01-10T09:30:01Z", "ap": 185.52, "bp": 185.48},
+                ],
+                "next_page_token": None,
+            },
+        ]
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.side_effect = [MagicMock(text=json.dumps(p)) for p in pages]
+
+        iterator = quotes_instance.iter_historical_quotes(
+            "AAPL", start="2024-01-10T09:30:00Z", end="2024-01-10T16:00:00Z"
+        )
+        first = next(iterator)
+
+        assert mock_request.call_count == 1
+        assert isinstance(first, pd.DataFrame)
+        assert first["ask_price"].tolist() == [185.50]
+
+        rest = list(iterator)
+        assert len(rest) == 1
+        assert rest[0]["ask_price"].tolist() == [185.52]
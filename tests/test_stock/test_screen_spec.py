@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.stock.screen_spec import ScreenSpec
+
+
+@pytest.fixture
+def universe():
+    return pd.DataFrame(
+        {
+            "symbol": ["A", "B", "C", "D", "E", "F"],
+            "change": [5.0, -3.0, 12.0, 0.5, np.nan, 7.0],
+            "price": [10.0, 50.0, 3.0, 120.0, 20.0, 80.0],
+            "volume": [1000, 5000, 800, 200, 100, 3000],
+            "trades": [10, 50, 8, 2, 1, 30],
+            "bid_price": [9.9, 49.5, 2.9, 119.0, 19.0, 79.9],
+            "ask_price": [10.1, 50.5, 3.1, 121.0, 21.0, 80.1],
+        }
+    )
+
+
+class TestScreenSpec:
+    def test_thresholds_and_sort(self, universe):
+        spec = (
+            ScreenSpec(sort_by="change").where("price", ">", 5).where("change", ">", 0)
+        )
+
+        result = spec.apply(universe)
+
+        assert result["symbol"].tolist() == ["F", "A", "D"]
+        assert result.index.tolist() == [0, 1, 2]
+
+    def test_top_k_uses_partial_sort(self, universe, mocker):
+        argpartition = mocker.spy(np, "argpartition")
+
+        result = ScreenSpec(sort_by="volume", top_k=2).apply(universe)
+
+        assert result["symbol"].tolist() == ["B", "F"]
+        argpartition.assert_called_once()
+
+    def test_ascending_with_missing_values_last(self, universe):
+        result = ScreenSpec(sort_by="change", ascending=True).apply(universe)
+
+        assert result["symbol"].tolist() == ["B", "D", "A", "F", "C", "E"]
+
+    def test_between_rank_and_percentile(self, universe):
+        assert ScreenSpec().between("price", 10, 80).apply(universe)[
+            "symbol"
+        ].tolist() == ["F", "A", "B", "E"]
+        # The three largest volumes, and the two smallest prices
+        assert sorted(
+            ScreenSpec().rank("volume", "<=", 3).mask(universe).nonzero()[0]
+        ) == [
+            0,
+            1,
+            5,
+        ]
+        assert ScreenSpec().rank("price", "<=", 2, ascending=True).mask(
+            universe
+        ).tolist() == [True, False, True, False, False, False]
+        # Percentiles span 0 (smallest) to 100 (largest)
+        assert ScreenSpec().percentile("trades", ">=", 80).mask(universe).tolist() == [
+            False,
+            True,
+            False,
+            False,
+            False,
+            True,
+        ]
+
+    def test_missing_values_fail_conditions(self, universe):
+        mask = ScreenSpec().percentile("change", "<", 101).mask(universe)
+
+        assert mask.tolist() == [True, True, True, True, False, True]
+
+    def test_indicators(self, universe):
+        spec = (
+            ScreenSpec(sort_by="dollar_volume")
+            .where("spread_pct", "<", 2.5)
+            .derive("notional_per_trade", lambda c: c["dollar_volume"] / c["trades"])
+            .where("notional_per_trade", ">=", 5000)
+        )
+
+        result = spec.apply(universe)
+
+        assert result["symbol"].tolist() == ["B", "F", "D"]
+
+    def test_custom_condition_and_numpy_universe(self, universe):
+        columns = {name: values.to_numpy() for name, values in universe.items()}
+        spec = ScreenSpec(sort_by="price", top_k=1).where_fn(lambda u: u["change"] > 1)
+
+        result = spec.apply(columns)
+
+        assert isinstance(result, dict)
+        assert result["symbol"].tolist() == ["F"]
+
+    def test_compiled_mask_is_reusable(self, universe):
+        mask = ScreenSpec().where("price", ">=", 20).compile()
+
+        assert mask(universe).sum() == 4
+        assert mask(universe.head(2)).tolist() == [False, True]
+
+    def test_select_matches_compiled_mask(self, universe):
+        spec = (
+            ScreenSpec(sort_by="price")
+            .where("change", ">", 0)
+            .percentile("volume", ">=", 20)
+        )
+
+        selected = spec.select(universe)
+
+        assert sorted(selected) == np.flatnonzero(spec.compile()(universe)).tolist()
+        assert universe["symbol"][selected].tolist() == ["D", "F", "A", "C"]
+
+    def test_invalid_specs(self, universe):
+        with pytest.raises(ValidationError, match="Invalid operator"):
+            ScreenSpec().where("price", "=>", 5)
+        with pytest.raises(ValidationError, match="low, high"):
+            ScreenSpec().where("price", "between", 5)
+        with pytest.raises(ValidationError, match="top_k"):
+            ScreenSpec(top_k=0)
+        with pytest.raises(ValidationError, match="Unknown screen column"):
+            ScreenSpec().where("gap_pct", ">", 1).apply(universe)
@@ -0,0 +1,194 @@
+import json
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.stock.assets import Assets
+from py_alpaca_api.stock.screen_spec import ScreenSpec
+from py_alpaca_api.stock.screener import Screener
+from py_alpaca_api.stock.snapshots import Snapshots
+
+
+def _bar(close: float, volume: int = 30000, trades: int = 3000) -> dict:
+    return {"t": "2025-01-14T05:00:00Z", "c": close, "v": volume, "n": trades}
+
+
+def _asset(symbol: str) -> dict:
+    return {
+        "id": symbol,
+        "class": "us_equity",
+        "exchange": "NASDAQ",
+        "symbol": symbol,
+        "name": symbol,
+        "status": "active",
+        "tradable": True,
+        "marginable": True,
+        "shortable": True,
+        "easy_to_borrow": True,
+        "fractionable": True,
+        "maintenance_margin_requirement": 30,
+    }
+
+
+def _screener(mocker, bars: dict[str, list[dict]], page_size: int = 1):
+    """Serves the assets of `bars`, then their bars `page_size` symbols a page."""
+    requests = []
+    lock = threading.Lock()
+
+    def request(method, url, headers=None, params=None, **kwargs):
+        if url.endswith("/assets"):
+            return MagicMock(text=json.dumps([_asset(s) for s in bars]))
+        with lock:
+            requests.append(dict(params))
+        symbols = params["symbols"].split(",")
+        start = int(params["page_token"] or 0)
+        page = symbols[start : start + page_size]
+        token = str(start + page_size) if start + page_size < len(symbols) else None
+        body = {"bars": {s: bars[s] for s in page}, "next_page_token": token}
+        return MagicMock(text=json.dumps(body))
+
+    mocker.patch("py_alpaca_api.http.requests.Requests.request", side_effect=request)
+    assets = Assets(base_url="https://api", headers={})
+    return Screener("https://data", headers={}, asset=assets, market=None), requests
+
+
+class TestGetPercentages:
+    def test_computes_columns_from_last_two_bars(self, mocker):
+        screener, _ = _screener(
+            mocker,
+            {
+                "MSFT": [_bar(100.0), _bar(110.0, 50000, 5000)],
+                "AAPL": [_bar(90.0), _bar(200.0), _bar(190.0)],
+                "NEW": [_bar(10.0)],
+                "ZERO": [_bar(0.0), _bar(1.0)],
+            },
+        )
+
+        df = screener._get_percentages(start="2025-01-13", end="2025-01-14")
+
+        expected = pd.DataFrame(
+            {
+                "symbol": ["AAPL", "MSFT"],
+                "change": [-5.0, 10.0],
+                "price": [190.0, 110.0],
+                "volume": np.array([30000, 50000], dtype="int64"),
+                "trades": np.array([3000, 5000], dtype="int64"),
+            }
+        )
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_batches_symbols_and_follows_pages(self, mocker):
+        bars = {f"S{i:03d}": [_bar(100.0), _bar(101.0 + i)] for i in range(450)}
+        screener, requests = _screener(mocker, bars, page_size=150)
+        screener.BATCH_SIZE = 200
+
+        df = screener._get_percentages(start="2025-01-13", end="2025-01-14")
+
+        batch_sizes = sorted(
+            len(r["symbols"].split(",")) for r in requests if not r["page_token"]
+        )
+        assert batch_sizes == [50, 200, 200]
+        assert len(requests) == 5  # Each full batch needs a second page
+        assert len(df) == 450
+        assert df["symbol"].is_monotonic_increasing
+        assert df.loc[df["symbol"] == "S449", "change"].item() == 450.0
+
+    def test_filter_stocks_uses_percentages(self, mocker):
+        screener, _ = _screener(
+            mocker,
+            {
+                "UP": [_bar(100.0), _bar(105.0)],
+                "FLAT": [_bar(100.0), _bar(100.5)],
+                "CHEAP": [_bar(1.0), _bar(2.0)],
+            },
+        )
+        mocker.patch.object(screener, "set_dates")
+
+        gainers = screener.gainers()
+
+        assert gainers["symbol"].tolist() == ["UP"]
+        assert isinstance(gainers["volume"][0], np.int64)
+
+
+def _snapshot(prev_close, open_, close, trade=None, volume=30000, trades=3000):
+    return {
+        "latestTrade": None if trade is None else {"p": trade, "s": 100},
+        "latestQuote": None,
+        "minuteBar": None,
+        "dailyBar": {"o": open_, "c": close, "v": volume, "n": trades},
+        "prevDailyBar": {"o": prev_close, "c": prev_close, "v": 1, "n": 1},
+    }
+
+
+class TestSnapshotModes:
+    @pytest.fixture
+    def screener(self, mocker):
+        snapshots = {
+            "UP": _snapshot(100.0, 110.0, 108.0, trade=112.0),
+            "DOWN": _snapshot(100.0, 95.0, 90.0),
+            "NEW": {"latestTrade": {"p": 20.0}, "dailyBar": None},
+        }
+        requests = []
+
+        def request(method, url, headers=None, params=None, **kwargs):
+            if url.endswith("/assets"):
+                return MagicMock(text=json.dumps([_asset(s) for s in snapshots]))
+            requests.append(params)
+            return MagicMock(text=json.dumps(snapshots))
+
+        mocker.patch(
+            "py_alpaca_api.http.requests.Requests.request", side_effect=request
+        )
+        screener = Screener(
+            "https://data",
+            headers={},
+            asset=Assets(base_url="https://api", headers={}),
+            market=None,
+            snapshots=Snapshots(headers={}),
+        )
+        screener.requests = requests
+        return screener
+
+    def test_change_from_previous_close(self, screener):
+        df = screener._get_snapshot_percentages()
+
+        assert df["symbol"].tolist() == ["DOWN", "UP"]
+        # The latest trade is the price, falling back to the daily close
+        assert df["price"].tolist() == [90.0, 112.0]
+        assert df["change"].tolist() == [-10.0, 12.0]
+        assert df["volume"].dtype == np.int64
+        assert len(screener.requests) == 1
+
+    def test_intraday_change_from_open(self, screener):
+        df = screener._get_snapshot_percentages(intraday=True)
+
+        assert df["change"].tolist() == [-5.26, 1.82]
+
+    def test_gainers_and_losers_modes(self, screener, mocker):
+        set_dates = mocker.patch.object(screener, "set_dates")
+
+        gainers = screener.gainers(mode="snapshots")
+        losers = screener.losers(mode="intraday")
+
+        assert gainers["symbol"].tolist() == ["UP"]
+        assert losers["symbol"].tolist() == ["DOWN"]
+        set_dates.assert_not_called()
+
+    def test_invalid_mode(self, screener):
+        with pytest.raises(ValidationError, match="Invalid mode"):
+            screener.gainers(mode="weekly")
+        screener.snapshots = None
+        with pytest.raises(ValidationError, match="require a Snapshots client"):
+            screener.gainers(mode="snapshots")
+
+    def test_screen_spec_over_snapshot_universe(self, screener):
+        spec = ScreenSpec(sort_by="gap_pct", top_k=1).where("daily_volume", ">", 0)
+
+        result = screener.screen(spec, mode="snapshots")
+
+        assert result["symbol"].tolist() == ["UP"]
+        assert result["daily_open"].tolist() == [110.0]
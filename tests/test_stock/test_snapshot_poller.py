@@ -0,0 +1,139 @@
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.models.clock_model import ClockModel
+from py_alpaca_api.stock.snapshot_poller import SnapshotPoller
+from py_alpaca_api.stock.snapshots import Snapshots
+
+
+def _snapshot(price: float, bid: float, t: str = "2025-01-14T10:30:00Z") -> dict:
+    return {
+        "latestTrade": {"t": t, "p": price, "s": 100, "x": "Q"},
+        "latestQuote": {"t": t, "ap": bid + 0.1, "as": 1, "bp": bid, "bs": 2},
+        "minuteBar": None,
+        "dailyBar": None,
+        "prevDailyBar": None,
+    }
+
+
+@pytest.fixture
+def mock_request(mocker):
+    return mocker.patch("py_alpaca_api.http.requests.Requests.request")
+
+
+def _respond(mock_request, *responses):
+    mock_request.side_effect = [MagicMock(text=json.dumps(r)) for r in responses]
+
+
+class TestSnapshotPoller:
+    def test_poll_emits_only_changes(self, mock_request):
+        _respond(
+            mock_request,
+            {"AAPL": _snapshot(150.0, 149.9), "MSFT": _snapshot(380.0, 379.9)},
+            {"AAPL": _snapshot(150.0, 149.9), "MSFT": _snapshot(381.0, 379.9)},
+            {"AAPL": _snapshot(150.0, 149.9), "MSFT": _snapshot(381.0, 379.9)},
+        )
+        poller = SnapshotPoller(
+            Snapshots(headers={}),
+            ["msft", "aapl"],
+            fields=("trade_price", "bid_price", "trade_size"),
+        )
+        received = []
+        poller.subscribe(received.append)
+        changes_queue = poller.subscribe()
+
+        first = poller.poll()
+        second = poller.poll()
+        third = poller.poll()
+
+        assert first["AAPL"] == {
+            "trade_price": 150.0,
+            "bid_price": 149.9,
+            "trade_size": 100,
+        }
+        assert second == {"MSFT": {"trade_price": 381.0}}
+        assert third == {}
+        assert received == [first, second]
+        assert changes_queue.get_nowait() == first
+        assert poller.state.loc["MSFT", "trade_price"] == 381.0
+
+    def test_first_poll_reports_missing_fields(self, mock_request):
+        _respond(
+            mock_request,
+            {"AAPL": _snapshot(150.0, 149.9)},
+            {"AAPL": _snapshot(150.0, 149.9)},
+        )
+        poller = SnapshotPoller(
+            Snapshots(headers={}), ["AAPL"], fields=("trade_price", "minute_close")
+        )
+
+        first = poller.poll()
+
+        assert first["AAPL"]["trade_price"] == 150.0
+        assert np.isnan(first["AAPL"]["minute_close"])
+        assert poller.poll() == {}
+
+    def test_missing_symbol_keeps_state(self, mock_request):
+        _respond(
+            mock_request,
+            {"AAPL": _snapshot(150.0, 149.9), "MSFT": _snapshot(380.0, 379.9)},
+            {"MSFT": _snapshot(380.0, 379.9)},
+        )
+        poller = SnapshotPoller(Snapshots(headers={}), ["AAPL", "MSFT"])
+        poller.poll()
+
+        assert poller.poll() == {}
+        assert poller.state.loc["AAPL", "trade_price"] == 150.0
+
+    def test_run_logs_failures(self, mock_request):
+        mock_request.side_effect = Exception("API Error")
+        poller = SnapshotPoller(Snapshots(headers={}), ["AAPL"], open_interval=0.01)
+
+        poller.run(max_polls=2)
+
+        assert mock_request.call_count == 2
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValidationError, match="Symbols are required"):
+            SnapshotPoller(Snapshots(headers={}), [])
+        with pytest.raises(ValidationError, match="must be positive"):
+            SnapshotPoller(Snapshots(headers={}), ["AAPL"], open_interval=0)
+
+
+class TestPollInterval:
+    @staticmethod
+    def _market(is_open: bool, next_open: str, next_close: str):
+        market = MagicMock()
+        market.clock.return_value = ClockModel(
+            market_time="2025-01-14 09:29:30",
+            is_open=is_open,
+            next_open=next_open,
+            next_close=next_close,
+        )
+        return market
+
+    def test_open_market(self):
+        market = self._market(True, "2025-01-15 09:30:00", "2025-01-14 16:00:00")
+        poller = SnapshotPoller(Snapshots(headers={}), ["AAPL"], market=market)
+
+        assert poller.interval() == 1.0
+        assert poller.interval() == 1.0
+        market.clock.assert_called_once()
+
+    def test_closed_market_waits_for_open(self):
+        market = self._market(False, "2025-01-14 09:30:00", "2025-01-14 16:00:00")
+        poller = SnapshotPoller(Snapshots(headers={}), ["AAPL"], market=market)
+
+        assert 29 < poller.interval() <= 30
+
+    def test_closed_market_is_capped(self):
+        market = self._market(False, "2025-01-15 09:30:00", "2025-01-14 16:00:00")
+        poller = SnapshotPoller(
+            Snapshots(headers={}), ["AAPL"], market=market, closed_interval=120
+        )
+
+        assert poller.interval() == 120
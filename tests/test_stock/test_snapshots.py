@@ -284,6 +284,57 @@ class TestSnapshots:
                 snapshots.get_snapshots(["AAPL", "MSFT"])
             assert "Failed to get snapshots" in str(exc_info.value)
 
+    def test_get_snapshots_batches_large_lists(self, snapshots, mock_snapshot_response):
+        symbols = [f"SYM{i}" for i in range(450)]
+
+        def respond(method, url, headers, params):
+            batch = params["symbols"].split(",")
+            return MagicMock(
+                text=json.dumps(dict.fromkeys(batch, mock_snapshot_response))
+            )
+
+        with patch("py_alpaca_api.stock.snapshots.Requests") as mock_requests:
+            mock_requests.return_value.request.side_effect = respond
+
+            result = snapshots.get_snapshots(symbols)
+
+            assert mock_requests.return_value.request.call_count == 3
+            assert len(result) == 450
+            assert result["SYM449"].symbol == "SYM449"
+
+    def test_get_snapshots_batch_error(self, snapshots):
+        with patch("py_alpaca_api.stock.snapshots.Requests") as mock_requests:
+            mock_requests.return_value.request.side_effect = Exception("API Error")
+
+            with pytest.raises(APIRequestError, match="Failed to get snapshots"):
+                snapshots.get_snapshots([f"SYM{i}" for i in range(250)])
+
+    def test_get_snapshots_frame(self, snapshots, mock_snapshots_response):
+        with patch("py_alpaca_api.stock.snapshots.Requests") as mock_requests:
+            mock_response = MagicMock()
+            mock_response.text = json.dumps(mock_snapshots_response)
+            mock_requests.return_value.request.return_value = mock_response
+
+            df = snapshots.get_snapshots_frame(["MSFT", "AAPL"])
+
+            assert df["symbol"].tolist() == ["AAPL", "MSFT"]
+            assert df["trade_price"].tolist() == [150.25, 380.50]
+            assert df["ask_price"].tolist() == [150.30, 380.60]
+            assert df["minute_volume"].tolist() == [10000, 5000]
+            assert df["daily_close"].isna().tolist() == [True, False]
+            assert df["prev_daily_timestamp"].isna().tolist() == [True, False]
+            assert str(df["trade_timestamp"].iloc[0]) == "2025-01-14 10:30:00"
+
+    def test_get_snapshots_frame_numpy(self, snapshots, mock_snapshots_response):
+        with patch("py_alpaca_api.stock.snapshots.Requests") as mock_requests:
+            mock_response = MagicMock()
+            mock_response.text = json.dumps(mock_snapshots_response)
+            mock_requests.return_value.request.return_value = mock_response
+
+            columns = snapshots.get_snapshots_frame("AAPL,MSFT", output="numpy")
+
+            assert columns["daily_vwap"][1] == 380.00
+
 
 class TestSnapshotModels:
     def test_bar_class_from_dict(self):
@@ -0,0 +1,212 @@
+"""Test cases for the memory-mapped tick store."""
+
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.stock.quotes import Quotes
+from py_alpaca_api.stock.trades import Trades
+from py_alpaca_api.storage.tick_store import (
+    TRADE_DTYPE,
+    TickStore,
+    records_from_dicts,
+    records_to_frame,
+)
+
+
+def _trade(t: str, i: int) -> dict:
+    return {
+        "t": t,
+        "x": "V",
+        "p": 100.0 + i,
+        "s": 10,
+        "c": ["@", "I"],
+        "i": i,
+        "z": "C",
+    }
+
+
+TRADES = [
+    _trade("2024-01-02T14:30:00Z", 1),
+    _trade("2024-01-02T14:30:01.5Z", 2),
+    _trade("2024-01-02T20:59:59Z", 3),
+    _trade("2024-01-03T14:30:00Z", 4),
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TickStore(tmp_path / "ticks")
+
+
+class TestTickStore:
+    def test_append_splits_days_and_skips_duplicates(self, store):
+        records = records_from_dicts(TRADES)
+
+        assert store.append("trades", "aapl", records) == 4
+        assert store.append("trades", "AAPL", records) == 0
+        assert store.days("trades", "AAPL") == ["2024-01-02", "2024-01-03"]
+        assert store.path("trades", "AAPL", "2024-01-02").stat().st_size == (
+            3 * TRADE_DTYPE.itemsize
+        )
+
+    def test_ticks_sharing_a_timestamp_are_kept(self, store):
+        tail = _trade("2024-01-02T20:59:59Z", 5)
+
+        store.append("trades", "AAPL", records_from_dicts(TRADES[:3]))
+        assert store.append("trades", "AAPL", records_from_dicts([tail])) == 1
+        assert store.append("trades", "AAPL", records_from_dicts([tail])) == 0
+
+        ids = store.read_day("trades", "AAPL", "2024-01-02")["id"].tolist()
+        assert ids == [1, 2, 3, 5]
+
+    def test_backfill_is_merged_in_order(self, store):
+        store.append("trades", "AAPL", records_from_dicts([TRADES[0], TRADES[2]]))
+
+        written = store.append("trades", "AAPL", records_from_dicts(TRADES[:3]))
+
+        assert written == 1
+        records = store.read_day("trades", "AAPL", "2024-01-02")
+        assert records["id"].tolist() == [1, 2, 3]
+        assert list(store.path("trades", "AAPL", "2024-01-02").parent.iterdir()) == [
+            store.path("trades", "AAPL", "2024-01-02")
+        ]
+
+    def test_identical_quotes_are_skipped_but_distinct_ones_kept(self, store):
+        quote = {"t": "2024-01-02T14:30:00Z", "bp": 100.0, "ap": 100.5, "c": ["R"]}
+        other = {**quote, "ap": 100.6}
+
+        assert (
+            store.append("quotes", "AAPL", records_from_dicts([quote], "quotes")) == 1
+        )
+        written = store.append(
+            "quotes", "AAPL", records_from_dicts([quote, other], "quotes")
+        )
+
+        assert written == 1
+        assert store.read_day("quotes", "AAPL", "2024-01-02")["ask_price"].tolist() == [
+            100.5,
+            100.6,
+        ]
+
+    def test_overlong_conditions_raise(self):
+        trade = {**_trade("2024-01-02T14:30:00Z", 1), "c": list("ABCDEFGHI")}
+        with pytest.raises(ValidationError, match="Condition codes"):
+            records_from_dicts([trade])
+
+    def test_read_day_is_a_memmap_slice(self, store):
+        store.append("trades", "AAPL", records_from_dicts(TRADES))
+
+        view = store.read_day(
+            "trades", "AAPL", "2024-01-02", start="2024-01-02T14:30:01Z"
+        )
+
+        assert isinstance(view, np.memmap)
+        assert view["id"].tolist() == [2, 3]
+        assert not view.flags.writeable
+
+    def test_read_range_across_days(self, store):
+        store.append("trades", "AAPL", records_from_dicts(TRADES))
+
+        records = store.read(
+            "trades", "AAPL", "2024-01-02T14:30:01Z", "2024-01-03T15:00:00Z"
+        )
+        df = records_to_frame(records)
+
+        assert df["id"].tolist() == [2, 3, 4]
+        assert df["conditions"].tolist() == ["@I", "@I", "@I"]
+        assert str(df["timestamp"].iloc[0]) == "2024-01-02 14:30:01.500000"
+
+    def test_read_missing_symbol(self, store):
+        records = store.read("quotes", "MSFT", "2024-01-02", "2024-01-03")
+        assert len(records) == 0
+
+    def test_invalid_kind(self, store):
+        with pytest.raises(ValidationError, match="Invalid kind"):
+            store.days("bars", "AAPL")
+
+
+class TestFillStore:
+    def test_trades_fill_store(self, store, mocker):
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.side_effect = [
+            MagicMock(
+                status_code=200,
+                text=json.dumps({"trades": TRADES[:2], "next_page_token": "next"}),
+            ),
+            MagicMock(
+                status_code=200,
+                text=json.dumps({"trades": TRADES[2:], "next_page_token": None}),
+            ),
+        ]
+
+        written = Trades(headers={}).fill_store(
+            store, "AAPL", "2024-01-02T00:00:00Z", "2024-01-04T00:00:00Z"
+        )
+
+        assert written == 4
+        assert len(store.read_day("trades", "AAPL", "2024-01-03")) == 1
+
+    def test_trades_fill_store_keeps_ticks_shared_across_pages(self, store, mocker):
+        same_time = _trade("2024-01-02T20:59:59Z", 5)
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.side_effect = [
+            MagicMock(
+                status_code=200,
+                text=json.dumps({"trades": TRADES[:3], "next_page_token": "next"}),
+            ),
+            MagicMock(
+                status_code=200,
+                text=json.dumps(
+                    {"trades": [same_time, TRADES[3]], "next_page_token": None}
+                ),
+            ),
+        ]
+        trades = Trades(headers={})
+
+        written = trades.fill_store(
+            store, "AAPL", "2024-01-02T00:00:00Z", "2024-01-04T00:00:00Z"
+        )
+
+        assert written == 5
+        df = trades.read_store(
+            store, "AAPL", "2024-01-02T00:00:00Z", "2024-01-04T00:00:00Z"
+        )
+        assert df["id"].tolist() == [1, 2, 3, 5, 4]
+
+    def test_quotes_fill_store(self, store, mocker):
+        response = {
+            "quotes": {
+                "AAPL": [
+                    {
+                        "t": "2024-01-02T14:30:00Z",
+                        "ax": "Q",
+                        "ap": 100.5,
+                        "as": 2,
+                        "bx": "P",
+                        "bp": 100.0,
+                        "bs": 3,
+                        "c": ["R"],
+                        "z": "C",
+                    }
+                ]
+            }
+        }
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(text=json.dumps(response))
+
+        written = Quotes(headers={}).fill_store(
+            store, ["AAPL", "MSFT"], "2024-01-02", "2024-01-03"
+        )
+
+        records = store.read_day("quotes", "AAPL", "2024-01-02")
+        assert written == 1
+        assert records["ask_price"][0] == 100.5
+        assert records["ask_exchange"][0] == b"Q"
+
+        df = Quotes(headers={}).read_store(store, "AAPL", "2024-01-02", "2024-01-03")
+        assert df["bid_exchange"].tolist() == ["P"]
+        assert df["conditions"].tolist() == ["R"]
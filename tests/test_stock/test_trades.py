@@ -1,3 +1,4 @@
+import json
 import os
 from unittest.mock import MagicMock, patch
 
@@ -6,8 +7,10 @@ import pytest
 from py_alpaca_api import PyAlpacaAPI
 from py_alpaca_api.exceptions import APIRequestError, ValidationError
 from py_alpaca_api.models.trade_model import (
+    TradeBatch,
     TradeModel,
     TradesResponse,
+    trade_batch_from_dicts,
     trade_class_from_dict,
 )
 
@@ -266,6 +269,36 @@ class TestTrades:
         assert result[0].price == 150.25
         assert result[1].price == 150.30
 
+    @patch("py_alpaca_api.http.requests.Requests.request")
+    def test_iter_trades_yields_pages(self, mock_request, alpaca):
+        """Test iter_trades yields each page as it arrives."""
+        mock_request.side_effect = [
+            MagicMock(
+                status_code=200,
+                text='{"trades": [{"t": "2024-01-15T14:30:00Z", "x": "V", "p": 150.25, "s": 100, "c": ["@"], "i": 1, "z": "C"}], "symbol": "AAPL", "next_page_token": "page2"}',
+            ),
+            MagicMock(
+                status_code=200,
+                text='{"trades": [{"t": "2024-01-15T14:31:00Z", "x": "K", "p": 150.30, "s": 200, "c": ["F"], "i": 2, "z": "C"}], "symbol": "AAPL", "next_page_token": null}',
+            ),
+        ]
+
+        iterator = alpaca.stock.trades.iter_trades(
+            symbol="AAPL",
+            start="2024-01-15T14:00:00Z",
+            end="2024-01-15T15:00:00Z",
+        )
+        first = next(iterator)
+
+        assert mock_request.call_count == 1
+        assert isinstance(first, TradesResponse)
+        assert first.trades[0].id == 1
+
+        rest = list(iterator)
+        assert len(rest) == 1
+        assert rest[0].trades[0].id == 2
+        assert mock_request.call_args[1]["params"]["page_token"] == "page2"
+
     def test_feed_parameter(self, alpaca):
         """Test that feed parameter is properly handled."""
         with patch("py_alpaca_api.http.requests.Requests.request") as mock_request:
@@ -328,3 +361,68 @@ class TestTrades:
         assert response.symbol == "AAPL"
         assert len(response.trades) == 1
         assert response.next_page_token == "token123"
+
+
+class TestTradeBatch:
+    """Test suite for columnar trade batches."""
+
+    def test_trade_batch_from_dicts(self, mock_trades_response):
+        """Test decoding raw trades into columns with lazy rows."""
+        batch = trade_batch_from_dicts(
+            mock_trades_response["trades"], "AAPL", "token123"
+        )
+
+        assert len(batch) == 2
+        assert batch.price.tolist() == [150.25, 150.26]
+        assert batch.size.dtype.kind == "i"
+        assert batch.timestamp.dtype.kind == "M"
+        assert batch.next_page_token == "token123"
+
+        trade = batch[1]
+        assert trade == trade_class_from_dict(mock_trades_response["trades"][1], "AAPL")
+        assert [t.id for t in batch] == [12345, 12346]
+        assert isinstance(batch[:1], TradeBatch)
+        assert len(batch[:1]) == 1
+
+    def test_trade_batches_compare_by_identity(self, mock_trades_response):
+        """Test that comparing batches does not compare their arrays."""
+        batch = trade_batch_from_dicts(mock_trades_response["trades"], "AAPL")
+        other = trade_batch_from_dicts(mock_trades_response["trades"], "AAPL")
+
+        assert batch != other
+        assert batch in [other, batch]
+
+    def test_trade_batch_to_pandas(self, mock_trades_response):
+        """Test converting a batch to a DataFrame."""
+        df = trade_batch_from_dicts(mock_trades_response["trades"], "AAPL").to_pandas()
+
+        assert list(df.columns) == [
+            "symbol",
+            "timestamp",
+            "exchange",
+            "price",
+            "size",
+            "conditions",
+            "id",
+            "tape",
+        ]
+        assert df["symbol"].tolist() == ["AAPL", "AAPL"]
+
+    @patch("py_alpaca_api.http.requests.Requests.request")
+    def test_get_all_trades_columnar(self, mock_request, alpaca, mock_trades_response):
+        """Test concatenating pages into one batch."""
+        last_page = {**mock_trades_response, "next_page_token": None}
+        mock_request.side_effect = [
+            MagicMock(status_code=200, text=json.dumps(mock_trades_response)),
+            MagicMock(status_code=200, text=json.dumps(last_page)),
+        ]
+
+        batch = alpaca.stock.trades.get_all_trades_columnar(
+            symbol="AAPL",
+            start="2024-01-15T14:00:00Z",
+            end="2024-01-15T15:00:00Z",
+        )
+
+        assert len(batch) == 4
+        assert batch.id.tolist() == [12345, 12346, 12345, 12346]
+        assert batch.next_page_token is None
@@ -0,0 +1,249 @@
+import asyncio
+import threading
+
+import pytest
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.streaming import Dispatcher, Stream
+
+serve = pytest.importorskip("websockets.asyncio.server").serve
+
+
+def _quote(symbol: str, price: float) -> dict:
+    return {"T": "q", "S": symbol, "bp": price}
+
+
+async def _put_all(dispatcher: Dispatcher, channel: str, handler, messages) -> None:
+    for message in messages:
+        await dispatcher.put(channel, handler, message)
+
+
+class TestDispatcher:
+    def test_invalid_arguments(self):
+        with pytest.raises(ValidationError, match="Invalid policy"):
+            Dispatcher(policy="latest")
+        with pytest.raises(ValidationError, match="Invalid policy"):
+            Dispatcher(policies={"quotes": "latest"})
+        with pytest.raises(ValidationError, match="Invalid executor"):
+            Dispatcher(executor="process")
+        with pytest.raises(ValidationError, match="at least 1"):
+            Dispatcher(maxsize=0)
+
+    def test_handles_messages_in_order(self):
+        received = []
+
+        async def scenario():
+            dispatcher = Dispatcher()
+            messages = [_quote("AAPL", float(i)) for i in range(50)]
+            await _put_all(dispatcher, "quotes", received.append, messages)
+            await dispatcher.drain()
+            stats = dispatcher.stats()
+            await dispatcher.close()
+            return messages, stats
+
+        messages, stats = asyncio.run(scenario())
+
+        assert received == messages
+        assert stats["quotes"].received == 50
+        assert stats["quotes"].dispatched == 50
+        assert stats["quotes"].dropped == 0
+        assert stats["quotes"].depth == 0
+
+    def test_drop_oldest_keeps_newest(self):
+        received = []
+
+        async def scenario():
+            dispatcher = Dispatcher(maxsize=3, policy="drop_oldest")
+            # Puts do not yield, so the worker only runs once all are queued
+            await _put_all(
+                dispatcher,
+                "trades",
+                received.append,
+                [_quote("AAPL", float(i)) for i in range(10)],
+            )
+            await dispatcher.drain()
+            stats = dispatcher.stats()
+            await dispatcher.close()
+            return stats
+
+        stats = asyncio.run(scenario())
+
+        assert [m["bp"] for m in received] == [7.0, 8.0, 9.0]
+        assert stats["trades"].dropped == 7
+        assert stats["trades"].max_depth == 3
+
+    def test_conflate_keeps_latest_per_symbol(self):
+        received = []
+
+        async def scenario():
+            dispatcher = Dispatcher(policies={"quotes": "conflate"})
+            messages = [
+                _quote("AAPL", 1.0),
+                _quote("MSFT", 2.0),
+                _quote("AAPL", 3.0),
+                _quote("MSFT", 4.0),
+                _quote("AAPL", 5.0),
+            ]
+            await _put_all(dispatcher, "quotes", received.append, messages)
+            await dispatcher.drain()
+            stats = dispatcher.stats()
+            await dispatcher.close()
+            return stats
+
+        stats = asyncio.run(scenario())
+
+        # The first-queued symbol keeps its place with its latest message
+        assert received == [_quote("AAPL", 5.0), _quote("MSFT", 4.0)]
+        assert stats["quotes"].conflated == 3
+        assert stats["quotes"].dispatched == 2
+
+    def test_block_applies_backpressure(self):
+        received = []
+
+        async def scenario():
+            gate = asyncio.Event()
+
+            async def slow(message):
+                await gate.wait()
+                received.append(message)
+
+            dispatcher = Dispatcher(maxsize=2)
+            producer = asyncio.ensure_future(
+                _put_all(
+                    dispatcher,
+                    "bars",
+                    slow,
+                    [_quote("AAPL", float(i)) for i in range(5)],
+                )
+            )
+            await asyncio.sleep(0.05)
+            # One message is being handled and two are queued; the producer waits
+            blocked = (producer.done(), dispatcher.stats()["bars"].depth)
+            gate.set()
+            await producer
+            await dispatcher.drain()
+            stats = dispatcher.stats()
+            await dispatcher.close()
+            return blocked, stats
+
+        blocked, stats = asyncio.run(scenario())
+
+        assert blocked == (False, 2)
+        assert [m["bp"] for m in received] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert stats["bars"].blocked >= 1
+        assert stats["bars"].dropped == 0
+        assert stats["bars"].max_lag > 0
+
+    def test_lag_includes_handling_time(self):
+        async def slow(message):
+            await asyncio.sleep(0.05)
+
+        async def scenario():
+            dispatcher = Dispatcher()
+            await dispatcher.put("trades", slow, _quote("AAPL", 1.0))
+            await dispatcher.drain()
+            stats = dispatcher.stats()
+            await dispatcher.close()
+            return stats
+
+        stats = asyncio.run(scenario())
+
+        assert stats["trades"].last_lag >= 0.05
+        assert stats["trades"].max_lag == stats["trades"].last_lag
+
+    def test_thread_executor_runs_off_the_loop(self):
+        threads = []
+
+        def handler(message):
+            threads.append(threading.current_thread().name)
+
+        def failing(message):
+            raise RuntimeError("boom")
+
+        async def scenario():
+            dispatcher = Dispatcher(executor="thread", workers=2)
+            await dispatcher.put("trades", failing, _quote("AAPL", 1.0))
+            await _put_all(dispatcher, "trades", handler, [_quote("AAPL", 1.0)] * 4)
+            await dispatcher.drain()
+            stats = dispatcher.stats()
+            await dispatcher.close()
+            return stats
+
+        stats = asyncio.run(scenario())
+
+        assert len(threads) == 4
+        assert all(name.startswith("StreamDispatcher") for name in threads)
+        assert stats["trades"].dispatched == 5
+
+    def test_thread_executor_isolates_channels(self):
+        quote_handled = threading.Event()
+        order = []
+
+        def slow_trade(message):
+            # Only returns early if the quote runs while this handler blocks
+            order.append(("trade", quote_handled.wait(timeout=2)))
+
+        def quote(message):
+            quote_handled.set()
+            order.append(("quote", True))
+
+        async def scenario():
+            dispatcher = Dispatcher(executor="thread")
+            await dispatcher.put("trades", slow_trade, _quote("AAPL", 1.0))
+            await asyncio.sleep(0.05)
+            await dispatcher.put("quotes", quote, _quote("AAPL", 1.0))
+            await dispatcher.drain()
+            await dispatcher.close()
+
+        asyncio.run(scenario())
+
+        assert order == [("quote", True), ("trade", True)]
+
+    def test_close_counts_discarded_messages_as_dropped(self):
+        async def scenario():
+            dispatcher = Dispatcher()
+            # Puts do not yield, so nothing is handled before close
+            await _put_all(
+                dispatcher, "trades", lambda m: None, [_quote("AAPL", 1.0)] * 3
+            )
+            await dispatcher.close()
+            return dispatcher.stats()
+
+        stats = asyncio.run(scenario())
+
+        assert stats["trades"].dropped == 3
+        assert stats["trades"].depth == 0
+
+    def test_stream_uses_dispatcher(self):
+        async def handler(ws):
+            await ws.send('[{"T": "success", "msg": "connected"}]')
+            await ws.recv()
+            await ws.send('[{"T": "success", "msg": "authenticated"}]')
+            async for _ in ws:
+                for price in range(3):
+                    await ws.send(f'[{{"T": "t", "S": "AAPL", "p": {price}}}]')
+
+        async def scenario():
+            server = await serve(handler, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            dispatcher = Dispatcher()
+            stream = Stream(
+                "key", "secret", url=f"ws://127.0.0.1:{port}", dispatcher=dispatcher
+            )
+            received = []
+            stream.subscribe_trades(received.append, "AAPL")
+
+            async def watch():
+                while len(received) < 3:
+                    await asyncio.sleep(0.01)
+                stream.stop()
+
+            await asyncio.wait_for(asyncio.gather(stream.run(), watch()), timeout=5)
+            server.close()
+            await server.wait_closed()
+            return received, dispatcher.stats()
+
+        received, stats = asyncio.run(scenario())
+
+        assert [m["p"] for m in received] == [0, 1, 2]
+        assert stats["trades"].dispatched == 3
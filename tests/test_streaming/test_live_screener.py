@@ -0,0 +1,136 @@
+import asyncio
+import heapq
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.streaming import LiveScreener, Stream
+
+
+def _universe() -> dict[str, np.ndarray]:
+    return {
+        "symbol": np.array(["AAA", "BBB", "CCC", "DDD"], dtype=object),
+        "trade_price": np.array([11.0, 95.0, np.nan, 50.0]),
+        "daily_open": np.array([10.5, 98.0, 20.0, 49.0]),
+        "daily_close": np.array([11.0, 95.0, 21.0, 50.0]),
+        "daily_volume": np.array([5000, 8000, 100, 3000], dtype=np.int64),
+        "daily_trade_count": np.array([50, 80, 1, 30], dtype=np.int64),
+        "prev_daily_close": np.array([10.0, 100.0, 20.0, np.nan]),
+    }
+
+
+def _trade(symbol: str, price: float, size: int = 100, conditions=("@",)) -> dict:
+    return {"T": "t", "S": symbol, "p": price, "s": size, "c": list(conditions)}
+
+
+class TestLiveScreener:
+    def test_load_ranks_gainers_and_losers(self):
+        screener = LiveScreener()
+        screener.load(_universe())
+
+        gainers = screener.gainers(2)
+        losers = screener.losers(10)
+
+        assert gainers["symbol"].tolist() == ["AAA", "CCC"]
+        assert gainers["change"].tolist() == [10.0, 5.0]
+        # DDD has no previous close, so it is not ranked
+        assert losers["symbol"].tolist() == ["BBB", "CCC", "AAA"]
+        assert len(screener) == 4
+
+    def test_rankings_are_read_under_one_lock_acquisition(self, mocker):
+        screener = LiveScreener()
+        screener.load(_universe())
+        lock = mocker.MagicMock(wraps=screener._lock)
+        lock.__enter__ = mocker.Mock(side_effect=screener._lock.__enter__)
+        lock.__exit__ = mocker.Mock(side_effect=screener._lock.__exit__)
+        screener._lock = lock
+
+        assert screener.gainers(2)["symbol"].tolist() == ["AAA", "CCC"]
+        assert lock.__enter__.call_count == 1
+
+    def test_trades_update_state_and_rankings(self):
+        screener = LiveScreener()
+        screener.load(_universe())
+
+        screener.on_trade(_trade("BBB", 130.0, size=200))
+        # Odd lots count towards volume without moving the last price
+        screener.on_trade(_trade("AAA", 99.0, size=10, conditions=("@", "I")))
+
+        assert screener.gainers(1)["symbol"].tolist() == ["BBB"]
+        state = screener.state
+        assert state.loc["BBB", ["price", "volume", "trades"]].tolist() == [
+            130.0,
+            8200,
+            81,
+        ]
+        assert state.loc["AAA", "price"] == 11.0
+        assert state.loc["AAA", "volume"] == 5010
+
+    def test_daily_bars_and_snapshot_changes(self):
+        screener = LiveScreener(basis="open")
+        screener.load(_universe())
+
+        screener.on_daily_bar(
+            {"T": "d", "S": "DDD", "o": 40.0, "c": 50.0, "v": 4000, "n": 40}
+        )
+        screener.on_changes({"CCC": {"trade_price": 10.0, "daily_volume": 300}})
+
+        assert screener.gainers(1)["symbol"].tolist() == ["DDD"]
+        assert screener.losers(1)["symbol"].tolist() == ["CCC"]
+        assert screener.state.loc["DDD", "volume"] == 4000
+        assert screener.state.loc["CCC", "volume"] == 300
+
+    def test_minimums_exclude_symbols(self):
+        screener = LiveScreener(min_price=15.0, min_volume=1000, min_trades=10)
+        screener.load(_universe())
+
+        assert screener.gainers(10)["symbol"].tolist() == ["BBB"]
+
+        screener.on_changes({"CCC": {"daily_volume": 2000, "daily_trade_count": 20}})
+        assert screener.gainers(10)["symbol"].tolist() == ["CCC", "BBB"]
+
+    def test_stale_entries_are_skipped_and_compacted(self):
+        screener = LiveScreener()
+        screener.load(_universe())
+        prices = np.linspace(5.0, 20.0, 200)
+        for price in prices:
+            screener.on_trade(_trade("AAA", float(price)))
+
+        gainers = screener.gainers(10)
+
+        assert gainers["symbol"].tolist() == ["AAA", "CCC", "BBB"]
+        assert gainers["change"].iloc[0] == 100.0
+        # Rebuilds keep the heaps bounded however many updates arrive
+        assert len(screener._gainers) <= 4 * len(screener) + 64
+        assert heapq.nsmallest(1, screener._gainers)[0][0] == -100.0
+
+    def test_new_symbols_grow_arrays(self):
+        screener = LiveScreener(capacity=2)
+        changes = {
+            f"S{i}": {"prev_daily_close": 10.0, "trade_price": 10.0 + i}
+            for i in range(5)
+        }
+
+        screener.on_changes(changes)
+
+        assert len(screener) == 5
+        assert screener.gainers(2)["symbol"].tolist() == ["S4", "S3"]
+
+    def test_attach_to_stream(self):
+        stream = Stream("key", "secret")
+        screener = LiveScreener()
+        screener.load(_universe())
+        screener.attach(stream, ["AAA"])
+
+        asyncio.run(stream.inject(_trade("AAA", 5.0)))
+
+        assert stream.subscriptions == {"trades": ["AAA"], "dailyBars": ["AAA"]}
+        assert screener.losers(1)["symbol"].tolist() == ["AAA"]
+
+    def test_empty_and_invalid(self):
+        assert LiveScreener().gainers(5).empty
+        assert isinstance(LiveScreener().state, pd.DataFrame)
+        with pytest.raises(ValidationError, match="Invalid basis"):
+            LiveScreener(basis="vwap")
@@ -0,0 +1,90 @@
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.stock.history import History
+from py_alpaca_api.streaming import LiveWindow
+
+
+def _bar(minute: int, close: float, symbol: str = "AAPL") -> dict:
+    return {
+        "T": "b",
+        "S": symbol,
+        "t": f"2024-01-02T14:{minute:02d}:00Z",
+        "o": close - 1,
+        "h": close + 1,
+        "l": close - 2,
+        "c": close,
+        "v": 100 * minute,
+    }
+
+
+class TestLiveWindow:
+    def test_view_is_contiguous_and_zero_copy(self):
+        window = LiveWindow(3)
+        for minute in range(5):
+            window.on_message(_bar(minute, 100.0 + minute))
+
+        closes = window.view("AAPL", "close")
+
+        assert closes.tolist() == [102.0, 103.0, 104.0]
+        assert np.shares_memory(closes, window._values["close"])
+        assert not closes.flags.writeable
+        assert window.count("AAPL") == 3
+        assert str(window.last("AAPL", "timestamp")) == "2024-01-02T14:04:00.000000000"
+
+    def test_partial_window(self):
+        window = LiveWindow(5, kind="trades")
+        window.append("MSFT", {"t": "2024-01-02T14:30:00.5Z", "p": 380.0, "s": 10})
+
+        assert window.view("MSFT", "price").tolist() == [380.0]
+        assert window.frame("MSFT")["size"].tolist() == [10.0]
+
+    def test_updated_bar_replaces_latest(self):
+        window = LiveWindow(3)
+        window.on_message(_bar(0, 100.0))
+        window.on_message(_bar(1, 101.0))
+        window.on_message({**_bar(1, 105.0), "T": "u"})
+
+        assert window.view("AAPL", "close").tolist() == [100.0, 105.0]
+
+    def test_matrix_and_growth(self):
+        window = LiveWindow(2, capacity=1)
+        window.on_message(_bar(0, 100.0))
+        window.on_message(_bar(1, 101.0))
+        window.on_message(_bar(2, 102.0))
+        window.on_message(_bar(0, 50.0, symbol="MSFT"))
+
+        matrix = window.matrix("close")
+
+        assert window.symbols == ["AAPL", "MSFT"]
+        np.testing.assert_array_equal(matrix, [[101.0, 102.0], [np.nan, 50.0]])
+        assert np.isnat(window.matrix("timestamp")[1, 0])
+
+    def test_poll_latest_bars(self, mocker):
+        bar = {k: v for k, v in _bar(30, 150.0).items() if k not in ("T", "S")}
+        mock_request = mocker.patch("py_alpaca_api.http.requests.Requests.request")
+        mock_request.return_value = MagicMock(
+            text=json.dumps({"bars": {"AAPL": bar, "MSFT": {**bar, "c": 380.0}}})
+        )
+        history = History(headers={}, data_url="https://data", asset=MagicMock())
+        window = LiveWindow(10)
+
+        window.poll_latest_bars(history, ["AAPL", "MSFT"])
+        window.poll_latest_bars(history, ["AAPL", "MSFT"])
+
+        assert window.view("MSFT", "close").tolist() == [380.0]
+        assert window.last("AAPL", "volume") == 3000
+
+    def test_validation(self):
+        with pytest.raises(ValidationError, match="Invalid kind"):
+            LiveWindow(3, kind="orders")
+        with pytest.raises(ValidationError, match="Size"):
+            LiveWindow(0)
+        window = LiveWindow(3, kind="quotes")
+        window.append("AAPL", {"t": "2024-01-02T14:30:00Z", "bp": 1.0})
+        with pytest.raises(ValidationError, match="Invalid field"):
+            window.view("AAPL", "close")
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from py_alpaca_api.exceptions import OrderError
+from py_alpaca_api.models.order_model import order_class_from_dict
+from py_alpaca_api.streaming import OrderMirror, TradeUpdatesStream
+
+serve = pytest.importorskip("websockets.asyncio.server").serve
+
+
+def _order(
+    status: str = "new",
+    updated_at: str = "2024-01-02T14:30:00Z",
+    order_id: str = "o1",
+    **fields,
+) -> dict:
+    return {
+        "id": order_id,
+        "client_order_id": f"c-{order_id}",
+        "symbol": "AAPL",
+        "status": status,
+        "submitted_at": "2024-01-02T14:30:00Z",
+        "updated_at": updated_at,
+        "filled_qty": "100" if status == "filled" else "0",
+        **fields,
+    }
+
+
+def _event(event: str, **order_fields) -> dict:
+    return {"event": event, "order": _order(**order_fields)}
+
+
+@pytest.fixture
+def orders():
+    orders = MagicMock()
+    orders.get_all_orders.return_value = []
+    return orders
+
+
+class TestOrderMirror:
+    def test_indexes(self, orders):
+        mirror = OrderMirror(orders)
+        mirror.apply_event(_event("new"))
+        mirror.apply_event(_event("new", order_id="o2"))
+
+        assert mirror.get("c-o1").id == "o1"
+        assert [o.id for o in mirror.orders_for("AAPL")] == ["o1", "o2"]
+        assert len(mirror.open_orders) == 2
+        assert mirror.get("missing") is None
+
+    def test_stale_updates_are_ignored(self, orders):
+        mirror = OrderMirror(orders)
+        mirror.apply_event(_event("fill", status="filled"))
+        mirror.update(order_class_from_dict(_order("new")))
+
+        assert mirror.get("o1").status == "filled"
+        assert mirror.orders_for("AAPL", open_only=True) == []
+
+    def test_wait_for_fill_blocking(self, orders):
+        mirror = OrderMirror(orders)
+        mirror.apply_event(_event("new"))
+        timer = threading.Timer(
+            0.05,
+            mirror.apply_event,
+            [_event("fill", status="filled", updated_at="2024-01-02T14:30:01Z")],
+        )
+        timer.start()
+
+        assert mirror.wait_for_fill("c-o1", timeout=2).status == "filled"
+
+    def test_wait_for_fill_follows_replacements(self, orders):
+        mirror = OrderMirror(orders)
+        mirror.apply_event(_event("replaced", status="replaced", replaced_by="o2"))
+        mirror.apply_event(_event("fill", status="filled", order_id="o2"))
+
+        assert mirror.wait_for_fill("o1", timeout=0).id == "o2"
+
+    def test_wait_for_fill_errors(self, orders):
+        mirror = OrderMirror(orders)
+        mirror.apply_event(_event("canceled", status="canceled"))
+
+        with pytest.raises(OrderError, match="canceled"):
+            mirror.wait_for_fill("o1")
+        with pytest.raises(TimeoutError):
+            mirror.wait_for_fill("o2", timeout=0.01)
+
+    def test_wait_for_fill_async(self, orders):
+        mirror = OrderMirror(orders)
+
+        async def scenario():
+            waiter = asyncio.create_task(mirror.wait_for_fill_async("o1", timeout=2))
+            await asyncio.sleep(0.01)
+            mirror.apply_event(_event("new"))
+            await asyncio.to_thread(
+                mirror.apply_event,
+                _event("fill", status="filled", updated_at="2024-01-02T14:30:01Z"),
+            )
+            return await waiter
+
+        assert asyncio.run(scenario()).status == "filled"
+
+    def test_resync_is_incremental(self, orders):
+        mirror = OrderMirror(orders)
+        orders.get_all_orders.return_value = [order_class_from_dict(_order())]
+        assert mirror.resync() == 1
+        orders.get_all_orders.assert_called_once_with(
+            status="open", limit=500, direction="asc"
+        )
+
+        # o1 filled while disconnected, so it is in neither list
+        orders.get_all_orders.reset_mock()
+        orders.get_all_orders.return_value = []
+        orders.get_by_id.return_value = order_class_from_dict(
+            _order("filled", updated_at="2024-01-02T14:31:00Z")
+        )
+        mirror.resync()
+
+        first_call = orders.get_all_orders.call_args_list[0].kwargs
+        assert first_call["status"] == "all"
+        assert first_call["after"].endswith("Z")
+        orders.get_by_id.assert_called_once_with("o1")
+        assert mirror.get("o1").status == "filled"
+
+
+class TestTradeUpdatesStream:
+    def test_stream_feeds_mirror_and_resyncs(self, orders):
+        connections = []
+
+        async def handler(ws):
+            connections.append(ws)
+            auth = json.loads(await ws.recv())
+            status = "authorized" if auth["key"] == "key" else "unauthorized"
+            await ws.send(
+                json.dumps({"stream": "authorization", "data": {"status": status}})
+            )
+            listen = json.loads(await ws.recv())
+            await ws.send(json.dumps({"stream": "listening", "data": listen["data"]}))
+            if len(connections) == 1:
+                return  # Drop the first connection
+            await ws.send(
+                json.dumps({"stream": "trade_updates", "data": _event("new")}).encode()
+            )
+            fill = _event("fill", status="filled", updated_at="2024-01-02T14:30:01Z")
+            await ws.send(json.dumps({"stream": "trade_updates", "data": fill}))
+            await ws.wait_closed()
+
+        async def scenario():
+            async with serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                stream = TradeUpdatesStream(
+                    "key", "secret", url=f"ws://127.0.0.1:{port}", backoff=0.01
+                )
+                mirror = OrderMirror(orders, stream)
+                task = asyncio.create_task(stream.run())
+                order = await mirror.wait_for_fill_async("c-o1", timeout=5)
+                stream.stop()
+                await asyncio.wait_for(task, timeout=5)
+                return order
+
+        assert asyncio.run(scenario()).status == "filled"
+        assert len(connections) == 2
+        assert orders.get_all_orders.call_count >= 2  # Initial sync and resync
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from py_alpaca_api.exceptions import ValidationError
+from py_alpaca_api.stock.snapshot_poller import SnapshotPoller
+from py_alpaca_api.stock.snapshots import Snapshots
+from py_alpaca_api.streaming import Dispatcher, Recorder, Replayer, Stream
+
+TRADE = {"T": "t", "S": "AAPL", "t": "2024-01-02T14:30:00.123Z", "p": 100.5, "s": 10}
+QUOTE = {"T": "q", "S": "MSFT", "t": "2024-01-02T14:30:00Z", "bp": 379.9, "ap": 380.1}
+STATUS = {"T": "subscription", "trades": ["AAPL"]}
+
+
+def _record(path, records, **kwargs) -> None:
+    with Recorder(path, **kwargs) as recorder:
+        for received_at, channel, message in records:
+            recorder.record(channel, message, received_at=received_at)
+
+
+class TestRecorder:
+    @pytest.mark.parametrize("name", ["session.log", "session.log.gz"])
+    def test_round_trip(self, tmp_path, name):
+        path = tmp_path / name
+        _record(path, [(1.0, "trades", TRADE), (1.5, "quotes", QUOTE)])
+
+        records = list(Replayer(path))
+
+        assert [(r.received_at, r.channel, r.message) for r in records] == [
+            (1.0, "trades", TRADE),
+            (1.5, "quotes", QUOTE),
+        ]
+        assert [r.message for r in Replayer(path, channels=["quotes"])] == [QUOTE]
+
+    def test_msgpack_codec_and_append(self, tmp_path):
+        pytest.importorskip("msgpack")
+        path = tmp_path / "session.log"
+        _record(path, [(1.0, "trades", TRADE)], codec="msgpack")
+        _record(path, [(2.0, "quotes", QUOTE)], codec="msgpack")
+
+        assert [r.message for r in Replayer(path)] == [TRADE, QUOTE]
+        with pytest.raises(ValidationError, match="recorded with msgpack"):
+            Recorder(path)
+
+    def test_invalid_logs(self, tmp_path):
+        with pytest.raises(ValidationError, match="Invalid codec"):
+            Recorder(tmp_path / "session.log", codec="pickle")
+        path = tmp_path / "other.log"
+        path.write_bytes(b"not a log")
+        with pytest.raises(ValidationError, match="not a recorded stream log"):
+            Replayer(path)
+
+    def test_truncated_record_is_skipped(self, tmp_path):
+        path = tmp_path / "session.log"
+        _record(path, [(1.0, "trades", TRADE), (2.0, "trades", TRADE)])
+        path.write_bytes(path.read_bytes()[:-5])
+
+        assert len(list(Replayer(path))) == 1
+
+    def test_records_stream_taps(self, tmp_path):
+        path = tmp_path / "session.log"
+        stream = Stream("key", "secret")
+        received = []
+        stream.subscribe_trades(received.append, "AAPL")
+
+        with Recorder(path) as recorder:
+            recorder.attach(stream)
+            for message in (TRADE, QUOTE, STATUS):
+                asyncio.run(stream.inject(message))
+            recorder.detach(stream)
+            asyncio.run(stream.inject(TRADE))
+
+        # Data messages are recorded whether or not a handler is subscribed
+        assert [(r.channel, r.message) for r in Replayer(path)] == [
+            ("trades", TRADE),
+            ("quotes", QUOTE),
+        ]
+        assert received == [TRADE, TRADE]
+
+    def test_records_snapshot_changes(self, tmp_path, mocker):
+        snapshot = {
+            "latestTrade": {"t": "2025-01-14T10:30:00Z", "p": 150.0, "s": 100},
+            "latestQuote": None,
+            "minuteBar": None,
+            "dailyBar": None,
+            "prevDailyBar": None,
+        }
+        mocker.patch(
+            "py_alpaca_api.http.requests.Requests.request",
+            return_value=MagicMock(text=json.dumps({"AAPL": snapshot})),
+        )
+        poller = SnapshotPoller(
+            Snapshots(headers={}),
+            ["AAPL"],
+            fields=("trade_timestamp", "trade_price", "trade_size"),
+        )
+        path = tmp_path / "snapshots.log"
+        with Recorder(path) as recorder:
+            recorder.attach(poller)
+            poller.poll()
+
+        (record,) = Replayer(path)
+        assert record.channel == "snapshots"
+        assert record.message == {
+            "AAPL": {
+                "trade_timestamp": "2025-01-14T10:30:00",
+                "trade_price": 150.0,
+                "trade_size": 100,
+            }
+        }
+
+
+class TestReplayer:
+    def test_replay_into_stream_at_max_speed(self, tmp_path):
+        path = tmp_path / "session.log"
+        _record(path, [(float(i), "trades", TRADE) for i in range(100)])
+        stream = Stream("key", "secret", dispatcher=Dispatcher())
+        received = []
+        stream.subscribe_trades(received.append, "*")
+
+        started = time.monotonic()
+        count = Replayer(path).replay_sync(stream, speed=None)
+
+        assert time.monotonic() - started < 5
+        assert count == 100
+        assert received == [TRADE] * 100
+        assert stream.dispatcher.stats()["trades"].dispatched == 100
+
+    def test_replay_keeps_scaled_gaps(self, tmp_path):
+        path = tmp_path / "session.log"
+        _record(path, [(10.0, "quotes", QUOTE), (11.0, "quotes", QUOTE)])
+        times = []
+
+        def on_quote(message):
+            times.append(time.monotonic())
+
+        count = Replayer(path).replay_sync(on_quote, speed=10)
+
+        assert count == 2
+        assert times[1] - times[0] == pytest.approx(0.1, abs=0.05)
+
+    def test_invalid_speed(self, tmp_path):
+        path = tmp_path / "session.log"
+        _record(path, [])
+        with pytest.raises(ValidationError, match="Speed must be positive"):
+            Replayer(path).replay_sync(print, speed=0)
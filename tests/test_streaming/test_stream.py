@@ -0,0 +1,191 @@
+import asyncio
+import json
+
+import pytest
+
+from py_alpaca_api.exceptions import AuthenticationError, ValidationError
+from py_alpaca_api.streaming import Stream
+
+msgpack = pytest.importorskip("msgpack")
+serve = pytest.importorskip("websockets.asyncio.server").serve
+
+TRADE = {"T": "t", "S": "AAPL", "t": "2024-01-02T14:30:00.123Z", "p": 100.5, "s": 10}
+QUOTE = {"T": "q", "S": "MSFT", "t": "2024-01-02T14:30:00Z", "bp": 379.9, "ap": 380.1}
+
+
+class FakeServer:
+    """Local stand-in for the data stream that records the client's requests."""
+
+    def __init__(self, messages: list[dict], drop_first: bool = False, key="key"):
+        self.messages = messages
+        self.drop_first = drop_first
+        self.key = key
+        self.connections = 0
+        self.requests: list[dict] = []
+
+    async def handler(self, ws):
+        use_msgpack = ws.request.headers.get("Content-Type") == "application/msgpack"
+
+        def encode(payload):
+            return msgpack.packb(payload) if use_msgpack else json.dumps(payload)
+
+        def decode(raw):
+            return msgpack.unpackb(raw) if use_msgpack else json.loads(raw)
+
+        self.connections += 1
+        await ws.send(encode([{"T": "success", "msg": "connected"}]))
+        auth = decode(await ws.recv())
+        if auth["key"] != self.key:
+            await ws.send(encode([{"T": "error", "code": 402, "msg": "auth failed"}]))
+            return
+        await ws.send(encode([{"T": "success", "msg": "authenticated"}]))
+
+        async for raw in ws:
+            request = decode(raw)
+            self.requests.append(request)
+            await ws.send(encode([{"T": "subscription", **request}]))
+            if request["action"] != "subscribe":
+                continue
+            if self.drop_first and self.connections == 1:
+                return  # Close the connection to force a reconnect
+            for message in self.messages:
+                if use_msgpack:
+                    timestamp = msgpack.Timestamp(1704205800, 123000000)
+                    await ws.send(encode([{**message, "t": timestamp}]))
+                else:
+                    await ws.send(encode([message]))
+
+    async def __aenter__(self):
+        self.server = await serve(self.handler, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def _stream(url: str, **kwargs) -> Stream:
+    return Stream("key", "secret", url=url, backoff=0.01, **kwargs)
+
+
+async def _collect(stream: Stream, received: list, count: int) -> None:
+    async def watch():
+        while len(received) < count:
+            await asyncio.sleep(0.01)
+        stream.stop()
+
+    await asyncio.wait_for(asyncio.gather(stream.run(), watch()), timeout=5)
+
+
+class TestStream:
+    def test_subscribe_and_dispatch(self):
+        async def scenario():
+            async with FakeServer([TRADE, QUOTE]) as server:
+                stream = _stream(server.url)
+                received = []
+                stream.subscribe_trades(received.append, "aapl")
+                stream.subscribe_quotes(received.append, "*")
+                await _collect(stream, received, 2)
+                return server, received
+
+        server, received = asyncio.run(scenario())
+
+        assert server.requests == [
+            {"action": "subscribe", "trades": ["AAPL"], "quotes": ["*"]}
+        ]
+        assert received == [TRADE, QUOTE]
+
+    def test_async_handler_and_unsubscribe(self):
+        async def scenario():
+            async with FakeServer([TRADE]) as server:
+                stream = _stream(server.url)
+                received = []
+
+                async def on_trade(message):
+                    received.append(message)
+                    stream.unsubscribe("trades", ["AAPL"])
+
+                stream.subscribe_trades(on_trade, "AAPL")
+                await _collect(stream, received, 1)
+                await asyncio.sleep(0.05)
+                return server, stream
+
+        server, stream = asyncio.run(scenario())
+
+        assert {"action": "unsubscribe", "trades": ["AAPL"]} in server.requests
+        assert stream.subscriptions == {}
+
+    def test_reconnect_resubscribes(self):
+        async def scenario():
+            async with FakeServer([TRADE], drop_first=True) as server:
+                stream = _stream(server.url)
+                received = []
+                stream.subscribe_trades(received.append, "AAPL")
+                await _collect(stream, received, 1)
+                return server
+
+        server = asyncio.run(scenario())
+
+        assert server.connections == 2
+        assert server.requests == [{"action": "subscribe", "trades": ["AAPL"]}] * 2
+
+    def test_msgpack_frames(self):
+        async def scenario():
+            async with FakeServer([TRADE]) as server:
+                stream = _stream(server.url, use_msgpack=True)
+                received = []
+                stream.subscribe_trades(received.append, "AAPL")
+                await _collect(stream, received, 1)
+                return received
+
+        received = asyncio.run(scenario())
+
+        assert received[0]["p"] == 100.5
+        assert received[0]["t"] == "2024-01-02T14:30:00.123Z"
+
+    def test_authentication_failure(self):
+        async def scenario():
+            async with FakeServer([], key="other") as server:
+                await asyncio.wait_for(_stream(server.url).run(), timeout=5)
+
+        with pytest.raises(AuthenticationError, match="auth failed"):
+            asyncio.run(scenario())
+
+    def test_stop_before_run_is_kept(self):
+        async def scenario():
+            async with FakeServer([TRADE]) as server:
+                stream = _stream(server.url)
+                stream.stop()
+                await asyncio.wait_for(stream.run(), timeout=5)
+                return server
+
+        server = asyncio.run(scenario())
+
+        assert server.connections == 0
+
+    def test_scheduled_failures_are_logged(self, caplog):
+        async def fail():
+            raise RuntimeError("send failed")
+
+        async def scenario():
+            stream = _stream("ws://unused")
+            stream._loop = asyncio.get_running_loop()
+            await asyncio.to_thread(stream._schedule, fail())
+            await asyncio.sleep(0.05)
+
+        asyncio.run(scenario())
+
+        assert "Scheduled stream operation failed" in caplog.text
+        assert "send failed" in caplog.text
+
+    def test_validation(self):
+        stream = Stream("key", "secret")
+        assert stream.url == "wss://stream.data.alpaca.markets/v2/iex"
+        with pytest.raises(ValidationError, match="Invalid channel"):
+            stream.subscribe("orders", print, ["AAPL"])
+        with pytest.raises(ValidationError, match="At least one symbol"):
+            stream.subscribe_bars(print)
+        with pytest.raises(ValidationError, match="Invalid feed"):
+            Stream("key", "secret", feed="otc")